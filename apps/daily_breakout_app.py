@@ -10,7 +10,6 @@ import os
 import argparse
 import logging
 from pathlib import Path
-from datetime import datetime
 import yaml
 from dotenv import load_dotenv
 
@@ -23,8 +22,12 @@ env_file = project_root / "config" / "settings.example.env"
 if env_file.exists():
     load_dotenv(env_file)
 
-from skills.trading_core.graph.graph_builder import build_trading_graph
-from skills.trading_core.graph.state import create_initial_state
+from skills.trading_core.clock import ClockFormatter, get_clock
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.graph.graph_builder import build_portfolio_graph, build_trading_graph
+from skills.trading_core.graph.state import create_initial_state, create_portfolio_state
+from skills.trading_core.scheduler import TradingScheduler
+from skills.trading_core.supervisor import RiskCoordinator, ShardSupervisor
 
 
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
@@ -40,15 +43,20 @@ def setup_logging(log_level: str = "INFO") -> logging.Logger:
     log_dir = project_root.parent / "data" / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
 
-    log_file = log_dir / f"trading_{datetime.now().strftime('%Y%m%d')}.log"
+    log_file = log_dir / f"trading_{get_clock().now().strftime('%Y%m%d')}.log"
+
+    # 로그 타임스탬프도 전역 시계를 따르도록 (리플레이 시 가상 시각)
+    formatter = ClockFormatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s')
+    handlers = [
+        logging.FileHandler(log_file, encoding='utf-8'),
+        logging.StreamHandler(sys.stdout)
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
 
     logging.basicConfig(
         level=getattr(logging, log_level),
-        format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
+        handlers=handlers
     )
 
     logger = logging.getLogger(__name__)
@@ -75,6 +83,380 @@ def load_strategy_config(config_path: Path) -> dict:
     return config
 
 
+def load_enabled_symbols(symbols_path: Path) -> list:
+    """
+    symbols.yaml의 활성 종목 코드
+
+    Args:
+        symbols_path: 종목 목록 파일 경로
+
+    Returns:
+        enabled: true인 종목 코드 목록 (파일이 없으면 빈 목록)
+    """
+    if not symbols_path.exists():
+        return []
+    with open(symbols_path, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f) or {}
+    return [str(item['code']) for item in config.get('symbols', []) if item.get('enabled', False)]
+
+
+def precompute_daily_tables(
+    config: dict, symbols: list, logger: logging.Logger, context: TradingContext
+) -> None:
+    """
+    장 시작 전 종목별 일일 테이블 계산
+
+    지표 엔진을 전일까지의 일봉으로 워밍업하고 당일 적응형 k(k_mode: adaptive)와
+    변동성 조정 계수(risk.volatility_adjustment)를 미리 만들어 두므로,
+    장중 노드는 테이블 조회만 합니다.
+
+    Args:
+        config: 전략 설정
+        symbols: 종목 코드 목록
+        logger: Logger
+        context: 실행 컨텍스트 (지표 엔진 · 적응형 k 테이블 · 포지션 사이저)
+    """
+    from skills.trading_core.data.history_store import HistoryStore
+    from skills.trading_core.strategies.adaptive_k import AdaptiveKTable
+
+    today = get_clock().now().strftime('%Y%m%d')
+    context.indicator_engine.warm_start(HistoryStore(), symbols, until=today)
+
+    if config.get('volatility_breakout', {}).get('k_mode') == 'adaptive':
+        context.adaptive_k_table = AdaptiveKTable.from_config(config)
+        count = context.adaptive_k_table.precompute(context.indicator_engine, symbols, today)
+        for symbol, k in context.adaptive_k_table.as_dict().items():
+            logger.debug(f"  - {symbol}: k={k:.4f}")
+        logger.info(f"적응형 k 사전 계산: {count}/{len(symbols)}개 종목")
+
+    if config.get('risk', {}).get('volatility_adjustment', False):
+        count = context.position_sizer.refresh(context.indicator_engine, symbols, today)
+        for symbol, factor in context.position_sizer.as_dict().items():
+            logger.debug(f"  - {symbol}: 변동성 조정 계수={factor:.2f}")
+        logger.info(f"변동성 조정 계수 사전 계산: {count}/{len(symbols)}개 종목")
+
+
+def attach_market_bus(config: dict, logger: logging.Logger, context: TradingContext) -> bool:
+    """
+    시세 버스 연결 (market_bus.enabled)
+
+    연결되면 fetch_market_data 노드가 게시된 시세를 먼저 읽고, 버스에 없거나
+    max_age보다 오래된 종목만 KIS로 직접 조회합니다.
+
+    Args:
+        config: 전략 설정
+        logger: Logger
+        context: 실행 컨텍스트
+
+    Returns:
+        연결 여부
+    """
+    from skills.trading_core.data.market_bus import MarketBus
+
+    bus_config = config.get('market_bus', {})
+    if not bus_config.get('enabled', False):
+        return False
+
+    bus = MarketBus.open(bus_config.get('path') or None, max_age=bus_config.get('max_age', 5))
+    if bus is None:
+        logger.warning("시세 버스가 없습니다 (apps/market_bus_app.py 실행 필요), 직접 조회합니다")
+        return False
+    context.market_bus = bus
+    logger.info(f"시세 버스 연결: {bus.path} ({len(bus)}개 종목, max_age={bus.max_age}초)")
+    return True
+
+
+def attach_strategies(config: dict, logger: logging.Logger, context: TradingContext) -> int:
+    """
+    전략 플러그인 등록 (strategies)
+
+    등록되면 generate_signal 노드가 모든 전략을 같은 시세로 평가해 종목 주문 하나로
+    병합합니다. 비어 있으면 컨텍스트의 기본 레지스트리(돌파 전략 하나)를 그대로 씁니다.
+
+    Args:
+        config: 전략 설정
+        logger: Logger
+        context: 실행 컨텍스트
+
+    Returns:
+        등록된 전략 수
+    """
+    from skills.trading_core.strategies.registry import StrategyRegistry
+
+    entries = config.get('strategies') or []
+    if not entries:
+        return 0
+
+    context.strategy_registry = StrategyRegistry.from_config(entries)
+    names = ', '.join(context.strategy_registry.names)
+    logger.info(f"전략 플러그인 {len(entries)}개 등록: {names}")
+    return len(entries)
+
+
+def attach_account_model(config: dict, logger: logging.Logger, context: TradingContext) -> bool:
+    """
+    로컬 계좌 모델 연결 (account.enabled)
+
+    연결되면 update_account 노드가 보유 종목을 현재가로 평가하고, 잔고 조회는
+    체결 후 · reconcile_interval 주기 · 보유 수량 불일치 시에만 합니다.
+    reconcile_background면 첫 대사 이후 대사는 백그라운드 스레드에서 페이지 단위로 합니다.
+
+    Args:
+        config: 전략 설정
+        logger: Logger
+        context: 실행 컨텍스트
+
+    Returns:
+        연결 여부
+    """
+    from skills.trading_core.account import AccountModel
+    from skills.trading_core.reconcile import PositionReconciler
+
+    if not config.get('account', {}).get('enabled', False):
+        return False
+
+    context.account_model = AccountModel.from_config(config)
+    interval = context.account_model.reconcile_interval
+    logger.info(f"로컬 계좌 모델 사용: 잔고 대사 {interval:g}초 주기 + 체결 후")
+    if config['account'].get('reconcile_background', False):
+        context.position_reconciler = PositionReconciler.from_config(config)
+        budget = context.position_reconciler.budget_seconds
+        logger.info(f"백그라운드 잔고 대사: 1회 예산 {budget:g}초")
+    return True
+
+
+def attach_kill_switch(config: dict, mode: str, logger: logging.Logger, context: TradingContext):
+    """
+    속도 제한기 · 킬 스위치 연결 (api.rate_limit_enabled, kill_switch.enabled)
+
+    속도 제한기가 연결되면 모든 KIS 호출이 api.rate_limit 간격으로 나가고, 킬 스위치 매도가
+    대기 중인 조회보다 먼저 나갑니다. 킬 스위치는 kill_switch.signal 신호를 받으면
+    미체결을 취소하고 전 종목을 시장가 매도한 뒤 매매 루프를 멈춥니다.
+
+    Args:
+        config: 전략 설정
+        mode: 거래 모드 (demo | real)
+        logger: Logger
+        context: 실행 컨텍스트 (킬 스위치가 halt_reason을 설정해 매매 루프를 멈춤)
+
+    Returns:
+        KillSwitch 또는 None
+    """
+    import signal
+
+    from skills.trading_core.kill_switch import KillSwitch, install_signal_handler
+    from skills.trading_core.rate_limit import PriorityRateLimiter
+
+    if config.get('api', {}).get('rate_limit_enabled', False):
+        context.rate_limiter = PriorityRateLimiter.from_config(config)
+        logger.info(f"KIS 호출 속도 제한: 초당 {context.rate_limiter.rate:g}회")
+
+    if not config.get('kill_switch', {}).get('enabled', False):
+        return None
+
+    kill_switch = KillSwitch.from_config(config, env_mode=mode, context=context)
+    signum = getattr(signal, config['kill_switch'].get('signal', 'SIGUSR1'))
+    install_signal_handler(kill_switch, signum)
+    logger.info(f"킬 스위치 대기: kill -{signal.Signals(signum).name[3:]} {os.getpid()}")
+    return kill_switch
+
+
+def attach_ledger(config: dict, mode: str, logger: logging.Logger, context: TradingContext):
+    """
+    실현 손익 원장 연결 (ledger.enabled)
+
+    연결되면 체결마다 원장에 기록하고, risk_check 노드는 원장의 당일 · 당월 손익과
+    최고 자산으로 손실 한도 · MDD를 점검합니다 (재시작해도 유지).
+    원장은 거래 모드 · 계좌번호별로 따로 둡니다 (모의투자 기록이 실전 한도에 섞이지 않도록).
+
+    Args:
+        config: 전략 설정
+        mode: 거래 모드 (demo | real)
+        logger: Logger
+        context: 실행 컨텍스트
+
+    Returns:
+        PnLLedger 또는 None
+    """
+    from skills.trading_core.data.pnl_ledger import PnLLedger
+    from skills.trading_core.graph import nodes
+
+    if not config.get('ledger', {}).get('enabled', False):
+        return None
+
+    ledger = PnLLedger.from_config(config, env_mode=mode, account=nodes._account_id(mode))
+    context.pnl_ledger = ledger
+    pnl = ledger.snapshot()
+    logger.info(
+        f"손익 원장 연결: {ledger.path} (당일 {pnl['daily_pnl']:,}원, "
+        f"이번 주 {pnl['weekly_pnl']:,}원, 당월 {pnl['monthly_pnl']:,}원, "
+        f"누적 거래 {pnl['trades']}회)"
+    )
+    return ledger
+
+
+def build_shadow(config: dict, logger: logging.Logger):
+    """
+    섀도 평가기 생성 (shadow.enabled, 변형이 있을 때만)
+
+    Args:
+        config: 전략 설정
+        logger: Logger
+
+    Returns:
+        ShadowRunner 또는 None
+    """
+    from skills.trading_core.shadow import ShadowRunner
+
+    shadow_config = config.get('shadow', {})
+    if not shadow_config.get('enabled', False) or not shadow_config.get('variants'):
+        return None
+
+    shadow = ShadowRunner.from_config(config)
+    logger.info(
+        f"섀도 평가 {len(shadow.variants)}개 변형 (예산 {shadow.budget * 1000:.1f}ms/호출): "
+        f"{', '.join(variant.name for variant in shadow.variants)}"
+    )
+    return shadow
+
+
+def report_shadow(shadow, logger: logging.Logger) -> None:
+    """섀도 로그 저장 · 변형별 손익 출력"""
+    path = shadow.save()
+    logger.info(
+        f"섀도 평가 결과 (로그: {path}, 평가 시간 {shadow.busy_seconds:.3f}초, "
+        f"미룬 평가 {shadow.deferred}회)"
+    )
+    for row in shadow.summary():
+        logger.info(
+            f"  - {row['name']}: 평가자산 {row['equity']:,.0f}원, "
+            f"실현손익 {row['realized_pnl']:,.0f}원, "
+            f"거래 {row['trades']}회 (승 {row['wins']}) {row['params']}"
+        )
+
+
+def run_portfolio(args, config: dict, logger: logging.Logger, context: TradingContext) -> int:
+    """
+    포트폴리오 모드 실행 (symbols.yaml 활성 종목 전체를 한 그래프로)
+
+    Args:
+        args: 명령행 인수
+        config: 전략 설정
+        logger: Logger
+        context: 실행 컨텍스트
+
+    Returns:
+        종료 코드
+    """
+    symbols = load_enabled_symbols(project_root / 'config' / 'symbols.yaml')
+    if not symbols:
+        logger.error("활성 종목이 없습니다 (config/symbols.yaml)")
+        return 1
+
+    graph = build_portfolio_graph(context)
+    state = create_portfolio_state(
+        symbols,
+        initial_capital=config.get('trading', {}).get('capital'),
+        max_positions=config.get('trading', {}).get('max_positions'),
+        k_value=config.get('volatility_breakout', {}).get('k_value'),
+        k_mode=config.get('volatility_breakout', {}).get('k_mode'),
+        stop_loss_pct=config.get('risk', {}).get('stop_loss'),
+        take_profit_pct=config.get('risk', {}).get('take_profit'),
+        env_mode=args.mode
+    )
+    if args.dry_run:
+        logger.warning("DRY-RUN 모드: 실제 주문은 실행되지 않습니다")
+        state["debug_mode"] = True
+        for symbol_state in state["symbol_states"].values():
+            symbol_state["debug_mode"] = True
+
+    logger.info(f"포트폴리오 모드: {len(symbols)}개 종목, 최대 보유 {state['max_positions']}개")
+
+    from skills.trading_core.strategies.portfolio_risk import PortfolioRisk
+
+    context.portfolio_risk = PortfolioRisk.from_config(config, symbols, cash=state['cash_balance'])
+    logger.info(f"포트폴리오 리스크 집계: 업종 {', '.join(context.portfolio_risk.sector_names)}")
+
+    if args.loop:
+        interval = args.interval or config.get('monitoring', {}).get('check_interval', 60)
+        logger.info(f"반복 실행 모드: {interval}초 간격")
+        result = TradingScheduler(graph, interval_seconds=interval).run(state)
+    else:
+        result = graph.invoke(state)
+
+    logger.info("=" * 80)
+    logger.info("포트폴리오 실행 결과")
+    logger.info("=" * 80)
+    for symbol, symbol_state in result['symbol_states'].items():
+        logger.info(
+            f"  - {symbol}: {symbol_state['position_status']}, "
+            f"현재가 {symbol_state['current_price']:,.0f}원, "
+            f"목표가 {symbol_state['target_price']:,.0f}원, "
+            f"보유 {symbol_state['position_qty']}주"
+        )
+    logger.info(f"현금: {result['cash_balance']:,.0f}원")
+    logger.info(f"일일손익: {result['daily_pnl']:,.0f}원")
+    logger.info(f"총거래수: {result['total_trades']}회")
+    if result['trading_stopped']:
+        logger.warning(f"거래 중단: {result['stop_reason']}")
+    return 0
+
+
+def run_sharded(args, config: dict, logger: logging.Logger, context: TradingContext) -> int:
+    """
+    워커 프로세스 샤딩 모드 실행 (종목을 args.workers개 프로세스로 나눔)
+
+    현금 · 손실 한도 · 주문 승인은 이 프로세스의 RiskCoordinator가 소유합니다.
+
+    Args:
+        args: 명령행 인수
+        config: 전략 설정
+        logger: Logger
+        context: 실행 컨텍스트 (워커 프로세스가 물려받음)
+
+    Returns:
+        종료 코드
+    """
+    symbols = load_enabled_symbols(project_root / 'config' / 'symbols.yaml')
+    if not symbols:
+        logger.error("활성 종목이 없습니다 (config/symbols.yaml)")
+        return 1
+
+    supervisor = ShardSupervisor(
+        symbols,
+        n_workers=args.workers,
+        coordinator=RiskCoordinator.from_config(config, ledger=context.pnl_ledger, context=context),
+        state_kwargs={
+            'k_value': config.get('volatility_breakout', {}).get('k_value'),
+            'k_mode': config.get('volatility_breakout', {}).get('k_mode'),
+            'stop_loss_pct': config.get('risk', {}).get('stop_loss'),
+            'take_profit_pct': config.get('risk', {}).get('take_profit'),
+            'env_mode': args.mode
+        },
+        interval_seconds=args.interval or config.get('monitoring', {}).get('check_interval', 60),
+        max_iterations=None if args.loop else 1,
+        context=context
+    )
+    result = supervisor.run()
+
+    logger.info("=" * 80)
+    logger.info("샤딩 실행 결과")
+    logger.info("=" * 80)
+    for worker_id, shard in result['shards'].items():
+        logger.info(f"  - 워커 {worker_id}: {shard}")
+    for symbol, position in result['positions'].items():
+        logger.info(f"  - {symbol}: {position['qty']}주 @ {position['entry_price']:,.0f}원")
+    logger.info(f"현금: {result['cash_balance']:,.0f}원")
+    logger.info(f"일일손익: {result['daily_pnl']:,.0f}원")
+    logger.info(f"총거래수: {result['total_trades']}회")
+    if result['failed']:
+        logger.warning(f"비정상 종료 워커: {result['failed']}")
+    if result['orphaned']:
+        logger.error(f"배정되지 못한 종목: {result['orphaned']}")
+        return 1
+    return 0
+
+
 def main():
     """메인 실행 함수"""
     # 명령행 인수 파싱
@@ -110,6 +492,29 @@ def main():
         action='store_true',
         help='실제 주문 없이 시뮬레이션만 실행'
     )
+    parser.add_argument(
+        '--loop',
+        action='store_true',
+        help='장 마감까지 일정 간격으로 반복 실행'
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=None,
+        help='반복 실행 간격 (초, 기본값: monitoring.check_interval 또는 60)'
+    )
+    parser.add_argument(
+        '--portfolio',
+        action='store_true',
+        help='symbols.yaml 활성 종목 전체를 하나의 포트폴리오 그래프로 실행 (--symbol 무시)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='symbols.yaml 활성 종목을 N개 워커 프로세스로 나눠 실행 '
+             '(중앙 코디네이터가 현금 · 손실 한도 관리)'
+    )
 
     args = parser.parse_args()
 
@@ -125,10 +530,31 @@ def main():
 
         config = load_strategy_config(config_path)
         logger.info(f"전략 설정 로드 완료: {config_path}")
+        context = TradingContext()
+
+        # 적응형 k / 변동성 조정 계수는 장 시작 전에 전 종목 한 번에 계산
+        if (config.get('volatility_breakout', {}).get('k_mode') == 'adaptive'
+                or config.get('risk', {}).get('volatility_adjustment', False)):
+            symbols = load_enabled_symbols(project_root / 'config' / 'symbols.yaml')
+            if args.symbol not in symbols:
+                symbols.append(args.symbol)
+            precompute_daily_tables(config, symbols, logger, context)
+
+        attach_market_bus(config, logger, context)
+        attach_strategies(config, logger, context)
+        attach_ledger(config, args.mode, logger, context)
+        attach_account_model(config, logger, context)
+        attach_kill_switch(config, args.mode, logger, context)
+
+        if args.workers:
+            return run_sharded(args, config, logger, context)
+
+        if args.portfolio:
+            return run_portfolio(args, config, logger, context)
 
         # LangGraph 빌드
         logger.info("LangGraph 빌드 시작...")
-        graph = build_trading_graph()
+        graph = build_trading_graph(context)
         logger.info("LangGraph 빌드 완료")
 
         # 초기 상태 생성 (config 값으로 오버라이드)
@@ -136,6 +562,7 @@ def main():
             symbol=args.symbol,
             initial_capital=config.get('trading', {}).get('capital'),
             k_value=config.get('volatility_breakout', {}).get('k_value'),
+            k_mode=config.get('volatility_breakout', {}).get('k_mode'),
             stop_loss_pct=config.get('risk', {}).get('stop_loss'),
             take_profit_pct=config.get('risk', {}).get('take_profit'),
             env_mode=args.mode
@@ -143,7 +570,10 @@ def main():
 
         logger.info(f"초기 상태 생성 완료: {args.symbol}")
         logger.info(f"  - 초기 자본: {config.get('trading', {}).get('capital', 0):,.0f}원")
-        logger.info(f"  - k 값: {config.get('volatility_breakout', {}).get('k_value', 0)}")
+        logger.info(
+            f"  - k 값: {config.get('volatility_breakout', {}).get('k_value', 0)} "
+            f"({initial_state['k_mode']})"
+        )
         logger.info(f"  - 손절매: {config.get('risk', {}).get('stop_loss', 0)*100}%")
         logger.info(f"  - 익절: {config.get('risk', {}).get('take_profit', 0)*100}%")
 
@@ -156,7 +586,19 @@ def main():
         logger.info("LangGraph 실행 시작")
         logger.info("=" * 80)
 
-        result = graph.invoke(initial_state)
+        if args.loop:
+            interval = args.interval or config.get('monitoring', {}).get('check_interval', 60)
+            logger.info(f"반복 실행 모드: {interval}초 간격")
+            shadow = build_shadow(config, logger)
+            scheduler = TradingScheduler(
+                graph, interval_seconds=interval,
+                on_iteration=shadow.on_state if shadow is not None else None
+            )
+            result = scheduler.run(initial_state)
+            if shadow is not None:
+                report_shadow(shadow, logger)
+        else:
+            result = graph.invoke(initial_state)
 
         # 결과 출력
         logger.info("=" * 80)
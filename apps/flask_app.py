@@ -5,6 +5,7 @@ Flask 기반 자동매매 웹 앱
 LangGraph 상태를 웹 UI로 모니터링하고 제어
 """
 
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -24,8 +25,14 @@ if env_file.exists():
 else:
     load_dotenv(project_root / "config" / "settings.example.env")
 
+from skills.trading_core.clock import get_clock
+from skills.trading_core.data.market_bus import MarketBus
+from skills.trading_core.data.target_table import TargetTable
+from skills.trading_core.graph.context import TradingContext
 from skills.trading_core.graph.graph_builder import build_trading_graph
-from skills.trading_core.graph.state import create_initial_state
+from skills.trading_core.graph.state import create_initial_state, load_trading_config
+from skills.trading_core.kill_switch import KillSwitch
+from skills.trading_core.rate_limit import PriorityRateLimiter
 
 # Flask 앱 생성
 app = Flask(__name__)
@@ -38,6 +45,22 @@ logger = logging.getLogger(__name__)
 # 전역 상태 (실제로는 Redis나 DB 사용 권장)
 current_state = None
 trading_graph = None
+target_table_dir = None  # 목표가 테이블 디렉토리 (None이면 data/target_tables)
+market_bus_path = None  # 시세 버스 파일 (None이면 /dev/shm/market_bus.npy)
+kill_switch = None  # 킬 스위치 (None이면 첫 요청 때 trading_context로 생성)
+
+
+def create_trading_context(config: dict) -> TradingContext:
+    """웹 앱 실행 컨텍스트 (api.rate_limit_enabled면 속도 제한기 연결)"""
+    context = TradingContext()
+    if config.get('api', {}).get('rate_limit_enabled', False):
+        context.rate_limiter = PriorityRateLimiter.from_config(config)
+    return context
+
+
+# 그래프와 킬 스위치가 함께 쓰는 실행 컨텍스트 (웹 청산이 매매 루프를 멈추고 같은 속도 제한을 따름)
+trading_config = load_trading_config()
+trading_context = create_trading_context(trading_config)
 
 
 # ========== HTML 템플릿 ==========
@@ -133,12 +156,38 @@ DASHBOARD_HTML = """
             </div>
         </div>
 
+        {% if targets %}
+        <div class="status-card">
+            <h2>🎯 당일 목표가 ({{ targets|length }}종목)</h2>
+            <table style="width:100%; border-collapse: collapse;">
+                <tr><th align="left">종목</th>
+                    <th align="right">전일 변동폭</th>
+                    <th align="right">k</th>
+                    <th align="right">시가</th>
+                    <th align="right">목표가</th>
+                    <th align="right">주문가</th></tr>
+                {% for row in targets %}
+                <tr><td>{{ row.symbol }}</td>
+                    <td align="right">{{ "{:,}".format(row.prev_high - row.prev_low) }}</td>
+                    <td align="right">{{ "{:.3f}".format(row.k) }}</td>
+                    <td align="right">{{ "{:,}".format(row.open) if row.open else '-' }}</td>
+                    <td align="right">
+                        {{ "{:,}".format(row.target) if row.open else '-' }}
+                        {{- ' (예상)' if row.provisional else '' }}</td>
+                    <td align="right">
+                        {{ "{:,}".format(row.order_price) if row.open else '-' }}</td></tr>
+                {% endfor %}
+            </table>
+        </div>
+        {% endif %}
+
         <div class="status-card">
             <h2>⚙️ 제어</h2>
             <button class="btn btn-success" onclick="runOnce()">1회 실행</button>
             <button class="btn btn-primary" onclick="startAuto()">자동 실행 시작</button>
             <button class="btn btn-danger" onclick="stopAuto()">자동 실행 중단</button>
             <button class="btn btn-primary" onclick="location.reload()">새로고침</button>
+            <button class="btn btn-danger" onclick="killSwitch()">전량 청산</button>
         </div>
 
         <p class="timestamp">마지막 업데이트: {{ state.timestamp }}</p>
@@ -154,6 +203,22 @@ DASHBOARD_HTML = """
                 });
         }
 
+        function killSwitch() {
+            const message = '미체결 주문을 모두 취소하고 전 종목을 시장가로 매도합니다. '
+                + '계속할까요?';
+            if (!confirm(message)) return;
+            fetch('/api/kill-switch', { method: 'POST' })
+                .then(r => r.json())
+                .then(data => {
+                    const lines = (data.orders || []).map(o =>
+                        `${o.symbol} ${o.kind} ${o.qty}주: ` +
+                        `${o.success ? '성공' : '실패'} ${o.message}`);
+                    const status = data.flat ? '완료' : '미완료';
+                    alert(`청산 ${status} (${data.time_to_flat}초)\n` + lines.join('\n'));
+                    location.reload();
+                });
+        }
+
         function startAuto() {
             alert('자동 실행 기능은 아직 구현되지 않았습니다.');
         }
@@ -170,6 +235,18 @@ DASHBOARD_HTML = """
 """
 
 
+def load_target_rows() -> list:
+    """게시된 당일 목표가 테이블 행 (없으면 빈 목록)"""
+    table = TargetTable.load(get_clock().now().strftime('%Y%m%d'), target_table_dir)
+    return table.records() if table is not None else []
+
+
+def load_market_rows() -> list:
+    """시세 버스에 게시된 종목 행 (게시 프로세스가 없으면 빈 목록, KIS 조회 없음)"""
+    bus = MarketBus.open(market_bus_path)
+    return bus.records() if bus is not None else []
+
+
 # ========== API 엔드포인트 ==========
 
 @app.route('/')
@@ -179,7 +256,6 @@ def dashboard():
 
     if current_state is None:
         # 초기 상태 생성 (trading_config.yaml에서 자동 로드)
-        import os
         env_mode = os.getenv('ENV_MODE', None)  # None이면 YAML에서 읽음
         current_state = create_initial_state(
             symbol="069500",
@@ -187,7 +263,7 @@ def dashboard():
         )
         current_state['symbol_name'] = 'KODEX 200'
 
-    return render_template_string(DASHBOARD_HTML, state=current_state)
+    return render_template_string(DASHBOARD_HTML, state=current_state, targets=load_target_rows())
 
 
 @app.route('/api/status')
@@ -201,6 +277,24 @@ def get_status():
     return jsonify(current_state)
 
 
+@app.route('/api/targets')
+def get_targets():
+    """당일 목표가 테이블 조회 API (장 시작 전 게시)"""
+    rows = load_target_rows()
+    if not rows:
+        return jsonify({"error": "당일 목표가 테이블이 아직 게시되지 않았습니다"}), 404
+    return jsonify({"date": get_clock().now().strftime('%Y%m%d'), "targets": rows})
+
+
+@app.route('/api/market')
+def get_market():
+    """시세 버스 최신 시세 조회 API (apps/market_bus_app.py 게시)"""
+    rows = load_market_rows()
+    if not rows:
+        return jsonify({"error": "시세 버스가 아직 게시되지 않았습니다"}), 404
+    return jsonify({"quotes": rows})
+
+
 @app.route('/api/run', methods=['POST'])
 def run_once():
     """1회 실행 API"""
@@ -210,7 +304,7 @@ def run_once():
         # 그래프 빌드 (처음 한 번만)
         if trading_graph is None:
             logger.info("LangGraph 빌드...")
-            trading_graph = build_trading_graph()
+            trading_graph = build_trading_graph(trading_context)
 
         # 초기 상태가 없으면 생성 (trading_config.yaml에서 자동 로드)
         if current_state is None:
@@ -239,6 +333,22 @@ def run_once():
         }), 500
 
 
+@app.route('/api/kill-switch', methods=['POST'])
+def trigger_kill_switch():
+    """긴급 전량 청산 API (미체결 취소 + 전 종목 시장가 매도, 주문별 결과 반환)"""
+    global kill_switch
+
+    if kill_switch is None:
+        kill_switch = KillSwitch.from_config(
+            trading_config, env_mode=os.getenv('ENV_MODE'), context=trading_context
+        )
+
+    reason = (request.get_json(silent=True) or {}).get('reason', '킬 스위치 (웹)')
+    report = kill_switch.flatten_all(reason)
+    status = 200 if report.error is None else 500
+    return jsonify({"success": report.flat, **report.to_dict()}), status
+
+
 @app.route('/api/reset', methods=['POST'])
 def reset_state():
     """상태 초기화 API"""
@@ -256,8 +366,6 @@ def reset_state():
 
 
 if __name__ == '__main__':
-    import os
-
     host = os.getenv('FLASK_HOST', '0.0.0.0')
     port = int(os.getenv('FLASK_PORT', 5000))
     debug = os.getenv('FLASK_DEBUG', 'True').lower() == 'true'
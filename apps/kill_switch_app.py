@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+긴급 전량 청산 앱 (킬 스위치)
+
+미체결 주문을 모두 취소하고 보유 종목 전부를 시장가로 매도한 뒤 주문별 결과를 출력합니다.
+--pid를 주면 직접 청산하지 않고 실행 중인 봇(daily_breakout_app.py)에 kill_switch.signal
+신호를 보내, 봇이 매매 루프를 멈추고 스스로 청산하게 합니다.
+
+Usage:
+    python apps/kill_switch_app.py --mode demo
+    python apps/kill_switch_app.py --mode real --yes --reason "장애 대응"
+    python apps/kill_switch_app.py --pid 12345
+"""
+
+import sys
+import os
+import argparse
+import signal
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from apps.daily_breakout_app import load_strategy_config, setup_logging
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.kill_switch import KillSwitch
+from skills.trading_core.rate_limit import PriorityRateLimiter
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(
+        description='긴급 전량 청산 (미체결 취소 + 전 종목 시장가 매도)'
+    )
+    parser.add_argument('--mode', choices=['demo', 'real'], default='demo', help='거래 모드')
+    parser.add_argument(
+        '--config', type=str, default='config/trading_config.yaml', help='전략 설정 파일 경로'
+    )
+    parser.add_argument(
+        '--pid', type=int, default=None, help='실행 중인 봇 프로세스에 청산 신호만 전송'
+    )
+    parser.add_argument('--reason', type=str, default='킬 스위치 (CLI)', help='중단 사유')
+    parser.add_argument('--yes', action='store_true', help='실전투자 확인 질문 생략')
+    parser.add_argument(
+        '--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], default='INFO'
+    )
+    args = parser.parse_args()
+
+    logger = setup_logging(args.log_level)
+
+    try:
+        config = load_strategy_config(project_root / args.config)
+
+        if args.pid is not None:
+            signum = getattr(signal, config.get('kill_switch', {}).get('signal', 'SIGUSR1'))
+            os.kill(args.pid, signum)
+            logger.warning(f"PID {args.pid}에 {signal.Signals(signum).name} 전송")
+            return 0
+
+        if args.mode == 'real' and not args.yes:
+            if (
+                input("실전 계좌 전 종목을 시장가로 매도합니다. 계속하려면 'yes' 입력: ").strip()
+                != 'yes'
+            ):
+                logger.info("취소")
+                return 1
+
+        context = TradingContext()
+        if config.get('api', {}).get('rate_limit_enabled', False):
+            context.rate_limiter = PriorityRateLimiter.from_config(config)
+
+        report = KillSwitch.from_config(config, env_mode=args.mode, context=context).flatten_all(
+            args.reason
+        )
+
+        logger.info("=" * 80)
+        logger.info(
+            f"청산 결과: {'완료' if report.flat else '미완료'} ({report.time_to_flat:.2f}초)"
+        )
+        logger.info("=" * 80)
+        for order in report.orders:
+            status = "성공" if order.success else "실패"
+            logger.info(
+                f"  - {order.symbol} {order.kind} {order.qty}주 [{status}] {order.order_no} "
+                f"{order.message} ({order.elapsed:.2f}초)"
+            )
+        if report.error:
+            logger.error(f"청산 중단: {report.error}")
+        return 0 if report.flat else 1
+
+    except KeyboardInterrupt:
+        logger.info("사용자 중단")
+        return 1
+    except Exception as e:
+        logger.error(f"예기치 않은 오류 발생: {e}", exc_info=True)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
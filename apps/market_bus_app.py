@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+시세 버스 게시 앱
+
+활성 종목의 현재가를 이 프로세스 하나만 KIS로 조회해 공유 메모리 시세 버스
+(skills/trading_core/data/market_bus.py)에 게시합니다. 전략 워커(market_bus.enabled),
+섀도 전략, 대시보드(/api/market)는 버스를 읽기만 하므로 프로세스 수와 무관하게
+종목당 조회는 게시 주기마다 1회입니다.
+
+1. 시작 시(그리고 일자가 바뀌면) 종목별 전일 일봉 1회 조회 · 게시
+2. interval초마다 전 종목 현재가 조회 · 게시 (세션 종료 시각까지)
+
+Usage:
+    python apps/market_bus_app.py --mode demo
+    python apps/market_bus_app.py --symbols 069500 229200 --interval 0.5
+"""
+
+import sys
+import argparse
+import logging
+from datetime import time, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from apps.daily_breakout_app import load_enabled_symbols, load_strategy_config, setup_logging
+from skills.trading_core.clock import get_clock
+from skills.trading_core.data.market_bus import MarketBusPublisher
+from skills.trading_core.graph import nodes
+
+SESSION_END = time(15, 30)
+
+
+def publish_prev_bars(
+    publisher: MarketBusPublisher,
+    symbols: List[str],
+    env_mode: str,
+    today: str,
+    logger: logging.Logger,
+) -> int:
+    """
+    종목별 전일 영업일 일봉 게시
+
+    Args:
+        publisher: 시세 버스
+        symbols: 종목 코드 목록
+        env_mode: 실행 모드
+        today: 오늘 (YYYYMMDD)
+        logger: Logger
+
+    Returns:
+        게시한 종목 수
+    """
+    count = 0
+    for symbol in symbols:
+        try:
+            chart = nodes._call_inquire_daily_chart(env_mode, symbol, days=5)
+        except Exception as e:
+            logger.warning(f"[market_bus] {symbol} 일봉 조회 실패: {e}")
+            continue
+        past = [bar for bar in chart if bar['date'] < today]
+        if not past:
+            logger.warning(f"[market_bus] {symbol} 전일 일봉 없음")
+            continue
+        publisher.publish_prev_bar(symbol, past[0])
+        count += 1
+    return count
+
+
+def run_publisher(
+    publisher: MarketBusPublisher,
+    env_mode: str,
+    logger: logging.Logger,
+    interval: float = 1.0,
+    session_end: time = SESSION_END,
+    max_cycles: Optional[int] = None,
+) -> int:
+    """
+    세션 종료까지 현재가 게시 반복
+
+    대기와 시각 판단은 전역 시계를 따르므로 VirtualClock으로 리플레이할 수 있습니다.
+
+    Args:
+        publisher: 시세 버스
+        env_mode: 실행 모드
+        logger: Logger
+        interval: 게시 주기 (초)
+        session_end: 세션 종료 시각
+        max_cycles: 최대 게시 횟수 (None이면 세션 종료까지)
+
+    Returns:
+        게시 횟수
+    """
+    clock = get_clock()
+    symbols = publisher.symbols
+    prev_day: Optional[str] = None
+    failures: Dict[str, int] = {}
+    cycles = 0
+    next_run = clock.now()
+
+    while clock.now().time() < session_end:
+        today = clock.now().strftime('%Y%m%d')
+        if today != prev_day:
+            count = publish_prev_bars(publisher, symbols, env_mode, today, logger)
+            logger.info(f"[market_bus] {today} 전일 일봉 게시: {count}/{len(symbols)}개 종목")
+            prev_day = today
+
+        for symbol in symbols:
+            try:
+                publisher.publish_quote(symbol, nodes._call_inquire_price(env_mode, symbol), today)
+                failures.pop(symbol, None)
+            except Exception as e:
+                failures[symbol] = failures.get(symbol, 0) + 1
+                logger.warning(
+                    f"[market_bus] {symbol} 현재가 조회 실패 ({failures[symbol]}회 연속): {e}"
+                )
+        cycles += 1
+
+        if max_cycles is not None and cycles >= max_cycles:
+            break
+        # 조회 시간이 주기에 누적되지 않도록 예정 시각 기준으로 대기
+        next_run = max(next_run + timedelta(seconds=interval), clock.now())
+        clock.sleep_until(next_run)
+
+    publisher.flush()
+    logger.info(f"[market_bus] 게시 종료: {cycles}회")
+    return cycles
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='공유 메모리 시세 버스 게시')
+    parser.add_argument('--mode', choices=['demo', 'real'], default='demo', help='거래 모드')
+    parser.add_argument(
+        '--config', type=str, default='config/trading_config.yaml', help='전략 설정 파일 경로'
+    )
+    parser.add_argument(
+        '--symbols', nargs='*', default=None, help='종목 코드 (기본: symbols.yaml 활성 종목)'
+    )
+    parser.add_argument(
+        '--interval', type=float, default=None, help='게시 주기 (초, 기본: market_bus.interval)'
+    )
+    parser.add_argument(
+        '--path', type=str, default=None, help='버스 파일 (기본: market_bus.path 또는 /dev/shm)'
+    )
+    parser.add_argument(
+        '--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], default='INFO'
+    )
+    args = parser.parse_args()
+
+    logger = setup_logging(args.log_level)
+
+    try:
+        config = load_strategy_config(project_root / args.config)
+        bus_config = config.get('market_bus', {})
+        symbols = args.symbols or load_enabled_symbols(project_root / 'config' / 'symbols.yaml')
+        if not symbols:
+            logger.error("대상 종목이 없습니다")
+            return 1
+        if not nodes._init_kis_auth(args.mode):
+            logger.error("KIS 인증 실패로 시세를 조회할 수 없습니다")
+            return 1
+
+        # 종목 구성이 같으면 기존 파일에 이어서 써서 읽는 쪽 매핑을 유지
+        publisher = MarketBusPublisher.open(symbols, args.path or bus_config.get('path') or None)
+        run_publisher(
+            publisher,
+            args.mode,
+            logger,
+            interval=args.interval or bus_config.get('interval', 1.0),
+        )
+        return 0
+
+    except KeyboardInterrupt:
+        logger.info("사용자 중단")
+        return 0
+    except Exception as e:
+        logger.error(f"예기치 않은 오류 발생: {e}", exc_info=True)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+장 시작 전 목표가 테이블 게시 앱
+
+1. 활성 종목의 전일 일봉을 HistoryStore에서 지표 엔진으로 로드 (전일 변동폭 · 적응형 k)
+2. 동시호가(08:30~09:00) 동안 예상 체결가로 전 종목 잠정 목표가 · 호가 단위 주문가 ·
+   수량을 한 번에 계산해 data/target_tables 에 게시
+3. 09:00 이후 시가가 확정되는 즉시 예상 체결가와 다른 종목만 다시 계산해 재게시
+
+전략 워커(calculate_target_node)와 대시보드(/api/targets)는 게시된 테이블을 읽습니다.
+
+Usage:
+    python apps/preopen_targets_app.py --mode demo
+    python apps/preopen_targets_app.py --symbols 069500 005930 --timeout 300
+"""
+
+import sys
+import argparse
+import logging
+import time as time_module
+from datetime import datetime, time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from apps.daily_breakout_app import (
+    load_enabled_symbols,
+    load_strategy_config,
+    precompute_daily_tables,
+    setup_logging,
+)
+from skills.trading_core.clock import get_clock
+from skills.trading_core.data.target_table import (
+    build_target_table,
+    finalize_target_table,
+    publish_target_table,
+    wait_for_opens,
+)
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.price import mul_ratio_floor, to_won
+
+MARKET_OPEN = time(9, 0)
+
+
+def run_preopen(
+    config: dict,
+    symbols: list,
+    env_mode: str,
+    logger: logging.Logger,
+    timeout: float = 120.0,
+    poll: float = 1.0,
+    auction_interval: float = 10.0,
+    directory=None,
+    context: Optional[TradingContext] = None,
+) -> np.ndarray:
+    """
+    장 시작 전 목표가 테이블 작업
+
+    1. 지표 엔진 워밍업 (전일 변동폭 · 적응형 k · 변동성 조정 계수)
+    2. 동시호가 동안 예상 체결가로 잠정 목표가/주문가/수량을 계산해 게시
+    3. 09:00 이후 시가가 확정되는 즉시 바뀐 종목만 다시 계산해 재게시
+
+    Args:
+        config: 전략 설정
+        symbols: 종목 코드 목록
+        env_mode: 실행 모드
+        logger: Logger
+        timeout: 시가 확정 최대 대기 (초)
+        poll: 시가 재조회 간격 (초)
+        auction_interval: 예상 체결가 재조회 간격 (초)
+        directory: 테이블 디렉토리 (None이면 data/target_tables)
+        context: 실행 컨텍스트 (지표 엔진 · 적응형 k · 속도 제한기, None이면 새로 생성)
+
+    Returns:
+        최종 테이블 (TARGET_DTYPE)
+    """
+    context = context or TradingContext()
+    precompute_daily_tables(config, symbols, logger, context)
+    clock = get_clock()
+    today = clock.now().strftime('%Y%m%d')
+    open_time = datetime.combine(clock.now().date(), MARKET_OPEN)
+
+    vb = config.get('volatility_breakout', {})
+    static_k = vb.get('k_value', 0.5)
+    k = context.adaptive_k_table.as_dict() if vb.get('k_mode') == 'adaptive' else static_k
+
+    # 종목별 투자 금액 (변동성 조정 계수 반영)
+    trading = config.get('trading', {})
+    capital = to_won(trading.get('capital', 10_000_000))
+    base_ratio = trading.get('position_size', 0.1)
+    adjust = config.get('risk', {}).get('volatility_adjustment', False)
+    budgets = {
+        symbol: mul_ratio_floor(
+            capital,
+            base_ratio
+            * (
+                context.position_sizer.factor(context.indicator_engine, symbol, today)
+                if adjust
+                else 1.0
+            ),
+        )
+        for symbol in symbols
+    }
+
+    def build(opens: dict, provisional: bool):
+        return build_target_table(
+            context.indicator_engine,
+            symbols,
+            opens,
+            k,
+            default_k=static_k,
+            budgets=budgets,
+            provisional=provisional,
+        )
+
+    # 1. 동시호가: 예상 체결가 기준 잠정 테이블
+    table = None
+    while clock.now() < open_time:
+        expected = {}
+        for symbol in symbols:
+            try:
+                expected[symbol] = nodes._call_inquire_expected_price(
+                    env_mode, symbol, context.rate_limiter
+                )['expected_price']
+            except Exception as e:
+                logger.warning(f"{symbol} 예상 체결가 조회 실패: {e}")
+        table = build(expected, provisional=True)
+        publish_target_table(table, today, directory)
+        remaining = (open_time - clock.now()).total_seconds()
+        if remaining > 0:
+            clock.sleep(min(auction_interval, remaining))
+
+    if table is None:
+        table = build({}, provisional=True)
+
+    # 2. 시가 확정 즉시 반영
+    def on_update(confirmed: dict) -> None:
+        nonlocal table
+        started = time_module.perf_counter()
+        table, changed = finalize_target_table(table, confirmed)
+        publish_target_table(table, today, directory)
+        logger.info(
+            f"시가 확정 {len(confirmed)}개 반영 (재계산 {changed}개, "
+            f"{(time_module.perf_counter() - started) * 1000:.2f}ms)"
+        )
+
+    wait_for_opens(
+        lambda symbol: nodes._call_inquire_price(env_mode, symbol, context.rate_limiter)['open'],
+        symbols,
+        timeout=timeout,
+        poll_interval=poll,
+        on_update=on_update,
+    )
+    return table
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='장 시작 전 목표가 테이블 게시')
+    parser.add_argument('--mode', choices=['demo', 'real'], default='demo', help='거래 모드')
+    parser.add_argument(
+        '--config', type=str, default='config/trading_config.yaml', help='전략 설정 파일 경로'
+    )
+    parser.add_argument(
+        '--symbols', nargs='*', default=None, help='종목 코드 (기본: symbols.yaml 활성 종목)'
+    )
+    parser.add_argument('--timeout', type=float, default=120.0, help='시가 확정 최대 대기 (초)')
+    parser.add_argument('--poll', type=float, default=1.0, help='시가 재조회 간격 (초)')
+    parser.add_argument(
+        '--auction-interval', type=float, default=10.0, help='동시호가 예상 체결가 재조회 간격 (초)'
+    )
+    parser.add_argument(
+        '--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], default='INFO'
+    )
+    args = parser.parse_args()
+
+    logger = setup_logging(args.log_level)
+
+    try:
+        config = load_strategy_config(project_root / args.config)
+        symbols = args.symbols or load_enabled_symbols(project_root / 'config' / 'symbols.yaml')
+        if not symbols:
+            logger.error("대상 종목이 없습니다")
+            return 1
+        if not nodes._init_kis_auth(args.mode):
+            logger.error("KIS 인증 실패로 시세를 조회할 수 없습니다")
+            return 1
+
+        table = run_preopen(
+            config,
+            symbols,
+            args.mode,
+            logger,
+            timeout=args.timeout,
+            poll=args.poll,
+            auction_interval=args.auction_interval,
+        )
+        for row in table:
+            logger.info(
+                f"  - {row['symbol'].decode()}: 시가 {row['open']:,}원"
+                f"{' (예상)' if row['provisional'] else ''}, k={row['k']:.3f}, "
+                f"목표가 {row['target']:,}원, 주문가 {row['order_price']:,}원, {row['qty']}주"
+            )
+        return 0
+
+    except Exception as e:
+        logger.error(f"예기치 않은 오류 발생: {e}", exc_info=True)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+"""
+벤치마크 측정 · 기록 · 비교
+
+- measure(): 호출 1회 시간을 반복 측정 (반복당 최소 min_time 초가 되도록 횟수 자동 보정)
+- summarize(): 시간이 아닌 지표(반납 비율 등) 표본을 같은 형식으로 요약 (unit으로 구분)
+- append_history() / load_history(): 실행 결과를 JSONL 한 줄씩 누적
+- compare(): 두 실행의 중앙값을 비교해 threshold 이상 느려진 항목을 회귀로 표시
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+project_root = Path(__file__).parent.parent
+
+DEFAULT_HISTORY = project_root / "benchmarks" / "results" / "history.jsonl"
+
+
+def measure(
+    func: Callable[[], object],
+    repeat: int = 5,
+    min_time: float = 0.05,
+    number: Optional[int] = None,
+) -> Dict[str, float]:
+    """
+    호출당 실행 시간 측정
+
+    Args:
+        func: 측정할 인자 없는 함수
+        repeat: 반복 측정 횟수
+        min_time: 반복 1회 최소 측정 시간 (초, number 자동 보정용)
+        number: 반복 1회당 호출 횟수 (None이면 자동)
+
+    Returns:
+        {'min', 'median', 'mean', 'stdev'} (초/호출) 및 'number', 'repeat'
+    """
+    if number is None:
+        number = 1
+        while True:
+            started = time.perf_counter()
+            for _ in range(number):
+                func()
+            if time.perf_counter() - started >= min_time or number >= 1_000_000:
+                break
+            number *= 10
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - started) / number)
+
+    return summarize(samples, number=number, repeat=repeat)
+
+
+def summarize(samples: List[float], unit: Optional[str] = None, **extra) -> Dict[str, float]:
+    """
+    표본 요약 (값이 클수록 나쁜 지표여야 compare의 회귀 판정이 맞음)
+
+    Args:
+        samples: 표본 값
+        unit: 단위 (None이면 초, "ratio"면 비율)
+        **extra: 결과에 함께 기록할 값
+
+    Returns:
+        {'min', 'median', 'mean', 'stdev'} 및 extra (unit 지정 시 'unit')
+    """
+    result = {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        **extra,
+    }
+    if unit is not None:
+        result["unit"] = unit
+    return result
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        ).stdout.strip()
+    except Exception:
+        return ""
+
+
+def make_record(results: Dict[str, Dict[str, float]], label: str = "") -> Dict:
+    """실행 결과 기록 생성 (환경 정보 포함)"""
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "label": label,
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def append_history(record: Dict, path: Union[str, Path] = DEFAULT_HISTORY) -> Path:
+    """기록 파일에 한 줄 추가"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return path
+
+
+def load_history(path: Union[str, Path] = DEFAULT_HISTORY) -> List[Dict]:
+    """기록 파일 전체 로드 (오래된 순)"""
+    path = Path(path)
+    if not path.exists():
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find_record(history: List[Dict], ref: str) -> Dict:
+    """
+    기록 선택
+
+    Args:
+        history: load_history() 결과
+        ref: 음수/양수 인덱스("-2"), 라벨, 또는 git 커밋 접두어
+
+    Raises:
+        LookupError: 일치하는 기록이 없는 경우
+    """
+    try:
+        return history[int(ref)]
+    except ValueError:
+        pass
+    except IndexError:
+        raise LookupError(f"기록 인덱스 범위 초과: {ref} (총 {len(history)}개)")
+
+    for record in reversed(history):
+        if record.get("label") == ref or (ref and record.get("git_commit", "").startswith(ref)):
+            return record
+    raise LookupError(f"일치하는 기록이 없습니다: {ref}")
+
+
+def compare(
+    baseline: Dict, current: Dict, threshold: float = 0.10, stat: str = "median"
+) -> List[Dict]:
+    """
+    두 실행 비교
+
+    Args:
+        baseline: 기준 기록
+        current: 비교 기록
+        threshold: 회귀 판정 비율 (0.10 = 10% 이상 느려지면 회귀)
+        stat: 비교할 통계 (median | min | mean)
+
+    Returns:
+        [{'name', 'baseline', 'current', 'change', 'status', 'unit'}]
+        (status: regression | improved | ok | new | removed)
+    """
+    rows = []
+    base_results = baseline["results"]
+    cur_results = current["results"]
+
+    for name in sorted(set(base_results) | set(cur_results)):
+        if name not in base_results:
+            rows.append(
+                {
+                    "name": name,
+                    "baseline": None,
+                    "current": cur_results[name][stat],
+                    "change": None,
+                    "status": "new",
+                    "unit": cur_results[name].get("unit"),
+                }
+            )
+            continue
+        if name not in cur_results:
+            rows.append(
+                {
+                    "name": name,
+                    "baseline": base_results[name][stat],
+                    "current": None,
+                    "change": None,
+                    "status": "removed",
+                    "unit": base_results[name].get("unit"),
+                }
+            )
+            continue
+
+        before = base_results[name][stat]
+        after = cur_results[name][stat]
+        change = after / before - 1 if before > 0 else 0.0
+        if change > threshold:
+            status = "regression"
+        elif change < -threshold:
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append(
+            {
+                "name": name,
+                "baseline": before,
+                "current": after,
+                "change": change,
+                "status": status,
+                "unit": cur_results[name].get("unit"),
+            }
+        )
+
+    return rows
+
+
+def format_seconds(value: Optional[float]) -> str:
+    """사람이 읽기 쉬운 시간 단위"""
+    if value is None:
+        return "-"
+    if value >= 1:
+        return f"{value:.3f} s"
+    if value >= 1e-3:
+        return f"{value * 1e3:.3f} ms"
+    return f"{value * 1e6:.2f} µs"
+
+
+def format_value(value: Optional[float], unit: Optional[str] = None) -> str:
+    """단위별 표시 (None이면 시간)"""
+    if unit == "ratio" and value is not None:
+        return f"{value * 100:.3f} %"
+    return format_seconds(value)
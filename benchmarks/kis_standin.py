@@ -0,0 +1,438 @@
+"""
+KIS API 오프라인 대역 (stand-in)
+
+lib/kis/kis_auth 모듈의 인터페이스(auth, _TRENV, _url_fetch)를 흉내 내어
+네트워크 없이 nodes.py의 실제 _call_* 함수 경로를 그대로 실행합니다.
+벤치마크와 오프라인 리플레이에서 사용합니다.
+
+- 현재가: 종목별 시드 고정 랜덤워크 (조회할 때마다 한 틱 진행)
+- 예상 체결가: 첫 시세 조회 전에는 당일 시가, 이후에는 현재가
+- 일봉: 시계(get_clock) 기준 영업일 역순으로 생성
+- 주문: 지정가로 즉시 전량 체결, 예수금/보유 수량 반영
+  (fill_orders=False면 미체결로 남기고 매수 금액 · 매도 수량만 묶어 둠)
+- 미체결 조회 · 취소: inquire-daily-ccld(미체결만) / order-rvsecncl(전량 취소)
+- 잔고: 보유 종목(output1)과 총평가(output2) 반환, output1은 page_size 종목씩 연속 조회
+  (응답 헤더 tr_cont M: 다음 페이지 있음 / D: 마지막, ctx_area_nk100에 다음 시작 위치)
+- 속도 제한: rate_limit을 주면 최근 1초 호출이 그 수에 이르면 EGW00201로 거절
+- 여러 스레드에서 동시에 호출해도 되며, 지연(latency)은 호출끼리 겹침
+
+사용 예:
+    from benchmarks.kis_standin import KISStandIn
+
+    with KISStandIn(seed=0).install():
+        graph.invoke(state)
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, Optional
+
+from skills.trading_core.clock import get_clock
+
+
+class StandInResponse:
+    """kis_auth.APIResp와 같은 메서드를 제공하는 응답 객체"""
+
+    def __init__(self, body: Dict[str, Any], tr_cont: str = ""):
+        self._body = SimpleNamespace(**body)
+        self._header = SimpleNamespace(tr_cont=tr_cont)
+
+    def isOK(self) -> bool:
+        return self._body.rt_cd == "0"
+
+    def getBody(self) -> SimpleNamespace:
+        return self._body
+
+    def getHeader(self) -> SimpleNamespace:
+        return self._header
+
+    def getResCode(self) -> int:
+        return 200
+
+    def getErrorCode(self) -> str:
+        return self._body.msg_cd
+
+    def getErrorMessage(self) -> str:
+        return self._body.msg1
+
+    def printError(self, url: str = "") -> None:
+        print(f"-------------------------------\nError in response: {self._body.msg_cd} url={url}")
+        print(
+            f"rt_cd : {self._body.rt_cd} / msg_cd : {self._body.msg_cd} / msg1 : {self._body.msg1}"
+        )
+
+
+class KISStandIn:
+    """kis_auth 모듈 대역"""
+
+    def __init__(
+        self,
+        seed: int = 0,
+        base_price: float = 30000.0,
+        cash: float = 10_000_000.0,
+        volatility: float = 0.001,
+        latency: float = 0.0,
+        page_size: int = 20,
+        fill_orders: bool = True,
+        rate_limit: Optional[int] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            seed: 랜덤워크 시드 (같은 시드면 같은 시세)
+            base_price: 종목별 시작 가격
+            cash: 초기 예수금
+            volatility: 조회 1회당 가격 변동 표준편차 (비율)
+            latency: 호출당 인위적 지연 (초, 네트워크 흉내)
+            page_size: 잔고 · 미체결 조회 output1 한 페이지 행 수
+            fill_orders: False면 주문을 체결하지 않고 미체결(open_orders)로 남김
+            rate_limit: 초당 최대 호출 수 (None이면 제한 없음)
+        """
+        self.seed = seed
+        self.base_price = base_price
+        self.volatility = volatility
+        self.latency = latency
+        self.page_size = page_size
+        self.fill_orders = fill_orders
+        self.rate_limit = rate_limit
+        self.cash = float(cash)
+        self._TRENV = SimpleNamespace(my_acct="00000000", my_prod="01", my_htsid="standin")
+        self.holdings: Dict[str, Dict[str, float]] = {}
+        self.orders: list = []
+        self.open_orders: Dict[str, Dict[str, Any]] = {}  # 주문번호 → 미체결 주문
+        self.cancels: list = []
+        self.calls = 0
+        self.rejected = 0  # 속도 제한 거절 수
+        self._call_times: deque = deque()
+        self._order_seq = 0
+        self._lock = threading.Lock()
+        self._quotes: Dict[str, Dict[str, float]] = {}
+        self._opens: Dict[str, float] = {}
+        self._rngs: Dict[str, random.Random] = {}
+
+    # ========== kis_auth 인터페이스 ==========
+
+    def auth(self, svr: str = "prod", product: str = "01", url: Optional[str] = None) -> None:
+        """인증 (항상 성공)"""
+
+    def _url_fetch(
+        self,
+        api_url: str,
+        ptr_id: str,
+        tr_cont: str,
+        params: Dict[str, Any],
+        appendHeaders: Optional[Dict[str, str]] = None,
+        postFlag: bool = False,
+        hashFlag: bool = True,
+    ) -> StandInResponse:
+        """KIS REST 호출 대역"""
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.calls += 1
+            if self._rate_limited():
+                self.rejected += 1
+                return self._error("EGW00201", "초당 거래건수를 초과하였습니다.")
+            return self._dispatch(api_url, ptr_id, tr_cont, params)
+
+    # ========== 내부 구현 ==========
+
+    def _rate_limited(self) -> bool:
+        """최근 1초 호출 수가 rate_limit에 이르렀는지 (거절된 호출은 세지 않음)"""
+        if self.rate_limit is None:
+            return False
+        now = time.monotonic()
+        while self._call_times and now - self._call_times[0] >= 1.0:
+            self._call_times.popleft()
+        if len(self._call_times) >= self.rate_limit:
+            return True
+        self._call_times.append(now)
+        return False
+
+    def _dispatch(
+        self, api_url: str, ptr_id: str, tr_cont: str, params: Dict[str, Any]
+    ) -> StandInResponse:
+        if api_url.endswith("/quotations/inquire-price"):
+            return self._ok(output=self._price_output(params["FID_INPUT_ISCD"]))
+        if api_url.endswith("/quotations/inquire-asking-price-exp-ccn"):
+            return self._ok(output1={}, output2=self._expected_output(params["FID_INPUT_ISCD"]))
+        if api_url.endswith("/quotations/inquire-daily-itemchartprice"):
+            return self._ok(output2=self._daily_output(params))
+        if api_url.endswith("/trading/order-cash"):
+            return self._order(ptr_id, params)
+        if api_url.endswith("/trading/inquire-balance"):
+            return self._balance(tr_cont, params)
+        if api_url.endswith("/trading/inquire-daily-ccld"):
+            return self._open_orders_page(tr_cont, params)
+        if api_url.endswith("/trading/order-rvsecncl"):
+            return self._cancel(params)
+
+        return self._error("EGW00000", f"대역 미지원 API: {api_url}")
+
+    @staticmethod
+    def _ok(**outputs) -> StandInResponse:
+        return StandInResponse(
+            {"rt_cd": "0", "msg_cd": "MCA00000", "msg1": "정상처리 되었습니다.", **outputs}
+        )
+
+    @staticmethod
+    def _error(msg_cd: str, msg1: str) -> StandInResponse:
+        return StandInResponse({"rt_cd": "1", "msg_cd": msg_cd, "msg1": msg1})
+
+    def _rng(self, symbol: str) -> random.Random:
+        rng = self._rngs.get(symbol)
+        if rng is None:
+            rng = random.Random(f"{self.seed}:{symbol}")
+            self._rngs[symbol] = rng
+        return rng
+
+    def _planned_open(self, symbol: str) -> float:
+        """당일 시가 (첫 시세 조회 전에도 동시호가 예상 체결가로 쓰이도록 미리 결정)"""
+        open_ = self._opens.get(symbol)
+        if open_ is None:
+            open_ = self.base_price * (1 + self._rng(symbol).uniform(-0.01, 0.01))
+            self._opens[symbol] = open_
+        return open_
+
+    def _quote(self, symbol: str) -> Dict[str, float]:
+        """종목 시세를 한 틱 진행"""
+        rng = self._rng(symbol)
+        quote = self._quotes.get(symbol)
+        if quote is None:
+            open_ = self._planned_open(symbol)
+            quote = {"open": open_, "high": open_, "low": open_, "price": open_, "volume": 0}
+            self._quotes[symbol] = quote
+
+        price = quote["price"] * (1 + rng.gauss(0.0, self.volatility))
+        quote["price"] = price
+        quote["high"] = max(quote["high"], price)
+        quote["low"] = min(quote["low"], price)
+        quote["volume"] += rng.randint(100, 5000)
+        return quote
+
+    def _price_output(self, symbol: str) -> Dict[str, str]:
+        quote = self._quote(symbol)
+        prev_close = self.base_price
+        change = quote["price"] - prev_close
+        return {
+            "stck_prpr": f"{quote['price']:.0f}",
+            "stck_oprc": f"{quote['open']:.0f}",
+            "stck_hgpr": f"{quote['high']:.0f}",
+            "stck_lwpr": f"{quote['low']:.0f}",
+            "acml_vol": str(int(quote["volume"])),
+            "prdy_vrss": f"{change:.0f}",
+            "prdy_ctrt": f"{change / prev_close * 100:.2f}",
+        }
+
+    def _expected_output(self, symbol: str) -> Dict[str, str]:
+        """동시호가 예상 체결가 (장 시작 전에는 당일 시가, 이후에는 현재가)"""
+        quote = self._quotes.get(symbol)
+        price = quote["price"] if quote is not None else self._planned_open(symbol)
+        return {
+            "antc_cnpr": f"{price:.0f}",
+            "antc_vol": str(random.Random(f"{self.seed}:{symbol}:auction").randint(1_000, 50_000)),
+        }
+
+    def _daily_output(self, params: Dict[str, str]) -> list:
+        """기준일부터 영업일 역순 일봉 (최신순)"""
+        symbol = params["FID_INPUT_ISCD"]
+        rng = random.Random(f"{self.seed}:{symbol}:daily")
+        day = get_clock().now().date()
+        rows = []
+        close = self.base_price
+        while len(rows) < 30:
+            if day.weekday() < 5:
+                open_ = close * (1 + rng.uniform(-0.01, 0.01))
+                high = max(open_, close) * (1 + rng.uniform(0, 0.02))
+                low = min(open_, close) * (1 - rng.uniform(0, 0.02))
+                rows.append(
+                    {
+                        "stck_bsop_date": day.strftime("%Y%m%d"),
+                        "stck_oprc": f"{open_:.0f}",
+                        "stck_hgpr": f"{high:.0f}",
+                        "stck_lwpr": f"{low:.0f}",
+                        "stck_clpr": f"{close:.0f}",
+                        "acml_vol": str(rng.randint(100_000, 1_000_000)),
+                    }
+                )
+                close = open_ * (1 + rng.uniform(-0.01, 0.01))
+            day -= timedelta(days=1)
+        return rows
+
+    def _order(self, tr_id: str, params: Dict[str, str]) -> StandInResponse:
+        """지정가 즉시 체결"""
+        symbol = params["PDNO"]
+        qty = int(params["ORD_QTY"])
+        price = float(params["ORD_UNPR"]) or self._quotes.get(symbol, {}).get(
+            "price", self.base_price
+        )
+        is_buy = tr_id.endswith("0012U")
+        holding = self.holdings.setdefault(symbol, {"qty": 0, "avg_price": 0.0})
+
+        if qty <= 0:
+            return self._error("APBK0918", "주문수량을 확인하세요.")
+        if not self.fill_orders:
+            return self._rest(symbol, is_buy, qty, price, holding)
+        if is_buy:
+            if price * qty > self.cash:
+                return self._error("APBK0952", "주문가능금액을 초과 했습니다.")
+            total_cost = holding["avg_price"] * holding["qty"] + price * qty
+            holding["qty"] += qty
+            holding["avg_price"] = total_cost / holding["qty"]
+            self.cash -= price * qty
+        else:
+            if qty > holding["qty"] - holding.get("reserved", 0):
+                return self._error("APBK0400", "주문 가능한 수량을 초과하였습니다.")
+            holding["qty"] -= qty
+            self.cash += price * qty
+
+        order_no = self._next_order_no()
+        self.orders.append(
+            {
+                "order_no": order_no,
+                "symbol": symbol,
+                "side": "buy" if is_buy else "sell",
+                "qty": qty,
+                "price": price,
+                "time": get_clock().now(),
+            }
+        )
+        return self._order_ok(order_no)
+
+    def _next_order_no(self) -> str:
+        self._order_seq += 1
+        return f"{self._order_seq:010d}"
+
+    def _order_ok(self, order_no: str) -> StandInResponse:
+        return self._ok(
+            output={
+                "KRX_FWDG_ORD_ORGNO": "00950",
+                "ODNO": order_no,
+                "ORD_TMD": get_clock().now().strftime("%H%M%S"),
+            }
+        )
+
+    def _rest(
+        self, symbol: str, is_buy: bool, qty: int, price: float, holding: Dict[str, float]
+    ) -> StandInResponse:
+        """미체결 주문 접수 (매수 금액 · 매도 수량을 취소될 때까지 묶어 둠)"""
+        if is_buy:
+            if price * qty > self.cash:
+                return self._error("APBK0952", "주문가능금액을 초과 했습니다.")
+            self.cash -= price * qty
+        else:
+            if qty > holding["qty"] - holding.get("reserved", 0):
+                return self._error("APBK0400", "주문 가능한 수량을 초과하였습니다.")
+            holding["reserved"] = holding.get("reserved", 0) + qty
+        order_no = self._next_order_no()
+        self.open_orders[order_no] = {
+            "symbol": symbol,
+            "side": "buy" if is_buy else "sell",
+            "qty": qty,
+            "price": price,
+        }
+        return self._order_ok(order_no)
+
+    def _cancel(self, params: Dict[str, str]) -> StandInResponse:
+        """미체결 주문 전량 취소 (묶어 둔 금액 · 수량 해제)"""
+        order = self.open_orders.pop(params["ORGN_ODNO"], None)
+        if order is None:
+            return self._error("APBK0913", "취소 가능한 주문이 없습니다.")
+        if order["side"] == "buy":
+            self.cash += order["price"] * order["qty"]
+        else:
+            self.holdings[order["symbol"]]["reserved"] -= order["qty"]
+        self.cancels.append(params["ORGN_ODNO"])
+        return self._order_ok(self._next_order_no())
+
+    def _page(self, rows: list, tr_cont: str, params: Dict[str, str], **outputs) -> StandInResponse:
+        """CTX_AREA_NK100 위치부터 page_size 행 (다음 페이지 있으면 tr_cont M, 마지막이면 D)"""
+        start = int(params.get("CTX_AREA_NK100") or 0) if tr_cont == "N" else 0
+        end = start + self.page_size
+        response = self._ok(
+            output1=rows[start:end],
+            **outputs,
+            ctx_area_fk100=params.get("CANO", ""),
+            ctx_area_nk100=str(end) if end < len(rows) else "",
+        )
+        response._header.tr_cont = "M" if end < len(rows) else "D"
+        return response
+
+    def _open_orders_page(self, tr_cont: str, params: Dict[str, str]) -> StandInResponse:
+        """미체결 주문 (주문번호순)"""
+        rows = [
+            {
+                "odno": order_no,
+                "ord_gno_brno": "00950",
+                "pdno": order["symbol"],
+                "sll_buy_dvsn_cd": "02" if order["side"] == "buy" else "01",
+                "ord_qty": str(order["qty"]),
+                "ord_unpr": f"{order['price']:.0f}",
+                "tot_ccld_qty": "0",
+                "rmn_qty": str(order["qty"]),
+            }
+            for order_no, order in sorted(self.open_orders.items())
+        ]
+        return self._page(rows, tr_cont, params, output2={})
+
+    def _balance(self, tr_cont: str, params: Dict[str, str]) -> StandInResponse:
+        """잔고 (output1은 CTX_AREA_NK100 위치부터 page_size 종목, output2는 매 페이지 동일)"""
+        output1 = []
+        eval_total = 0.0
+        for symbol, holding in self.holdings.items():
+            if holding["qty"] <= 0:
+                continue
+            price = self._quotes.get(symbol, {}).get("price", holding["avg_price"])
+            eval_amt = price * holding["qty"]
+            eval_total += eval_amt
+            output1.append(
+                {
+                    "pdno": symbol,
+                    "hldg_qty": str(holding["qty"]),
+                    "ord_psbl_qty": str(holding["qty"] - holding.get("reserved", 0)),
+                    "pchs_avg_pric": f"{holding['avg_price']:.2f}",
+                    "prpr": f"{price:.0f}",
+                    "evlu_amt": f"{eval_amt:.0f}",
+                }
+            )
+        output2 = [
+            {
+                "dnca_tot_amt": f"{self.cash:.0f}",
+                "scts_evlu_amt": f"{eval_total:.0f}",
+                "tot_evlu_amt": f"{self.cash + eval_total:.0f}",
+            }
+        ]
+        return self._page(output1, tr_cont, params, output2=output2)
+
+    # ========== 설치 ==========
+
+    @contextmanager
+    def install(self, nodes_module: Any = None) -> Iterator["KISStandIn"]:
+        """
+        nodes 모듈의 ka / KIS_AVAILABLE을 대역으로 교체 (블록 종료 시 복원)
+
+        Args:
+            nodes_module: 교체 대상 모듈 (None이면 skills.trading_core.graph.nodes)
+        """
+        if nodes_module is None:
+            from skills.trading_core.graph import nodes as nodes_module
+
+        missing = object()
+        previous_ka = getattr(nodes_module, "ka", missing)
+        previous_available = nodes_module.KIS_AVAILABLE
+        nodes_module.ka = self
+        nodes_module.KIS_AVAILABLE = True
+        try:
+            yield self
+        finally:
+            nodes_module.KIS_AVAILABLE = previous_available
+            if previous_ka is missing:
+                del nodes_module.ka
+            else:
+                nodes_module.ka = previous_ka
@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+성능 벤치마크
+
+KIS 대역(benchmarks/kis_standin.py)을 설치하고 오프라인으로 측정합니다.
+측정 대상: 호가 단위 조정, BreakoutStrategy 메서드, nodes.py 각 노드,
+그래프 빌드, build_trading_graph().invoke 1회, 1,000회 연속 실행,
+트레일링 스탑 감시기 틱 처리 · 청산 지연(틱 수신 → 청산 그래프 매도 완료),
+공유 메모리 시세 버스 읽기 · 버스 경유 fetch_market_data 노드.
+시간 외 지표로 트레일링 스탑 반납 비율(구간 최고가 대비 청산가, 틱 감시 vs 주기 폴링)과
+킬 스위치 전량 청산 소요 시간(초당 호출 한도가 있는 대역, 20종목)을 기록합니다.
+
+결과는 benchmarks/results/history.jsonl 에 한 줄씩 누적되며,
+compare 명령으로 두 실행을 비교해 임계값 이상 느려진 항목을 회귀로 표시합니다.
+
+Usage:
+    python benchmarks/run_benchmarks.py run
+    python benchmarks/run_benchmarks.py run --filter node. --quick
+    python benchmarks/run_benchmarks.py compare                  # 직전 실행 vs 최신 실행
+    python benchmarks/run_benchmarks.py compare --baseline v1.0 --threshold 0.15
+    python benchmarks/run_benchmarks.py list
+"""
+
+import argparse
+import sys
+import tempfile
+from datetime import datetime, time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "config"))
+
+from benchmarks.harness import (
+    DEFAULT_HISTORY,
+    append_history,
+    compare,
+    find_record,
+    format_value,
+    load_history,
+    make_record,
+    measure,
+    summarize,
+)
+from benchmarks.kis_standin import KISStandIn
+from skills.trading_core.account import AccountModel
+from skills.trading_core.clock import FixedClock, VirtualClock, use_clock
+from skills.trading_core.data.market_bus import MarketBus, MarketBusPublisher
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.graph.graph_builder import (
+    build_exit_graph,
+    build_trading_graph,
+    execute_trailing_exit,
+)
+from skills.trading_core.graph.state import create_initial_state
+from skills.trading_core.kill_switch import KillSwitch
+from skills.trading_core.rate_limit import PriorityRateLimiter
+from skills.trading_core.scheduler import TradingScheduler
+from skills.trading_core.strategies.breakout_etf import BreakoutStrategy
+from skills.trading_core.strategies.trailing_stop import TrailingStopWatcher
+import numpy as np
+from tick_size import adjust_price_to_tick, adjust_prices_to_tick
+
+# 장중 평일 고정 시각 (진입 가능 시간대)
+BENCH_TIME = datetime(2025, 1, 6, 10, 0)
+SYMBOL = "069500"
+
+# (이름, 준비 함수) — 준비 함수는 (측정 함수, 고정 호출 횟수 또는 None)을 반환
+Case = Tuple[str, Callable[[], Tuple[Callable[[], object], Optional[int]]]]
+
+
+def _market_state() -> dict:
+    """시세/목표가가 채워진 상태"""
+    state = create_initial_state(symbol=SYMBOL, initial_capital=10_000_000, env_mode="demo")
+    state.update(nodes.fetch_market_data_node(state))
+    state.update(nodes.calculate_target_node(state))
+    return state
+
+
+def _tick_case():
+    prices = [1000 + i * 137.3 for i in range(1000)]
+
+    def run():
+        for price in prices:
+            adjust_price_to_tick(price)
+
+    return run, None
+
+
+def _tick_array_case():
+    prices = np.array([1000 + i * 137.3 for i in range(1000)])
+    return (lambda: adjust_prices_to_tick(prices)), None
+
+
+def _strategy_cases() -> List[Case]:
+    strategy = BreakoutStrategy()
+    return [
+        (
+            "strategy.calculate_target_price",
+            lambda: (lambda: strategy.calculate_target_price(30000, 30500, 29500, 0.5), None),
+        ),
+        (
+            "strategy.should_enter",
+            lambda: (lambda: strategy.should_enter(30600, 30500, current_time=BENCH_TIME), None),
+        ),
+        (
+            "strategy.should_exit",
+            lambda: (
+                lambda: strategy.should_exit(30000, 30400, -0.03, 0.05, current_time=BENCH_TIME),
+                None,
+            ),
+        ),
+        (
+            "strategy.calculate_position_size",
+            lambda: (lambda: strategy.calculate_position_size(10_000_000, 30000, 0.1), None),
+        ),
+    ]
+
+
+def _node_case(node: Callable, prepare: Optional[Callable[[dict], None]] = None):
+    def setup():
+        state = _market_state()
+        if prepare is not None:
+            prepare(state)
+        return (lambda: node(state)), None
+
+    return setup
+
+
+def _buy_signal(state: dict) -> None:
+    state.update({"should_buy": True, "order_qty": 1})
+
+
+def _in_position(state: dict) -> None:
+    state.update(
+        {
+            "position_status": "IN_POSITION",
+            "entry_price": state["current_price"],
+            "position_qty": 10,
+            "highest_price": state["current_price"],
+            "lowest_price": state["current_price"],
+        }
+    )
+
+
+def _graph_invoke_case():
+    graph = build_trading_graph()
+    state = create_initial_state(symbol=SYMBOL, initial_capital=10_000_000, env_mode="demo")
+    return (lambda: graph.invoke(state)), None
+
+
+def _continuous_case():
+    graph = build_trading_graph()
+
+    def run():
+        clock = VirtualClock(datetime.combine(BENCH_TIME.date(), time(9, 0)))
+        with use_clock(clock):
+            state = create_initial_state(symbol=SYMBOL, initial_capital=10_000_000, env_mode="demo")
+        scheduler = TradingScheduler(graph, clock=clock, interval_seconds=1, max_iterations=1000)
+        scheduler.run(state)
+
+    return run, 1
+
+
+def _trailing_tick_case():
+    """청산 없이 최고가 갱신/유지가 섞인 틱 1,000개"""
+    watcher = TrailingStopWatcher(pct=0.02)
+    watcher.arm(SYMBOL, 30000, 10)
+    prices = [30000 + (i % 50) for i in range(1000)]
+
+    def run():
+        for price in prices:
+            watcher.on_tick(SYMBOL, price)
+
+    return run, None
+
+
+def _trailing_exit_case():
+    """청산 틱 수신부터 청산 그래프 매도 완료까지"""
+    graph = build_exit_graph()
+    state = _market_state()
+    _in_position(state)
+    entry = state["current_price"]
+    # 반복 매도가 거절되지 않도록 보유 수량 확보
+    nodes._call_order_cash("demo", "buy", SYMBOL, qty=10**9, price=entry)
+    watcher = TrailingStopWatcher(
+        pct=0.02, on_exit=lambda signal: execute_trailing_exit(graph, state, signal)
+    )
+
+    def run():
+        watcher.arm(SYMBOL, entry, state["position_qty"], highest_price=entry + entry // 20)
+        watcher.on_tick(SYMBOL, entry)
+
+    return run, None
+
+
+def _bus(symbols: List[str]) -> MarketBus:
+    """대역 시세를 한 번 게시한 임시 시세 버스"""
+    path = Path(tempfile.mkdtemp(prefix="bench_bus_")) / "market_bus.npy"
+    publisher = MarketBusPublisher(symbols, path)
+    today = BENCH_TIME.strftime("%Y%m%d")
+    for symbol in symbols:
+        chart = nodes._call_inquire_daily_chart("demo", symbol, days=5)
+        publisher.publish_prev_bar(symbol, next(bar for bar in chart if bar["date"] < today))
+        publisher.publish_quote(symbol, nodes._call_inquire_price("demo", symbol), today)
+    return MarketBus(path)
+
+
+def _bus_read_case():
+    """종목 100개 버스에서 seqlock 읽기 1,000회"""
+    symbols = [f"{900000 + i}" for i in range(100)]
+    bus = _bus(symbols)
+
+    def run():
+        for i in range(1000):
+            bus.read(symbols[i % 100])
+
+    return run, None
+
+
+def _bus_fetch_case():
+    """게시된 시세로 fetch_market_data (KIS 호출 없음)"""
+    context = TradingContext(market_bus=_bus([SYMBOL]))
+    state = create_initial_state(symbol=SYMBOL, initial_capital=10_000_000, env_mode="demo")
+
+    def run():
+        return nodes.fetch_market_data_node(state, context)
+
+    return run, None
+
+
+def _account_local_case():
+    """로컬 계좌 모델로 update_account (대사 후 잔고 조회 없음)"""
+    model = AccountModel(reconcile_interval=1e9)
+    state = _market_state()
+    model.reconcile(*nodes._call_inquire_balance("demo"))
+    context = TradingContext(account_model=model)
+
+    def run():
+        return nodes.update_account_node(state, context)
+
+    return run, None
+
+
+def trailing_giveback(
+    mode: str = "pct", every: int = 1, paths: int = 200, ticks: int = 3000, seed: int = 0
+) -> Dict[str, float]:
+    """
+    트레일링 스탑 반납 비율
+
+    난수 경로마다 첫 틱에 진입해 every틱마다 감시기에 넣고, 청산 시점까지의 실제
+    최고가 대비 청산가 비율을 표본으로 모읍니다 (청산 없으면 마지막 틱 기준).
+
+    Args:
+        mode: 트레일링 방식 (pct | atr, ATR은 300원 고정)
+        every: 감시 간격 (틱, 1이면 모든 틱)
+        paths: 경로 수
+        ticks: 경로당 틱 수
+        seed: 난수 시드
+
+    Returns:
+        summarize() 결과 (unit: ratio)
+    """
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(0.00002, 0.001, (paths, ticks))
+    prices = np.rint(30000 * np.exp(np.cumsum(steps, axis=1))).astype(np.int64)
+    watcher = TrailingStopWatcher(mode=mode, pct=0.02, atr_multiplier=2.0)
+
+    samples = []
+    for path in prices:
+        watcher.arm(SYMBOL, int(path[0]), 1, atr=300.0)
+        exit_index = len(path) - 1
+        for i in range(0, len(path), every):
+            if watcher.on_tick(SYMBOL, int(path[i])) is not None:
+                exit_index = i
+                break
+        watcher.disarm(SYMBOL)
+        highest = int(path[: exit_index + 1].max())
+        samples.append((highest - int(path[exit_index])) / highest)
+    return summarize(samples, unit="ratio", paths=paths, ticks=ticks)
+
+
+def kill_switch_time_to_flat(
+    positions: int = 20,
+    open_orders: int = 5,
+    rate_limit: int = 20,
+    latency: float = 0.05,
+    runs: int = 3,
+) -> Dict[str, float]:
+    """
+    킬 스위치 전량 청산 소요 시간 (미체결 취소 + 보유 종목 시장가 매도)
+
+    대역은 초당 rate_limit회를 넘는 호출을 EGW00201로 거절하고, 속도 제한기는
+    그보다 10% 낮은 속도로 호출을 내보냅니다.
+
+    Args:
+        positions: 보유 종목 수
+        open_orders: 미체결 매도 주문 수 (보유 종목 일부)
+        rate_limit: 대역 초당 호출 한도
+        latency: 호출당 지연 (초)
+        runs: 측정 횟수
+
+    Returns:
+        summarize() 결과 (초)
+    """
+    samples = []
+    rejected = 0
+    for _ in range(runs):
+        standin = KISStandIn(seed=0, latency=latency, fill_orders=False, rate_limit=rate_limit)
+        for i in range(positions):
+            standin.holdings[f"{i:06d}"] = {"qty": 10, "avg_price": 30_000.0}
+        with standin.install(nodes):
+            for i in range(open_orders):
+                nodes._call_order_cash("demo", "sell", f"{i:06d}", 5, 31_000)
+            standin.fill_orders = True
+            context = TradingContext(rate_limiter=PriorityRateLimiter(rate_limit * 0.9))
+            report = KillSwitch(max_workers=8, context=context).flatten_all("벤치마크")
+        assert report.flat and not any(h["qty"] for h in standin.holdings.values())
+        samples.append(report.time_to_flat)
+        rejected += standin.rejected
+    return summarize(samples, positions=positions, rate_limit=rate_limit, rejected=rejected)
+
+
+CASES: List[Case] = [
+    ("tick.adjust_price_to_tick_x1000", _tick_case),
+    ("tick.adjust_prices_to_tick_x1000", _tick_array_case),
+    *_strategy_cases(),
+    ("node.fetch_market_data", _node_case(nodes.fetch_market_data_node)),
+    ("node.fetch_market_data_bus", _bus_fetch_case),
+    ("node.calculate_target", _node_case(nodes.calculate_target_node)),
+    ("node.generate_signal", _node_case(nodes.generate_signal_node)),
+    ("node.risk_check", _node_case(nodes.risk_check_node, _buy_signal)),
+    ("node.execute_order", _node_case(nodes.execute_order_node, _buy_signal)),
+    ("node.monitor_position", _node_case(nodes.monitor_position_node, _in_position)),
+    ("node.update_account", _node_case(nodes.update_account_node)),
+    ("node.update_account_local", _account_local_case),
+    ("graph.build", lambda: (build_trading_graph, None)),
+    ("graph.invoke", _graph_invoke_case),
+    ("graph.continuous_1000", _continuous_case),
+    ("trailing.on_tick_x1000", _trailing_tick_case),
+    ("trailing.exit_latency", _trailing_exit_case),
+    ("market_bus.read_x1000", _bus_read_case),
+]
+
+# 시간 외 지표 (이름, 측정 함수) — 값이 클수록 나쁨
+METRICS: List[Tuple[str, Callable[[], Dict[str, float]]]] = [
+    ("trailing.giveback_pct_tick", lambda: trailing_giveback("pct")),
+    ("trailing.giveback_atr_tick", lambda: trailing_giveback("atr")),
+    ("trailing.giveback_pct_poll60", lambda: trailing_giveback("pct", every=60)),
+    ("kill_switch.time_to_flat_20", kill_switch_time_to_flat),
+]
+
+
+def run_suite(
+    name_filter: Optional[str] = None, repeat: int = 5, min_time: float = 0.05
+) -> Dict[str, Dict[str, float]]:
+    """
+    벤치마크 실행
+
+    Args:
+        name_filter: 이름에 이 문자열이 포함된 항목만 실행
+        repeat: 반복 측정 횟수
+        min_time: 반복 1회 최소 측정 시간 (초)
+
+    Returns:
+        {이름: measure() 결과}
+    """
+    results = {}
+    # 예수금을 충분히 주어 반복 매수 주문이 거절되지 않도록 함
+    with KISStandIn(seed=0, cash=1e15).install(nodes), use_clock(FixedClock(BENCH_TIME)):
+        for name, setup in CASES:
+            if name_filter and name_filter not in name:
+                continue
+            func, number = setup()
+            case_repeat = min(repeat, 3) if number == 1 else repeat
+            results[name] = measure(func, repeat=case_repeat, min_time=min_time, number=number)
+            print(f"  {name:<40} {format_value(results[name]['median']):>12}")
+        for name, metric in METRICS:
+            if name_filter and name_filter not in name:
+                continue
+            results[name] = metric()
+            value = format_value(results[name]['median'], results[name].get('unit'))
+            print(f"  {name:<40} {value:>12}")
+    return results
+
+
+def _print_comparison(rows: List[Dict], threshold: float) -> int:
+    marks = {"regression": "❌", "improved": "✅", "ok": "  ", "new": "🆕", "removed": "➖"}
+    print(f"{'':2} {'벤치마크':<40} {'기준':>12} {'현재':>12} {'변화':>8}")
+    for row in rows:
+        change = f"{row['change'] * 100:+.1f}%" if row["change"] is not None else "-"
+        print(
+            f"{marks[row['status']]} {row['name']:<40} "
+            f"{format_value(row['baseline'], row['unit']):>12} "
+            f"{format_value(row['current'], row['unit']):>12} {change:>8}"
+        )
+
+    regressions = [row for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\n❌ 회귀 {len(regressions)}건 (임계값 {threshold * 100:.0f}%)")
+        return 1
+    print(f"\n✅ 회귀 없음 (임계값 {threshold * 100:.0f}%)")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="성능 벤치마크")
+    parser.add_argument("--history", default=str(DEFAULT_HISTORY), help="기록 파일 (JSONL)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="벤치마크 실행 및 기록")
+    run_p.add_argument("--filter", default=None, help="이름 부분 일치 필터")
+    run_p.add_argument("--label", default="", help="기록 라벨")
+    run_p.add_argument("--repeat", type=int, default=5)
+    run_p.add_argument("--quick", action="store_true", help="짧게 측정 (repeat 3, 10ms)")
+    run_p.add_argument("--no-save", action="store_true", help="기록하지 않음")
+
+    cmp_p = sub.add_parser("compare", help="두 실행 비교 (회귀 시 종료 코드 1)")
+    cmp_p.add_argument("--baseline", default="-2", help="기준 기록 (인덱스/라벨/커밋)")
+    cmp_p.add_argument("--current", default="-1", help="비교 기록 (인덱스/라벨/커밋)")
+    cmp_p.add_argument("--threshold", type=float, default=0.10, help="회귀 판정 비율")
+    cmp_p.add_argument("--stat", choices=["median", "min", "mean"], default="median")
+
+    sub.add_parser("list", help="기록 목록")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        repeat, min_time = (3, 0.01) if args.quick else (args.repeat, 0.05)
+        print("벤치마크 실행 (호출당 중앙값)")
+        results = run_suite(args.filter, repeat=repeat, min_time=min_time)
+        if not args.no_save:
+            path = append_history(make_record(results, args.label), args.history)
+            print(f"\n기록 저장: {path}")
+        return 0
+
+    history = load_history(args.history)
+
+    if args.command == "list":
+        for i, record in enumerate(history):
+            print(
+                f"[{i - len(history)}] {record['timestamp']} {record.get('git_commit', ''):<8} "
+                f"{record.get('label', '')} ({len(record['results'])}개)"
+            )
+        return 0
+
+    try:
+        baseline = find_record(history, args.baseline)
+        current = find_record(history, args.current)
+    except LookupError as e:
+        print(f"❌ {e}")
+        return 2
+
+    print(
+        f"기준: {baseline['timestamp']} {baseline.get('git_commit', '')} "
+        f"{baseline.get('label', '')}"
+    )
+    print(
+        f"현재: {current['timestamp']} {current.get('git_commit', '')} {current.get('label', '')}\n"
+    )
+    return _print_comparison(compare(baseline, current, args.threshold, args.stat), args.threshold)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,24 @@
 """
 한국 주식시장 호가 단위 설정
+
+가격 구간 경계(breakpoints)를 미리 계산해 두고 스칼라는 bisect,
+배열은 np.searchsorted로 호가 단위를 찾습니다 (구간 수에 대해 O(log n)).
+
+상품 구분별 호가 단위 (2023-01-25 KRX 개편 기준):
+- 주식: KOSPI/KOSDAQ 동일 7단계 (1원 ~ 1,000원)
+- ETF/ETN: 2,000원 미만 1원, 2,000원 이상 5원
 """
 
-from typing import List, Tuple
+import math
+from bisect import bisect_right
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple, Union
 
+import numpy as np
 
-# 호가 단위 테이블 (가격 구간, 호가 단위)
+
+# 호가 단위 테이블 (가격 구간, 호가 단위) — 주식 기준
 TICK_SIZE_TABLE: List[Tuple[float, float, int]] = [
     (0, 2000, 1),           # ~2,000원 미만: 1원
     (2000, 5000, 5),        # 2,000~5,000원: 5원
@@ -16,13 +29,66 @@ TICK_SIZE_TABLE: List[Tuple[float, float, int]] = [
     (500000, float('inf'), 1000)  # 500,000원 이상: 1,000원
 ]
 
+# ETF/ETN 호가 단위 테이블
+FUND_TICK_SIZE_TABLE: List[Tuple[float, float, int]] = [
+    (0, 2000, 1),               # ~2,000원 미만: 1원
+    (2000, float('inf'), 5),    # 2,000원 이상: 5원
+]
+
+INSTRUMENTS = ("stock", "etf", "etn")
+MARKETS = ("KOSPI", "KOSDAQ")
+
+# (상품 구분, 시장) → 호가 단위 테이블
+MARKET_TICK_TABLES: Dict[Tuple[str, str], List[Tuple[float, float, int]]] = {
+    ("stock", "KOSPI"): TICK_SIZE_TABLE,
+    ("stock", "KOSDAQ"): TICK_SIZE_TABLE,
+    ("etf", "KOSPI"): FUND_TICK_SIZE_TABLE,
+    ("etf", "KOSDAQ"): FUND_TICK_SIZE_TABLE,
+    ("etn", "KOSPI"): FUND_TICK_SIZE_TABLE,
+    ("etn", "KOSDAQ"): FUND_TICK_SIZE_TABLE,
+}
+
+ROUND_MODES = ("nearest", "up", "down")
+
+# 부동소수점 오차로 정확히 호가에 있는 가격이 올림/내림되지 않도록 하는 여유
+_EPSILON = 1e-9
 
-def get_tick_size(price: float) -> int:
+
+def _compile(
+    table: List[Tuple[float, float, int]]
+) -> Tuple[List[float], List[int], np.ndarray, np.ndarray]:
+    """테이블 → (경계 리스트, 호가 리스트, 경계 배열, 호가 배열)"""
+    breakpoints = [min_price for min_price, _, _ in table[1:]]
+    ticks = [tick for _, _, tick in table]
+    return (
+        breakpoints,
+        ticks,
+        np.asarray(breakpoints, dtype=np.float64),
+        np.asarray(ticks, dtype=np.int64),
+    )
+
+
+_COMPILED = {key: _compile(table) for key, table in MARKET_TICK_TABLES.items()}
+
+
+def _lookup(instrument: str, market: str):
+    try:
+        return _COMPILED[(instrument, market)]
+    except KeyError:
+        raise ValueError(
+            f"지원하지 않는 상품 구분/시장입니다: {instrument}/{market} "
+            f"(상품: {', '.join(INSTRUMENTS)}, 시장: {', '.join(MARKETS)})"
+        ) from None
+
+
+def get_tick_size(price: float, instrument: str = "stock", market: str = "KOSPI") -> int:
     """
     가격에 따른 호가 단위를 반환합니다.
 
     Args:
         price: 주식 가격
+        instrument: 상품 구분 ("stock" | "etf" | "etn")
+        market: 시장 ("KOSPI" | "KOSDAQ")
 
     Returns:
         해당 가격 구간의 호가 단위
@@ -36,21 +102,27 @@ def get_tick_size(price: float) -> int:
         10
         >>> get_tick_size(600000)
         1000
+        >>> get_tick_size(35000, instrument="etf")
+        5
     """
-    for min_price, max_price, tick_size in TICK_SIZE_TABLE:
-        if min_price <= price < max_price:
-            return tick_size
+    breakpoints, ticks, _, _ = _lookup(instrument, market)
+    return ticks[bisect_right(breakpoints, price)]
 
-    # 기본값 (500,000원 이상)
-    return 1000
 
-
-def adjust_price_to_tick(price: float) -> int:
+def adjust_price_to_tick(
+    price: float,
+    instrument: str = "stock",
+    market: str = "KOSPI",
+    mode: str = "nearest"
+) -> int:
     """
     가격을 호가 단위에 맞게 조정합니다.
 
     Args:
         price: 조정할 가격
+        instrument: 상품 구분 ("stock" | "etf" | "etn")
+        market: 시장 ("KOSPI" | "KOSDAQ")
+        mode: "nearest"(반올림) | "up"(올림, 매수 지정가) | "down"(내림, 매도 지정가)
 
     Returns:
         호가 단위에 맞춰진 가격 (정수)
@@ -62,10 +134,95 @@ def adjust_price_to_tick(price: float) -> int:
         3005
         >>> adjust_price_to_tick(10003.5)
         10000
+        >>> adjust_price_to_tick(10003.5, mode="up")
+        10010
+    """
+    tick_size = get_tick_size(price, instrument, market)
+
+    if mode == "nearest":
+        # 호가 단위로 반올림
+        return int(round(price / tick_size) * tick_size)
+    if mode == "up":
+        return int(math.ceil(price / tick_size - _EPSILON) * tick_size)
+    if mode == "down":
+        return int(math.floor(price / tick_size + _EPSILON) * tick_size)
+    raise ValueError(f"지원하지 않는 반올림 모드입니다: {mode} ({', '.join(ROUND_MODES)})")
+
+
+def get_tick_sizes(
+    prices: Union[Sequence[float], np.ndarray],
+    instrument: str = "stock",
+    market: str = "KOSPI"
+) -> np.ndarray:
+    """
+    가격 배열의 호가 단위 (벡터화)
+
+    Args:
+        prices: 가격 배열
+        instrument: 상품 구분
+        market: 시장
+
+    Returns:
+        호가 단위 배열 (int64)
+    """
+    _, _, breakpoints, ticks = _lookup(instrument, market)
+    return ticks[np.searchsorted(breakpoints, np.asarray(prices, dtype=np.float64), side="right")]
+
+
+def adjust_prices_to_tick(
+    prices: Union[Sequence[float], np.ndarray],
+    instrument: str = "stock",
+    market: str = "KOSPI",
+    mode: str = "nearest"
+) -> np.ndarray:
     """
-    tick_size = get_tick_size(price)
+    가격 배열을 호가 단위에 맞게 조정 (벡터화, adjust_price_to_tick과 같은 결과)
+
+    Args:
+        prices: 가격 배열
+        instrument: 상품 구분
+        market: 시장
+        mode: "nearest" | "up" | "down"
 
-    # 호가 단위로 반올림
-    adjusted = round(price / tick_size) * tick_size
+    Returns:
+        조정된 가격 배열 (int64)
+    """
+    values = np.asarray(prices, dtype=np.float64)
+    ticks = get_tick_sizes(values, instrument, market)
+    units = values / ticks
+
+    if mode == "nearest":
+        units = np.round(units)
+    elif mode == "up":
+        units = np.ceil(units - _EPSILON)
+    elif mode == "down":
+        units = np.floor(units + _EPSILON)
+    else:
+        raise ValueError(f"지원하지 않는 반올림 모드입니다: {mode} ({', '.join(ROUND_MODES)})")
+
+    return units.astype(np.int64) * ticks
+
+
+@lru_cache(maxsize=1)
+def _symbol_classes() -> Dict[str, Tuple[str, str]]:
+    """symbols.yaml의 종목별 (type, market)"""
+    import yaml
+
+    path = Path(__file__).parent / "symbols.yaml"
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+    return {
+        str(item["code"]): (item.get("type", "stock"), item.get("market", "KOSPI"))
+        for item in config.get("symbols", [])
+    }
+
+
+def get_symbol_class(symbol: str) -> Tuple[str, str]:
+    """
+    종목의 (상품 구분, 시장)
 
-    return int(adjusted)
+    config/symbols.yaml의 type/market 필드를 사용하며, 없으면 ("stock", "KOSPI")입니다.
+    """
+    return _symbol_classes().get(symbol, ("stock", "KOSPI"))
@@ -0,0 +1,224 @@
+"""
+로컬 계좌 모델 (잔고 · 보유 종목 평가)
+
+update_account 노드가 반복마다 잔고 조회(inquire-balance)를 호출하지 않도록
+보유 종목을 시세로 직접 평가(mark-to-market)합니다. KIS 잔고와의 대사(reconcile)는
+아래 경우에만 합니다.
+
+- 처음 (아직 대사한 적 없음)
+- 체결 후 (on_fill)
+- 느린 주기 (reconcile_interval초마다)
+- 불일치 감지 (종목 상태의 보유 수량과 모델 수량이 다르거나 flag_drift 호출)
+
+대사 시 현금은 KIS 총평가금액 - 유가증권 평가금액으로 맞추므로, 대사 직후 모델의
+총자산은 KIS tot_evlu_amt와 같습니다.
+
+reconcile()은 전체 잔고로 모델을 다시 만들고(첫 대사), apply_reconcile()은
+백그라운드 대사(reconcile.PositionReconciler)의 종목별 보정만 반영합니다.
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, Mapping, Optional, Sequence
+
+from .clock import get_clock
+from .price import Won, to_won
+from .reconcile import ReconcileResult
+
+logger = logging.getLogger(__name__)
+
+
+class AccountModel:
+    """현금 + 보유 종목 로컬 평가 (총자산은 시세 · 체결마다 증분 갱신)"""
+
+    def __init__(self, reconcile_interval: float = 300.0):
+        """
+        초기화
+
+        Args:
+            reconcile_interval: 주기 대사 간격 (초)
+        """
+        self.reconcile_interval = reconcile_interval
+        self.cash: Won = 0
+        self.positions: Dict[str, Dict[str, Won]] = {}  # 종목 → {"qty", "avg_price", "price"}
+        self.stock_eval: Won = 0  # 보유 종목 평가금액 합 (sum qty × price)
+        self.reconciled_at: Optional[datetime] = None
+        self.reconciles = 0
+        self.last_drift: Won = 0  # 마지막 대사 시 KIS 총평가 - 모델 총자산
+        self.fills = 0  # 체결 반영 횟수 (백그라운드 대사 결과가 그 사이 체결을 놓쳤는지 확인)
+        self._pending_reason: Optional[str] = None
+
+    @classmethod
+    def from_config(cls, config: dict) -> "AccountModel":
+        """trading_config.yaml account 설정으로 생성"""
+        return cls(reconcile_interval=config.get("account", {}).get("reconcile_interval", 300))
+
+    @property
+    def total_asset(self) -> Won:
+        """총자산 (현금 + 보유 종목 평가)"""
+        return self.cash + self.stock_eval
+
+    def book(self) -> Dict[str, int]:
+        """보유 수량 (종목 → 수량)"""
+        return {symbol: position["qty"] for symbol, position in self.positions.items()}
+
+    def on_price(self, symbol: str, price: Won) -> None:
+        """보유 종목 평가가 갱신 (보유하지 않은 종목은 무시)"""
+        position = self.positions.get(symbol)
+        if position is None or price <= 0:
+            return
+        self.stock_eval += position["qty"] * (price - position["price"])
+        position["price"] = price
+
+    def on_fill(self, symbol: str, side: str, qty: int, price: Won) -> None:
+        """
+        체결 반영 (다음 update_account에서 대사)
+
+        Args:
+            symbol: 종목 코드
+            side: "buy" | "sell"
+            qty: 체결 수량
+            price: 체결 기준 가격 (원)
+        """
+        position = self.positions.get(symbol)
+        if position is None:
+            position = self.positions[symbol] = {"qty": 0, "avg_price": price, "price": price}
+        self.on_price(symbol, price)
+        if side == "buy":
+            cost = position["avg_price"] * position["qty"] + price * qty
+            position["qty"] += qty
+            position["avg_price"] = cost // position["qty"]
+            self.cash -= price * qty
+            self.stock_eval += price * qty
+        else:
+            qty = min(qty, position["qty"])
+            position["qty"] -= qty
+            self.cash += price * qty
+            self.stock_eval -= price * qty
+            if position["qty"] == 0:
+                del self.positions[symbol]
+        self.fills += 1
+        self._pending_reason = "체결 후"
+
+    def flag_drift(self, reason: str) -> None:
+        """불일치 표시 (다음 update_account에서 대사)"""
+        if self._pending_reason is None:
+            self._pending_reason = f"불일치: {reason}"
+
+    def check_positions(self, quantities: Mapping[str, int]) -> bool:
+        """
+        종목 상태의 보유 수량과 모델 수량 비교
+
+        Args:
+            quantities: 종목 → 보유 수량 (그래프 상태 기준)
+
+        Returns:
+            일치 여부 (다르면 불일치 표시)
+        """
+        for symbol, qty in quantities.items():
+            held = self.positions.get(symbol, {}).get("qty", 0)
+            if held != qty:
+                self.flag_drift(f"{symbol} 상태 {qty}주 / 모델 {held}주")
+                return False
+        return True
+
+    def needs_reconcile(self, now: Optional[datetime] = None) -> Optional[str]:
+        """
+        대사 필요 여부
+
+        Returns:
+            대사 사유 (필요 없으면 None)
+        """
+        if self.reconciled_at is None:
+            return "초기"
+        if self._pending_reason is not None:
+            return self._pending_reason
+        now = now or get_clock().now()
+        if (now - self.reconciled_at).total_seconds() >= self.reconcile_interval:
+            return "주기"
+        return None
+
+    def reconcile(
+        self,
+        output1: Sequence[Mapping[str, str]],
+        output2: Sequence[Mapping[str, str]],
+        now: Optional[datetime] = None,
+    ) -> Won:
+        """
+        KIS 잔고 조회 결과로 모델 재설정
+
+        Args:
+            output1: 종목별 잔고 (전체 페이지, pdno · hldg_qty · pchs_avg_pric · prpr)
+            output2: 계좌 총평가 (tot_evlu_amt · scts_evlu_amt)
+            now: 대사 시각 (None이면 전역 시계)
+
+        Returns:
+            KIS 총평가금액 (원)
+
+        Raises:
+            ValueError: output2가 비어 있을 때
+        """
+        if not output2:
+            raise ValueError("잔고 데이터 없음")
+        before = self.total_asset
+        positions: Dict[str, Dict[str, Won]] = {}
+        for row in output1:
+            qty = int(row.get("hldg_qty", 0) or 0)
+            if qty <= 0:
+                continue
+            positions[row["pdno"]] = {
+                "qty": qty,
+                "avg_price": to_won(row.get("pchs_avg_pric", 0) or 0),
+                "price": to_won(row.get("prpr", 0) or 0),
+            }
+        total_eval = to_won(output2[0].get("tot_evlu_amt", 0))
+        self.positions = positions
+        self.stock_eval = sum(p["qty"] * p["price"] for p in positions.values())
+        self.cash = total_eval - to_won(output2[0].get("scts_evlu_amt", self.stock_eval))
+        self.stock_eval = total_eval - self.cash
+        if self.reconciled_at is not None:
+            self.last_drift = total_eval - before
+        self.reconciled_at = now or get_clock().now()
+        self.reconciles += 1
+        self._pending_reason = None
+        return total_eval
+
+    def apply_reconcile(self, result: ReconcileResult, now: Optional[datetime] = None) -> bool:
+        """
+        백그라운드 대사 결과 반영 (종목별 보정 + 현금)
+
+        대사 시작 후 체결이 있었거나 조회에 실패한 결과는 버리고 대사 필요 상태를
+        유지합니다. 모든 페이지를 읽지 못한 부분 결과는 읽은 종목만 보정하고 다음에 다시 대사합니다.
+
+        Args:
+            result: PositionReconciler 결과
+            now: 반영 시각 (None이면 전역 시계)
+
+        Returns:
+            반영 여부
+        """
+        if result.error is not None or result.fills != self.fills or not result.output2:
+            return False
+        before = self.total_asset
+        for correction in result.corrections:
+            logger.warning(f"[account] 잔고 보정: {correction}")
+            if correction.broker_qty == 0:
+                self.positions.pop(correction.symbol, None)
+                continue
+            mark = self.positions.get(correction.symbol, {}).get("price") or correction.price
+            self.positions[correction.symbol] = {
+                "qty": correction.broker_qty,
+                "avg_price": correction.avg_price,
+                "price": mark,
+            }
+        total_eval = to_won(result.output2[0].get("tot_evlu_amt", 0))
+        self.cash = total_eval - to_won(result.output2[0].get("scts_evlu_amt", 0))
+        self.stock_eval = sum(p["qty"] * p["price"] for p in self.positions.values())
+        self.last_drift = self.total_asset - before
+        if result.complete:
+            self.reconciled_at = now or get_clock().now()
+            self.reconciles += 1
+            self._pending_reason = None
+        else:
+            self._pending_reason = "부분 대사"
+        return True
@@ -0,0 +1,237 @@
+"""
+백테스트 결과 캐시 (콘텐츠 주소 방식)
+
+(전략 코드 버전, 파라미터, 종목, 데이터 구간, 데이터 파일 체크섬)의 해시를 키로
+자산 곡선과 지표를 압축 npz 파일로 저장합니다. 같은 조합은 다시 계산하지 않으며,
+전략 코드나 데이터 파일이 바뀌면 키가 달라져 자동으로 무효화됩니다.
+
+전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은(LRU) 항목부터 삭제합니다.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+project_root = Path(__file__).parent.parent.parent.parent
+
+# 결과에 영향을 주는 전략 코드 (내용이 바뀌면 캐시 키가 달라짐)
+STRATEGY_SOURCES = [
+    Path(__file__).parent / "engine.py",
+    Path(__file__).parent.parent / "strategies" / "breakout_etf.py",
+    Path(__file__).parent.parent / "strategies" / "adaptive_k.py",
+    Path(__file__).parent.parent / "price.py",
+]
+
+
+@lru_cache(maxsize=1)
+def strategy_code_version() -> str:
+    """전략/백테스터 소스 파일 내용의 SHA-256 (앞 16자리)"""
+    digest = hashlib.sha256()
+    for source in STRATEGY_SOURCES:
+        if source.exists():
+            digest.update(source.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def make_cache_key(
+    symbol: str,
+    params: Dict,
+    start: Optional[str],
+    end: Optional[str],
+    data_checksum: str,
+    code_version: Optional[str] = None,
+) -> str:
+    """
+    캐시 키 생성
+
+    Args:
+        symbol: 종목 코드
+        params: 백테스트 파라미터
+        start: 시작일 (YYYYMMDD)
+        end: 종료일 (YYYYMMDD)
+        data_checksum: HistoryStore.checksum(symbol)
+        code_version: 전략 코드 버전 (None이면 strategy_code_version())
+
+    Returns:
+        SHA-256 16진 문자열
+    """
+    payload = {
+        "code": code_version or strategy_code_version(),
+        "params": {k: params[k] for k in sorted(params)},
+        "symbol": symbol,
+        "start": start,
+        "end": end,
+        "data": data_checksum,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class BacktestCache:
+    """디스크 기반 LRU 백테스트 결과 캐시"""
+
+    def __init__(self, root: Optional[Union[str, Path]] = None, max_bytes: int = 512 * 1024 * 1024):
+        """
+        초기화
+
+        Args:
+            root: 캐시 디렉토리 (None이면 data/backtest_cache)
+            max_bytes: 캐시 최대 크기 (바이트)
+        """
+        self.root = Path(root) if root is not None else project_root / "data" / "backtest_cache"
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._index: Optional["OrderedDict[str, int]"] = None
+        self._total_bytes = 0
+
+    # ========== 인덱스 ==========
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.npz"
+
+    def _load_index(self) -> "OrderedDict[str, int]":
+        """디스크 스캔으로 LRU 인덱스 구성 (최초 1회, mtime = 최근 사용 시각)"""
+        if self._index is None:
+            entries = []
+            for path in self.root.glob("*/*.npz"):
+                stat = path.stat()
+                entries.append((stat.st_mtime_ns, path.stem, stat.st_size))
+            entries.sort()
+            self._index = OrderedDict((key, size) for _, key, size in entries)
+            self._total_bytes = sum(self._index.values())
+        return self._index
+
+    def __len__(self) -> int:
+        return len(self._load_index())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._load_index()
+
+    @property
+    def total_bytes(self) -> int:
+        self._load_index()
+        return self._total_bytes
+
+    # ========== 조회/저장 ==========
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        캐시 조회
+
+        Returns:
+            저장된 결과 (없으면 None)
+        """
+        index = self._load_index()
+        path = self._path(key)
+
+        if key not in index or not path.exists():
+            if key in index:
+                self._total_bytes -= index.pop(key)
+            self.misses += 1
+            return None
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                result = {
+                    "dates": data["dates"].astype(str),
+                    "equity": data["equity"],
+                    "daily_returns": data["daily_returns"],
+                    "trade_returns": data["trade_returns"],
+                    "metrics": json.loads(str(data["metrics"])),
+                }
+        except Exception as e:
+            logger.warning(f"캐시 항목 손상, 삭제합니다: {path} ({e})")
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        index.move_to_end(key)
+        os.utime(path)
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: Dict) -> None:
+        """
+        결과 저장 후 크기 한도 초과 시 LRU 삭제
+
+        Args:
+            key: make_cache_key() 결과
+            result: run_breakout_backtest() 결과
+        """
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            dates=np.asarray(result["dates"]).astype(np.int32),
+            equity=np.asarray(result["equity"], dtype=np.float64),
+            daily_returns=np.asarray(result["daily_returns"], dtype=np.float64),
+            trade_returns=np.asarray(result["trade_returns"], dtype=np.float64),
+            metrics=np.array(json.dumps(result["metrics"])),
+        )
+        payload = buffer.getvalue()
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(payload)
+        tmp.replace(path)
+
+        index = self._load_index()
+        if key in index:
+            self._total_bytes -= index.pop(key)
+        index[key] = len(payload)
+        self._total_bytes += len(payload)
+        self._evict()
+
+    def get_or_compute(self, key: str, compute: Callable[[], Dict]) -> Dict:
+        """
+        캐시에 있으면 반환, 없으면 계산 후 저장
+
+        Args:
+            key: 캐시 키
+            compute: 결과 계산 함수
+
+        Returns:
+            백테스트 결과
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        result = compute()
+        self.put(key, result)
+        return result
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        for key in list(self._load_index()):
+            self._remove(key)
+
+    # ========== 내부 ==========
+
+    def _remove(self, key: str) -> None:
+        index = self._load_index()
+        if key in index:
+            self._total_bytes -= index.pop(key)
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        index = self._load_index()
+        while self._total_bytes > self.max_bytes and len(index) > 1:
+            oldest = next(iter(index))
+            logger.debug(f"캐시 LRU 삭제: {oldest}")
+            self._remove(oldest)
@@ -0,0 +1,309 @@
+"""
+변동성 돌파 벡터화 백테스터
+
+실전 봇과 같이 당일 진입 · 당일 청산(15:20 장 마감 청산)하는 데이 트레이딩
+모델을 일봉 배열 연산으로 한 번에 계산합니다.
+
+- 목표가 = 당일 시가 + 전일 변동폭 × k (BreakoutStrategy.calculate_target_price)
+- 진입: 당일 고가 >= 목표가 → 목표가(갭 상승 시 시가)에 매수
+- 돌파 필터 (BreakoutStrategy.validate_breakout과 같은 규칙):
+    min_breakout_strength > 0이면 목표가 + ceil(목표가 × 비율) 도달 시 그 가격에 진입,
+    min_volume > 0이면 당일 거래량이 min_volume 미만인 날 제외 (장중 누적 거래량은
+    당일 거래량을 넘을 수 없으므로 실전 필터가 반드시 거르는 날만 제외)
+- 청산: 저가가 손절가 이하면 손절 (익절과 동시 도달 시 보수적으로 손절),
+        고가가 익절가 이상이면 익절, 아니면 종가 청산
+- 자본 대비 수익률 = 거래 수익률 × position_ratio (복리)
+- k_mode="adaptive"이면 k = 전일까지 noise_period일 평균 노이즈 비율 ([k_min, k_max])
+
+가격 배열은 int64 원 단위이며, 목표가/손절가/익절가도 실전 전략과 같은 규칙
+(skills/trading_core/price.py)으로 원 단위 올림/내림하여 정수로 비교합니다.
+"""
+
+import logging
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ..price import PRICE_DTYPE, mul_ratio_ceil, mul_ratio_floor, to_won_array
+from ..strategies.adaptive_k import K_MODES, noise_ratios, trailing_noise_k
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAYS_PER_YEAR = 252
+
+DEFAULT_PARAMS: Dict[str, Any] = {
+    "k_value": 0.5,
+    "k_mode": "static",
+    "noise_period": 20,
+    "k_min": 0.2,
+    "k_max": 0.9,
+    "min_volume": 0,
+    "min_breakout_strength": 0.0,
+    "stop_loss_pct": -0.03,
+    "take_profit_pct": 0.05,
+    "position_ratio": 0.1,
+    "commission": 0.00015,
+    "slippage": 0.001,
+    "initial_capital": 10_000_000,
+}
+
+
+def default_params(config: Optional[dict] = None) -> Dict[str, Any]:
+    """
+    trading_config.yaml 값을 반영한 기본 파라미터
+
+    Args:
+        config: load_trading_config() 결과 (None이면 하드코딩 기본값만 사용)
+
+    Returns:
+        백테스트 파라미터 딕셔너리
+    """
+    params = dict(DEFAULT_PARAMS)
+    if not config:
+        return params
+
+    vb = config.get("volatility_breakout", {})
+    for name in (
+        "k_value",
+        "k_mode",
+        "noise_period",
+        "k_min",
+        "k_max",
+        "min_volume",
+        "min_breakout_strength",
+    ):
+        params[name] = vb.get(name, params[name])
+    params["stop_loss_pct"] = config.get("risk", {}).get("stop_loss", params["stop_loss_pct"])
+    params["take_profit_pct"] = config.get("risk", {}).get("take_profit", params["take_profit_pct"])
+    params["position_ratio"] = config.get("trading", {}).get(
+        "position_size", params["position_ratio"]
+    )
+    backtest = config.get("backtest", {})
+    params["commission"] = backtest.get("commission", params["commission"])
+    params["slippage"] = backtest.get("slippage", params["slippage"])
+    params["initial_capital"] = backtest.get("initial_capital", params["initial_capital"])
+    return params
+
+
+def simulate_breakout_days(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    k_value: Union[float, np.ndarray] = 0.5,
+    stop_loss_pct: float = -0.03,
+    take_profit_pct: float = 0.05,
+    commission: float = 0.00015,
+    slippage: float = 0.001,
+    volume: Optional[np.ndarray] = None,
+    min_volume: int = 0,
+    min_breakout_strength: float = 0.0,
+) -> Dict[str, np.ndarray]:
+    """
+    일별 돌파 거래 시뮬레이션 (벡터화)
+
+    첫째 날은 전일 데이터가 없으므로 거래하지 않습니다.
+
+    Args:
+        open_, high, low, close: int64 원 단위 일봉 배열 (날짜 오름차순)
+        k_value: 변동성 계수 (스칼라 또는 날짜별 배열)
+        stop_loss_pct: 손절 비율
+        take_profit_pct: 익절 비율
+        commission: 편도 수수료율
+        slippage: 편도 슬리피지
+        volume: 일별 거래량 (min_volume 필터용, None이면 미적용)
+        min_volume: 최소 거래량 (0이면 미사용)
+        min_breakout_strength: 목표가 대비 최소 초과 비율 (0이면 미사용)
+
+    Returns:
+        target, traded(bool), entry, exit (int64, traded가 아닌 날은 0),
+        trade_return(수수료 차감 순수익률), filtered(bool, 목표가는 돌파했지만
+        필터로 거른 날) 배열
+    """
+    n = len(open_)
+    # 첫째 날은 도달 불가능한 목표가
+    target = np.full(n, np.iinfo(PRICE_DTYPE).max, dtype=PRICE_DTYPE)
+    if n > 1:
+        k = k_value[1:] if isinstance(k_value, np.ndarray) else k_value
+        target[1:] = open_[1:] + mul_ratio_ceil(high[:-1] - low[:-1], k)
+
+    # 돌파 강도 필터: 진입 기준가를 목표가 위로 올림
+    trigger = target.copy()
+    if min_breakout_strength > 0 and n > 1:
+        trigger[1:] += mul_ratio_ceil(target[1:], min_breakout_strength)
+
+    breakout = high >= target
+    traded = high >= trigger
+    if volume is not None and min_volume > 0:
+        traded &= np.asarray(volume) >= min_volume
+    entry = np.where(traded, np.maximum(trigger, open_), 0)
+    stop_px = entry + mul_ratio_floor(entry, stop_loss_pct)
+    take_px = entry + mul_ratio_ceil(entry, take_profit_pct)
+
+    exit_ = np.where(
+        traded, np.where(low <= stop_px, stop_px, np.where(high >= take_px, take_px, close)), 0
+    )
+
+    buy_cost = entry * ((1 + slippage) * (1 + commission))
+    sell_proceeds = exit_ * ((1 - slippage) * (1 - commission))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        trade_return = np.where(traded, sell_proceeds / buy_cost - 1.0, 0.0)
+
+    return {
+        "target": target,
+        "traded": traded,
+        "entry": entry,
+        "exit": exit_,
+        "trade_return": trade_return,
+        "filtered": breakout & ~traded,
+    }
+
+
+def resolve_k(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, params: Dict[str, Any]
+) -> Union[float, np.ndarray]:
+    """
+    k_mode에 따른 k (static: k_value, adaptive: 날짜별 배열)
+
+    Args:
+        open_, high, low, close: int64 원 단위 일봉 배열 (날짜 오름차순)
+        params: 백테스트 파라미터
+
+    Returns:
+        simulate_breakout_days()의 k_value 인자
+    """
+    mode = params.get("k_mode", "static")
+    if mode == "static":
+        return params["k_value"]
+    if mode != "adaptive":
+        raise ValueError(f"지원하지 않는 k_mode입니다: {mode} ({', '.join(K_MODES)})")
+    return trailing_noise_k(
+        noise_ratios(open_, high, low, close),
+        int(params["noise_period"]),
+        params["k_min"],
+        params["k_max"],
+        fallback=params["k_value"],
+    )
+
+
+def warmup_bars(params: Dict[str, Any]) -> int:
+    """백테스트 구간 앞에 필요한 일봉 수 (전일 1일, 적응형 k는 noise_period일)"""
+    if params.get("k_mode", "static") == "adaptive":
+        return max(1, int(params["noise_period"]))
+    return 1
+
+
+def compute_metrics(
+    daily_returns: np.ndarray, equity: np.ndarray, trade_returns: np.ndarray
+) -> Dict[str, float]:
+    """
+    성과 지표 계산
+
+    Args:
+        daily_returns: 자본 기준 일별 수익률
+        equity: 자산 곡선
+        trade_returns: 거래별 수익률 (포지션 기준)
+
+    Returns:
+        total_return, cagr, mdd, sharpe, n_trades, win_rate, avg_win, avg_loss
+    """
+    n_days = len(equity)
+    if n_days == 0:
+        return {
+            "total_return": 0.0,
+            "cagr": 0.0,
+            "mdd": 0.0,
+            "sharpe": 0.0,
+            "n_trades": 0,
+            "win_rate": 0.0,
+            "avg_win": 0.0,
+            "avg_loss": 0.0,
+        }
+
+    initial = equity[0] / (1 + daily_returns[0])
+    total_return = float(equity[-1] / initial - 1)
+    years = n_days / TRADING_DAYS_PER_YEAR
+    cagr = float((1 + total_return) ** (1 / years) - 1) if years > 0 and total_return > -1 else -1.0
+
+    peak = np.maximum.accumulate(np.maximum(equity, initial))
+    mdd = float((equity / peak - 1).min())
+
+    std = daily_returns.std()
+    sharpe = float(daily_returns.mean() / std * np.sqrt(TRADING_DAYS_PER_YEAR)) if std > 0 else 0.0
+
+    wins = trade_returns[trade_returns > 0]
+    losses = trade_returns[trade_returns <= 0]
+    n_trades = int(trade_returns.size)
+
+    return {
+        "total_return": total_return,
+        "cagr": cagr,
+        "mdd": mdd,
+        "sharpe": sharpe,
+        "n_trades": n_trades,
+        "win_rate": float(wins.size / n_trades) if n_trades else 0.0,
+        "avg_win": float(wins.mean()) if wins.size else 0.0,
+        "avg_loss": float(losses.mean()) if losses.size else 0.0,
+    }
+
+
+def run_breakout_backtest(
+    bars: pd.DataFrame, params: Optional[Dict[str, Any]] = None, warmup: int = 1
+) -> Dict:
+    """
+    일봉 데이터로 변동성 돌파 백테스트 실행
+
+    Args:
+        bars: date, open, high, low, close (+ volume) 컬럼 DataFrame (날짜 오름차순).
+        params: 파라미터 (누락된 값은 DEFAULT_PARAMS)
+        warmup: 앞쪽 행 수 — 목표가/적응형 k 계산용으로만 쓰고 성과에서 제외 (최소 1)
+
+    Returns:
+        {
+            'dates': 날짜 배열 (warmup 행 제외),
+            'equity': 자산 곡선,
+            'daily_returns': 자본 기준 일별 수익률,
+            'trade_returns': 거래별 수익률,
+            'metrics': 성과 지표 (+ n_filtered: 필터로 거른 돌파 수)
+        }
+    """
+    p = dict(DEFAULT_PARAMS)
+    if params:
+        p.update(params)
+
+    open_ = to_won_array(bars["open"].to_numpy())
+    high = to_won_array(bars["high"].to_numpy())
+    low = to_won_array(bars["low"].to_numpy())
+    close = to_won_array(bars["close"].to_numpy())
+
+    sim = simulate_breakout_days(
+        open_,
+        high,
+        low,
+        close,
+        k_value=resolve_k(open_, high, low, close, p),
+        stop_loss_pct=p["stop_loss_pct"],
+        take_profit_pct=p["take_profit_pct"],
+        commission=p["commission"],
+        slippage=p["slippage"],
+        volume=bars["volume"].to_numpy() if "volume" in bars else None,
+        min_volume=p["min_volume"],
+        min_breakout_strength=p["min_breakout_strength"],
+    )
+
+    warmup = max(1, warmup)
+    daily_returns = (sim["trade_return"] * p["position_ratio"])[warmup:]
+    equity = p["initial_capital"] * np.cumprod(1.0 + daily_returns)
+    trade_returns = sim["trade_return"][warmup:][sim["traded"][warmup:]]
+    metrics = compute_metrics(daily_returns, equity, trade_returns)
+    # 필터로 거른 돌파 (실전이라면 주문 왕복을 아낀 횟수)
+    metrics["n_filtered"] = int(sim["filtered"][warmup:].sum())
+
+    return {
+        "dates": bars["date"].to_numpy()[warmup:],
+        "equity": equity,
+        "daily_returns": daily_returns,
+        "trade_returns": trade_returns,
+        "metrics": metrics,
+    }
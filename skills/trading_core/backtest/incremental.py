@@ -0,0 +1,309 @@
+"""
+증분 일일 백테스트
+
+run_breakout_backtest()를 매일 전체 기간에 대해 다시 돌리는 대신, 실행이 끝날 때
+백테스트 상태(자산, 최고 자산, 누적 통계, 마지막 봉, 파일 오프셋)를 스냅샷으로 저장하고
+다음 실행에서는 HistoryStore에 새로 추가된 일봉만 읽어 O(신규 봉)으로 지표를 갱신합니다.
+
+변동성 돌파 봇은 당일 청산(15:20)하므로 장 마감 후에는 보유 포지션이 없고,
+다음 날 목표가 계산에 필요한 것은 전일 고가/저가뿐입니다. 적응형 k(k_mode="adaptive")는
+최근 noise_period일 노이즈 비율만 스냅샷에 함께 저장합니다.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from .cache import strategy_code_version
+from .engine import DEFAULT_PARAMS, TRADING_DAYS_PER_YEAR, simulate_breakout_days
+from ..strategies.adaptive_k import K_MODES, noise_ratios, trailing_noise_k
+from ..data.history_store import HistoryStore
+from ..price import to_won_array
+
+logger = logging.getLogger(__name__)
+
+project_root = Path(__file__).parent.parent.parent.parent
+
+SNAPSHOT_VERSION = 4
+
+
+def _empty_snapshot(symbol: str, params: Dict) -> Dict:
+    return {
+        "version": SNAPSHOT_VERSION,
+        "code_version": strategy_code_version(),
+        "symbol": symbol,
+        "params": params,
+        "last_date": None,
+        "file_offset": None,
+        "prev_high": None,
+        "prev_low": None,
+        "noise_tail": [],  # 적응형 k용 최근 noise_period일 노이즈 비율
+        "position": None,  # 당일 청산 모델이므로 장 마감 후 항상 None
+        "equity": float(params["initial_capital"]),
+        "peak": float(params["initial_capital"]),
+        "mdd": 0.0,
+        # 일별 수익률 Welford 누적 (평균, 제곱편차합)
+        "n_days": 0,
+        "mean_return": 0.0,
+        "m2_return": 0.0,
+        "n_trades": 0,
+        "n_filtered": 0,
+        "n_wins": 0,
+        "sum_wins": 0.0,
+        "sum_losses": 0.0,
+    }
+
+
+def snapshot_metrics(snapshot: Dict) -> Dict[str, float]:
+    """
+    스냅샷 누적 통계로 compute_metrics()와 같은 지표 계산
+
+    Args:
+        snapshot: 증분 백테스트 스냅샷
+
+    Returns:
+        total_return, cagr, mdd, sharpe, n_trades, win_rate, avg_win, avg_loss, n_filtered
+    """
+    initial = snapshot["params"]["initial_capital"]
+    total_return = snapshot["equity"] / initial - 1
+    n_days = snapshot["n_days"]
+    years = n_days / TRADING_DAYS_PER_YEAR
+    cagr = (1 + total_return) ** (1 / years) - 1 if years > 0 and total_return > -1 else -1.0
+
+    std = np.sqrt(snapshot["m2_return"] / n_days) if n_days else 0.0
+    sharpe = snapshot["mean_return"] / std * np.sqrt(TRADING_DAYS_PER_YEAR) if std > 0 else 0.0
+
+    n_trades = snapshot["n_trades"]
+    n_wins = snapshot["n_wins"]
+    n_losses = n_trades - n_wins
+    return {
+        "total_return": float(total_return),
+        "cagr": float(cagr) if n_days else 0.0,
+        "mdd": float(snapshot["mdd"]),
+        "sharpe": float(sharpe),
+        "n_trades": int(n_trades),
+        "win_rate": n_wins / n_trades if n_trades else 0.0,
+        "avg_win": snapshot["sum_wins"] / n_wins if n_wins else 0.0,
+        "avg_loss": snapshot["sum_losses"] / n_losses if n_losses else 0.0,
+        "n_filtered": int(snapshot["n_filtered"]),
+    }
+
+
+class IncrementalBacktester:
+    """스냅샷 기반 증분 백테스터"""
+
+    def __init__(self, store: HistoryStore, snapshot_dir: Optional[Union[str, Path]] = None):
+        """
+        초기화
+
+        Args:
+            store: 일봉 저장소
+            snapshot_dir: 스냅샷 디렉토리 (None이면 data/backtest_state)
+        """
+        self.store = store
+        self.snapshot_dir = (
+            Path(snapshot_dir)
+            if snapshot_dir is not None
+            else project_root / "data" / "backtest_state"
+        )
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+
+    def snapshot_path(self, symbol: str, params: Dict) -> Path:
+        """(종목, 파라미터)별 스냅샷 경로"""
+        encoded = json.dumps({k: params[k] for k in sorted(params)}).encode("utf-8")
+        digest = hashlib.sha256(encoded).hexdigest()[:16]
+        return self.snapshot_dir / f"{symbol}_{digest}.json"
+
+    def load_snapshot(self, symbol: str, params: Dict) -> Dict:
+        """
+        스냅샷 로드
+
+        스냅샷이 없거나 전략 코드가 바뀌었으면 빈 상태를 반환합니다 (전체 재계산).
+        """
+        path = self.snapshot_path(symbol, params)
+        if path.exists():
+            snapshot = json.loads(path.read_text(encoding="utf-8"))
+            if (
+                snapshot.get("version") == SNAPSHOT_VERSION
+                and snapshot.get("code_version") == strategy_code_version()
+            ):
+                return snapshot
+            logger.info(f"[incremental] 전략 코드 변경으로 스냅샷 재생성: {symbol}")
+        return _empty_snapshot(symbol, params)
+
+    def save_snapshot(self, snapshot: Dict) -> None:
+        path = self.snapshot_path(snapshot["symbol"], snapshot["params"])
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(snapshot), encoding="utf-8")
+        tmp.replace(path)
+
+    def update(self, symbol: str, params: Optional[Dict] = None) -> Dict:
+        """
+        신규 일봉만 반영하여 스냅샷/지표 갱신
+
+        Args:
+            symbol: 종목 코드
+            params: 백테스트 파라미터 (누락 값은 DEFAULT_PARAMS)
+
+        Returns:
+            {'snapshot': 갱신된 스냅샷, 'new_bars': 반영한 봉 수, 'metrics': 지표}
+        """
+        full_params = dict(DEFAULT_PARAMS)
+        if params:
+            full_params.update(params)
+
+        snapshot = self.load_snapshot(symbol, full_params)
+        new_bars, offset = self.store.load_after(
+            symbol, snapshot["last_date"], snapshot["file_offset"]
+        )
+
+        if not new_bars.empty:
+            self._apply(snapshot, new_bars)
+            snapshot["file_offset"] = offset
+            self.save_snapshot(snapshot)
+
+        logger.info(
+            f"[incremental] {symbol}: 신규 {len(new_bars)}봉 반영 (마지막: {snapshot['last_date']})"
+        )
+
+        return {
+            "snapshot": snapshot,
+            "new_bars": len(new_bars),
+            "metrics": snapshot_metrics(snapshot),
+        }
+
+    def _apply(self, snapshot: Dict, bars) -> None:
+        """신규 봉을 스냅샷 누적 통계에 반영 (신규 봉 수에 비례)"""
+        p = snapshot["params"]
+        open_ = to_won_array(bars["open"].to_numpy())
+        high = to_won_array(bars["high"].to_numpy())
+        low = to_won_array(bars["low"].to_numpy())
+        close = to_won_array(bars["close"].to_numpy())
+
+        has_prev = snapshot["prev_high"] is not None
+        if has_prev:
+            # 스냅샷의 전일 봉을 앞에 붙여 첫 신규 봉의 목표가 계산
+            # (앞에 붙인 봉의 시가/종가는 쓰이지 않음)
+            open_ = np.concatenate([[0], open_])
+            high = np.concatenate([[snapshot["prev_high"]], high])
+            low = np.concatenate([[snapshot["prev_low"]], low])
+            close = np.concatenate([[0], close])
+        volume = bars["volume"].to_numpy() if "volume" in bars else None
+        if volume is not None and has_prev:
+            volume = np.concatenate([[0], volume])
+
+        k_value = p["k_value"]
+        mode = p.get("k_mode", "static")
+        if mode == "adaptive":
+            # 신규 봉의 k = 스냅샷 노이즈 꼬리 + 신규 노이즈의 직전 period일 평균
+            period = int(p["noise_period"])
+            history = np.concatenate(
+                [
+                    np.asarray(snapshot["noise_tail"], dtype=np.float64),
+                    noise_ratios(
+                        open_[has_prev:], high[has_prev:], low[has_prev:], close[has_prev:]
+                    ),
+                ]
+            )
+            k_new = trailing_noise_k(history, period, p["k_min"], p["k_max"], fallback=p["k_value"])
+            k_new = k_new[len(snapshot["noise_tail"]) :]
+            k_value = np.concatenate([[p["k_value"]], k_new]) if has_prev else k_new
+            snapshot["noise_tail"] = history[-period:].tolist()
+        elif mode != "static":
+            raise ValueError(f"지원하지 않는 k_mode입니다: {mode} ({', '.join(K_MODES)})")
+
+        sim = simulate_breakout_days(
+            open_,
+            high,
+            low,
+            close,
+            k_value=k_value,
+            stop_loss_pct=p["stop_loss_pct"],
+            take_profit_pct=p["take_profit_pct"],
+            commission=p["commission"],
+            slippage=p["slippage"],
+            volume=volume,
+            min_volume=p.get("min_volume", 0),
+            min_breakout_strength=p.get("min_breakout_strength", 0.0),
+        )
+        # 첫 봉은 (스냅샷 전일 봉이든, 최초 실행의 첫 봉이든) 거래 대상이 아님
+        trade_return = sim["trade_return"][1:]
+        traded = sim["traded"][1:]
+        daily = trade_return * p["position_ratio"]
+
+        if daily.size:
+            equity = snapshot["equity"] * np.cumprod(1.0 + daily)
+            peak = np.maximum.accumulate(np.maximum(equity, snapshot["peak"]))
+            snapshot["mdd"] = float(min(snapshot["mdd"], (equity / peak - 1).min()))
+            snapshot["equity"] = float(equity[-1])
+            snapshot["peak"] = float(peak[-1])
+
+            # Welford 병합 (기존 누적 + 신규 묶음)
+            n_a, mean_a, m2_a = snapshot["n_days"], snapshot["mean_return"], snapshot["m2_return"]
+            n_b = daily.size
+            mean_b = float(daily.mean())
+            m2_b = float(((daily - mean_b) ** 2).sum())
+            n = n_a + n_b
+            delta = mean_b - mean_a
+            snapshot["n_days"] = n
+            snapshot["mean_return"] = mean_a + delta * n_b / n
+            snapshot["m2_return"] = m2_a + m2_b + delta**2 * n_a * n_b / n
+
+            trades = trade_return[traded]
+            wins = trades[trades > 0]
+            snapshot["n_trades"] += int(trades.size)
+            snapshot["n_filtered"] += int(sim["filtered"][1:].sum())
+            snapshot["n_wins"] += int(wins.size)
+            snapshot["sum_wins"] += float(wins.sum())
+            snapshot["sum_losses"] += float(trades[trades <= 0].sum())
+
+        snapshot["prev_high"] = int(high[-1])
+        snapshot["prev_low"] = int(low[-1])
+        snapshot["last_date"] = str(bars["date"].iloc[-1])
+
+
+def main() -> int:
+    """CLI: 저장소의 모든 종목을 증분 갱신 (장 마감 후 실행)"""
+    import argparse
+    import sys
+
+    sys.path.insert(0, str(project_root))
+    from skills.trading_core.backtest.engine import default_params
+    from skills.trading_core.graph.state import load_trading_config
+
+    parser = argparse.ArgumentParser(description="증분 일일 백테스트 갱신")
+    parser.add_argument("symbols", nargs="*", help="종목 코드 (없으면 저장소 전체)")
+    parser.add_argument("--fetch", action="store_true", help="KIS 일봉 조회 후 저장소에 추가")
+    parser.add_argument("--mode", choices=["demo", "real"], default="demo")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    store = HistoryStore()
+    params = default_params(load_trading_config())
+    symbols = args.symbols or store.symbols()
+
+    if args.fetch:
+        from skills.trading_core.graph import nodes
+
+        nodes._init_kis_auth(args.mode)
+        for symbol in symbols:
+            chart = nodes._call_inquire_daily_chart(args.mode, symbol, days=5)
+            store.append(symbol, chart)
+
+    backtester = IncrementalBacktester(store)
+    for symbol in symbols:
+        metrics = backtester.update(symbol, params)["metrics"]
+        print(
+            f"{symbol}: 수익률 {metrics['total_return']*100:.2f}%, "
+            f"MDD {metrics['mdd']*100:.2f}%, 샤프 {metrics['sharpe']:.2f}, "
+            f"거래 {metrics['n_trades']}회"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,289 @@
+"""
+거래 수익률 몬테카를로 부트스트랩
+
+과거 거래별 수익률을 블록 부트스트랩으로 재표본추출하여 수만~수십만 개의
+가상 경로를 한 번에(벡터화) 시뮬레이션하고, 다음 분포를 추정합니다.
+
+- 최대 낙폭(MDD)과 회복 기간
+- max_daily_loss / max_monthly_loss / max_drawdown 한도 도달 확률
+- 월 기대 수익률과 월 목표 수익률(README: 10%) 달성 확률
+
+경로는 chunk_size 단위로 나누어 계산하므로 메모리 사용량은
+chunk_size × 경로 길이에만 비례합니다.
+"""
+
+import json
+import logging
+import math
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# README 목표: 월 10% 수익
+MONTHLY_TARGET_RETURN = 0.10
+
+
+def load_trade_returns(path: Union[str, Path]) -> np.ndarray:
+    """
+    거래 기록 파일에서 거래별 수익률 로드
+
+    data/trades/ 의 JSON(리스트) 또는 JSONL 파일에서 매도 기록의
+    pnl_pct 값을 읽습니다. 한 줄에 숫자 하나인 텍스트 파일도 허용합니다.
+
+    Args:
+        path: 거래 기록 파일 경로
+
+    Returns:
+        거래별 수익률 배열 (예: 0.012 = +1.2%)
+    """
+    path = Path(path)
+    text = path.read_text(encoding='utf-8').strip()
+
+    if not text:
+        return np.empty(0, dtype=np.float64)
+
+    if text.startswith('['):
+        records = json.loads(text)
+    elif text.startswith('{'):
+        records = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        return np.array([float(line) for line in text.splitlines() if line.strip()])
+
+    returns = [
+        float(record['pnl_pct'])
+        for record in records
+        if record.get('action', 'SELL') == 'SELL' and record.get('pnl_pct') is not None
+    ]
+    return np.asarray(returns, dtype=np.float64)
+
+
+def block_bootstrap_indices(
+    rng: np.random.Generator, n_samples: int, n_paths: int, n_steps: int, block_size: int
+) -> np.ndarray:
+    """
+    순환 블록 부트스트랩 인덱스 생성
+
+    연속된 block_size개 거래를 하나의 블록으로 묶어 재표본추출하므로
+    연승/연패 같은 단기 자기상관이 보존됩니다.
+
+    Args:
+        rng: 난수 생성기
+        n_samples: 원본 거래 수
+        n_paths: 경로 수
+        n_steps: 경로당 거래 수
+        block_size: 블록 길이
+
+    Returns:
+        (n_paths, n_steps) 인덱스 배열
+    """
+    block_size = max(1, min(block_size, n_samples))
+    n_blocks = math.ceil(n_steps / block_size)
+    starts = rng.integers(0, n_samples, size=(n_paths, n_blocks))
+    offsets = np.arange(block_size)
+    indices = (starts[:, :, None] + offsets) % n_samples
+    return indices.reshape(n_paths, n_blocks * block_size)[:, :n_steps]
+
+
+class MonteCarloSimulator:
+    """거래 수익률 블록 부트스트랩 시뮬레이터"""
+
+    def __init__(
+        self,
+        n_paths: int = 100_000,
+        n_months: int = 12,
+        trades_per_month: int = 16,
+        block_size: int = 5,
+        position_ratio: float = 0.1,
+        chunk_size: int = 10_000,
+        seed: Optional[int] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            n_paths: 시뮬레이션 경로 수
+            n_months: 경로당 개월 수
+            trades_per_month: 월 평균 거래 횟수 (README: 주 3-5회)
+            block_size: 부트스트랩 블록 길이 (거래 수)
+            position_ratio: 거래당 투자 비율 (거래 수익률 × 비율 = 자본 수익률)
+            chunk_size: 한 번에 계산할 경로 수 (메모리 상한)
+            seed: 난수 시드 (재현용)
+        """
+        if n_paths <= 0 or n_months <= 0 or trades_per_month <= 0:
+            raise ValueError("n_paths, n_months, trades_per_month는 0보다 커야 합니다")
+
+        self.n_paths = n_paths
+        self.n_months = n_months
+        self.trades_per_month = trades_per_month
+        self.block_size = block_size
+        self.position_ratio = position_ratio
+        self.chunk_size = max(1, chunk_size)
+        self.seed = seed
+
+    @property
+    def n_steps(self) -> int:
+        """경로당 거래 수"""
+        return self.n_months * self.trades_per_month
+
+    def run(
+        self,
+        trade_returns: Sequence[float],
+        max_daily_loss: float = -0.05,
+        max_monthly_loss: float = -0.15,
+        max_drawdown: float = -0.20,
+        monthly_target: float = MONTHLY_TARGET_RETURN,
+    ) -> Dict:
+        """
+        시뮬레이션 실행
+
+        거래가 하루 최대 1회라고 가정하여 거래 하나를 거래일 하나로 봅니다.
+
+        Args:
+            trade_returns: 과거 거래별 수익률 (포지션 기준)
+            max_daily_loss: 일일 최대 손실 한도
+            max_monthly_loss: 월간 최대 손실 한도
+            max_drawdown: 최대 허용 낙폭
+            monthly_target: 월 목표 수익률
+
+        Returns:
+            경로별 분포 배열과 요약 통계 딕셔너리
+        """
+        returns = np.asarray(trade_returns, dtype=np.float64) * self.position_ratio
+        if returns.size == 0:
+            raise ValueError("거래 수익률이 비어 있습니다")
+
+        rng = np.random.default_rng(self.seed)
+        n_steps = self.n_steps
+        step_index = np.arange(n_steps)
+
+        mdd = np.empty(self.n_paths)
+        time_to_recovery = np.empty(self.n_paths)
+        monthly_mean = np.empty(self.n_paths)
+        final_return = np.empty(self.n_paths)
+        daily_breach = np.empty(self.n_paths, dtype=bool)
+        monthly_breach = np.empty(self.n_paths, dtype=bool)
+        target_hit_months = 0
+
+        for start in range(0, self.n_paths, self.chunk_size):
+            stop = min(start + self.chunk_size, self.n_paths)
+            n = stop - start
+
+            idx = block_bootstrap_indices(rng, returns.size, n, n_steps, self.block_size)
+            path_returns = returns[idx]
+
+            # 자산 곡선 (초기값 1.0)
+            equity = np.cumprod(1.0 + path_returns, axis=1)
+            peak = np.maximum.accumulate(np.maximum(equity, 1.0), axis=1)
+            drawdown = equity / peak - 1.0
+
+            trough = drawdown.argmin(axis=1)
+            rows = np.arange(n)
+            mdd[start:stop] = drawdown[rows, trough]
+
+            # 최대 낙폭 구간의 고점 회복까지 걸린 거래 수 (미회복: NaN)
+            peak_at_trough = peak[rows, trough]
+            recovered = (step_index > trough[:, None]) & (equity >= peak_at_trough[:, None])
+            has_recovered = recovered.any(axis=1)
+            ttr = np.where(has_recovered, recovered.argmax(axis=1) - trough, np.nan)
+            time_to_recovery[start:stop] = np.where(mdd[start:stop] < 0, ttr, 0.0)
+
+            # 월별 수익률 (월초 자산 대비)
+            month_end = equity[:, self.trades_per_month - 1 :: self.trades_per_month]
+            month_start = np.concatenate([np.ones((n, 1)), month_end[:, :-1]], axis=1)
+            monthly = month_end / month_start - 1.0
+
+            monthly_mean[start:stop] = monthly.mean(axis=1)
+            final_return[start:stop] = equity[:, -1] - 1.0
+            daily_breach[start:stop] = (path_returns <= max_daily_loss).any(axis=1)
+            monthly_breach[start:stop] = (monthly <= max_monthly_loss).any(axis=1)
+            target_hit_months += int((monthly >= monthly_target).sum())
+
+        drawdown_breach = mdd <= max_drawdown
+        summary = {
+            "n_paths": self.n_paths,
+            "n_steps": n_steps,
+            "mdd_median": float(np.median(mdd)),
+            "mdd_p05": float(np.percentile(mdd, 5)),
+            "mdd_p01": float(np.percentile(mdd, 1)),
+            "time_to_recovery_median": (
+                float(np.nanmedian(time_to_recovery))
+                if np.isfinite(time_to_recovery).any()
+                else float('nan')
+            ),
+            "prob_never_recovered": float(np.isnan(time_to_recovery).mean()),
+            "prob_daily_loss_breach": float(daily_breach.mean()),
+            "prob_monthly_loss_breach": float(monthly_breach.mean()),
+            "prob_drawdown_breach": float(drawdown_breach.mean()),
+            "expected_monthly_return": float(monthly_mean.mean()),
+            "monthly_target": monthly_target,
+            "prob_month_meets_target": target_hit_months / (self.n_paths * self.n_months),
+            "prob_avg_month_meets_target": float((monthly_mean >= monthly_target).mean()),
+        }
+
+        logger.info(
+            f"몬테카를로 완료: {self.n_paths:,}경로 × {n_steps}거래, "
+            f"MDD 중앙값={summary['mdd_median']*100:.2f}%, "
+            f"MDD 한도 도달 확률={summary['prob_drawdown_breach']*100:.2f}%, "
+            f"월 기대수익률={summary['expected_monthly_return']*100:.2f}%"
+        )
+
+        return {
+            "mdd": mdd,
+            "time_to_recovery": time_to_recovery,
+            "monthly_return": monthly_mean,
+            "final_return": final_return,
+            "summary": summary,
+        }
+
+
+def main() -> int:
+    """CLI: 거래 기록으로 몬테카를로 리포트 출력"""
+    import argparse
+    import sys
+
+    project_root = Path(__file__).parent.parent.parent.parent
+    sys.path.insert(0, str(project_root))
+    from skills.trading_core.graph.state import load_trading_config
+
+    parser = argparse.ArgumentParser(description="거래 수익률 몬테카를로 부트스트랩")
+    parser.add_argument("trades", help="거래 기록 파일 (JSON/JSONL/텍스트)")
+    parser.add_argument("--paths", type=int, default=100_000)
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--trades-per-month", type=int, default=16)
+    parser.add_argument("--block-size", type=int, default=5)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = load_trading_config()
+    risk = config.get('risk', {})
+
+    simulator = MonteCarloSimulator(
+        n_paths=args.paths,
+        n_months=args.months,
+        trades_per_month=args.trades_per_month,
+        block_size=args.block_size,
+        position_ratio=config.get('trading', {}).get('position_size', 0.1),
+        chunk_size=args.chunk_size,
+        seed=args.seed,
+    )
+    result = simulator.run(
+        load_trade_returns(args.trades),
+        max_daily_loss=risk.get('max_daily_loss', -0.05),
+        max_monthly_loss=risk.get('max_monthly_loss', -0.15),
+        max_drawdown=risk.get('max_drawdown', -0.20),
+    )
+
+    print("=" * 80)
+    print("몬테카를로 리포트")
+    print("=" * 80)
+    for key, value in result["summary"].items():
+        print(f"{key:32s} {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
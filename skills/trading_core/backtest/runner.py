@@ -0,0 +1,286 @@
+"""
+백테스트 실행기
+
+HistoryStore의 일봉으로 단일 백테스트, 파라미터 스윕, 워크포워드 분석을 실행합니다.
+cache를 넘기면 이미 계산한 (코드, 파라미터, 종목, 구간, 데이터) 조합은 건너뜁니다.
+"""
+
+import itertools
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .cache import BacktestCache, make_cache_key
+from .engine import DEFAULT_PARAMS, compute_metrics, run_breakout_backtest, warmup_bars
+from ..data.history_store import HistoryStore
+
+logger = logging.getLogger(__name__)
+
+
+def slice_with_warmup(
+    bars: pd.DataFrame, start: Optional[str], end: Optional[str], warmup: int = 1
+) -> Tuple[pd.DataFrame, int]:
+    """
+    [start, end] 구간 + 목표가(적응형 k) 계산용 직전 warmup일
+
+    Args:
+        bars: 전체 일봉
+        start: 시작일 (YYYYMMDD)
+        end: 종료일 (YYYYMMDD)
+        warmup: 구간 앞에 붙일 일수
+
+    Returns:
+        (잘라낸 일봉, 실제 붙인 warmup 행 수 — 데이터 시작이면 더 적을 수 있음, 최소 1)
+    """
+    dates = bars["date"].to_numpy().astype(str)
+    first = 0 if start is None else int(np.searchsorted(dates, start, side="left"))
+    lo = max(0, first - warmup)
+    hi = len(dates) if end is None else int(np.searchsorted(dates, end, side="right"))
+    return bars.iloc[lo:hi].reset_index(drop=True), max(1, first - lo)
+
+
+class _LazyBars:
+    """캐시 미스일 때만 일봉을 한 번 로드"""
+
+    def __init__(self, store: HistoryStore, symbol: str):
+        self.store = store
+        self.symbol = symbol
+        self._bars: Optional[pd.DataFrame] = None
+
+    def get(self) -> pd.DataFrame:
+        if self._bars is None:
+            self._bars = self.store.load(self.symbol)
+        return self._bars
+
+
+def backtest_symbol(
+    store: HistoryStore,
+    symbol: str,
+    params: Optional[Dict] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    cache: Optional[BacktestCache] = None,
+    _bars: Optional[_LazyBars] = None,
+) -> Dict:
+    """
+    단일 종목 · 단일 파라미터 백테스트
+
+    Args:
+        store: 일봉 저장소
+        symbol: 종목 코드
+        params: 파라미터 (누락 값은 DEFAULT_PARAMS)
+        start: 시작일 (YYYYMMDD)
+        end: 종료일 (YYYYMMDD)
+        cache: 결과 캐시 (None이면 항상 계산)
+
+    Returns:
+        run_breakout_backtest() 결과
+    """
+    full_params = dict(DEFAULT_PARAMS)
+    if params:
+        full_params.update(params)
+
+    bars = _bars or _LazyBars(store, symbol)
+
+    def compute() -> Dict:
+        sliced, warmup = slice_with_warmup(bars.get(), start, end, warmup_bars(full_params))
+        return run_breakout_backtest(sliced, full_params, warmup=warmup)
+
+    if cache is None:
+        return compute()
+
+    key = make_cache_key(symbol, full_params, start, end, store.checksum(symbol))
+    return cache.get_or_compute(key, compute)
+
+
+def expand_grid(grid: Dict[str, Sequence]) -> List[Dict]:
+    """{'k_value': [0.4, 0.5]} → [{'k_value': 0.4}, {'k_value': 0.5}]"""
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+
+
+def run_parameter_sweep(
+    store: HistoryStore,
+    symbol: str,
+    grid: Dict[str, Sequence],
+    base_params: Optional[Dict] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    cache: Optional[BacktestCache] = None,
+    sort_by: str = "sharpe",
+) -> List[Dict]:
+    """
+    파라미터 그리드 스윕
+
+    Args:
+        store: 일봉 저장소
+        symbol: 종목 코드
+        grid: 파라미터별 후보 값
+        base_params: 그리드 외 고정 파라미터
+        start, end: 구간 (YYYYMMDD)
+        cache: 결과 캐시
+        sort_by: 정렬 기준 지표 (내림차순)
+
+    Returns:
+        [{'params': {...}, 'metrics': {...}}, ...] (sort_by 내림차순)
+    """
+    bars = _LazyBars(store, symbol)
+    rows = []
+    for combo in expand_grid(grid):
+        params = dict(base_params or {})
+        params.update(combo)
+        result = backtest_symbol(store, symbol, params, start, end, cache, _bars=bars)
+        rows.append({"params": combo, "metrics": result["metrics"]})
+
+    rows.sort(key=lambda row: row["metrics"].get(sort_by, 0.0), reverse=True)
+
+    if cache is not None:
+        logger.info(
+            f"스윕 완료: {symbol} {len(rows)}개 조합 "
+            f"(캐시 적중 {cache.hits}, 미스 {cache.misses})"
+        )
+    return rows
+
+
+def walk_forward(
+    store: HistoryStore,
+    symbol: str,
+    grid: Dict[str, Sequence],
+    train_days: int = 252,
+    test_days: int = 63,
+    base_params: Optional[Dict] = None,
+    cache: Optional[BacktestCache] = None,
+    sort_by: str = "sharpe",
+) -> Dict:
+    """
+    워크포워드 분석
+
+    학습 구간에서 sort_by 기준 최적 파라미터를 고르고, 바로 다음 검증 구간에
+    적용하는 과정을 test_days씩 밀며 반복합니다.
+
+    Args:
+        store: 일봉 저장소
+        symbol: 종목 코드
+        grid: 파라미터 후보
+        train_days: 학습 구간 길이 (거래일)
+        test_days: 검증 구간 길이 (거래일)
+        base_params: 고정 파라미터
+        cache: 결과 캐시
+        sort_by: 최적화 기준 지표
+
+    Returns:
+        {
+            'windows': [
+                {'train': (시작, 끝), 'test': (시작, 끝), 'params': {...}, 'metrics': {...}}
+            ],
+            'daily_returns': 검증 구간 이어붙인 일별 수익률,
+            'metrics': 검증 구간 전체 지표
+        }
+    """
+    bars = _LazyBars(store, symbol)
+    dates = bars.get()["date"].to_numpy().astype(str)
+    base = dict(DEFAULT_PARAMS)
+    base.update(base_params or {})
+
+    windows = []
+    oos_returns = []
+    oos_trades = []
+
+    # 첫 행은 전일 데이터용이므로 1부터 시작
+    for i in range(1, len(dates) - train_days - test_days + 1, test_days):
+        train = (dates[i], dates[i + train_days - 1])
+        test_end = min(i + train_days + test_days, len(dates)) - 1
+        test = (dates[i + train_days], dates[test_end])
+
+        best_params, best_score = None, -np.inf
+        for combo in expand_grid(grid):
+            params = dict(base)
+            params.update(combo)
+            result = backtest_symbol(store, symbol, params, train[0], train[1], cache, _bars=bars)
+            score = result["metrics"].get(sort_by, 0.0)
+            if score > best_score:
+                best_params, best_score = params, score
+
+        test_result = backtest_symbol(
+            store, symbol, best_params, test[0], test[1], cache, _bars=bars
+        )
+        oos_returns.append(test_result["daily_returns"])
+        oos_trades.append(test_result["trade_returns"])
+        windows.append(
+            {
+                "train": train,
+                "test": test,
+                "params": {k: best_params[k] for k in grid},
+                "metrics": test_result["metrics"],
+            }
+        )
+
+    daily_returns = np.concatenate(oos_returns) if oos_returns else np.empty(0)
+    trade_returns = np.concatenate(oos_trades) if oos_trades else np.empty(0)
+    equity = base["initial_capital"] * np.cumprod(1.0 + daily_returns)
+
+    return {
+        "windows": windows,
+        "daily_returns": daily_returns,
+        "metrics": compute_metrics(daily_returns, equity, trade_returns),
+    }
+
+
+def compare_k_modes(
+    store: HistoryStore,
+    symbols: Sequence[str],
+    base_params: Optional[Dict] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    cache: Optional[BacktestCache] = None,
+) -> Dict:
+    """
+    고정 k vs 적응형 k 비교
+
+    같은 구간 · 같은 파라미터에서 k_mode만 바꿔 종목별로 백테스트합니다.
+
+    Args:
+        store: 일봉 저장소
+        symbols: 종목 목록
+        base_params: 공통 파라미터 (k_value는 고정 모드 값이자 적응형 모드의 데이터 부족 시 값)
+        start, end: 구간 (YYYYMMDD)
+        cache: 결과 캐시
+
+    Returns:
+        {
+            'symbols': {종목: {'static': 지표, 'adaptive': 지표}},
+            'summary': {
+                'static': 평균 지표, 'adaptive': 평균 지표, 'adaptive_wins': 샤프 우위 종목 수
+            }
+        }
+    """
+    per_symbol = {}
+    for symbol in symbols:
+        bars = _LazyBars(store, symbol)
+        row = {}
+        for mode in ("static", "adaptive"):
+            params = dict(base_params or {})
+            params["k_mode"] = mode
+            row[mode] = backtest_symbol(store, symbol, params, start, end, cache, _bars=bars)[
+                "metrics"
+            ]
+        per_symbol[symbol] = row
+
+    summary: Dict = {}
+    for mode in ("static", "adaptive"):
+        rows = [row[mode] for row in per_symbol.values()]
+        summary[mode] = {
+            name: float(np.mean([m[name] for m in rows])) if rows else 0.0
+            for name in ("total_return", "cagr", "mdd", "sharpe", "n_trades", "win_rate")
+        }
+    summary["adaptive_wins"] = sum(
+        1 for row in per_symbol.values() if row["adaptive"]["sharpe"] > row["static"]["sharpe"]
+    )
+
+    logger.info(
+        f"k 모드 비교 ({len(per_symbol)}개 종목): 샤프 고정 {summary['static']['sharpe']:.2f} / "
+        f"적응형 {summary['adaptive']['sharpe']:.2f}, 적응형 우위 {summary['adaptive_wins']}개"
+    )
+    return {"symbols": per_symbol, "summary": summary}
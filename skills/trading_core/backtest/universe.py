@@ -0,0 +1,366 @@
+"""
+유니버스 규모 스트리밍 백테스트
+
+KOSPI/KOSDAQ 전 종목(~2,500개) 중 변동성 돌파에 적합한 종목을 찾기 위해
+종목을 디스크에서 chunk_size 단위로 읽어 워커 프로세스에서 백테스트하고,
+종목별 지표를 결과 파일(JSONL)로 흘려보낸 뒤 상위 N개 순위표로 축약합니다.
+
+- 동시에 처리 중인 청크 수를 워커 수 × 2로 제한하므로 최대 메모리는
+  유니버스 크기가 아니라 chunk_size와 워커 수에만 비례합니다.
+- 완료된 청크 번호를 체크포인트에 기록하므로 중단 후 같은 설정으로 다시 실행하면
+  남은 청크만 처리합니다. 설정 지문(파라미터, 청크 크기, 종목 목록 파일 내용,
+  종목별 마지막 저장일 · 파일 크기, 전략 코드 버전)이 다르면 체크포인트를 쓰지 않습니다.
+"""
+
+import hashlib
+import heapq
+import json
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from .cache import strategy_code_version
+from .engine import DEFAULT_PARAMS, run_breakout_backtest
+from ..data.history_store import HistoryStore
+
+logger = logging.getLogger(__name__)
+
+project_root = Path(__file__).parent.parent.parent.parent
+
+
+def iter_universe(source: Union[HistoryStore, str, Path]) -> Iterator[str]:
+    """
+    유니버스 종목 코드를 하나씩 생성
+
+    Args:
+        source: HistoryStore (저장된 CSV 전체) 또는 종목 목록 파일
+                (한 줄에 종목 코드 하나, CSV면 첫 컬럼, '#' 주석/헤더 무시)
+
+    Yields:
+        종목 코드
+    """
+    if isinstance(source, HistoryStore):
+        with os.scandir(source.root) as entries:
+            names = sorted(e.name for e in entries if e.name.endswith(".csv"))
+        for name in names:
+            yield name[:-4]
+        return
+
+    with open(source, "r", encoding="utf-8") as f:
+        for line in f:
+            code = line.split(",", 1)[0].strip()
+            if code and not code.startswith("#") and code.lower() not in ("code", "symbol"):
+                yield code
+
+
+def iter_chunks(symbols: Iterator[str], chunk_size: int) -> Iterator[Tuple[int, List[str]]]:
+    """종목 스트림을 (청크 번호, 종목 리스트)로 묶음"""
+    chunk: List[str] = []
+    chunk_id = 0
+    for symbol in symbols:
+        chunk.append(symbol)
+        if len(chunk) >= chunk_size:
+            yield chunk_id, chunk
+            chunk_id += 1
+            chunk = []
+    if chunk:
+        yield chunk_id, chunk
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """파일 내용 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def data_fingerprint(store: HistoryStore, symbols: Iterator[str]) -> str:
+    """
+    종목별 저장 데이터 지문 (마지막 저장일 + 파일 크기, 파일 전체를 읽지 않음)
+
+    일봉 추가(append)는 마지막 저장일을, 과거 행 수정(save 재작성)은 파일 크기를 바꿉니다.
+
+    Args:
+        store: 일봉 저장소
+        symbols: 종목 코드 스트림
+
+    Returns:
+        SHA-256 16진수
+    """
+    digest = hashlib.sha256()
+    for symbol in symbols:
+        path = store.path(symbol)
+        size = path.stat().st_size if path.exists() else -1
+        digest.update(f"{symbol},{store.last_date(symbol)},{size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def run_symbol_chunk(
+    chunk_id: int, symbols: List[str], store_root: str, params: Dict, min_bars: int = 60
+) -> Tuple[int, List[Dict]]:
+    """
+    워커: 청크 내 종목 백테스트 (프로세스 풀에서 실행)
+
+    Returns:
+        (청크 번호, 종목별 지표 행 리스트)
+    """
+    store = HistoryStore(store_root)
+    rows = []
+    for symbol in symbols:
+        try:
+            bars = store.load(symbol)
+            if len(bars) < min_bars:
+                rows.append({"symbol": symbol, "error": f"데이터 부족 ({len(bars)}일)"})
+                continue
+            metrics = run_breakout_backtest(bars, params)["metrics"]
+            rows.append({"symbol": symbol, "n_bars": len(bars), **metrics})
+        except Exception as e:
+            rows.append({"symbol": symbol, "error": str(e)})
+    return chunk_id, rows
+
+
+class UniverseBacktest:
+    """체크포인트 기반 유니버스 백테스트 실행기"""
+
+    def __init__(
+        self,
+        store: HistoryStore,
+        params: Optional[Dict] = None,
+        chunk_size: int = 50,
+        max_workers: Optional[int] = None,
+        run_dir: Optional[Union[str, Path]] = None,
+        min_bars: int = 60,
+        source: Optional[Union[str, Path]] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            store: 일봉 저장소
+            params: 백테스트 파라미터 (누락 값은 DEFAULT_PARAMS)
+            chunk_size: 워커 1회 처리 종목 수
+            max_workers: 워커 프로세스 수 (None이면 CPU 수)
+            run_dir: 체크포인트 디렉토리 (None이면 data/universe_runs/{설정 해시})
+            min_bars: 최소 일봉 수 (미만이면 제외)
+            source: 종목 목록 파일 (None이면 저장소 전체)
+        """
+        self.store = store
+        self.source = Path(source) if source is not None else None
+        self.params = dict(DEFAULT_PARAMS)
+        if params:
+            self.params.update(params)
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_bars = min_bars
+
+        self.fingerprint = self._fingerprint()
+        if run_dir is None:
+            run_dir = project_root / "data" / "universe_runs" / self.fingerprint[:12]
+        self.run_dir = Path(run_dir)
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        self.results_path = self.run_dir / "results.jsonl"
+        self.checkpoint_path = self.run_dir / "done_chunks.txt"
+        self.fingerprint_path = self.run_dir / "fingerprint.txt"
+        self._check_fingerprint()
+
+    def _universe(self) -> Iterator[str]:
+        return iter_universe(self.source if self.source is not None else self.store)
+
+    def _fingerprint(self) -> str:
+        """설정 · 종목 목록 · 데이터 · 전략 코드 지문 (하나라도 바뀌면 다른 실행)"""
+        source = None
+        if self.source is not None:
+            source = {"path": str(self.source.resolve()), "sha256": file_sha256(self.source)}
+        fingerprint = json.dumps(
+            {
+                "params": self.params,
+                "chunk_size": self.chunk_size,
+                "min_bars": self.min_bars,
+                "store": str(self.store.root),
+                "source": source,
+                "data": data_fingerprint(self.store, self._universe()),
+                "code": strategy_code_version(),
+            },
+            sort_keys=True,
+        ).encode("utf-8")
+        return hashlib.sha256(fingerprint).hexdigest()
+
+    def _check_fingerprint(self) -> None:
+        """실행 디렉토리의 체크포인트가 다른 설정 · 데이터로 만든 것이면 버리고 새로 시작"""
+        previous = None
+        if self.fingerprint_path.exists():
+            previous = self.fingerprint_path.read_text(encoding="utf-8").strip()
+        stale = self.checkpoint_path.exists() or self.results_path.exists()
+        if previous != self.fingerprint and stale:
+            logger.warning(f"[universe] 설정 · 데이터가 바뀌어 체크포인트를 버림: {self.run_dir}")
+            self.checkpoint_path.unlink(missing_ok=True)
+            self.results_path.unlink(missing_ok=True)
+        self.fingerprint_path.write_text(self.fingerprint + "\n", encoding="utf-8")
+
+    def completed_chunks(self) -> set:
+        """체크포인트에 기록된 완료 청크 번호"""
+        if not self.checkpoint_path.exists():
+            return set()
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            return {int(line) for line in f if line.strip()}
+
+    def _repair_results_tail(self) -> None:
+        """중단으로 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄바꿈 보정"""
+        if not self.results_path.exists() or self.results_path.stat().st_size == 0:
+            return
+        with open(self.results_path, "rb+") as f:
+            f.seek(-1, 2)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    def run(self) -> int:
+        """
+        유니버스 백테스트 실행 (중단 지점부터 재개)
+
+        Returns:
+            이번 실행에서 처리한 청크 수
+        """
+        done = self.completed_chunks()
+        self._repair_results_tail()
+        if done:
+            logger.info(f"[universe] 체크포인트에서 재개: 완료 청크 {len(done)}개 건너뜀")
+
+        chunks = (
+            (chunk_id, symbols)
+            for chunk_id, symbols in iter_chunks(self._universe(), self.chunk_size)
+            if chunk_id not in done
+        )
+        max_in_flight = self.max_workers * 2
+        processed = 0
+
+        with (
+            ProcessPoolExecutor(max_workers=self.max_workers) as pool,
+            open(self.results_path, "a", encoding="utf-8") as results,
+            open(self.checkpoint_path, "a", encoding="utf-8") as checkpoint,
+        ):
+            pending = set()
+
+            def submit_next() -> bool:
+                try:
+                    chunk_id, symbols = next(chunks)
+                except StopIteration:
+                    return False
+                pending.add(
+                    pool.submit(
+                        run_symbol_chunk,
+                        chunk_id,
+                        symbols,
+                        str(self.store.root),
+                        self.params,
+                        self.min_bars,
+                    )
+                )
+                return True
+
+            while len(pending) < max_in_flight and submit_next():
+                pass
+
+            while pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    chunk_id, rows = future.result()
+                    # 결과를 먼저 기록한 뒤 체크포인트 기록 (재개 시 중복은 reduce에서 제거)
+                    for row in rows:
+                        results.write(json.dumps(row, ensure_ascii=False) + "\n")
+                    results.flush()
+                    checkpoint.write(f"{chunk_id}\n")
+                    checkpoint.flush()
+                    processed += 1
+                    if processed % 10 == 0:
+                        logger.info(f"[universe] 청크 {processed}개 처리")
+
+                while len(pending) < max_in_flight and submit_next():
+                    pass
+
+        logger.info(f"[universe] 완료: 이번 실행 {processed}개 청크")
+        return processed
+
+    def ranking(
+        self, sort_by: str = "sharpe", top_n: int = 100, min_trades: int = 20
+    ) -> List[Dict]:
+        """
+        결과 파일을 스트리밍으로 읽어 상위 N개 순위표 생성
+
+        메모리는 top_n에만 비례합니다.
+
+        Args:
+            sort_by: 정렬 기준 지표 (내림차순)
+            top_n: 반환할 종목 수
+            min_trades: 최소 거래 횟수 (미만 종목 제외)
+
+        Returns:
+            지표 행 리스트 (sort_by 내림차순)
+        """
+        heap: List[Tuple[float, str, Dict]] = []
+        if not self.results_path.exists():
+            return []
+
+        with open(self.results_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 중단 시 잘린 마지막 줄
+                if "error" in row or row.get("n_trades", 0) < min_trades:
+                    continue
+                entry = (row.get(sort_by, 0.0), row["symbol"], row)
+                if any(existing[1] == row["symbol"] for existing in heap):
+                    continue  # 재개 시 중복 기록된 종목
+                if len(heap) < top_n:
+                    heapq.heappush(heap, entry)
+                elif entry[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, entry)
+
+        return [row for _, _, row in sorted(heap, key=lambda e: e[:2], reverse=True)]
+
+
+def main() -> int:
+    """CLI: 유니버스 백테스트 실행 및 순위표 출력"""
+    import argparse
+    import sys
+
+    sys.path.insert(0, str(project_root))
+    from skills.trading_core.backtest.engine import default_params
+    from skills.trading_core.graph.state import load_trading_config
+
+    parser = argparse.ArgumentParser(description="유니버스 변동성 돌파 백테스트")
+    parser.add_argument(
+        "--universe", default=None, help="종목 목록 파일 (없으면 data/historical 전체)"
+    )
+    parser.add_argument("--chunk-size", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--sort-by", default="sharpe")
+    parser.add_argument("--top", type=int, default=50)
+    parser.add_argument("--min-trades", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    runner = UniverseBacktest(
+        HistoryStore(),
+        params=default_params(load_trading_config()),
+        chunk_size=args.chunk_size,
+        max_workers=args.workers,
+        source=args.universe,
+    )
+    runner.run()
+
+    print(f"{'순위':>4} {'종목':>8} {args.sort_by:>10} {'수익률':>10} {'MDD':>8} {'거래':>6}")
+    for rank, row in enumerate(runner.ranking(args.sort_by, args.top, args.min_trades), 1):
+        print(
+            f"{rank:>4} {row['symbol']:>8} {row.get(args.sort_by, 0):>10.3f} "
+            f"{row['total_return']*100:>9.2f}% {row['mdd']*100:>7.2f}% {row['n_trades']:>6}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
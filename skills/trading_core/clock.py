@@ -0,0 +1,215 @@
+"""
+시계(Clock) 추상화
+
+전략, 노드, 스케줄러, 로그 타임스탬프가 datetime.now()를 직접 호출하지 않고
+주입 가능한 시계를 통해 현재 시각을 얻도록 합니다.
+
+- RealTimeClock: 실제 시각 (운영 기본값)
+- FixedClock: 고정 시각 (단위 테스트)
+- AcceleratedClock: 실제 시간보다 N배 빠르게 흐르는 시각
+- VirtualClock: sleep() 호출 시 즉시 시각만 전진 (리플레이/백테스트)
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Clock(ABC):
+    """시계 인터페이스"""
+
+    @abstractmethod
+    def now(self) -> datetime:
+        """현재 시각 반환"""
+
+    @abstractmethod
+    def sleep(self, seconds: float) -> None:
+        """주어진 시간(초)만큼 대기"""
+
+    def sleep_until(self, target: datetime) -> None:
+        """
+        지정 시각까지 대기
+
+        Args:
+            target: 대기 종료 시각 (이미 지났으면 즉시 반환)
+        """
+        remaining = (target - self.now()).total_seconds()
+        if remaining > 0:
+            self.sleep(remaining)
+
+    def isoformat(self) -> str:
+        """현재 시각 ISO 문자열 (TradingState.timestamp 용)"""
+        return self.now().isoformat()
+
+
+class RealTimeClock(Clock):
+    """실제 시스템 시각을 사용하는 시계"""
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class FixedClock(Clock):
+    """
+    고정 시각 시계
+
+    set()으로 바꾸기 전까지 항상 같은 시각을 반환합니다.
+    sleep()은 시각을 바꾸지 않고 즉시 반환합니다.
+    """
+
+    def __init__(self, fixed_time: datetime):
+        self._time = fixed_time
+
+    def now(self) -> datetime:
+        return self._time
+
+    def set(self, new_time: datetime) -> None:
+        """고정 시각 변경"""
+        self._time = new_time
+
+    def sleep(self, seconds: float) -> None:
+        return None
+
+
+class AcceleratedClock(Clock):
+    """
+    가속 시계
+
+    start_time부터 실제 경과 시간 × speed 만큼 흐르는 시각을 반환합니다.
+    sleep(seconds)는 가상 시간 기준이므로 실제로는 seconds / speed 만큼만 대기합니다.
+    """
+
+    def __init__(self, start_time: datetime, speed: float = 60.0):
+        if speed <= 0:
+            raise ValueError(f"speed는 0보다 커야 합니다: {speed}")
+        self.start_time = start_time
+        self.speed = speed
+        self._origin = time.monotonic()
+
+    def now(self) -> datetime:
+        elapsed = (time.monotonic() - self._origin) * self.speed
+        return self.start_time + timedelta(seconds=elapsed)
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds / self.speed)
+
+
+class VirtualClock(Clock):
+    """
+    가상(이산 이벤트) 시계
+
+    실제 시간과 무관하게 sleep()/advance() 호출 시에만 시각이 전진합니다.
+    기록된 거래일을 실제 대기 없이 결정적으로 리플레이할 때 사용합니다.
+    """
+
+    def __init__(self, start_time: datetime):
+        self._time = start_time
+        self._lock = threading.Lock()
+
+    def now(self) -> datetime:
+        with self._lock:
+            return self._time
+
+    def advance(self, seconds: float) -> datetime:
+        """
+        시각 전진
+
+        Args:
+            seconds: 전진할 시간 (초)
+
+        Returns:
+            전진 후 시각
+        """
+        with self._lock:
+            if seconds > 0:
+                self._time += timedelta(seconds=seconds)
+            return self._time
+
+    def set(self, new_time: datetime) -> None:
+        """시각 직접 설정 (과거로 되돌리는 것은 허용하지 않음)"""
+        with self._lock:
+            if new_time < self._time:
+                raise ValueError(
+                    f"가상 시계를 과거로 되돌릴 수 없습니다: {self._time} → {new_time}"
+                )
+            self._time = new_time
+
+    def sleep(self, seconds: float) -> None:
+        self.advance(seconds)
+
+
+# ========== 전역 시계 ==========
+
+_clock: Clock = RealTimeClock()
+
+
+def get_clock() -> Clock:
+    """현재 설정된 전역 시계 반환"""
+    return _clock
+
+
+def set_clock(clock: Clock) -> Clock:
+    """
+    전역 시계 교체
+
+    Args:
+        clock: 새 시계
+
+    Returns:
+        이전 시계 (복원용)
+    """
+    global _clock
+    previous = _clock
+    _clock = clock
+    logger.debug(f"전역 시계 변경: {type(previous).__name__} → {type(clock).__name__}")
+    return previous
+
+
+@contextmanager
+def use_clock(clock: Clock) -> Iterator[Clock]:
+    """
+    with 블록 안에서만 전역 시계를 교체
+
+    Example:
+        >>> with use_clock(VirtualClock(datetime(2024, 1, 2, 9, 0))):
+        ...     graph.invoke(state)
+    """
+    previous = set_clock(clock)
+    try:
+        yield clock
+    finally:
+        set_clock(previous)
+
+
+class ClockFormatter(logging.Formatter):
+    """
+    전역 시계 기준으로 asctime을 찍는 로그 포매터
+
+    리플레이 중에는 로그 타임스탬프도 가상 시각을 따릅니다.
+    """
+
+    def __init__(
+        self,
+        fmt: Optional[str] = None,
+        datefmt: Optional[str] = None,
+        clock: Optional[Clock] = None,
+    ):
+        super().__init__(fmt, datefmt)
+        self._clock = clock
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        current = (self._clock or get_clock()).now()
+        if datefmt:
+            return current.strftime(datefmt)
+        return f"{current.strftime('%Y-%m-%d %H:%M:%S')},{current.microsecond // 1000:03d}"
@@ -0,0 +1,222 @@
+"""
+일봉 OHLCV 로컬 저장소
+
+종목별 일봉 데이터를 data/historical/{symbol}.csv 에 보관합니다.
+백테스트, 지표 워밍업, 결과 캐시 키(데이터 체크섬)가 모두 이 저장소를 사용합니다.
+
+CSV 컬럼: date(YYYYMMDD), open, high, low, close, volume (가격은 원 단위 정수)
+"""
+
+import hashlib
+import io
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from ..price import to_won_array
+
+logger = logging.getLogger(__name__)
+
+project_root = Path(__file__).parent.parent.parent.parent
+
+COLUMNS = ["date", "open", "high", "low", "close", "volume"]
+PRICE_COLUMNS = ["open", "high", "low", "close"]
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """COLUMNS만 남기고 날짜는 문자열, 가격은 원 단위 정수로 변환"""
+    out = df[COLUMNS].copy()
+    out["date"] = out["date"].astype(str)
+    for column in PRICE_COLUMNS:
+        out[column] = to_won_array(out[column].to_numpy())
+    return out
+
+
+class HistoryStore:
+    """종목별 일봉 CSV 저장소"""
+
+    def __init__(self, root: Optional[Union[str, Path]] = None):
+        """
+        초기화
+
+        Args:
+            root: 저장 디렉토리 (None이면 data/historical)
+        """
+        self.root = Path(root) if root is not None else project_root / "data" / "historical"
+        self.root.mkdir(parents=True, exist_ok=True)
+        # (mtime_ns, size) → 체크섬 캐시
+        self._checksums: Dict[str, Tuple[int, int, str]] = {}
+
+    def path(self, symbol: str) -> Path:
+        """종목 CSV 경로"""
+        return self.root / f"{symbol}.csv"
+
+    def exists(self, symbol: str) -> bool:
+        return self.path(symbol).exists()
+
+    def symbols(self) -> List[str]:
+        """저장된 종목 코드 목록 (정렬)"""
+        return sorted(p.stem for p in self.root.glob("*.csv"))
+
+    def load(
+        self, symbol: str, start: Optional[str] = None, end: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        일봉 로드 (날짜 오름차순)
+
+        Args:
+            symbol: 종목 코드
+            start: 시작일 (YYYYMMDD, 포함)
+            end: 종료일 (YYYYMMDD, 포함)
+
+        Returns:
+            COLUMNS 컬럼의 DataFrame
+
+        Raises:
+            FileNotFoundError: 저장된 데이터가 없는 경우
+        """
+        path = self.path(symbol)
+        if not path.exists():
+            raise FileNotFoundError(f"일봉 데이터가 없습니다: {path}")
+
+        df = pd.read_csv(path, dtype={"date": str})
+        if start is not None:
+            df = df[df["date"] >= start]
+        if end is not None:
+            df = df[df["date"] <= end]
+        return df.reset_index(drop=True)
+
+    def save(self, symbol: str, df: pd.DataFrame) -> Path:
+        """
+        일봉 전체 저장 (기존 파일 덮어쓰기)
+
+        Args:
+            symbol: 종목 코드
+            df: COLUMNS 컬럼을 포함한 DataFrame
+
+        Returns:
+            저장 경로
+        """
+        path = self.path(symbol)
+        out = _normalize(df).drop_duplicates("date", keep="last").sort_values("date")
+        tmp = path.with_suffix(".csv.tmp")
+        out.to_csv(tmp, index=False)
+        tmp.replace(path)
+        return path
+
+    def append(self, symbol: str, bars: Union[pd.DataFrame, List[dict]]) -> int:
+        """
+        신규 일봉 추가
+
+        이미 있는 날짜는 새 값으로 교체하고, 마지막 저장일 이후 데이터만
+        있으면 파일 끝에 덧붙입니다 (전체 재작성 없음).
+
+        Args:
+            symbol: 종목 코드
+            bars: 일봉 DataFrame 또는 _call_inquire_daily_chart 형식의 딕셔너리 리스트
+
+        Returns:
+            추가된 행 수
+        """
+        new = pd.DataFrame(bars) if not isinstance(bars, pd.DataFrame) else bars.copy()
+        if new.empty:
+            return 0
+        new = _normalize(new).drop_duplicates("date", keep="last").sort_values("date")
+
+        path = self.path(symbol)
+        last_date = self.last_date(symbol)
+
+        if last_date is None:
+            self.save(symbol, new)
+            return len(new)
+
+        if new["date"].iloc[0] > last_date:
+            new.to_csv(path, mode="a", header=False, index=False)
+            return len(new)
+
+        existing = self.load(symbol)
+        added = int((~new["date"].isin(existing["date"])).sum())
+        self.save(symbol, pd.concat([existing, new], ignore_index=True))
+        return added
+
+    def load_after(
+        self, symbol: str, after_date: Optional[str], offset_hint: Optional[int] = None
+    ) -> Tuple[pd.DataFrame, int]:
+        """
+        after_date 이후 일봉만 로드
+
+        offset_hint(이전 호출이 반환한 파일 오프셋)가 유효하면 그 위치부터만 읽으므로
+        파일 전체 크기와 무관하게 신규 행 수에 비례하는 비용으로 동작합니다.
+        파일이 재작성되어 오프셋이 맞지 않으면 전체를 읽어 날짜로 거릅니다.
+
+        Args:
+            symbol: 종목 코드
+            after_date: 이 날짜 이후(미포함) 데이터만 반환 (None이면 전체)
+            offset_hint: 이전에 읽은 위치 (바이트)
+
+        Returns:
+            (신규 일봉 DataFrame, 파일 끝 오프셋)
+        """
+        path = self.path(symbol)
+        size = path.stat().st_size
+
+        if offset_hint is not None and after_date is not None and 0 < offset_hint <= size:
+            with open(path, "rb") as f:
+                # 오프셋 직전 줄이 after_date 행인지 확인
+                f.seek(max(0, offset_hint - 256))
+                head = f.read(offset_hint - max(0, offset_hint - 256)).decode("utf-8")
+                lines = head.rstrip("\n").splitlines()
+                if head.endswith("\n") and lines and lines[-1].split(",", 1)[0] == after_date:
+                    f.seek(offset_hint)
+                    rest = f.read().decode("utf-8")
+                    if not rest.strip():
+                        return pd.DataFrame(columns=COLUMNS), size
+                    df = pd.read_csv(
+                        io.StringIO(rest), header=None, names=COLUMNS, dtype={"date": str}
+                    )
+                    return df, size
+
+        df = self.load(symbol)
+        if after_date is not None:
+            df = df[df["date"] > after_date].reset_index(drop=True)
+        return df, size
+
+    def last_date(self, symbol: str) -> Optional[str]:
+        """마지막 저장일 (없으면 None)"""
+        path = self.path(symbol)
+        if not path.exists():
+            return None
+
+        # 파일 끝만 읽어서 마지막 날짜 확인
+        with open(path, "rb") as f:
+            f.seek(0, 2)
+            size = f.tell()
+            f.seek(max(0, size - 256))
+            tail = f.read().decode("utf-8").strip().splitlines()
+
+        if not tail or tail[-1].startswith("date"):
+            return None
+        return tail[-1].split(",", 1)[0]
+
+    def checksum(self, symbol: str) -> str:
+        """
+        데이터 파일 SHA-256 체크섬
+
+        파일의 (수정시각, 크기)가 같으면 재계산하지 않습니다.
+        """
+        path = self.path(symbol)
+        stat = path.stat()
+        cached = self._checksums.get(symbol)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+
+        value = digest.hexdigest()
+        self._checksums[symbol] = (stat.st_mtime_ns, stat.st_size, value)
+        return value
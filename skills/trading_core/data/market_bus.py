@@ -0,0 +1,391 @@
+"""
+공유 메모리 시세 버스
+
+여러 프로세스(전략 워커, Flask 대시보드, 섀도 전략)가 같은 종목을 각자 KIS로
+조회하면 API 호출이 프로세스 수만큼 늘어납니다. 시세 게시 프로세스 하나
+(apps/market_bus_app.py)가 종목별 최신 현재가 · 당일 시고저 · 누적 거래량과
+전일 일봉을 고정 레이아웃 테이블에 쓰고, 같은 머신의 다른 프로세스는 이 테이블을
+메모리 맵으로 열어 네트워크 호출 없이 읽습니다.
+
+- 파일: /dev/shm/market_bus.npy (없으면 data/market_bus/market_bus.npy),
+  MARKET_BUS_DTYPE 배열을 .npy 형식으로 저장 (종목 코드 오름차순, 게시 중 종목 고정)
+- 쓰기: 게시 프로세스 하나만. 행마다 seq를 홀수로 올린 뒤 값을 쓰고 다시 짝수로 올림
+- 읽기: 락 없이 seq(짝수) → 행 복사 → seq 재확인. 값이 바뀌는 중이면 다시 읽음 (seqlock)
+
+updated_at은 게시 시각(전역 시계 기준 epoch 초)이며, 읽는 쪽은 max_age보다 오래된
+행을 쓰지 않고 직접 조회로 대체합니다.
+"""
+
+import logging
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..clock import get_clock
+from ..price import Won, to_won
+
+project_root = Path(__file__).parent.parent.parent.parent
+
+logger = logging.getLogger(__name__)
+
+MARKET_BUS_DTYPE = np.dtype(
+    [
+        ("seq", "<u8"),  # seqlock 버전 (홀수: 쓰는 중, 0: 게시 전)
+        ("symbol", "S12"),
+        ("date", "<i8"),  # 시세 일자 (YYYYMMDD)
+        ("updated_at", "<f8"),  # 게시 시각 (epoch 초)
+        ("price", "<i8"),
+        ("open", "<i8"),
+        ("high", "<i8"),
+        ("low", "<i8"),
+        ("volume", "<i8"),
+        ("change", "<i8"),
+        ("change_pct", "<f8"),
+        ("prev_date", "<i8"),  # 전일 영업일 (YYYYMMDD, 0이면 미게시)
+        ("prev_open", "<i8"),
+        ("prev_high", "<i8"),
+        ("prev_low", "<i8"),
+        ("prev_close", "<i8"),
+        ("prev_volume", "<i8"),
+    ]
+)
+
+# 행 바이트 ↔ 값 변환 (np.void 복사보다 한 자릿수 빠름, MARKET_BUS_DTYPE과 같은 배치)
+_ROW = struct.Struct("<Q12sqdqqqqqqdqqqqqq")
+
+
+class BusRecord(NamedTuple):
+    """시세 버스 한 행 (MARKET_BUS_DTYPE 필드 순서)"""
+
+    seq: int
+    symbol: bytes
+    date: int
+    updated_at: float
+    price: Won
+    open: Won
+    high: Won
+    low: Won
+    volume: int
+    change: Won
+    change_pct: float
+    prev_date: int
+    prev_open: Won
+    prev_high: Won
+    prev_low: Won
+    prev_close: Won
+    prev_volume: int
+
+
+# 쓰는 중인 행을 만났을 때 다시 읽는 최대 횟수
+READ_RETRIES = 1000
+
+
+def default_bus_path() -> Path:
+    """기본 버스 파일 경로 (/dev/shm이 있으면 메모리 파일시스템 사용)"""
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return shm / "market_bus.npy"
+    return project_root / "data" / "market_bus" / "market_bus.npy"
+
+
+class MarketBusPublisher:
+    """시세 버스 쓰기 (게시 프로세스 전용, 한 프로세스만 사용)"""
+
+    def __init__(self, symbols: Sequence[str], path: Optional[Union[str, Path]] = None):
+        """
+        버스 파일 생성 (임시 파일을 채운 뒤 os.replace로 교체)
+
+        Args:
+            symbols: 게시할 종목 코드 (게시 중에는 고정)
+            path: 버스 파일 경로 (None이면 default_bus_path())
+        """
+        self.path = Path(path) if path is not None else default_bus_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        names = sorted(set(symbols))
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        data = np.lib.format.open_memmap(
+            tmp, mode="w+", dtype=MARKET_BUS_DTYPE, shape=(len(names),)
+        )
+        data["symbol"] = np.asarray(names, dtype="S12")
+        data.flush()
+        os.replace(tmp, self.path)
+
+        self._bind(data)
+        logger.info(f"[market_bus] 버스 생성: {len(names)}개 종목 → {self.path}")
+
+    @classmethod
+    def attach(cls, path: Optional[Union[str, Path]] = None) -> "MarketBusPublisher":
+        """
+        기존 버스 파일에 이어서 쓰기 (게시 프로세스 재시작 시 읽는 쪽 매핑 유지)
+
+        Args:
+            path: 버스 파일 경로 (None이면 default_bus_path())
+
+        Raises:
+            ValueError: 버스 형식이 다른 경우
+        """
+        publisher = cls.__new__(cls)
+        publisher.path = Path(path) if path is not None else default_bus_path()
+        data = np.load(publisher.path, mmap_mode="r+")
+        if data.dtype != MARKET_BUS_DTYPE:
+            raise ValueError(f"시세 버스 형식이 다릅니다: {publisher.path}")
+        publisher._bind(data)
+        return publisher
+
+    @classmethod
+    def open(
+        cls, symbols: Sequence[str], path: Optional[Union[str, Path]] = None
+    ) -> "MarketBusPublisher":
+        """
+        같은 종목 구성의 버스 파일이 있으면 이어서 쓰고, 없거나 다르면 새로 생성
+
+        새로 만들면 파일이 교체(inode 변경)되므로 읽는 쪽은 MarketBus가 다시 엽니다.
+
+        Args:
+            symbols: 게시할 종목 코드
+            path: 버스 파일 경로 (None이면 default_bus_path())
+        """
+        path = Path(path) if path is not None else default_bus_path()
+        if path.exists():
+            try:
+                publisher = cls.attach(path)
+            except (ValueError, OSError) as e:
+                logger.warning(f"[market_bus] 기존 버스를 쓸 수 없어 새로 생성: {e}")
+            else:
+                if publisher.symbols == sorted(set(symbols)):
+                    logger.info(f"[market_bus] 기존 버스에 이어서 게시: {path}")
+                    return publisher
+                logger.info("[market_bus] 종목 구성이 달라 버스를 새로 생성")
+        return cls(symbols, path)
+
+    def _bind(self, data: np.memmap) -> None:
+        self._data = data
+        self._seq = data.view(np.ndarray)["seq"]
+        self._buffer = memoryview(data.view(np.uint8))
+        self._index = {symbol.decode(): i for i, symbol in enumerate(data["symbol"])}
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._index
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._index)
+
+    def _write(self, i: int, **fields) -> None:
+        """행 갱신 (seq 홀수 → 값 기록 → seq 짝수)"""
+        offset = i * _ROW.size
+        record = BusRecord._make(_ROW.unpack_from(self._buffer, offset))
+        seq = record.seq
+        # 읽는 쪽이 재시도하는 구간(seq 홀수)이 바이트 복사 한 번이 되도록 미리 직렬화
+        raw = _ROW.pack(*record._replace(seq=seq + 1, **fields))
+        self._seq[i] = seq + 1
+        self._buffer[offset : offset + _ROW.size] = raw
+        self._seq[i] = seq + 2
+
+    def publish_quote(
+        self, symbol: str, price_data: Dict[str, Any], date: Optional[str] = None
+    ) -> None:
+        """
+        현재가 게시
+
+        Args:
+            symbol: 종목 코드
+            price_data: nodes._call_inquire_price 결과 (current_price, open, high, low, volume, ...)
+            date: 시세 일자 (YYYYMMDD, None이면 전역 시계 기준 오늘)
+        """
+        now = get_clock().now()
+        self._write(
+            self._index[symbol],
+            date=int(date or now.strftime("%Y%m%d")),
+            updated_at=now.timestamp(),
+            price=to_won(price_data["current_price"]),
+            open=to_won(price_data["open"]),
+            high=to_won(price_data["high"]),
+            low=to_won(price_data["low"]),
+            volume=int(price_data["volume"]),
+            change=to_won(price_data.get("change", 0)),
+            change_pct=float(price_data.get("change_pct", 0.0)),
+        )
+
+    def publish_prev_bar(self, symbol: str, bar: Dict[str, Any]) -> None:
+        """
+        전일 영업일 일봉 게시 (장 시작 전 또는 일자가 바뀐 첫 조회에서 1회)
+
+        Args:
+            symbol: 종목 코드
+            bar: nodes._call_inquire_daily_chart 결과의 전일 행
+                (date, open, high, low, close, volume)
+        """
+        self._write(
+            self._index[symbol],
+            prev_date=int(bar["date"]),
+            prev_open=to_won(bar["open"]),
+            prev_high=to_won(bar["high"]),
+            prev_low=to_won(bar["low"]),
+            prev_close=to_won(bar["close"]),
+            prev_volume=int(bar["volume"]),
+        )
+
+    def flush(self) -> None:
+        """파일에 반영 (/dev/shm에서는 필요 없음, 디스크 경로에서 종료 시)"""
+        self._data.flush()
+
+
+class MarketBus:
+    """시세 버스 읽기 (락 없음, 읽기 전용 메모리 맵)"""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, max_age: float = 5.0):
+        """
+        초기화
+
+        Args:
+            path: 버스 파일 경로 (None이면 default_bus_path())
+            max_age: 이보다 오래된 게시(초)는 market_data가 None 반환
+        """
+        self.path = Path(path) if path is not None else default_bus_path()
+        self.max_age = max_age
+        self._load(self.path.stat())
+
+    def _load(self, stat: os.stat_result) -> None:
+        data = np.load(self.path, mmap_mode="r")
+        if data.dtype != MARKET_BUS_DTYPE:
+            raise ValueError(f"시세 버스 형식이 다릅니다: {self.path}")
+        index = {symbol.decode(): i for i, symbol in enumerate(data["symbol"])}
+        seq = data.view(np.ndarray)["seq"]
+        rows = data.view(np.uint8).reshape(len(data), _ROW.size)
+        # 다른 스레드(대시보드 요청)가 읽는 중이어도 한 번에 교체
+        self._data, self._index, self._view = data, index, (index, seq, rows)
+        self._inode = (stat.st_dev, stat.st_ino)
+
+    def _refresh(self) -> None:
+        """
+        게시 프로세스가 버스를 새로 만들었으면 다시 열기
+
+        생성은 os.replace이므로 교체되면 inode가 바뀜 (stat 1회, 제자리 갱신은 inode 유지)
+        """
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return
+        if (stat.st_dev, stat.st_ino) == self._inode:
+            return
+        try:
+            self._load(stat)
+        except Exception as e:
+            logger.warning(f"[market_bus] 교체된 버스 열기 실패, 기존 매핑 유지: {e}")
+            return
+        logger.info(f"[market_bus] 교체된 버스 다시 열기: {len(self._index)}개 종목")
+
+    @classmethod
+    def open(
+        cls, path: Optional[Union[str, Path]] = None, max_age: float = 5.0
+    ) -> Optional["MarketBus"]:
+        """버스 열기 (아직 게시 프로세스가 만들지 않았으면 None)"""
+        path = Path(path) if path is not None else default_bus_path()
+        if not path.exists():
+            return None
+        return cls(path, max_age)
+
+    def __len__(self) -> int:
+        self._refresh()
+        return len(self._data)
+
+    def __contains__(self, symbol: str) -> bool:
+        self._refresh()
+        return symbol in self._index
+
+    def read(self, symbol: str) -> Optional[BusRecord]:
+        """
+        종목 행 스냅샷 (seqlock)
+
+        Returns:
+            행 복사본 (종목이 없거나 게시 전이면 None)
+
+        Raises:
+            RuntimeError: 게시 프로세스가 쓰는 도중 멈춰 READ_RETRIES 안에 일관된 값을 못 읽은 경우
+        """
+        self._refresh()
+        index, seq, rows = self._view
+        i = index.get(symbol)
+        if i is None:
+            return None
+        for _ in range(READ_RETRIES):
+            before = int(seq[i])
+            if not before & 1:
+                raw = rows[i].tobytes()
+                if int(seq[i]) == before:
+                    return BusRecord._make(_ROW.unpack(raw)) if before else None
+            # 쓰는 쪽이 행 중간에서 선점됐을 수 있으므로 CPU를 양보한 뒤 재시도
+            os.sched_yield()
+        raise RuntimeError(f"[market_bus] {symbol} 행이 계속 갱신 중입니다 (seq={int(seq[i])})")
+
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """종목 행 (대시보드용, 없거나 게시 전이면 None)"""
+        record = self.read(symbol)
+        if record is None:
+            return None
+        row = record._asdict()
+        row["symbol"] = record.symbol.rstrip(b"\0").decode()
+        return row
+
+    def records(self) -> List[Dict[str, Any]]:
+        """게시된 전 종목 행"""
+        self._refresh()
+        return [
+            row for row in (self.get(symbol) for symbol in list(self._index)) if row is not None
+        ]
+
+    def market_data(
+        self, symbol: str, today: str, max_age: Optional[float] = None
+    ) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        fetch_market_data 노드 입력 (직접 조회 결과와 같은 형식)
+
+        Args:
+            symbol: 종목 코드
+            today: 오늘 (YYYYMMDD)
+            max_age: 허용 게시 경과 시간 (초, None이면 생성 시 값)
+
+        Returns:
+            (현재가 데이터, 일봉 [당일, 전일]) — 게시 전 · 다른 일자 · 오래된 시세 ·
+            전일 일봉 미게시이면 None
+        """
+        record = self.read(symbol)
+        if record is None or record.date != int(today) or not record.prev_date:
+            return None
+        age = get_clock().now().timestamp() - record.updated_at
+        if age > (self.max_age if max_age is None else max_age):
+            return None
+
+        price_data = {
+            "current_price": record.price,
+            "open": record.open,
+            "high": record.high,
+            "low": record.low,
+            "volume": record.volume,
+            "change": record.change,
+            "change_pct": record.change_pct,
+        }
+        chart_data = [
+            {
+                "date": today,
+                "open": record.open,
+                "high": record.high,
+                "low": record.low,
+                "close": record.price,
+                "volume": record.volume,
+            },
+            {
+                "date": str(record.prev_date),
+                "open": record.prev_open,
+                "high": record.prev_high,
+                "low": record.prev_low,
+                "close": record.prev_close,
+                "volume": record.prev_volume,
+            },
+        ]
+        return price_data, chart_data
@@ -0,0 +1,233 @@
+"""
+실현 손익 원장 (P&L ledger)
+
+체결마다 실현 손익을 data/ledger/{모드}/{계좌번호}.csv 에 한 줄씩 덧붙이고, 일 · 주 · 월 누적
+손익을 메모리에서 체결당 O(1)로 갱신합니다. 재시작하면 원장을 한 번 읽어 누적값을
+복원하므로 risk_check 노드의 일일/월간 손실 한도와 MDD(최고 자산)가 재시작으로
+초기화되지 않습니다. 한도 점검 시에는 누적값 조회만 하고 거래 내역을 다시 합산하지 않습니다.
+
+모의투자와 실전투자, 계좌마다 원장 파일이 따로이고, 최고 자산은 기록할 때의 운용 자본
+(capital)별로 따로 복원하므로 운용 자본을 바꾸면 이전 자본 기준 최고 자산으로 MDD를 보지 않습니다.
+
+CSV 컬럼: ts(ISO 시각), symbol, side(buy | sell | peak), qty, price, pnl, capital (원 단위 정수)
+    peak 행은 최고 자산 갱신 기록 (price = 최고 자산, capital = 기록 시 운용 자본)
+"""
+
+import csv
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from ..clock import get_clock
+from ..price import Won, to_won
+
+logger = logging.getLogger(__name__)
+
+project_root = Path(__file__).parent.parent.parent.parent
+
+COLUMNS = ["ts", "symbol", "side", "qty", "price", "pnl", "capital"]
+
+
+def ledger_path(env_mode: str = "demo", account: Optional[str] = None) -> Path:
+    """모드 · 계좌별 원장 경로 (data/ledger/{env_mode}/{account}.csv, 계좌를 모르면 default)"""
+    return project_root / "data" / "ledger" / env_mode / f"{account or 'default'}.csv"
+
+
+def day_key(ts: datetime) -> str:
+    """일 누적 키 (YYYYMMDD)"""
+    return ts.strftime("%Y%m%d")
+
+
+def week_key(ts: datetime) -> str:
+    """주 누적 키 (ISO 주차, 예: 2025-W02)"""
+    year, week, _ = ts.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def month_key(ts: datetime) -> str:
+    """월 누적 키 (YYYYMM)"""
+    return ts.strftime("%Y%m")
+
+
+class PnLLedger:
+    """체결별 실현 손익 원장 + 일 · 주 · 월 누적"""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, capital: Optional[Won] = None):
+        """
+        초기화 (원장 파일이 있으면 누적값 복원)
+
+        Args:
+            path: 원장 CSV 경로 (None이면 data/ledger/demo/default.csv)
+            capital: 운용 자본 (최고 자산 기록 · 조회 기준, None이면 자본 구분 없는 기록만)
+        """
+        self.path = Path(path) if path is not None else ledger_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.capital: Optional[Won] = to_won(capital) if capital is not None else None
+        self.daily: Dict[str, Won] = {}
+        self.weekly: Dict[str, Won] = {}
+        self.monthly: Dict[str, Won] = {}
+        self.realized_pnl: Won = 0
+        self.trades = 0
+        self.peaks: Dict[Optional[Won], Won] = {}  # 운용 자본 → 최고 자산
+        if self.path.exists():
+            self._replay()
+        else:
+            with open(self.path, "w", encoding="utf-8", newline="") as f:
+                csv.writer(f).writerow(COLUMNS)
+
+    @classmethod
+    def from_config(
+        cls, config: dict, env_mode: str = "demo", account: Optional[str] = None
+    ) -> "PnLLedger":
+        """
+        trading_config.yaml ledger 설정으로 생성
+
+        Args:
+            config: 전략 설정 (ledger.path에 {env_mode} · {account} 치환 가능, trading.capital)
+            env_mode: 실행 모드
+            account: 계좌번호 (CANO, None이면 default)
+        """
+        path = config.get("ledger", {}).get("path")
+        if path:
+            path = path.format(env_mode=env_mode, account=account or "default")
+        capital = config.get("trading", {}).get("capital")
+        return cls(path or ledger_path(env_mode, account), capital=capital)
+
+    @property
+    def peak_asset(self) -> Optional[Won]:
+        """이 원장 운용 자본 기준 최고 자산 (기록 없으면 None)"""
+        return self.peaks.get(self.capital)
+
+    def peak_for(self, capital: Optional[Won]) -> Optional[Won]:
+        """운용 자본 capital 기준으로 기록된 최고 자산 (기록 없으면 None)"""
+        return self.peaks.get(to_won(capital) if capital is not None else None)
+
+    def _replay(self) -> None:
+        """원장 전체를 한 번 읽어 누적값 복원 (기동 시 1회, 이전 컬럼 형식이면 다시 씀)"""
+        count = 0
+        with open(self.path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+        for row in rows:
+            try:
+                ts = datetime.fromisoformat(row["ts"])
+                if row["side"] == "peak":
+                    capital = to_won(row["capital"]) if row.get("capital") else None
+                    self.peaks[capital] = max(self.peaks.get(capital, 0), to_won(row["price"]))
+                else:
+                    self._apply(ts, row["side"], to_won(row["pnl"]))
+                count += 1
+            except (TypeError, ValueError) as e:
+                # 기록 도중 종료된 마지막 줄 등
+                logger.warning(f"[ledger] 원장 행 무시: {row} ({e})")
+        if reader.fieldnames != COLUMNS:
+            with open(self.path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.DictWriter(f, COLUMNS, extrasaction="ignore")
+                writer.writeheader()
+                writer.writerows(rows)
+        logger.info(f"[ledger] 원장 복원: {count}행, 누적 실현손익 {self.realized_pnl:,}원")
+
+    def _apply(self, ts: datetime, side: str, pnl: Won) -> None:
+        """누적값 갱신 (O(1))"""
+        if side != "sell":
+            return
+        for table, key in (
+            (self.daily, day_key(ts)),
+            (self.weekly, week_key(ts)),
+            (self.monthly, month_key(ts)),
+        ):
+            table[key] = table.get(key, 0) + pnl
+        self.realized_pnl += pnl
+        self.trades += 1
+
+    def _append(
+        self,
+        ts: datetime,
+        symbol: str,
+        side: str,
+        qty: int,
+        price: Won,
+        pnl: Won,
+        capital: Optional[Won] = None,
+    ) -> None:
+        capital = self.capital if capital is None else capital
+        row = [ts.isoformat(), symbol, side, qty, price, pnl, "" if capital is None else capital]
+        with open(self.path, "a", encoding="utf-8", newline="") as f:
+            csv.writer(f).writerow(row)
+
+    def record(
+        self,
+        symbol: str,
+        side: str,
+        qty: int,
+        price: Won,
+        pnl: Won = 0,
+        ts: Optional[datetime] = None,
+    ) -> None:
+        """
+        체결 기록 (원장에 한 줄 추가 + 누적 갱신)
+
+        Args:
+            symbol: 종목 코드
+            side: "buy" | "sell"
+            qty: 체결 수량
+            price: 체결 기준 가격 (원)
+            pnl: 실현 손익 (매도, 원)
+            ts: 체결 시각 (None이면 전역 시계)
+
+        Raises:
+            ValueError: side가 buy/sell이 아닐 때
+        """
+        if side not in ("buy", "sell"):
+            raise ValueError(f"알 수 없는 체결 구분: {side}")
+        ts = ts or get_clock().now()
+        self._append(ts, symbol, side, qty, to_won(price), to_won(pnl))
+        self._apply(ts, side, to_won(pnl))
+
+    def mark(
+        self, asset: Won, capital: Optional[Won] = None, ts: Optional[datetime] = None
+    ) -> bool:
+        """
+        평가 자산 반영 (운용 자본 기준 최고 자산을 넘을 때만 원장에 기록)
+
+        Args:
+            asset: 총 평가 자산 (원)
+            capital: 운용 자본 (None이면 원장 capital)
+            ts: 시각 (None이면 전역 시계)
+
+        Returns:
+            최고 자산 갱신 여부
+        """
+        asset = to_won(asset)
+        capital = to_won(capital) if capital is not None else self.capital
+        peak = self.peaks.get(capital)
+        if peak is not None and asset <= peak:
+            return False
+        self.peaks[capital] = asset
+        self._append(ts or get_clock().now(), "", "peak", 0, asset, 0, capital)
+        return True
+
+    def daily_pnl(self, now: Optional[datetime] = None) -> Won:
+        """당일 실현 손익"""
+        return self.daily.get(day_key(now or get_clock().now()), 0)
+
+    def weekly_pnl(self, now: Optional[datetime] = None) -> Won:
+        """이번 주(ISO 주차) 실현 손익"""
+        return self.weekly.get(week_key(now or get_clock().now()), 0)
+
+    def monthly_pnl(self, now: Optional[datetime] = None) -> Won:
+        """당월 실현 손익"""
+        return self.monthly.get(month_key(now or get_clock().now()), 0)
+
+    def snapshot(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """기준 시각의 일 · 주 · 월 손익과 누적값"""
+        now = now or get_clock().now()
+        return {
+            "daily_pnl": self.daily_pnl(now),
+            "weekly_pnl": self.weekly_pnl(now),
+            "monthly_pnl": self.monthly_pnl(now),
+            "realized_pnl": self.realized_pnl,
+            "trades": self.trades,
+            "peak_asset": self.peak_asset,
+        }
@@ -0,0 +1,323 @@
+"""
+당일 목표가 공유 테이블
+
+장 시작 전 작업이 전 종목의 전일 변동폭 · k · 시가 · 목표가 · 호가 단위 주문가를
+한 번에 벡터 연산으로 계산해 data/target_tables/targets_{YYYYMMDD}.npy 로 게시합니다.
+전략 워커와 대시보드는 이 파일을 읽기 전용 메모리 맵(np.load(mmap_mode="r"))으로
+열어 조회하므로 프로세스 수와 무관하게 페이지 캐시 한 벌만 공유합니다.
+
+게시는 임시 파일에 쓴 뒤 os.replace로 교체하므로 읽는 쪽은 항상 완성된 테이블만 봅니다.
+시가가 아직 없는 종목은 open/target/order_price가 0입니다.
+
+동시호가(08:30~09:00) 동안에는 예상 체결가를 시가로 놓은 잠정(provisional) 테이블을
+게시해 두고, 시가가 확정되는 즉시 finalize_target_table로 바뀐 종목만 다시 계산합니다.
+"""
+
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..clock import get_clock
+from ..price import Won, mul_ratio_ceil, to_won_array
+
+project_root = Path(__file__).parent.parent.parent.parent
+
+# 호가 단위 설정 import
+sys.path.insert(0, str(project_root / "config"))
+from tick_size import adjust_prices_to_tick, get_symbol_class, get_tick_sizes
+
+logger = logging.getLogger(__name__)
+
+TARGET_DTYPE = np.dtype(
+    [
+        ("symbol", "S12"),
+        ("prev_high", np.int64),
+        ("prev_low", np.int64),
+        ("k", np.float64),
+        ("open", np.int64),
+        ("target", np.int64),  # 시가 + ceil(전일 변동폭 × k)
+        ("order_price", np.int64),  # 목표가를 호가 단위로 올림한 매수 지정가
+        ("tick", np.int64),
+        ("provisional", np.bool_),  # True: 동시호가 예상 체결가 기준 (시가 미확정)
+        ("budget", np.int64),  # 종목 투자 금액 (원, 0이면 수량 미계산)
+        ("qty", np.int64),  # budget // order_price
+    ]
+)
+
+
+def target_table_path(date: str, directory: Optional[Union[str, Path]] = None) -> Path:
+    """일자별 테이블 경로"""
+    root = Path(directory) if directory is not None else project_root / "data" / "target_tables"
+    return root / f"targets_{date}.npy"
+
+
+def compute_targets(
+    symbols: Sequence[str],
+    prev_high: Sequence[Won],
+    prev_low: Sequence[Won],
+    opens: Sequence[Won],
+    k: Union[float, Sequence[float]],
+    budgets: Union[Won, Sequence[Won]] = 0,
+    provisional: bool = False,
+) -> np.ndarray:
+    """
+    목표가 · 주문가 · 수량 일괄 계산 (벡터화)
+
+    Args:
+        symbols: 종목 코드
+        prev_high, prev_low: 전일 고가/저가 (원)
+        opens: 당일 시가 또는 예상 체결가 (원, 없으면 0)
+        k: 변동성 계수 (스칼라 또는 종목별)
+        budgets: 종목별 투자 금액 (원, 0이면 수량 미계산)
+        provisional: 예상 체결가 기준 잠정 값 여부
+
+    Returns:
+        TARGET_DTYPE 배열 (종목 코드 오름차순)
+    """
+    table = np.zeros(len(symbols), dtype=TARGET_DTYPE)
+    if not len(symbols):
+        return table
+
+    table["symbol"] = np.asarray(symbols, dtype="S12")
+    table["prev_high"] = to_won_array(prev_high)
+    table["prev_low"] = to_won_array(prev_low)
+    table["open"] = to_won_array(opens)
+    table["k"] = np.broadcast_to(np.asarray(k, dtype=np.float64), len(symbols))
+    table["budget"] = np.broadcast_to(np.asarray(budgets, dtype=np.int64), len(symbols))
+    table["provisional"] = provisional
+
+    ready = table["open"] > 0
+    target = table["open"] + mul_ratio_ceil(table["prev_high"] - table["prev_low"], table["k"])
+    table["target"] = np.where(ready, target, 0)
+
+    # 호가 단위 테이블은 상품 구분/시장별이므로 같은 구분끼리 묶어 한 번씩 계산
+    classes = [get_symbol_class(symbol) for symbol in symbols]
+    for cls in set(classes):
+        mask = ready & np.fromiter((c == cls for c in classes), dtype=bool, count=len(classes))
+        if mask.any():
+            table["order_price"][mask] = adjust_prices_to_tick(
+                table["target"][mask], *cls, mode="up"
+            )
+            table["tick"][mask] = get_tick_sizes(table["order_price"][mask], *cls)
+
+    priced = table["order_price"] > 0
+    table["qty"][priced] = table["budget"][priced] // table["order_price"][priced]
+    return np.sort(table, order="symbol")
+
+
+def finalize_target_table(table: np.ndarray, opens: Dict[str, Won]) -> Tuple[np.ndarray, int]:
+    """
+    확정 시가 반영
+
+    확정 시가가 잠정 값(예상 체결가)과 같은 종목은 플래그만 바꾸고, 다른 종목만
+    목표가 · 주문가 · 수량을 다시 계산합니다.
+
+    Args:
+        table: 게시된(잠정) 테이블
+        opens: {종목: 확정 시가}
+
+    Returns:
+        (새 테이블, 다시 계산한 종목 수)
+    """
+    out = table.copy()
+    symbols = out["symbol"].astype(str)
+    confirmed = np.fromiter((symbol in opens for symbol in symbols), dtype=bool, count=len(out))
+    new_open = np.array([opens.get(symbol, 0) for symbol in symbols], dtype=np.int64)
+
+    changed = confirmed & (out["open"] != new_open)
+    if changed.any():
+        rows = out[changed]
+        out[changed] = compute_targets(
+            symbols[changed].tolist(),
+            rows["prev_high"],
+            rows["prev_low"],
+            new_open[changed],
+            rows["k"],
+            rows["budget"],
+        )
+    out["provisional"][confirmed] = False
+    return out, int(changed.sum())
+
+
+def build_target_table(
+    engine,
+    symbols: Iterable[str],
+    opens: Dict[str, Won],
+    k: Union[float, Dict[str, float]],
+    default_k: float = 0.5,
+    budgets: Optional[Dict[str, Won]] = None,
+    provisional: bool = False,
+) -> np.ndarray:
+    """
+    워밍업된 지표 엔진의 전일 봉과 시가로 테이블 생성
+
+    Args:
+        engine: 전일까지 반영된 IndicatorEngine (전일 변동폭 캐시)
+        symbols: 종목 목록 (엔진에 전일 봉이 없는 종목은 제외)
+        opens: 종목별 당일 시가 (provisional이면 예상 체결가)
+        k: 고정 k 또는 종목별 k (적응형 k 테이블)
+        default_k: 종목별 k에 없는 종목의 k
+        budgets: 종목별 투자 금액 (None이면 수량 미계산)
+        provisional: 예상 체결가 기준 잠정 테이블 여부
+
+    Returns:
+        TARGET_DTYPE 배열
+    """
+    rows = []
+    for symbol in symbols:
+        if symbol not in engine or engine.get(symbol).prev_high is None:
+            logger.warning(f"[target_table] {symbol} 전일 일봉 없음, 제외")
+            continue
+        state = engine.get(symbol)
+        symbol_k = k.get(symbol, default_k) if isinstance(k, dict) else k
+        budget = (budgets or {}).get(symbol, 0)
+        rows.append(
+            (symbol, state.prev_high, state.prev_low, opens.get(symbol, 0), symbol_k, budget)
+        )
+
+    if not rows:
+        return np.zeros(0, dtype=TARGET_DTYPE)
+    names, highs, lows, open_prices, ks, budget_values = zip(*rows)
+    return compute_targets(names, highs, lows, open_prices, ks, budget_values, provisional)
+
+
+def publish_target_table(
+    table: np.ndarray, date: str, directory: Optional[Union[str, Path]] = None
+) -> Path:
+    """
+    테이블 게시 (원자적 교체)
+
+    Args:
+        table: TARGET_DTYPE 배열
+        date: 일자 (YYYYMMDD)
+        directory: 저장 디렉토리 (None이면 data/target_tables)
+
+    Returns:
+        게시된 파일 경로
+    """
+    path = target_table_path(date, directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, np.ascontiguousarray(table, dtype=TARGET_DTYPE))
+    os.replace(tmp, path)
+
+    ready = int(((table["open"] > 0) & ~table["provisional"]).sum()) if len(table) else 0
+    logger.info(
+        f"[target_table] {date} 목표가 테이블 게시: {len(table)}개 종목 "
+        f"(시가 확정 {ready}개) → {path}"
+    )
+    return path
+
+
+def wait_for_opens(
+    fetch_open: Callable[[str], Won],
+    symbols: Iterable[str],
+    timeout: float = 120.0,
+    poll_interval: float = 1.0,
+    on_update: Optional[Callable[[Dict[str, Won]], None]] = None,
+) -> Dict[str, Won]:
+    """
+    시가 확정 대기
+
+    시가가 0보다 큰 종목이 생길 때마다 모으고, 전 종목이 확정되거나 timeout이 지나면
+    반환합니다. 대기는 전역 시계를 따릅니다 (리플레이/테스트 시 가상 시각).
+
+    Args:
+        fetch_open: 종목 코드 → 시가 (미확정이면 0)
+        symbols: 종목 목록
+        timeout: 최대 대기 시간 (초)
+        poll_interval: 재조회 간격 (초)
+        on_update: 조회 1회마다 새로 확정된 {종목: 시가}로 호출 (즉시 확정 반영용)
+
+    Returns:
+        {종목: 시가} (시간 초과 시 확정된 종목만)
+    """
+    clock = get_clock()
+    deadline = clock.now().timestamp() + timeout
+    pending = list(symbols)
+    opens: Dict[str, Won] = {}
+
+    while True:
+        confirmed: Dict[str, Won] = {}
+        still_pending = []
+        for symbol in pending:
+            try:
+                open_price = fetch_open(symbol)
+            except Exception as e:
+                logger.warning(f"[target_table] {symbol} 시가 조회 실패: {e}")
+                open_price = 0
+            if open_price > 0:
+                confirmed[symbol] = open_price
+            else:
+                still_pending.append(symbol)
+        pending = still_pending
+        opens.update(confirmed)
+        if confirmed and on_update is not None:
+            on_update(confirmed)
+
+        if not pending or clock.now().timestamp() >= deadline:
+            break
+        clock.sleep(poll_interval)
+
+    if pending:
+        logger.warning(
+            f"[target_table] 시가 미확정 {len(pending)}개 종목: {', '.join(pending[:10])}"
+        )
+    return opens
+
+
+class TargetTable:
+    """게시된 목표가 테이블 (읽기 전용 메모리 맵)"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._data = np.load(self.path, mmap_mode="r")
+        if self._data.dtype != TARGET_DTYPE:
+            raise ValueError(f"목표가 테이블 형식이 다릅니다: {self.path}")
+        self._index = {symbol.decode(): i for i, symbol in enumerate(self._data["symbol"])}
+
+    @classmethod
+    def load(
+        cls, date: str, directory: Optional[Union[str, Path]] = None
+    ) -> Optional["TargetTable"]:
+        """일자 테이블 열기 (아직 게시되지 않았으면 None)"""
+        path = target_table_path(date, directory)
+        if not path.exists():
+            return None
+        return cls(path)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._index
+
+    @staticmethod
+    def _row(record) -> Dict[str, Any]:
+        return {
+            "symbol": record["symbol"].decode(),
+            "prev_high": int(record["prev_high"]),
+            "prev_low": int(record["prev_low"]),
+            "k": float(record["k"]),
+            "open": int(record["open"]),
+            "target": int(record["target"]),
+            "order_price": int(record["order_price"]),
+            "tick": int(record["tick"]),
+            "provisional": bool(record["provisional"]),
+            "budget": int(record["budget"]),
+            "qty": int(record["qty"]),
+        }
+
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """종목 행 (없으면 None)"""
+        i = self._index.get(symbol)
+        return None if i is None else self._row(self._data[i])
+
+    def records(self) -> List[Dict[str, Any]]:
+        """전 종목 행 (대시보드용)"""
+        return [self._row(record) for record in self._data]
@@ -0,0 +1,108 @@
+"""
+그래프 실행 컨텍스트
+
+노드가 함께 쓰는 런타임 구성 요소(전략 레지스트리, 리스크 규칙, 지표 엔진, 시세 버스,
+계좌 모델, 손익 원장, 속도 제한기 등)를 한 객체에 담습니다. graph_builder의
+build_*_graph(context)가 노드에 묶어 주므로 노드 모듈에는 가변 전역 상태가 없고,
+앱 · 워커 프로세스 · 테스트는 각자 만든 컨텍스트로 그래프를 만듭니다.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from ..account import AccountModel
+from ..data.market_bus import MarketBus
+from ..data.pnl_ledger import PnLLedger
+from ..data.target_table import TargetTable
+from ..rate_limit import PriorityRateLimiter
+from ..reconcile import PositionReconciler
+from ..strategies.adaptive_k import AdaptiveKTable
+from ..strategies.breakout_etf import BreakoutStrategy
+from ..strategies.indicators import IndicatorEngine
+from ..strategies.intraday_tape import IntradayTape
+from ..strategies.portfolio_risk import PortfolioRisk
+from ..strategies.position_sizing import PositionSizer
+from ..strategies.registry import BreakoutPlugin, StrategyRegistry
+from ..strategies.risk_rules import RiskRules
+from .state import TradingState
+
+# 중앙 코디네이터 주문 승인: order_gate(state) -> (승인 수량, 거절 사유)
+OrderGate = Callable[[TradingState], Tuple[int, Optional[str]]]
+
+
+def default_registry(strategy: Optional[BreakoutStrategy] = None) -> StrategyRegistry:
+    """
+    기본 전략 레지스트리 (상태 값으로 판단하는 BreakoutPlugin 하나)
+
+    Args:
+        strategy: 목표가 · 진입 · 청산 계산기 (None이면 새로 생성)
+    """
+    return StrategyRegistry([BreakoutPlugin("breakout", strategy=strategy)])
+
+
+@dataclass
+class TradingContext:
+    """노드 런타임 구성 요소 (그래프 하나 또는 워커 프로세스 하나가 소유)"""
+
+    # 목표가 계산 (calculate_target)과 기본 레지스트리의 돌파 판단
+    breakout_strategy: BreakoutStrategy = field(default_factory=BreakoutStrategy)
+
+    # 전략 플러그인 (trading_config.yaml strategies)
+    # None이면 breakout_strategy로 만든 기본 레지스트리
+    strategy_registry: Optional[StrategyRegistry] = None
+
+    # 손실 한도 · MDD · 포지션 크기 점검
+    risk_rules: RiskRules = field(default_factory=RiskRules)
+
+    # 종목별 증분 지표 (첫 조회 시 HistoryStore로 워밍업)
+    indicator_engine: IndicatorEngine = field(default_factory=IndicatorEngine)
+
+    # 종목별 적응형 k (장 시작 전 precompute, 없는 종목은 첫 조회 시 계산)
+    adaptive_k_table: AdaptiveKTable = field(default_factory=AdaptiveKTable)
+
+    # 종목별 변동성 조정 계수 (장 시작 전 refresh, 없는 종목은 첫 진입 시 계산)
+    position_sizer: PositionSizer = field(default_factory=PositionSizer)
+
+    # 종목별 당일 누적 거래량 · 최근 체결가 (틱 스트림 on_tick, 현재가 조회 시 sync)
+    intraday_tape: IntradayTape = field(default_factory=IntradayTape)
+
+    # 장 시작 전 게시된 당일 목표가 테이블 디렉토리 (None이면 data/target_tables)
+    target_table_dir: Optional[Path] = None
+
+    # 포트폴리오 노출 · 업종 집중 · 상관관계 (None이면 종목별 비중 · 보유 종목 수만 확인)
+    portfolio_risk: Optional[PortfolioRisk] = None
+
+    # 공유 메모리 시세 버스 (None이면 매번 KIS 조회)
+    market_bus: Optional[MarketBus] = None
+
+    # 로컬 계좌 모델 (None이면 update_account가 반복마다 잔고 조회)
+    account_model: Optional[AccountModel] = None
+
+    # 백그라운드 보유 종목 대사 (계좌 모델이 있을 때, None이면 잔고를 직접 조회)
+    position_reconciler: Optional[PositionReconciler] = None
+
+    # 실현 손익 원장 (None이면 상태의 daily_pnl / monthly_pnl / peak_asset만 사용)
+    pnl_ledger: Optional[PnLLedger] = None
+
+    # KIS 호출 우선순위 속도 제한 (None이면 제한 없이 EGW00201 재시도만)
+    rate_limiter: Optional[PriorityRateLimiter] = None
+
+    # 외부 거래 중단 사유 (킬 스위치가 설정, 설정되면 risk_check가 주문을 모두 취소하고 중단)
+    halt_reason: Optional[str] = None
+
+    # 중앙 코디네이터 주문 승인 (supervisor 워커 프로세스에서만, None이면 종목 상태만으로 판단)
+    order_gate: Optional[OrderGate] = None
+
+    # 게시 목표가 테이블 캐시: (일자, (inode, mtime_ns), 테이블)
+    target_table_cache: Optional[Tuple[str, Tuple[int, int], TargetTable]] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.strategy_registry is None:
+            self.strategy_registry = default_registry(self.breakout_strategy)
+
+    def halt(self, reason: str) -> None:
+        """거래 중단 (다음 risk_check / portfolio_risk에서 주문 취소 후 중단)"""
+        self.halt_reason = reason
@@ -1,15 +1,20 @@
 """
 LangGraph 그래프 빌더
 
-노드들을 연결하여 상태 머신을 구성합니다.
+노드들을 연결하여 상태 머신을 구성합니다. 노드가 쓰는 런타임 구성 요소(전략 레지스트리,
+시세 버스, 계좌 모델 등)는 build_*_graph(context)로 받은 TradingContext를 노드에 묶어
+전달합니다.
 """
 
 import logging
-from typing import Literal
+from functools import partial
+from typing import Any, List, Literal, Optional, Union
 
 from langgraph.graph import StateGraph, START, END
+from langgraph.types import Send
 
-from .state import TradingState
+from .context import TradingContext
+from .state import PortfolioState, TradingState
 from .nodes import (
     fetch_market_data_node,
     calculate_target_node,
@@ -17,7 +22,11 @@ from .nodes import (
     risk_check_node,
     execute_order_node,
     monitor_position_node,
-    update_account_node
+    update_account_node,
+    symbol_signal_node,
+    portfolio_risk_node,
+    execute_symbol_node,
+    settle_portfolio_node
 )
 
 logger = logging.getLogger(__name__)
@@ -48,26 +57,30 @@ def has_signal(state: TradingState) -> Literal["execute", "monitor"]:
     return "monitor"
 
 
-def build_trading_graph() -> StateGraph:
+def build_trading_graph(context: Optional[TradingContext] = None) -> StateGraph:
     """
     자동매매 LangGraph 구축
 
+    Args:
+        context: 노드 실행 컨텍스트 (None이면 기본 구성)
+
     Returns:
         컴파일된 StateGraph 인스턴스
     """
     logger.info("LangGraph 빌드 시작")
+    context = context or TradingContext()
 
     # 그래프 생성
     graph = StateGraph(TradingState)
 
     # ========== 노드 추가 ==========
-    graph.add_node("fetch_data", fetch_market_data_node)
-    graph.add_node("calculate_target", calculate_target_node)
-    graph.add_node("generate_signal", generate_signal_node)
-    graph.add_node("risk_check", risk_check_node)
-    graph.add_node("execute_order", execute_order_node)
+    graph.add_node("fetch_data", partial(fetch_market_data_node, context=context))
+    graph.add_node("calculate_target", partial(calculate_target_node, context=context))
+    graph.add_node("generate_signal", partial(generate_signal_node, context=context))
+    graph.add_node("risk_check", partial(risk_check_node, context=context))
+    graph.add_node("execute_order", partial(execute_order_node, context=context))
     graph.add_node("monitor", monitor_position_node)
-    graph.add_node("update_account", update_account_node)
+    graph.add_node("update_account", partial(update_account_node, context=context))
 
     # ========== 엣지 연결 ==========
 
@@ -124,27 +137,31 @@ def build_trading_graph() -> StateGraph:
     return compiled_graph
 
 
-def build_continuous_trading_graph() -> StateGraph:
+def build_continuous_trading_graph(context: Optional[TradingContext] = None) -> StateGraph:
     """
     연속 거래 LangGraph 구축
 
     일정 시간마다 반복 실행되는 버전
 
+    Args:
+        context: 노드 실행 컨텍스트 (None이면 기본 구성)
+
     Returns:
         컴파일된 StateGraph 인스턴스
     """
     logger.info("연속 거래 LangGraph 빌드 시작")
+    context = context or TradingContext()
 
     graph = StateGraph(TradingState)
 
     # 노드 추가
-    graph.add_node("fetch_data", fetch_market_data_node)
-    graph.add_node("calculate_target", calculate_target_node)
-    graph.add_node("generate_signal", generate_signal_node)
-    graph.add_node("risk_check", risk_check_node)
-    graph.add_node("execute_order", execute_order_node)
+    graph.add_node("fetch_data", partial(fetch_market_data_node, context=context))
+    graph.add_node("calculate_target", partial(calculate_target_node, context=context))
+    graph.add_node("generate_signal", partial(generate_signal_node, context=context))
+    graph.add_node("risk_check", partial(risk_check_node, context=context))
+    graph.add_node("execute_order", partial(execute_order_node, context=context))
     graph.add_node("monitor", monitor_position_node)
-    graph.add_node("update_account", update_account_node)
+    graph.add_node("update_account", partial(update_account_node, context=context))
 
     # 엣지 연결
     graph.add_edge(START, "fetch_data")
@@ -187,6 +204,130 @@ def build_continuous_trading_graph() -> StateGraph:
     return compiled_graph
 
 
+def fan_out_symbols(state: PortfolioState) -> List[Send]:
+    """
+    종목별 분기 생성 (map)
+
+    각 분기에는 포트폴리오 공유 현금을 넣은 종목 상태를 보내므로, 신호 노드의
+    매수 수량이 공유 현금 기준으로 계산됩니다.
+    """
+    return [
+        Send("symbol_signal", {"symbol_state": {
+            **state["symbol_states"][symbol],
+            "cash_balance": state["cash_balance"],
+            "total_asset": state["total_asset"],
+        }})
+        for symbol in state["symbols"]
+    ]
+
+
+def route_orders(state: PortfolioState) -> Union[str, List[Send]]:
+    """
+    포트폴리오 리스크 체크 후 분기
+
+    거래 중단이면 종료, 배분된 주문이 있으면 종목별 주문 분기, 없으면 정산
+    """
+    if state["trading_stopped"]:
+        logger.info(f"거래 중단: {state['stop_reason']}")
+        return END
+    if not state["orders"]:
+        return "settle"
+    return [
+        Send("execute_symbol", {"symbol_state": state["symbol_states"][symbol]})
+        for symbol in state["orders"]
+    ]
+
+
+def build_portfolio_graph(context: Optional[TradingContext] = None) -> StateGraph:
+    """
+    다종목 포트폴리오 LangGraph 구축
+
+    START → (종목별 병렬) symbol_signal → portfolio_risk
+          → (주문 종목별 병렬) execute_symbol → settle → update_account → END
+
+    종목 분기는 같은 단계(superstep)에서 함께 실행되므로 반복 1회 지연은 종목 수가
+    아니라 가장 느린 종목의 조회 시간에 가깝습니다. 동시 실행 수는 invoke의
+    config={"max_concurrency": N}으로 제한할 수 있습니다.
+
+    Args:
+        context: 노드 실행 컨텍스트 (None이면 기본 구성, 종목 분기가 함께 사용)
+
+    Returns:
+        컴파일된 StateGraph 인스턴스
+    """
+    logger.info("포트폴리오 LangGraph 빌드 시작")
+    context = context or TradingContext()
+
+    graph = StateGraph(PortfolioState)
+
+    graph.add_node("symbol_signal", partial(symbol_signal_node, context=context))
+    graph.add_node("portfolio_risk", partial(portfolio_risk_node, context=context))
+    graph.add_node("execute_symbol", partial(execute_symbol_node, context=context))
+    graph.add_node("settle", partial(settle_portfolio_node, context=context))
+    graph.add_node("update_account", partial(update_account_node, context=context))
+
+    graph.add_conditional_edges(START, fan_out_symbols, ["symbol_signal"])
+    graph.add_edge("symbol_signal", "portfolio_risk")
+    graph.add_conditional_edges("portfolio_risk", route_orders, ["execute_symbol", "settle", END])
+    graph.add_edge("execute_symbol", "settle")
+    graph.add_edge("settle", "update_account")
+    graph.add_edge("update_account", END)
+
+    compiled_graph = graph.compile()
+
+    logger.info("포트폴리오 LangGraph 빌드 완료")
+
+    return compiled_graph
+
+
+def build_exit_graph(context: Optional[TradingContext] = None) -> StateGraph:
+    """
+    트레일링 스탑 청산 전용 LangGraph 구축
+
+    청산 판정은 그래프 밖 TrailingStopWatcher가 틱마다 하므로, 이 그래프는
+    시세 조회/신호 생성 없이 매도 주문과 포지션 정리만 수행합니다.
+
+    Args:
+        context: 노드 실행 컨텍스트 (None이면 기본 구성, 매매 그래프와 같은 컨텍스트 권장)
+
+    Returns:
+        컴파일된 StateGraph 인스턴스
+    """
+    context = context or TradingContext()
+    graph = StateGraph(TradingState)
+
+    graph.add_node("execute_order", partial(execute_order_node, context=context))
+    graph.add_node("monitor", monitor_position_node)
+
+    graph.add_edge(START, "execute_order")
+    graph.add_edge("execute_order", "monitor")
+    graph.add_edge("monitor", END)
+
+    return graph.compile()
+
+
+def execute_trailing_exit(graph: Any, state: TradingState, signal: Any) -> TradingState:
+    """
+    감시기의 청산 신호로 청산 그래프 1회 실행
+
+    Args:
+        graph: build_exit_graph() 결과
+        state: 포지션 보유 중인 상태
+        signal: TrailingStopWatcher가 만든 TrailExit
+
+    Returns:
+        청산 후 상태
+    """
+    return graph.invoke({
+        **state,
+        "current_price": signal.exit_price,
+        "highest_price": max(state.get("highest_price") or 0, signal.highest_price),
+        "should_buy": False,
+        "should_sell": True,
+        "sell_reason": signal.reason,
+    })
+
+
 if __name__ == "__main__":
     # 테스트용 코드
     logging.basicConfig(level=logging.INFO)
@@ -1,12 +1,14 @@
 """
 LangGraph 노드 함수들
 
-각 노드는 TradingState를 받아 처리 후 업데이트된 상태를 반환합니다.
+각 노드는 TradingState와 실행 컨텍스트(TradingContext)를 받아 처리 후 업데이트된 상태를
+반환합니다. 컨텍스트는 graph_builder가 그래프를 만들 때 노드에 묶어 주며,
+노드를 직접 호출할 때 생략하면 기본 구성 요소로 만든 새 컨텍스트를 씁니다.
 """
 
-from datetime import datetime
 import logging
-from typing import Dict, Any
+from functools import partial
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 import sys
 from pathlib import Path
 
@@ -14,13 +16,21 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from .state import TradingState
-from ..strategies.breakout_etf import BreakoutStrategy
-from ..strategies.risk_rules import RiskRules
+from .context import TradingContext
+from .state import PortfolioState, TradingState
+from ..account import AccountModel
+from ..clock import get_clock
+from ..data.target_table import TargetTable, target_table_path
+from ..price import Won, mul_ratio_floor, to_won
+from ..rate_limit import PRIORITY_ORDER, PRIORITY_QUERY, PriorityRateLimiter
+from ..reconcile import PageLimitExceeded, PositionReconciler
+from ..strategies.portfolio_risk import REASONS
+from ..strategies.registry import SignalContext, merge_signals
+from ..strategies.trailing_stop import trailing_stop_price
 
 # 호가 단위 설정 import
 sys.path.insert(0, str(project_root / "config"))
-from tick_size import adjust_price_to_tick
+from tick_size import adjust_price_to_tick, get_symbol_class
 
 # KIS API import
 try:
@@ -32,9 +42,10 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
-# 전략 및 리스크 관리자 인스턴스
-breakout_strategy = BreakoutStrategy()
-risk_rules = RiskRules()
+def _throttle(limiter: Optional[PriorityRateLimiter], priority: int) -> None:
+    """속도 제한기가 있으면 호출 토큰 대기"""
+    if limiter is not None:
+        limiter.acquire(priority)
 
 
 def _init_kis_auth(env_mode: str = "demo"):
@@ -60,16 +71,36 @@ def _init_kis_auth(env_mode: str = "demo"):
         return False
 
 
-def _call_inquire_price(env_mode: str, symbol: str) -> Dict[str, Any]:
+def _account_id(env_mode: str) -> Optional[str]:
+    """
+    인증된 계좌번호 (CANO 8자리)
+
+    Args:
+        env_mode: 실행 모드
+
+    Returns:
+        계좌번호 (KIS 미사용 · 인증 실패 시 None)
+    """
+    if not _init_kis_auth(env_mode):
+        return None
+    return getattr(ka._TRENV, "my_acct", None) or None
+
+
+def _call_inquire_price(
+    env_mode: str,
+    symbol: str,
+    limiter: Optional[PriorityRateLimiter] = None
+) -> Dict[str, Any]:
     """
     현재가 조회 API 호출
 
     Args:
         env_mode: 실행 모드
         symbol: 종목 코드
+        limiter: 속도 제한기 (None이면 제한 없음)
 
     Returns:
-        현재가 데이터
+        현재가 데이터 (가격은 원 단위 정수)
     """
     try:
         # API 호출
@@ -86,17 +117,18 @@ def _call_inquire_price(env_mode: str, symbol: str) -> Dict[str, Any]:
 
         # API 호출
         api_url = "/uapi/domestic-stock/v1/quotations/inquire-price"
+        _throttle(limiter, PRIORITY_QUERY)
         res = ka._url_fetch(api_url, tr_id, "", params)
 
         if res.isOK():
             output = res.getBody().output
             return {
-                'current_price': float(output['stck_prpr']),  # 현재가
-                'open': float(output['stck_oprc']),  # 시가
-                'high': float(output['stck_hgpr']),  # 고가
-                'low': float(output['stck_lwpr']),  # 저가
+                'current_price': to_won(output['stck_prpr']),  # 현재가
+                'open': to_won(output['stck_oprc']),  # 시가
+                'high': to_won(output['stck_hgpr']),  # 고가
+                'low': to_won(output['stck_lwpr']),  # 저가
                 'volume': int(output['acml_vol']),  # 누적거래량
-                'change': float(output['prdy_vrss']),  # 전일대비
+                'change': to_won(output['prdy_vrss']),  # 전일대비
                 'change_pct': float(output['prdy_ctrt'])  # 전일대비율
             }
         else:
@@ -108,7 +140,12 @@ def _call_inquire_price(env_mode: str, symbol: str) -> Dict[str, Any]:
         raise
 
 
-def _call_inquire_daily_chart(env_mode: str, symbol: str, days: int = 2) -> list:
+def _call_inquire_daily_chart(
+    env_mode: str,
+    symbol: str,
+    days: int = 2,
+    limiter: Optional[PriorityRateLimiter] = None
+) -> list:
     """
     일봉 차트 조회 API 호출
 
@@ -120,16 +157,18 @@ def _call_inquire_daily_chart(env_mode: str, symbol: str, days: int = 2) -> list
         env_mode: 실행 모드
         symbol: 종목 코드
         days: 조회할 영업일 수
+        limiter: 속도 제한기 (None이면 제한 없음)
 
     Returns:
         일봉 데이터 리스트 (최신순, [0]=당일 또는 최근일, [1]=전일 영업일)
     """
     try:
-        from datetime import datetime, timedelta
+        from datetime import timedelta
 
-        # 날짜 계산 (오늘부터 days일 전까지)
-        end_date = datetime.now().strftime("%Y%m%d")
-        start_date = (datetime.now() - timedelta(days=days+5)).strftime("%Y%m%d")  # 여유있게 조회
+        # 날짜 계산 (오늘부터 days일 전까지, 리플레이 시 가상 시각 기준)
+        today = get_clock().now()
+        end_date = today.strftime("%Y%m%d")
+        start_date = (today - timedelta(days=days+5)).strftime("%Y%m%d")  # 여유있게 조회
 
         # API 호출
         params = {
@@ -149,6 +188,7 @@ def _call_inquire_daily_chart(env_mode: str, symbol: str, days: int = 2) -> list
 
         # API 호출
         api_url = "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
+        _throttle(limiter, PRIORITY_QUERY)
         res = ka._url_fetch(api_url, tr_id, "", params)
 
         if res.isOK():
@@ -157,10 +197,10 @@ def _call_inquire_daily_chart(env_mode: str, symbol: str, days: int = 2) -> list
             for item in output2[:days]:
                 chart_data.append({
                     'date': item['stck_bsop_date'],
-                    'open': float(item['stck_oprc']),
-                    'high': float(item['stck_hgpr']),
-                    'low': float(item['stck_lwpr']),
-                    'close': float(item['stck_clpr']),
+                    'open': to_won(item['stck_oprc']),
+                    'high': to_won(item['stck_hgpr']),
+                    'low': to_won(item['stck_lwpr']),
+                    'close': to_won(item['stck_clpr']),
                     'volume': int(item['acml_vol'])
                 })
             return chart_data
@@ -173,64 +213,243 @@ def _call_inquire_daily_chart(env_mode: str, symbol: str, days: int = 2) -> list
         raise
 
 
-def _call_inquire_balance(env_mode: str) -> tuple:
+def _iter_pages(
+    api_url: str,
+    tr_id: str,
+    params: Dict[str, str],
+    max_pages: int = 50,
+    priority: int = PRIORITY_QUERY,
+    limiter: Optional[PriorityRateLimiter] = None
+) -> Iterator[Tuple[list, list]]:
+    """
+    KIS 조회 API 연속 조회 (페이지 단위)
+
+    응답 헤더 tr_cont가 F/M이면 다음 페이지가 있으므로, 응답의 ctx_area_fk100 /
+    ctx_area_nk100을 그대로 넘기고 tr_cont "N"으로 이어서 조회합니다.
+
+    Args:
+        api_url: 조회 API 경로
+        tr_id: TR ID
+        params: 조회 파라미터 (CTX_AREA_FK100 / CTX_AREA_NK100 포함, 페이지마다 갱신)
+        max_pages: 최대 페이지 수
+        priority: 속도 제한 우선순위
+        limiter: 속도 제한기 (None이면 제한 없음)
+
+    Yields:
+        (output1 페이지, output2)
+
+    Raises:
+        PageLimitExceeded: max_pages를 읽고도 다음 페이지가 남았을 때
+        Exception: 조회 실패 시
+    """
+    tr_cont = ""
+    for _ in range(max_pages):
+        _throttle(limiter, priority)
+        res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+        if not res.isOK():
+            res.printError(url=api_url)
+            raise Exception(f"조회 실패: {api_url}")
+
+        body = res.getBody()
+        yield body.output1, body.output2
+        if res.getHeader().tr_cont not in ("F", "M"):
+            return
+        params["CTX_AREA_FK100"] = getattr(body, "ctx_area_fk100", "")
+        params["CTX_AREA_NK100"] = getattr(body, "ctx_area_nk100", "")
+        tr_cont = "N"
+    raise PageLimitExceeded(f"{api_url} {max_pages}페이지 초과")
+
+
+def _iter_inquire_balance(
+    env_mode: str,
+    max_pages: int = 50,
+    priority: int = PRIORITY_QUERY,
+    limiter: Optional[PriorityRateLimiter] = None
+) -> Iterator[Tuple[list, list]]:
+    """
+    잔고 조회 API 연속 조회 (페이지 단위)
+
+    Args:
+        env_mode: 실행 모드
+        max_pages: 최대 페이지 수 (넘으면 PageLimitExceeded)
+        priority: 속도 제한 우선순위
+        limiter: 속도 제한기 (None이면 제한 없음)
+
+    Yields:
+        (output1 페이지: 종목별 잔고, output2: 계좌 총평가)
+    """
+    # TR ID 설정
+    if env_mode == "demo":
+        tr_id = "VTTC8434R"
+    else:
+        tr_id = "TTTC8434R"
+
+    # API 호출
+    params = {
+        "CANO": ka._TRENV.my_acct,  # 계좌번호 앞 8자리
+        "ACNT_PRDT_CD": ka._TRENV.my_prod,  # 계좌번호 뒤 2자리
+        "AFHR_FLPR_YN": "N",  # N:기본값
+        "OFL_YN": "",
+        "INQR_DVSN": "02",  # 02:종목별
+        "UNPR_DVSN": "01",
+        "FUND_STTL_ICLD_YN": "N",
+        "FNCG_AMT_AUTO_RDPT_YN": "N",
+        "PRCS_DVSN": "01",  # 01:전일매매미포함
+        "CTX_AREA_FK100": "",
+        "CTX_AREA_NK100": ""
+    }
+
+    api_url = "/uapi/domestic-stock/v1/trading/inquire-balance"
+    yield from _iter_pages(api_url, tr_id, params, max_pages, priority, limiter)
+
+
+def _call_inquire_balance(env_mode: str, limiter: Optional[PriorityRateLimiter] = None) -> tuple:
     """
-    잔고 조회 API 호출
+    잔고 조회 API 호출 (연속 조회로 output1 전체 페이지를 합침)
 
     Args:
         env_mode: 실행 모드
+        limiter: 속도 제한기 (None이면 제한 없음)
 
     Returns:
-        (잔고 DataFrame1, 잔고 DataFrame2)
+        (종목별 잔고 output1 전체, 계좌 총평가 output2)
+
+    Raises:
+        PageLimitExceeded: 최대 페이지 수를 넘어 잔고 일부를 읽지 못했을 때
     """
     try:
-        # TR ID 설정
-        if env_mode == "demo":
-            tr_id = "VTTC8434R"
-        else:
-            tr_id = "TTTC8434R"
+        output1: List[Dict[str, Any]] = []
+        output2: list = []
+        for page, output2 in _iter_inquire_balance(env_mode, limiter=limiter):
+            output1.extend(page)
+        return output1, output2
 
-        # API 호출
-        params = {
-            "CANO": ka._TRENV.my_acct,  # 계좌번호 앞 8자리
-            "ACNT_PRDT_CD": ka._TRENV.my_prod,  # 계좌번호 뒤 2자리
-            "AFHR_FLPR_YN": "N",  # N:기본값
-            "OFL_YN": "",
-            "INQR_DVSN": "02",  # 02:종목별
-            "UNPR_DVSN": "01",
-            "FUND_STTL_ICLD_YN": "N",
-            "FNCG_AMT_AUTO_RDPT_YN": "N",
-            "PRCS_DVSN": "01",  # 01:전일매매미포함
-            "CTX_AREA_FK100": "",
-            "CTX_AREA_NK100": ""
-        }
+    except Exception as e:
+        logger.error(f"잔고 조회 API 호출 실패: {e}")
+        raise
 
-        api_url = "/uapi/domestic-stock/v1/trading/inquire-balance"
-        res = ka._url_fetch(api_url, tr_id, "", params)
 
-        if res.isOK():
-            # output1: 종목별 잔고
-            # output2: 계좌 총평가
-            return (res.getBody().output1, res.getBody().output2)
-        else:
-            res.printError(url=api_url)
-            raise Exception("잔고 조회 실패")
+def _call_inquire_open_orders(
+    env_mode: str,
+    priority: int = PRIORITY_QUERY,
+    limiter: Optional[PriorityRateLimiter] = None
+) -> List[Dict[str, Any]]:
+    """
+    당일 미체결 주문 조회 (주식일별주문체결조회, 미체결만)
+
+    Args:
+        env_mode: 실행 모드
+        priority: 속도 제한 우선순위
+        limiter: 속도 제한기 (None이면 제한 없음)
+
+    Returns:
+        미체결 주문 목록 (odno · pdno · ord_gno_brno · sll_buy_dvsn_cd · rmn_qty, 잔량 0은 제외)
+    """
+    if env_mode == "demo":
+        tr_id = "VTTC0081R"
+    else:
+        tr_id = "TTTC0081R"
+
+    today = get_clock().now().strftime("%Y%m%d")
+    params = {
+        "CANO": ka._TRENV.my_acct,
+        "ACNT_PRDT_CD": ka._TRENV.my_prod,
+        "INQR_STRT_DT": today,
+        "INQR_END_DT": today,
+        "SLL_BUY_DVSN_CD": "00",  # 00:전체
+        "PDNO": "",
+        "ORD_GNO_BRNO": "",
+        "ODNO": "",
+        "CCLD_DVSN": "02",  # 02:미체결
+        "INQR_DVSN": "00",  # 00:역순
+        "INQR_DVSN_1": "",
+        "INQR_DVSN_3": "00",
+        "EXCG_ID_DVSN_CD": "KRX",
+        "CTX_AREA_FK100": "",
+        "CTX_AREA_NK100": ""
+    }
+
+    try:
+        orders: List[Dict[str, Any]] = []
+        api_url = "/uapi/domestic-stock/v1/trading/inquire-daily-ccld"
+        for page, _ in _iter_pages(api_url, tr_id, params, priority=priority, limiter=limiter):
+            orders.extend(row for row in page if int(row.get("rmn_qty", 0) or 0) > 0)
+        return orders
 
     except Exception as e:
-        logger.error(f"잔고 조회 API 호출 실패: {e}")
+        logger.error(f"미체결 조회 API 호출 실패: {e}")
         raise
 
 
-def _call_order_cash(
+def _call_cancel_order(
     env_mode: str,
-    order_type: str,  # "buy" | "sell"
+    order: Dict[str, Any],
+    priority: int = PRIORITY_ORDER,
+    limiter: Optional[PriorityRateLimiter] = None
+) -> Dict[str, Any]:
+    """
+    주문 전량 취소 API 호출 (주식주문 정정취소)
+
+    Args:
+        env_mode: 실행 모드
+        order: 미체결 주문 (_call_inquire_open_orders 결과 행)
+        priority: 속도 제한 우선순위
+        limiter: 속도 제한기 (None이면 제한 없음)
+
+    Returns:
+        취소 결과 {'success', 'order_no', 'message'}
+    """
+    if env_mode == "demo":
+        tr_id = "VTTC0013U"
+    else:
+        tr_id = "TTTC0013U"
+
+    params = {
+        "CANO": ka._TRENV.my_acct,
+        "ACNT_PRDT_CD": ka._TRENV.my_prod,
+        "KRX_FWDG_ORD_ORGNO": order.get("ord_gno_brno", ""),
+        "ORGN_ODNO": order["odno"],
+        "ORD_DVSN": "00",
+        "RVSE_CNCL_DVSN_CD": "02",  # 02:취소
+        "ORD_QTY": "0",
+        "ORD_UNPR": "0",
+        "QTY_ALL_ORD_YN": "Y",  # 잔량 전부
+        "EXCG_ID_DVSN_CD": "KRX"
+    }
+
+    api_url = "/uapi/domestic-stock/v1/trading/order-rvsecncl"
+    try:
+        _throttle(limiter, priority)
+        res = ka._url_fetch(api_url, tr_id, "", params, postFlag=True)
+        if res.isOK():
+            output = res.getBody().output
+            return {
+                'success': True,
+                'order_no': output.get('ODNO', ''),
+                'message': f"{order['odno']} 취소 접수 완료"
+            }
+        res.printError(url=api_url)
+        return {
+            'success': False,
+            'order_no': '',
+            'message': f"{order['odno']} 취소 실패: {getattr(res.getBody(), 'msg1', '')}"
+        }
+
+    except Exception as e:
+        logger.error(f"취소 API 호출 실패: {e}")
+        return {'success': False, 'order_no': '', 'message': f"취소 API 호출 오류: {str(e)}"}
+
+
+def build_order_cash_request(
+    env_mode: str,
+    order_type: str,
     symbol: str,
     qty: int,
     price: int = 0,
-    order_dvsn: str = "00"  # 00:지정가, 01:시장가
-) -> Dict[str, Any]:
+    order_dvsn: str = "00"
+) -> Tuple[str, Dict[str, str]]:
     """
-    현금 주문 API 호출 (Rate Limit 재시도 로직 포함)
+    현금 주문 요청 (TR ID, 파라미터) 생성
 
     Args:
         env_mode: 실행 모드
@@ -241,12 +460,8 @@ def _call_order_cash(
         order_dvsn: 주문 구분 (00:지정가, 01:시장가)
 
     Returns:
-        주문 결과
+        (tr_id, params)
     """
-    import time
-
-    max_retries = 3
-
     # TR ID 설정
     if env_mode == "demo":
         if order_type == "buy":
@@ -271,12 +486,92 @@ def _call_order_cash(
         "SLL_TYPE": "01" if order_type == "sell" else "",
         "CNDT_PRIC": ""
     }
+    return tr_id, params
+
+
+def _call_inquire_expected_price(
+    env_mode: str,
+    symbol: str,
+    limiter: Optional[PriorityRateLimiter] = None
+) -> Dict[str, Any]:
+    """
+    예상 체결가 조회 API 호출 (장 시작 전 동시호가)
+
+    Args:
+        env_mode: 실행 모드
+        symbol: 종목 코드
+        limiter: 속도 제한기 (None이면 제한 없음)
+
+    Returns:
+        {'expected_price': 예상 체결가, 'expected_volume': 예상 거래량} (미형성 시 0)
+    """
+    try:
+        params = {
+            "FID_COND_MRKT_DIV_CODE": "J",  # J:KRX
+            "FID_INPUT_ISCD": symbol
+        }
+        tr_id = "FHKST01010200"  # 주식현재가 호가/예상체결 (모의/실전 동일)
+
+        api_url = "/uapi/domestic-stock/v1/quotations/inquire-asking-price-exp-ccn"
+        _throttle(limiter, PRIORITY_QUERY)
+        res = ka._url_fetch(api_url, tr_id, "", params)
+
+        if res.isOK():
+            output2 = res.getBody().output2
+            return {
+                'expected_price': to_won(output2.get('antc_cnpr') or 0),  # 예상 체결가
+                'expected_volume': int(output2.get('antc_vol') or 0)  # 예상 거래량
+            }
+        else:
+            res.printError(url=api_url)
+            raise Exception("예상 체결가 조회 실패")
+
+    except Exception as e:
+        logger.error(f"예상 체결가 조회 API 호출 실패: {e}")
+        raise
+
+
+def _call_order_cash(
+    env_mode: str,
+    order_type: str,  # "buy" | "sell"
+    symbol: str,
+    qty: int,
+    price: int = 0,
+    order_dvsn: str = "00",  # 00:지정가, 01:시장가
+    priority: int = PRIORITY_ORDER,
+    limiter: Optional[PriorityRateLimiter] = None
+) -> Dict[str, Any]:
+    """
+    현금 주문 API 호출 (Rate Limit 재시도 로직 포함)
+
+    속도 제한기(limiter)가 있으면 매 시도 전에 토큰을 받으므로
+    EGW00201 재시도도 고정 백오프 대신 제한기 간격으로 다시 보냅니다.
+
+    Args:
+        env_mode: 실행 모드
+        order_type: 주문 유형 (buy | sell)
+        symbol: 종목 코드
+        qty: 주문 수량
+        price: 주문 단가 (시장가의 경우 0)
+        order_dvsn: 주문 구분 (00:지정가, 01:시장가)
+        priority: 속도 제한 우선순위 (킬 스위치 매도는 PRIORITY_FLATTEN)
+        limiter: 속도 제한기 (None이면 제한 없음)
+
+    Returns:
+        주문 결과
+    """
+    import time
+
+    max_retries = 3
+
+    tr_id, params = build_order_cash_request(env_mode, order_type, symbol, qty, price, order_dvsn)
 
     api_url = "/uapi/domestic-stock/v1/trading/order-cash"
 
     # 재시도 로직 (Rate Limit 대응)
     for attempt in range(max_retries):
         try:
+            _throttle(limiter, priority)
             res = ka._url_fetch(api_url, tr_id, "", params, postFlag=True)
 
             if res.isOK():
@@ -303,7 +598,7 @@ def _call_order_cash(
                 is_rate_limit = (msg_cd == 'EGW00201' or '초당 거래건수' in msg1)
 
                 if is_rate_limit and attempt < max_retries - 1:
-                    wait_time = 2 ** attempt  # 1초, 2초, 4초
+                    wait_time = 0 if limiter is not None else 2 ** attempt  # 1초, 2초, 4초
                     logger.warning(
                         f"[_call_order_cash] Rate Limit 감지 ({msg_cd}). "
                         f"{wait_time}초 대기 후 재시도 ({attempt + 1}/{max_retries})..."
@@ -347,25 +642,73 @@ def _call_order_cash(
     }
 
 
-def fetch_market_data_node(state: TradingState) -> Dict[str, Any]:
+def _sync_indicators(
+    context: TradingContext,
+    symbol: str,
+    chart_data: list,
+    price_data: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    지표 엔진에 전일까지의 일봉과 현재가 반영
+
+    이미 반영한 날짜는 건너뛰므로 평소에는 현재가 1틱, 날짜가 바뀐 첫 조회에서만
+    전일 봉 1개가 추가로 반영됩니다.
+
+    Args:
+        context: 실행 컨텍스트 (지표 엔진)
+        symbol: 종목 코드
+        chart_data: _call_inquire_daily_chart 결과 (최신순)
+        price_data: _call_inquire_price 결과
+
+    Returns:
+        지표 값 딕셔너리
+    """
+    today = get_clock().now().strftime("%Y%m%d")
+    indicator_engine = context.indicator_engine
+
+    if symbol not in indicator_engine:
+        try:
+            from ..data.history_store import HistoryStore
+            indicator_engine.warm_start(HistoryStore(), [symbol], until=today)
+        except Exception as e:
+            logger.warning(f"[indicators] {symbol} 워밍업 실패, 조회 일봉으로만 계산: {e}")
+
+    past_bars = [bar for bar in reversed(chart_data) if bar["date"] < today]
+    indicator_engine.update_bars(symbol, past_bars)
+    indicator_engine.update_tick(symbol, price_data["current_price"], price_data["open"])
+    return indicator_engine.values(symbol)
+
+
+def fetch_market_data_node(
+    state: TradingState,
+    context: Optional[TradingContext] = None
+) -> Dict[str, Any]:
     """
     시장 데이터 수집 노드
 
-    KIS API를 통해 현재가 및 전일 데이터를 조회합니다.
+    KIS API를 통해 현재가 및 전일 데이터를 조회합니다. 시세 버스(context.market_bus)에
+    max_age 이내로 게시된 당일 시세가 있으면 조회 없이 그 값을 사용합니다.
 
     Raises:
         RuntimeError: KIS API를 사용할 수 없는 경우
         Exception: API 호출 실패 시
     """
     logger.info(f"[fetch_market_data] 시작: {state['symbol']}")
+    context = context or TradingContext()
+    market_bus = context.market_bus
 
     updates = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": get_clock().isoformat(),
         "iteration": state["iteration"] + 1,
     }
 
+    # 시세 버스에 최근 게시된 시세가 있으면 KIS 조회 없이 사용
+    published = None
+    if market_bus is not None:
+        published = market_bus.market_data(state["symbol"], get_clock().now().strftime("%Y%m%d"))
+
     # KIS API 사용 가능 여부 확인
-    if not KIS_AVAILABLE:
+    if published is None and not KIS_AVAILABLE:
         error_msg = (
             "KIS API를 사용할 수 없습니다.\n"
             "해결 방법:\n"
@@ -377,7 +720,7 @@ def fetch_market_data_node(state: TradingState) -> Dict[str, Any]:
         raise RuntimeError(error_msg)
 
     # KIS 인증
-    if not _init_kis_auth(state["env_mode"]):
+    if published is None and not _init_kis_auth(state["env_mode"]):
         error_msg = (
             "KIS 인증에 실패했습니다.\n"
             "해결 방법:\n"
@@ -390,13 +733,24 @@ def fetch_market_data_node(state: TradingState) -> Dict[str, Any]:
         raise RuntimeError(error_msg)
 
     try:
-        # 1. 현재가 조회
-        price_data = _call_inquire_price(state["env_mode"], state["symbol"])
-        logger.info(f"[fetch_market_data] 현재가 조회 완료: {price_data['current_price']:,.0f}원")
+        if published is not None:
+            # 0. 시세 버스 (현재가 + [당일, 전일] 일봉)
+            price_data, chart_data = published
+            logger.info(f"[fetch_market_data] 시세 버스 사용: {price_data['current_price']:,.0f}원")
+        else:
+            # 1. 현재가 조회
+            price_data = _call_inquire_price(
+                state["env_mode"], state["symbol"], context.rate_limiter
+            )
+            logger.info(
+                f"[fetch_market_data] 현재가 조회 완료: {price_data['current_price']:,.0f}원"
+            )
 
-        # 2. 일봉 차트 조회 (전일 데이터 포함, 영업일 고려하여 여유있게 조회)
-        chart_data = _call_inquire_daily_chart(state["env_mode"], state["symbol"], days=5)
-        logger.info(f"[fetch_market_data] 일봉 조회 완료: {len(chart_data)}일")
+            # 2. 일봉 차트 조회 (전일 데이터 포함, 영업일 고려하여 여유있게 조회)
+            chart_data = _call_inquire_daily_chart(
+                state["env_mode"], state["symbol"], days=5, limiter=context.rate_limiter
+            )
+            logger.info(f"[fetch_market_data] 일봉 조회 완료: {len(chart_data)}일")
 
         # 전일 영업일 데이터 추출
         # chart_data[0]은 오늘(당일), chart_data[1]은 전일 영업일
@@ -419,6 +773,12 @@ def fetch_market_data_node(state: TradingState) -> Dict[str, Any]:
         else:
             raise Exception("일봉 데이터 부족")
 
+        # 돌파 필터용 누적 거래량 (틱으로 더 누적된 값은 유지)
+        context.intraday_tape.sync(
+            state["symbol"], price_data['current_price'], price_data['volume'],
+            get_clock().now().strftime("%Y%m%d")
+        )
+
         # 상태 업데이트
         updates.update({
             "current_price": price_data['current_price'],
@@ -431,6 +791,7 @@ def fetch_market_data_node(state: TradingState) -> Dict[str, Any]:
             "yesterday_low": yesterday['low'],
             "yesterday_close": yesterday['close'],
             "yesterday_volume": yesterday['volume'],
+            "indicators": _sync_indicators(context, state["symbol"], chart_data, price_data),
         })
 
         logger.info(
@@ -458,99 +819,207 @@ def fetch_market_data_node(state: TradingState) -> Dict[str, Any]:
         raise Exception(error_msg) from e
 
 
-def calculate_target_node(state: TradingState) -> Dict[str, Any]:
+def _published_target(context: TradingContext, symbol: str, today: str) -> Optional[Dict[str, Any]]:
+    """
+    게시된 당일 목표가 테이블의 종목 행
+
+    파일 stat 1회로 재게시 여부를 확인하고, 바뀌었을 때만 다시 메모리 맵으로 엽니다.
+
+    Returns:
+        시가가 확정된 행 (테이블이 없거나 종목이 없거나 시가 미확정 · 잠정 값이면 None)
+    """
+    path = target_table_path(today, context.target_table_dir)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    # 게시는 os.replace이므로 재게시되면 inode가 바뀜
+    version = (stat.st_ino, stat.st_mtime_ns)
+    cached = context.target_table_cache
+    if cached is None or cached[0] != today or cached[1] != version:
+        try:
+            cached = (today, version, TargetTable(path))
+        except Exception as e:
+            logger.warning(f"[calculate_target] 목표가 테이블 열기 실패, 직접 계산: {e}")
+            return None
+        context.target_table_cache = cached
+
+    row = cached[2].get(symbol)
+    if row is None or row["open"] <= 0 or row["provisional"]:
+        return None
+    return row
+
+
+def calculate_target_node(
+    state: TradingState,
+    context: Optional[TradingContext] = None
+) -> Dict[str, Any]:
     """
     목표가 계산 노드
 
     변동성 돌파 전략의 목표가를 계산합니다.
+    k_mode가 "adaptive"이면 종목별 노이즈 비율 k를, 데이터가 부족하면 k_value를 씁니다.
+    장 시작 전 게시된 목표가 테이블에 시가 · 전일 고저가가 같은 종목 행이 있으면
+    그 값을 그대로 씁니다.
     """
     logger.info("[calculate_target] 목표가 계산 시작")
+    context = context or TradingContext()
+
+    today = get_clock().now().strftime("%Y%m%d")
+    row = _published_target(context, state["symbol"], today)
+    if row is not None and (row["open"], row["prev_high"], row["prev_low"]) == (
+            state["today_open"], state["yesterday_high"], state["yesterday_low"]):
+        logger.info(
+            f"[calculate_target] 목표가 (게시 테이블): {row['target']:,.0f}원 (k={row['k']:.4f})"
+        )
+        return {
+            "target_price": row["target"],
+            "effective_k": row["k"]
+        }
 
-    target_price = breakout_strategy.calculate_target_price(
+    k = state["k_value"]
+    if state.get("k_mode") == "adaptive":
+        adaptive_k = context.adaptive_k_table.lookup(
+            context.indicator_engine, state["symbol"], today
+        )
+        if adaptive_k is not None:
+            k = adaptive_k
+        else:
+            logger.warning(
+                f"[calculate_target] {state['symbol']} 적응형 k 데이터 부족, 고정 k 사용: {k}"
+            )
+
+    target_price = context.breakout_strategy.calculate_target_price(
         open_price=state["today_open"],
         prev_high=state["yesterday_high"],
         prev_low=state["yesterday_low"],
-        k=state["k_value"]
+        k=k
     )
 
-    logger.info(f"[calculate_target] 목표가: {target_price:,.0f}원")
+    logger.info(f"[calculate_target] 목표가: {target_price:,.0f}원 (k={k:.4f})")
 
     return {
-        "target_price": target_price
+        "target_price": target_price,
+        "effective_k": k
     }
 
 
-def generate_signal_node(state: TradingState) -> Dict[str, Any]:
+def _loss_inputs(context: TradingContext, state: Dict[str, Any]) -> Tuple[Won, Won, Won]:
     """
-    매매 신호 생성 노드
+    손실 한도 · MDD 점검 입력 (일일 손익, 월간 손익, 최고 자산)
 
-    현재 포지션 상태에 따라 매수 또는 매도 신호를 생성합니다.
+    원장이 있으면 원장 누적값(당일 · 당월)과, 같은 운용 자본(initial_capital)으로
+    원장에 기록된 최고 자산을 함께 씁니다. 다른 자본 기준 최고 자산은 쓰지 않습니다.
     """
-    logger.info("[generate_signal] 신호 생성 시작")
-
-    updates: Dict[str, Any] = {
-        "should_buy": False,
-        "should_sell": False,
-        "buy_reason": None,
-        "sell_reason": None
-    }
-
-    # 포지션 없을 때: 매수 신호 확인
-    if state["position_status"] == "IDLE":
-        should_enter, reason = breakout_strategy.should_enter(
-            current_price=state["current_price"],
-            target_price=state["target_price"],
-            skip_time_check=state.get("debug_mode", False)
+    peak_asset = state.get("peak_asset", state["initial_capital"])
+    pnl_ledger = context.pnl_ledger
+    if pnl_ledger is None:
+        return state["daily_pnl"], state.get("monthly_pnl", 0), peak_asset
+    now = get_clock().now()
+    ledger_peak = pnl_ledger.peak_for(state["initial_capital"])
+    if ledger_peak is not None:
+        peak_asset = max(peak_asset, ledger_peak)
+    return pnl_ledger.daily_pnl(now), pnl_ledger.monthly_pnl(now), peak_asset
+
+
+def _position_ratio(context: TradingContext, state: TradingState, today: str) -> float:
+    """종목 투자 비율 (변동성 조정 계수는 하루 한 번 계산된 캐시 값)"""
+    position_ratio = state["max_position_size"]
+    if state.get("volatility_adjustment", False):
+        factor = context.position_sizer.factor(context.indicator_engine, state["symbol"], today)
+        position_ratio *= factor
+        logger.info(
+            f"[generate_signal] 변동성 조정 계수: {factor:.2f} "
+            f"(투자 비율 {position_ratio*100:.1f}%)"
         )
+    return position_ratio
+
+
+def _trail_price(state: TradingState) -> Optional[Won]:
+    """트레일링 청산가 (틱 단위 감시는 TrailingStopWatcher, 여기서는 반복 주기마다 한 번 더 확인)"""
+    if not state.get("trailing_stop"):
+        return None
+    highest = max(state.get("highest_price") or state["entry_price"], state["current_price"])
+    return trailing_stop_price(
+        highest,
+        mode=state.get("trailing_mode", "pct"),
+        pct=state["trailing_stop_pct"],
+        atr=(state.get("indicators") or {}).get("atr"),
+        atr_multiplier=state.get("trailing_atr_multiplier", 2.0),
+    )
 
-        if should_enter:
-            # 매수 수량 계산
-            qty = breakout_strategy.calculate_position_size(
-                capital=state["cash_balance"],
-                current_price=state["current_price"],
-                position_ratio=state["max_position_size"]
-            )
 
-            updates["should_buy"] = True
-            updates["buy_reason"] = reason
-            updates["order_qty"] = qty
-            logger.info(f"[generate_signal] 매수 신호 발생: {reason}, 수량: {qty}주")
-
-    # 포지션 있을 때: 매도 신호 확인
-    elif state["position_status"] == "IN_POSITION":
-        should_exit, reason = breakout_strategy.should_exit(
-            entry_price=state["entry_price"],
-            current_price=state["current_price"],
-            stop_loss_pct=state["stop_loss_pct"],
-            take_profit_pct=state["take_profit_pct"]
-        )
+def generate_signal_node(
+    state: TradingState,
+    context: Optional[TradingContext] = None
+) -> Dict[str, Any]:
+    """
+    매매 신호 생성 노드
 
-        if should_exit:
-            updates["should_sell"] = True
-            updates["sell_reason"] = reason
-            logger.info(f"[generate_signal] 매도 신호 발생: {reason}")
+    컨텍스트의 전략 레지스트리에 등록된 전략을 모두 같은 시세 스냅샷으로 평가하고
+    신호를 종목 주문 하나로 병합합니다 (strategies/registry.py). 설정에 전략이 없으면
+    레지스트리에는 상태 값으로 판단하는 BreakoutPlugin 하나만 있습니다.
+    """
+    logger.info("[generate_signal] 신호 생성 시작")
+    context = context or TradingContext()
+    registry = context.strategy_registry
+
+    now = get_clock().now()
+    today = now.strftime("%Y%m%d")
+    idle = state["position_status"] == "IDLE"
+    # 돌파 필터 입력: 틱 누적 거래량/최근 체결가 (테이프에 없으면 상태 값, 추가 조회 없음)
+    volume = context.intraday_tape.volume(state["symbol"], today)
+    price = context.intraday_tape.last_price(state["symbol"], today)
+    signal_context = SignalContext(
+        now=now,
+        volume=volume if volume is not None else state.get("today_volume", 0),
+        last_price=price if price is not None else state["current_price"],
+        position_ratio=(
+            _position_ratio(context, state, today) if idle else state["max_position_size"]
+        ),
+        trail_price=None if idle else _trail_price(state),
+    )
 
+    signals = registry.evaluate(state, signal_context)
+    updates = merge_signals(signals, state, signal_context)
+    if updates["should_buy"]:
+        logger.info(
+            f"[generate_signal] 매수 신호 발생: {updates['buy_reason']}, "
+            f"수량: {updates['order_qty']}주"
+        )
+    elif updates["should_sell"]:
+        logger.info(f"[generate_signal] 매도 신호 발생: {updates['sell_reason']}")
+    logger.debug(f"[generate_signal] 전략 {len(registry)}개 중 {len(signals)}개 신호")
     return updates
 
 
-def risk_check_node(state: TradingState) -> Dict[str, Any]:
+def risk_check_node(
+    state: TradingState,
+    context: Optional[TradingContext] = None
+) -> Dict[str, Any]:
     """
     리스크 체크 노드
     
     일일/월간 손실 한도, 포지션 크기, MDD 등을 종합적으로 확인합니다.
     """
     logger.info("[risk_check] 리스크 체크 시작")
+    context = context or TradingContext()
+    risk_rules = context.risk_rules
     
     updates: Dict[str, Any] = {}
     
     # 1. 종합 거래 조건 검증 (일일/월간 손실 한도)
+    daily_pnl, monthly_pnl, peak_asset = _loss_inputs(context, state)
     can_trade, trade_reason = risk_rules.validate_trading_conditions(
-        daily_pnl=state["daily_pnl"],
-        monthly_pnl=state.get("monthly_pnl", 0.0),
+        daily_pnl=daily_pnl,
+        monthly_pnl=monthly_pnl,
         initial_capital=state["initial_capital"],
         max_daily_loss=state["max_daily_loss"],
         max_monthly_loss=state.get("max_monthly_loss", -0.15)
     )
+    if context.halt_reason is not None:
+        can_trade, trade_reason = False, context.halt_reason
     
     if not can_trade:
         logger.warning(f"[risk_check] 거래 조건 불만족: {trade_reason}")
@@ -562,7 +1031,6 @@ def risk_check_node(state: TradingState) -> Dict[str, Any]:
     
     # 2. MDD(최대 낙폭) 체크
     current_asset = state.get("total_asset", state["initial_capital"])
-    peak_asset = state.get("peak_asset", state["initial_capital"])
     
     if risk_rules.check_max_drawdown(
         current_asset=current_asset,
@@ -594,7 +1062,28 @@ def risk_check_node(state: TradingState) -> Dict[str, Any]:
             updates["risk_check_failed"] = True
             updates["risk_check_reason"] = reason
     
-    # 4. 리스크 체크 통과
+    # 4. 중앙 코디네이터 주문 승인 (공유 현금 · 포트폴리오 손실 한도)
+    order_gate = context.order_gate
+    wants_order = state.get("should_buy") or state.get("should_sell")
+    if order_gate is not None and not updates and wants_order:
+        approved_qty, reason = order_gate(state)
+        if approved_qty <= 0:
+            logger.warning(f"[risk_check] 코디네이터 주문 거절: {reason}")
+            return {
+                "should_buy": False,
+                "should_sell": False,
+                "buy_reason": None,
+                "risk_check_failed": True,
+                "risk_check_reason": reason
+            }
+        if state.get("should_buy") and approved_qty != state.get("order_qty", 0):
+            logger.info(
+                f"[risk_check] 코디네이터 승인 수량: "
+                f"{state.get('order_qty', 0)}주 → {approved_qty}주"
+            )
+            return {"order_qty": approved_qty, "risk_check_passed": True}
+
+    # 5. 리스크 체크 통과
     if not updates:
         logger.info("[risk_check] 모든 리스크 체크 통과")
         updates["risk_check_passed"] = True
@@ -602,7 +1091,10 @@ def risk_check_node(state: TradingState) -> Dict[str, Any]:
     return updates
 
 
-def execute_order_node(state: TradingState) -> Dict[str, Any]:
+def execute_order_node(
+    state: TradingState,
+    context: Optional[TradingContext] = None
+) -> Dict[str, Any]:
     """
     주문 실행 노드
 
@@ -612,6 +1104,8 @@ def execute_order_node(state: TradingState) -> Dict[str, Any]:
         RuntimeError: KIS API를 사용할 수 없거나 인증 실패 시
     """
     logger.info("[execute_order] 주문 실행 시작")
+    context = context or TradingContext()
+    pnl_ledger, account_model = context.pnl_ledger, context.account_model
 
     updates: Dict[str, Any] = {}
 
@@ -656,8 +1150,10 @@ def execute_order_node(state: TradingState) -> Dict[str, Any]:
             slippage = state.get("slippage", 0.002)  # 기본값 0.2%
             raw_limit_price = current_price * (1 + slippage)
 
-            # 호가 단위에 맞게 조정
-            limit_price = adjust_price_to_tick(raw_limit_price)
+            # 호가 단위에 맞게 조정 (매수는 올림: 슬리피지 이상 확보)
+            limit_price = adjust_price_to_tick(
+                raw_limit_price, *get_symbol_class(state["symbol"]), mode="up"
+            )
 
             logger.info(
                 f"[execute_order] 매수 주문 실행: {state['symbol']}, "
@@ -672,15 +1168,20 @@ def execute_order_node(state: TradingState) -> Dict[str, Any]:
                 symbol=state["symbol"],
                 qty=order_qty,
                 price=limit_price,
-                order_dvsn="00"  # 지정가
+                order_dvsn="00",  # 지정가
+                limiter=context.rate_limiter
             )
 
             if result["success"]:
                 logger.info(f"[execute_order] 매수 체결: {result['order_no']}")
+                if pnl_ledger is not None:
+                    pnl_ledger.record(state["symbol"], "buy", order_qty, state["current_price"])
+                if account_model is not None:
+                    account_model.on_fill(state["symbol"], "buy", order_qty, state["current_price"])
                 updates.update({
                     "position_status": "IN_POSITION",
                     "entry_price": state["current_price"],
-                    "entry_time": datetime.now().isoformat(),
+                    "entry_time": get_clock().isoformat(),
                     "position_qty": order_qty,
                     "highest_price": state["current_price"],
                     "lowest_price": state["current_price"],
@@ -702,8 +1203,10 @@ def execute_order_node(state: TradingState) -> Dict[str, Any]:
             slippage = state.get("slippage", 0.002)  # 기본값 0.2%
             raw_limit_price = current_price * (1 - slippage)
 
-            # 호가 단위에 맞게 조정
-            limit_price = adjust_price_to_tick(raw_limit_price)
+            # 호가 단위에 맞게 조정 (매도는 내림)
+            limit_price = adjust_price_to_tick(
+                raw_limit_price, *get_symbol_class(state["symbol"]), mode="down"
+            )
 
             logger.info(
                 f"[execute_order] 매도 주문 실행: {state['symbol']}, "
@@ -718,7 +1221,8 @@ def execute_order_node(state: TradingState) -> Dict[str, Any]:
                 symbol=state["symbol"],
                 qty=state["position_qty"],
                 price=limit_price,
-                order_dvsn="00"  # 지정가
+                order_dvsn="00",  # 지정가
+                limiter=context.rate_limiter
             )
 
             if result["success"]:
@@ -727,6 +1231,14 @@ def execute_order_node(state: TradingState) -> Dict[str, Any]:
                 # 손익 계산
                 pnl = (state["current_price"] - state["entry_price"]) * state["position_qty"]
                 pnl_pct = (state["current_price"] - state["entry_price"]) / state["entry_price"]
+                if pnl_ledger is not None:
+                    pnl_ledger.record(
+                        state["symbol"], "sell", state["position_qty"], state["current_price"], pnl
+                    )
+                if account_model is not None:
+                    account_model.on_fill(
+                        state["symbol"], "sell", state["position_qty"], state["current_price"]
+                    )
 
                 updates.update({
                     "position_status": "IDLE",
@@ -755,6 +1267,9 @@ def execute_order_node(state: TradingState) -> Dict[str, Any]:
         logger.error(f"[execute_order] 주문 실행 오류: {e}")
         updates["should_buy"] = False
         updates["should_sell"] = False
+        if account_model is not None:
+            # 체결 여부를 모르므로 다음 갱신 때 잔고 대사
+            account_model.flag_drift("주문 결과 확인 불가")
 
     return updates
 
@@ -793,17 +1308,113 @@ def monitor_position_node(state: TradingState) -> Dict[str, Any]:
     return updates
 
 
-def update_account_node(state: TradingState) -> Dict[str, Any]:
+def _asset_updates(context: TradingContext, state: TradingState, total_eval: Won) -> Dict[str, Any]:
+    """총자산 · 최고 자산(peak_asset) 갱신 내용과 낙폭 로깅"""
+    updates = {
+        "total_asset": total_eval,
+        "daily_pnl_pct": (total_eval - state["initial_capital"]) / state["initial_capital"]
+    }
+
+    # Peak Asset 갱신 로직 (원장이 있으면 재시작 전 최고 자산 포함)
+    current_peak = _loss_inputs(context, state)[2]
+    if context.pnl_ledger is not None:
+        context.pnl_ledger.mark(total_eval, state["initial_capital"])
+
+    if total_eval > current_peak:
+        updates["peak_asset"] = total_eval
+        gain_amount = total_eval - current_peak
+        gain_pct = (gain_amount / current_peak) * 100
+
+        logger.info(
+            f"[update_account] !신규 최고 자산 경신! "
+            f"{current_peak:,.0f}원 → {total_eval:,.0f}원 "
+            f"(+{gain_amount:,.0f}원, +{gain_pct:.2f}%)"
+        )
+    else:
+        # MDD 계산 및 로깅 (디버깅/모니터링용)
+        current_mdd = (total_eval - current_peak) / current_peak
+        drawdown_amount = total_eval - current_peak
+
+        if current_mdd < -0.05:  # -5% 이상 하락 시 경고
+            logger.warning(
+                f"[update_account] ⚠️ 낙폭 발생: {current_mdd*100:.2f}% "
+                f"(최고: {current_peak:,.0f}원, 현재: {total_eval:,.0f}원, "
+                f"차이: {drawdown_amount:,.0f}원)"
+            )
+        else:
+            logger.debug(
+                f"[update_account] 현재 MDD: {current_mdd*100:.2f}% "
+                f"(최고: {current_peak:,.0f}원, 현재: {total_eval:,.0f}원)"
+            )
+
+    return updates
+
+
+def _mark_account(account_model: AccountModel, state: Dict[str, Any]) -> None:
+    """계좌 모델에 현재가 반영 후 그래프 상태의 보유 수량과 비교 (종목 · 포트폴리오 상태 모두)"""
+    symbol_states = state.get("symbol_states") or {state["symbol"]: state}
+    for symbol, sym in symbol_states.items():
+        account_model.on_price(symbol, sym["current_price"])
+    account_model.check_positions(
+        {symbol: sym["position_qty"] for symbol, sym in symbol_states.items()}
+    )
+
+
+def _apply_background_reconcile(
+    account_model: AccountModel,
+    position_reconciler: PositionReconciler
+) -> None:
+    """끝난 백그라운드 대사 결과를 계좌 모델에 반영 (실행 중이면 아무것도 안 함)"""
+    result = position_reconciler.poll()
+    if result is None:
+        return
+    if account_model.apply_reconcile(result):
+        logger.info(
+            f"[update_account] 잔고 대사 반영: {result.pages}페이지 {result.rows}종목, "
+            f"보정 {len(result.corrections)}건, {result.elapsed * 1000:.1f}ms"
+            f"{'' if result.complete else ' (시간 예산 초과, 부분 대사)'}"
+        )
+    else:
+        logger.info("[update_account] 잔고 대사 결과 폐기 (조회 실패 또는 대사 중 체결), 다시 대사")
+
+
+def update_account_node(
+    state: TradingState,
+    context: Optional[TradingContext] = None
+) -> Dict[str, Any]:
     """
     계좌 정보 업데이트 노드
 
     현금 잔고, 총 자산 및 최고 자산(peak_asset, MDD계산용)을 업데이트합니다.
+    로컬 계좌 모델이 있으면 보유 종목을 현재가로 평가하고, 체결 후 · 주기 · 불일치
+    감지 시에만 잔고를 조회해 대사합니다. 백그라운드 대사가 설정되어 있으면 첫 대사 이후에는
+    대사를 백그라운드로 넘기고 이번 반복은 로컬 평가로 진행합니다.
 
     Raises:
         RuntimeError: KIS API를 사용할 수 없거나 인증 실패 시
         Exception: 잔고 조회 실패 시
     """
     logger.info("[update_account] 계좌 정보 업데이트")
+    context = context or TradingContext()
+    account_model, position_reconciler = context.account_model, context.position_reconciler
+
+    if account_model is not None:
+        _mark_account(account_model, state)
+        if position_reconciler is not None:
+            _apply_background_reconcile(account_model, position_reconciler)
+        reason = account_model.needs_reconcile()
+        if reason is None:
+            logger.debug(f"[update_account] 로컬 평가: 총자산 {account_model.total_asset:,}원")
+            return _asset_updates(context, state, account_model.total_asset)
+        if position_reconciler is not None and account_model.reconciled_at is not None:
+            fetch_pages = partial(
+                _iter_inquire_balance, state["env_mode"], position_reconciler.max_pages,
+                limiter=context.rate_limiter,
+            )
+            if position_reconciler.submit(fetch_pages, account_model.book(), account_model.fills):
+                logger.info(f"[update_account] 백그라운드 잔고 대사 시작: {reason}")
+            return _asset_updates(context, state, account_model.total_asset)
+        logger.info(f"[update_account] 잔고 대사: {reason}")
 
     # KIS API 사용 가능 여부 확인
     if not KIS_AVAILABLE:
@@ -829,50 +1440,21 @@ def update_account_node(state: TradingState) -> Dict[str, Any]:
 
     try:
         # 잔고 조회
-        output1, output2 = _call_inquire_balance(state["env_mode"])
+        output1, output2 = _call_inquire_balance(state["env_mode"], context.rate_limiter)
 
         # output2에서 총평가금액 추출
         if output2 and len(output2) > 0:
-            total_eval = float(output2[0].get('tot_evlu_amt', 0))  # 총평가금액
+            total_eval = to_won(output2[0].get('tot_evlu_amt', 0))  # 총평가금액
             logger.info(f"[update_account] API 잔고 조회 완료: 총평가금액 {total_eval:,.0f}원")
 
-            # 기본 업데이트 정보
-            updates = {
-                "total_asset": total_eval,
-                "daily_pnl_pct": (total_eval - state["initial_capital"]) / state["initial_capital"]
-            }
-
-            # Peak Asset 갱신 로직
-            current_peak = state.get("peak_asset", state["initial_capital"])
-
-            if total_eval > current_peak:
-                updates["peak_asset"] = total_eval
-                gain_amount = total_eval - current_peak
-                gain_pct = (gain_amount / current_peak) * 100
-
-                logger.info(
-                    f"[update_account] !신규 최고 자산 경신! "
-                    f"{current_peak:,.0f}원 → {total_eval:,.0f}원 "
-                    f"(+{gain_amount:,.0f}원, +{gain_pct:.2f}%)"
-                )
-            else:
-                # MDD 계산 및 로깅 (디버깅/모니터링용)
-                current_mdd = (total_eval - current_peak) / current_peak
-                drawdown_amount = total_eval - current_peak
-                
-                if current_mdd < -0.05:  # -5% 이상 하락 시 경고
-                    logger.warning(
-                        f"[update_account] ⚠️ 낙폭 발생: {current_mdd*100:.2f}% "
-                        f"(최고: {current_peak:,.0f}원, 현재: {total_eval:,.0f}원, "
-                        f"차이: {drawdown_amount:,.0f}원)"
-                    )
-                else:
-                    logger.debug(
-                        f"[update_account] 현재 MDD: {current_mdd*100:.2f}% "
-                        f"(최고: {current_peak:,.0f}원, 현재: {total_eval:,.0f}원)"
+            if account_model is not None:
+                account_model.reconcile(output1, output2)
+                if account_model.last_drift:
+                    logger.info(
+                        f"[update_account] 로컬 평가 대비 차이 {account_model.last_drift:+,}원 보정"
                     )
 
-            return updates
+            return _asset_updates(context, state, total_eval)
         else:
             raise Exception("잔고 데이터 없음")
 
@@ -887,3 +1469,210 @@ def update_account_node(state: TradingState) -> Dict[str, Any]:
         )
         logger.error(error_msg)
         raise Exception(error_msg) from e
+
+
+# ========== 포트폴리오 노드 (graph_builder.build_portfolio_graph) ==========
+
+
+def symbol_signal_node(
+    payload: Dict[str, Any],
+    context: Optional[TradingContext] = None
+) -> Dict[str, Any]:
+    """
+    종목 분기 노드 (Send 입력: {"symbol_state": TradingState})
+
+    시세 조회 → 목표가 → 신호 → 포지션 모니터링을 한 종목에 대해 실행합니다.
+    종목마다 병렬로 실행되며, 한 종목의 조회 실패는 그 종목의 신호만 취소합니다.
+    """
+    context = context or TradingContext()
+    state = dict(payload["symbol_state"])
+    try:
+        for node in (fetch_market_data_node, calculate_target_node, generate_signal_node):
+            state.update(node(state, context))
+        state.update(monitor_position_node(state))
+    except Exception as e:
+        logger.error(f"[symbol_signal] {state['symbol']} 분기 실패, 이번 반복 신호 없음: {e}")
+        state.update({"should_buy": False, "should_sell": False})
+    return {"symbol_states": {state["symbol"]: state}}
+
+
+def portfolio_risk_node(
+    state: PortfolioState,
+    context: Optional[TradingContext] = None
+) -> Dict[str, Any]:
+    """
+    포트폴리오 리스크 체크 · 주문 배분 노드
+
+    종목 분기 결과를 모아 포트폴리오 손실 한도와 MDD를 확인하고, 매수 신호를
+    돌파 강도 순으로 공유 현금 · 종목당 최대 비중 · 최대 보유 종목 수 안에서
+    배분합니다 (변동성 조정 종목은 비중 한도를 조정 계수만큼 축소).
+    매도는 항상 허용하되 매도 대금은 체결 후(settle) 반영합니다.
+    포트폴리오 리스크 집계기가 있으면 배분된 매수 묶음을 총 · 순 노출, 업종 집중,
+    보유 종목과의 상관계수 한도로 한 번 더 점검합니다.
+    """
+    logger.info("[portfolio_risk] 포트폴리오 리스크 체크 시작")
+    context = context or TradingContext()
+    risk_rules, portfolio_risk = context.risk_rules, context.portfolio_risk
+
+    symbol_states = state["symbol_states"]
+    cash = state["cash_balance"]
+
+    def cancel_all(reason: str) -> Dict[str, Any]:
+        return {
+            "trading_stopped": True,
+            "stop_reason": reason,
+            "orders": [],
+            "symbol_states": {
+                symbol: {**sym, "should_buy": False, "should_sell": False}
+                for symbol, sym in symbol_states.items()
+            },
+        }
+
+    # 0. 킬 스위치
+    if context.halt_reason is not None:
+        logger.warning(f"[portfolio_risk] 거래 중단: {context.halt_reason}")
+        return cancel_all(context.halt_reason)
+
+    # 1. 포트폴리오 손실 한도
+    daily_pnl, monthly_pnl, peak_asset = _loss_inputs(context, state)
+    can_trade, trade_reason = risk_rules.validate_trading_conditions(
+        daily_pnl=daily_pnl,
+        monthly_pnl=monthly_pnl,
+        initial_capital=state["initial_capital"],
+        max_daily_loss=state["max_daily_loss"],
+        max_monthly_loss=state.get("max_monthly_loss", -0.15)
+    )
+    if not can_trade:
+        logger.warning(f"[portfolio_risk] 거래 조건 불만족: {trade_reason}")
+        return cancel_all(trade_reason)
+
+    # 2. MDD
+    current_asset = state.get("total_asset", state["initial_capital"])
+    if risk_rules.check_max_drawdown(
+        current_asset=current_asset,
+        peak_asset=peak_asset,
+        max_drawdown=state.get("max_drawdown", -0.20)
+    ):
+        logger.warning("[portfolio_risk] 최대 낙폭(MDD) 초과!")
+        return cancel_all("최대 낙폭(MDD) 초과")
+
+    # 3. 주문 배분
+    orders = [symbol for symbol, sym in symbol_states.items() if sym.get("should_sell")]
+    held = sum(1 for sym in symbol_states.values() if sym["position_status"] == "IN_POSITION")
+    position_cap = mul_ratio_floor(current_asset, state["max_position_size"])
+
+    buys = [sym for sym in symbol_states.values() if sym.get("should_buy")]
+    buys.sort(
+        key=lambda sym: (sym["current_price"] - sym["target_price"]) / sym["target_price"],
+        reverse=True,
+    )
+
+    # 종목당 최대 수량 (변동성 조정 종목은 캐시된 조정 계수로 한 번에 계산)
+    caps = {sym["symbol"]: position_cap // sym["current_price"] for sym in buys}
+    adjusted = [sym for sym in buys if sym.get("volatility_adjustment", False)]
+    if adjusted:
+        symbols = [sym["symbol"] for sym in adjusted]
+        sizes = context.position_sizer.size_many(
+            context.indicator_engine,
+            symbols,
+            current_asset,
+            [sym["current_price"] for sym in adjusted],
+            state["max_position_size"],
+            get_clock().now().strftime("%Y%m%d"),
+        )
+        caps.update(zip(symbols, sizes.tolist()))
+
+    updated = {}
+    remaining = cash
+    for sym in buys:
+        price = sym["current_price"]
+        qty = min(sym.get("order_qty", 0), caps[sym["symbol"]], remaining // price)
+        if held >= state["max_positions"] or qty <= 0:
+            if held >= state["max_positions"]:
+                reason = "최대 보유 종목 수 도달"
+            else:
+                reason = "배분 가능 현금 부족"
+            logger.info(f"[portfolio_risk] {sym['symbol']} 매수 보류: {reason}")
+            updated[sym["symbol"]] = {**sym, "should_buy": False, "order_qty": 0}
+            continue
+        remaining -= price * qty
+        held += 1
+        orders.append(sym["symbol"])
+        updated[sym["symbol"]] = {**sym, "order_qty": qty}
+        logger.info(f"[portfolio_risk] {sym['symbol']} 매수 배분: {qty}주 ({price * qty:,}원)")
+
+    # 4. 포트폴리오 노출 · 업종 집중 · 상관관계 (배분된 매수를 우선순위 순으로 한 번에 점검)
+    if portfolio_risk is not None:
+        for symbol, sym in symbol_states.items():
+            portfolio_risk.on_price(symbol, sym["current_price"])
+        allocated = [symbol for symbol in orders if updated.get(symbol, {}).get("should_buy")]
+        if allocated:
+            approved, reasons = portfolio_risk.check_orders(
+                allocated,
+                ["buy"] * len(allocated),
+                [updated[symbol]["order_qty"] for symbol in allocated],
+                [updated[symbol]["current_price"] for symbol in allocated],
+            )
+            for symbol, ok, code in zip(allocated, approved, reasons):
+                if ok:
+                    continue
+                sym = updated[symbol]
+                remaining += sym["current_price"] * sym["order_qty"]
+                orders.remove(symbol)
+                updated[symbol] = {**sym, "should_buy": False, "order_qty": 0}
+                logger.info(f"[portfolio_risk] {symbol} 매수 보류: {REASONS[code]}")
+
+    # 체결 후 현금 변화를 종목별 차이로 합산하도록 모든 종목에 공유 현금 기록
+    symbol_updates = {
+        symbol: {**updated.get(symbol, sym), "cash_balance": cash}
+        for symbol, sym in symbol_states.items()
+    }
+    logger.info(f"[portfolio_risk] 주문 {len(orders)}건 (남은 배분 현금 {remaining:,}원)")
+    return {"orders": orders, "symbol_states": symbol_updates}
+
+
+def execute_symbol_node(
+    payload: Dict[str, Any],
+    context: Optional[TradingContext] = None
+) -> Dict[str, Any]:
+    """종목 주문 분기 노드 (Send 입력: {"symbol_state": TradingState})"""
+    state = dict(payload["symbol_state"])
+    state.update(execute_order_node(state, context))
+    return {"symbol_states": {state["symbol"]: state}}
+
+
+def settle_portfolio_node(
+    state: PortfolioState,
+    context: Optional[TradingContext] = None
+) -> Dict[str, Any]:
+    """
+    포트폴리오 정산 노드
+
+    종목별 체결로 바뀐 현금(종목 상태 현금 - 배분 시 공유 현금)과 손익을 합산합니다.
+    """
+    context = context or TradingContext()
+    portfolio_risk = context.portfolio_risk
+    cash = state["cash_balance"]
+    symbol_states = state["symbol_states"]
+    new_cash = cash + sum(sym["cash_balance"] - cash for sym in symbol_states.values())
+
+    updates = {
+        "cash_balance": new_cash,
+        "realized_pnl": sum(sym["realized_pnl"] for sym in symbol_states.values()),
+        "daily_pnl": sum(sym["daily_pnl"] for sym in symbol_states.values()),
+        "total_trades": sum(sym["total_trades"] for sym in symbol_states.values()),
+        "orders": [],
+        "iteration": state.get("iteration", 0) + 1,
+        "timestamp": get_clock().isoformat(),
+    }
+    # 체결 결과로 노출 동기화 후 상관행렬 표본 추가 (반복마다 1회)
+    if portfolio_risk is not None:
+        for symbol, sym in symbol_states.items():
+            portfolio_risk.set_position(symbol, sym["position_qty"], sym["current_price"])
+        portfolio_risk.cash = new_cash
+        portfolio_risk.roll()
+
+    logger.info(
+        f"[settle_portfolio] 현금 {cash:,}원 → {new_cash:,}원, 일일손익 {updates['daily_pnl']:,}원"
+    )
+    return updates
@@ -2,12 +2,14 @@
 TradingState: LangGraph 상태 정의
 """
 
-from typing import TypedDict, Optional, Literal
-from datetime import datetime
+from typing import Annotated, Any, Dict, List, TypedDict, Optional, Literal, Sequence
 from pathlib import Path
 import yaml
 import logging
 
+from ..clock import get_clock
+from ..price import Won, to_won
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,6 +19,7 @@ class TradingState(TypedDict):
 
     이 상태는 LangGraph의 모든 노드 간에 전달되며,
     매매 의사결정에 필요한 모든 정보를 담고 있습니다.
+    가격과 금액(Won)은 원 단위 정수입니다.
     """
 
     # ========== 메타 정보 ==========
@@ -27,43 +30,51 @@ class TradingState(TypedDict):
     symbol: str  # 종목 코드 (예: "069500")
     symbol_name: str  # 종목 명 (예: "KODEX 200")
 
-    current_price: float  # 현재가
-    today_open: float  # 당일 시가
-    today_high: float  # 당일 고가
-    today_low: float  # 당일 저가
+    current_price: Won  # 현재가
+    today_open: Won  # 당일 시가
+    today_high: Won  # 당일 고가
+    today_low: Won  # 당일 저가
     today_volume: int  # 당일 거래량
 
-    yesterday_open: float  # 전일 시가
-    yesterday_high: float  # 전일 고가
-    yesterday_low: float  # 전일 저가
-    yesterday_close: float  # 전일 종가
+    yesterday_open: Won  # 전일 시가
+    yesterday_high: Won  # 전일 고가
+    yesterday_low: Won  # 전일 저가
+    yesterday_close: Won  # 전일 종가
     yesterday_volume: int  # 전일 거래량
 
+    indicators: Dict[str, Optional[float]]  # 증분 지표 (ATR, 변동성, 노이즈 비율, 이동평균 등)
+
     # ========== 전략 파라미터 ==========
-    k_value: float  # 변동성 계수 (기본값: 0.5)
-    target_price: float  # 목표가 (돌파 기준)
+    k_value: float  # 변동성 계수 (기본값: 0.5, 적응형 모드에서는 데이터 부족 시 값)
+    k_mode: Literal["static", "adaptive"]  # k 결정 방식
+    effective_k: float  # 목표가 계산에 실제 사용한 k
+    target_price: Won  # 목표가 (돌파 기준)
+    min_volume: int  # 돌파 필터: 당일 누적 거래량 하한 (0이면 미사용)
+    min_breakout_strength: float  # 돌파 필터: 목표가 대비 최소 초과 비율 (0이면 미사용)
     stop_loss_pct: float  # 손절매 비율 (예: -0.03)
     take_profit_pct: float  # 익절 비율 (예: 0.05)
     trailing_stop: bool  # 트레일링 스탑 사용 여부
     trailing_stop_pct: float  # 트레일링 스탑 비율
+    trailing_mode: Literal["pct", "atr"]  # 트레일링 거리 방식 (최고가 비율 | ATR 배수)
+    trailing_atr_multiplier: float  # ATR 방식 배수
     slippage: float  # 슬리피지 (예: 0.002 = 0.2%)
 
     # ========== 포지션 정보 ==========
     position_status: Literal["IDLE", "IN_POSITION"]  # 포지션 상태
-    entry_price: Optional[float]  # 진입가
+    entry_price: Optional[Won]  # 진입가
     entry_time: Optional[str]  # 진입 시각
     position_qty: int  # 보유 수량
-    highest_price: Optional[float]  # 진입 후 최고가 (트레일링 스탑)
-    lowest_price: Optional[float]  # 진입 후 최저가
+    highest_price: Optional[Won]  # 진입 후 최고가 (트레일링 스탑)
+    lowest_price: Optional[Won]  # 진입 후 최저가
 
     # ========== 손익 정보 ==========
-    unrealized_pnl: float  # 미실현 손익 (원)
+    unrealized_pnl: Won  # 미실현 손익 (원)
     unrealized_pnl_pct: float  # 미실현 손익률 (%)
 
-    realized_pnl: float  # 실현 손익 (원)
+    realized_pnl: Won  # 실현 손익 (원)
     realized_pnl_pct: float  # 실현 손익률 (%)
 
-    daily_pnl: float  # 일일 손익 (원)
+    daily_pnl: Won  # 일일 손익 (원)
     daily_pnl_pct: float  # 일일 손익률 (%)
 
     total_trades: int  # 총 거래 횟수
@@ -71,16 +82,17 @@ class TradingState(TypedDict):
     losing_trades: int  # 손실 거래 횟수
 
     # ========== 계좌 정보 ==========
-    cash_balance: float  # 주문 가능 현금
-    total_asset: float  # 총 자산 (현금 + 주식)
-    initial_capital: float  # 초기 자본
-    peak_asset: float  # 최고 자산 (MDD 계산용)
+    cash_balance: Won  # 주문 가능 현금
+    total_asset: Won  # 총 자산 (현금 + 주식)
+    initial_capital: Won  # 초기 자본
+    peak_asset: Won  # 최고 자산 (MDD 계산용)
 
     # ========== 리스크 관리 ==========
     max_daily_loss: float  # 일일 최대 손실 한도 (예: -0.05)
     max_monthly_loss: float  # 월간 최대 손실 한도 (예: -0.15)
     max_drawdown: float  # 최대 허용 드로우다운 (예: -0.20)
     max_position_size: float  # 최대 포지션 크기 비율 (예: 0.1)
+    volatility_adjustment: bool  # 종목 변동성에 따라 투자 비율 축소 여부
     trading_stopped: bool  # 거래 중단 플래그
     stop_reason: Optional[str]  # 중단 사유
 
@@ -89,6 +101,8 @@ class TradingState(TypedDict):
     should_sell: bool  # 매도 신호
     buy_reason: Optional[str]  # 매수 사유
     sell_reason: Optional[str]  # 매도 사유
+    order_qty: int  # 매수 주문 수량 (generate_signal → execute_order)
+    strategy_signals: List[Dict[str, Any]]  # 이번 반복 전략별 신호 (레지스트리 병합 전)
 
     # ========== 주문 정보 ==========
     last_order_no: Optional[str]  # 마지막 주문번호
@@ -100,6 +114,58 @@ class TradingState(TypedDict):
     debug_mode: bool  # 디버그 모드
 
 
+def merge_symbol_states(
+    left: Optional[Dict[str, TradingState]],
+    right: Optional[Dict[str, TradingState]]
+) -> Dict[str, TradingState]:
+    """종목 분기 결과 병합 (병렬 분기가 각자 자기 종목만 돌려줌)"""
+    merged = dict(left or {})
+    merged.update(right or {})
+    return merged
+
+
+class PortfolioState(TypedDict):
+    """
+    다종목 포트폴리오 LangGraph 상태
+
+    종목별 TradingState는 symbol_states에 두고 병렬 분기가 각자 갱신합니다.
+    현금 · 손익 · 리스크 한도는 포트폴리오 전체가 공유하며, 계좌 필드 이름은
+    TradingState와 같아 update_account_node를 그대로 씁니다.
+    """
+
+    timestamp: str  # 현재 시각 (ISO format)
+    iteration: int  # 현재 반복 횟수
+
+    symbols: List[str]  # 운용 종목
+    symbol_states: Annotated[Dict[str, TradingState], merge_symbol_states]  # 종목별 상태
+    orders: List[str]  # 이번 반복에 주문을 실행할 종목 (portfolio_risk → execute)
+
+    # ========== 손익 (종목 합계) ==========
+    realized_pnl: Won  # 실현 손익 (원)
+    daily_pnl: Won  # 일일 손익 (원)
+    daily_pnl_pct: float  # 일일 손익률
+    total_trades: int  # 총 거래 횟수
+
+    # ========== 계좌 정보 (공유) ==========
+    cash_balance: Won  # 주문 가능 현금
+    total_asset: Won  # 총 자산 (현금 + 주식)
+    initial_capital: Won  # 초기 자본
+    peak_asset: Won  # 최고 자산 (MDD 계산용)
+
+    # ========== 리스크 관리 ==========
+    max_daily_loss: float  # 일일 최대 손실 한도
+    max_monthly_loss: float  # 월간 최대 손실 한도
+    max_drawdown: float  # 최대 허용 드로우다운
+    max_position_size: float  # 종목당 최대 포지션 크기 비율 (총 자산 대비)
+    max_positions: int  # 최대 동시 보유 종목 수
+    trading_stopped: bool  # 거래 중단 플래그
+    stop_reason: Optional[str]  # 중단 사유
+
+    # ========== 환경 설정 ==========
+    env_mode: Literal["demo", "real"]  # 실행 모드
+    debug_mode: bool  # 디버그 모드
+
+
 def load_trading_config() -> dict:
     """
     trading_config.yaml 로드
@@ -140,7 +206,13 @@ def create_initial_state(
     max_drawdown: Optional[float] = None,
     trailing_stop: Optional[bool] = None,
     trailing_stop_pct: Optional[float] = None,
-    slippage: Optional[float] = None
+    trailing_mode: Optional[str] = None,
+    trailing_atr_multiplier: Optional[float] = None,
+    slippage: Optional[float] = None,
+    k_mode: Optional[str] = None,
+    volatility_adjustment: Optional[bool] = None,
+    min_volume: Optional[int] = None,
+    min_breakout_strength: Optional[float] = None
 ) -> TradingState:
     """
     초기 상태 생성
@@ -161,7 +233,13 @@ def create_initial_state(
         max_drawdown: 최대 낙폭 한도 (None이면 YAML에서 로드)
         trailing_stop: 트레일링 스탑 사용 여부 (None이면 YAML에서 로드)
         trailing_stop_pct: 트레일링 스탑 비율 (None이면 YAML에서 로드)
+        trailing_mode: 트레일링 거리 방식 "pct" | "atr" (None이면 YAML에서 로드)
+        trailing_atr_multiplier: ATR 방식 배수 (None이면 YAML에서 로드)
         slippage: 슬리피지 (None이면 YAML에서 로드)
+        k_mode: k 결정 방식 "static" | "adaptive" (None이면 YAML에서 로드)
+        volatility_adjustment: 변동성 조정 포지션 크기 사용 여부 (None이면 YAML에서 로드)
+        min_volume: 돌파 필터 최소 누적 거래량 (None이면 YAML에서 로드)
+        min_breakout_strength: 돌파 필터 최소 초과 비율 (None이면 YAML에서 로드)
 
     Returns:
         초기화된 TradingState
@@ -170,7 +248,10 @@ def create_initial_state(
     config = load_trading_config()
 
     # 파라미터 우선, 없으면 YAML, 그것도 없으면 하드코딩 기본값
-    final_initial_capital = initial_capital if initial_capital is not None else config.get('trading', {}).get('capital', 1000000.0)
+    final_initial_capital = to_won(
+        initial_capital if initial_capital is not None
+        else config.get('trading', {}).get('capital', 1000000)
+    )
     final_k_value = k_value if k_value is not None else config.get('volatility_breakout', {}).get('k_value', 0.5)
     final_stop_loss_pct = stop_loss_pct if stop_loss_pct is not None else config.get('risk', {}).get('stop_loss', -0.03)
     final_take_profit_pct = take_profit_pct if take_profit_pct is not None else config.get('risk', {}).get('take_profit', 0.05)
@@ -180,35 +261,66 @@ def create_initial_state(
     final_max_monthly_loss = max_monthly_loss if max_monthly_loss is not None else config.get('risk', {}).get('max_monthly_loss', -0.15)
     final_trailing_stop = trailing_stop if trailing_stop is not None else config.get('risk', {}).get('trailing_stop', False)
     final_trailing_stop_pct = trailing_stop_pct if trailing_stop_pct is not None else config.get('risk', {}).get('trailing_stop_pct', 0.02)
+    final_trailing_mode = (
+        trailing_mode if trailing_mode is not None
+        else config.get('risk', {}).get('trailing_mode', 'pct')
+    )
+    final_trailing_atr_multiplier = (
+        trailing_atr_multiplier if trailing_atr_multiplier is not None
+        else config.get('risk', {}).get('trailing_atr_multiplier', 2.0)
+    )
     final_max_drawdown = max_drawdown if max_drawdown is not None else config.get('risk', {}).get('max_drawdown', -0.20)
     final_slippage = slippage if slippage is not None else config.get('volatility_breakout', {}).get('slippage', 0.002)
+    final_volatility_adjustment = (
+        volatility_adjustment if volatility_adjustment is not None
+        else config.get('risk', {}).get('volatility_adjustment', False)
+    )
+    final_min_volume = (
+        min_volume if min_volume is not None
+        else config.get('volatility_breakout', {}).get('min_volume', 0)
+    )
+    final_min_breakout_strength = (
+        min_breakout_strength if min_breakout_strength is not None
+        else config.get('volatility_breakout', {}).get('min_breakout_strength', 0.0)
+    )
+    final_k_mode = (
+        k_mode if k_mode is not None
+        else config.get('volatility_breakout', {}).get('k_mode', 'static')
+    )
 
     return TradingState(
         # 메타
-        timestamp=datetime.now().isoformat(),
+        timestamp=get_clock().isoformat(),
         iteration=0,
 
         # 시장 데이터
         symbol=symbol,
         symbol_name="",
-        current_price=0.0,
-        today_open=0.0,
-        today_high=0.0,
-        today_low=0.0,
+        current_price=0,
+        today_open=0,
+        today_high=0,
+        today_low=0,
         today_volume=0,
-        yesterday_open=0.0,
-        yesterday_high=0.0,
-        yesterday_low=0.0,
-        yesterday_close=0.0,
+        yesterday_open=0,
+        yesterday_high=0,
+        yesterday_low=0,
+        yesterday_close=0,
         yesterday_volume=0,
+        indicators={},
 
         # 전략
         k_value=final_k_value,
-        target_price=0.0,
+        k_mode=final_k_mode,
+        effective_k=final_k_value,
+        target_price=0,
+        min_volume=final_min_volume,
+        min_breakout_strength=final_min_breakout_strength,
         stop_loss_pct=final_stop_loss_pct,
         take_profit_pct=final_take_profit_pct,
         trailing_stop=final_trailing_stop,
         trailing_stop_pct=final_trailing_stop_pct,
+        trailing_mode=final_trailing_mode,
+        trailing_atr_multiplier=final_trailing_atr_multiplier,
         slippage=final_slippage,
 
         # 포지션
@@ -220,11 +332,11 @@ def create_initial_state(
         lowest_price=None,
 
         # 손익
-        unrealized_pnl=0.0,
+        unrealized_pnl=0,
         unrealized_pnl_pct=0.0,
-        realized_pnl=0.0,
+        realized_pnl=0,
         realized_pnl_pct=0.0,
-        daily_pnl=0.0, # 매도 주문 시 갱신됨
+        daily_pnl=0, # 매도 주문 시 갱신됨
         daily_pnl_pct=0.0,
         total_trades=0,
         winning_trades=0,
@@ -241,6 +353,7 @@ def create_initial_state(
         max_monthly_loss=final_max_monthly_loss,
         max_drawdown=final_max_drawdown,
         max_position_size=final_max_position_size,
+        volatility_adjustment=final_volatility_adjustment,
         trading_stopped=False,
         stop_reason=None,
 
@@ -249,6 +362,8 @@ def create_initial_state(
         should_sell=False,
         buy_reason=None,
         sell_reason=None,
+        order_qty=0,
+        strategy_signals=[],
 
         # 주문
         last_order_no=None,
@@ -259,3 +374,63 @@ def create_initial_state(
         env_mode=final_env_mode,  # type: ignore
         debug_mode=False
     )
+
+
+def create_portfolio_state(
+    symbols: Sequence[str],
+    initial_capital: Optional[float] = None,
+    max_positions: Optional[int] = None,
+    **kwargs
+) -> PortfolioState:
+    """
+    포트폴리오 초기 상태 생성
+
+    종목별 상태는 create_initial_state로 만들고, 현금 · 리스크 한도는 첫 종목
+    상태(= YAML 기본값 + 인자)를 포트폴리오 공유 값으로 씁니다.
+
+    Args:
+        symbols: 종목 코드 목록
+        initial_capital: 초기 자본 (None이면 YAML에서 로드)
+        max_positions: 최대 동시 보유 종목 수 (None이면 YAML trading.max_positions)
+        **kwargs: create_initial_state 인자 (env_mode, k_value, max_position_size 등)
+
+    Returns:
+        초기화된 PortfolioState
+    """
+    if not symbols:
+        raise ValueError("포트폴리오 종목이 비어 있습니다")
+
+    symbol_states = {
+        symbol: create_initial_state(symbol=symbol, initial_capital=initial_capital, **kwargs)
+        for symbol in symbols
+    }
+    base = symbol_states[symbols[0]]
+    final_max_positions = (
+        max_positions if max_positions is not None
+        else load_trading_config().get('trading', {}).get('max_positions', 3)
+    )
+
+    return PortfolioState(
+        timestamp=get_clock().isoformat(),
+        iteration=0,
+        symbols=list(symbols),
+        symbol_states=symbol_states,
+        orders=[],
+        realized_pnl=0,
+        daily_pnl=0,
+        daily_pnl_pct=0.0,
+        total_trades=0,
+        cash_balance=base["cash_balance"],
+        total_asset=base["total_asset"],
+        initial_capital=base["initial_capital"],
+        peak_asset=base["peak_asset"],
+        max_daily_loss=base["max_daily_loss"],
+        max_monthly_loss=base["max_monthly_loss"],
+        max_drawdown=base["max_drawdown"],
+        max_position_size=base["max_position_size"],
+        max_positions=final_max_positions,
+        trading_stopped=False,
+        stop_reason=None,
+        env_mode=base["env_mode"],
+        debug_mode=False
+    )
@@ -0,0 +1,265 @@
+"""
+긴급 전량 청산 킬 스위치 (flatten-all)
+
+flatten_all()은 다음 순서로 계좌를 정리합니다.
+
+1. 컨텍스트 halt_reason 설정 → 매매 루프의 risk_check / portfolio_risk가 새 주문을 막고 중단
+2. 당일 미체결 주문 조회 후 전량 취소 (동시 전송)
+3. 잔고의 주문 가능 수량 전부 시장가 매도 (동시 전송)
+
+취소 · 매도는 ThreadPoolExecutor로 동시에 보내되, 컨텍스트에 rate_limiter가 있으면
+PRIORITY_FLATTEN으로 토큰을 받으므로 초당 호출 한도를 지키면서 대기 중인 조회보다
+먼저 나갑니다. 결과는 주문별 상태(FlattenOrder)와 청산 소요 시간(time_to_flat)으로 보고합니다.
+
+진입점:
+- apps/kill_switch_app.py (CLI, --pid로 실행 중인 봇에 신호 전송)
+- apps/flask_app.py POST /api/kill-switch
+- install_signal_handler() (기본 SIGUSR1, daily_breakout_app이 설치)
+"""
+
+import logging
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+from .clock import get_clock
+from .graph import nodes
+from .graph.context import TradingContext
+from .rate_limit import PRIORITY_FLATTEN
+from .reconcile import PageLimitExceeded
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FlattenOrder:
+    """청산 주문 1건 결과"""
+
+    symbol: str
+    kind: str  # "취소" | "매도"
+    qty: int
+    success: bool = False
+    order_no: str = ""
+    message: str = ""
+    elapsed: float = 0.0  # 청산 시작부터 응답까지 (초)
+
+
+@dataclass
+class FlattenReport:
+    """청산 결과"""
+
+    reason: str
+    started_at: datetime
+    orders: List[FlattenOrder] = field(default_factory=list)
+    time_to_flat: float = 0.0  # 청산 시작부터 마지막 매도 응답까지 (초)
+    error: Optional[str] = None
+
+    @property
+    def flat(self) -> bool:
+        """모든 취소 · 매도 성공 여부"""
+        return self.error is None and all(order.success for order in self.orders)
+
+    @property
+    def failed(self) -> List[FlattenOrder]:
+        return [order for order in self.orders if not order.success]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 응답용"""
+        return {
+            "reason": self.reason,
+            "started_at": self.started_at.isoformat(),
+            "flat": self.flat,
+            "time_to_flat": round(self.time_to_flat, 3),
+            "error": self.error,
+            "orders": [asdict(order) for order in self.orders],
+        }
+
+
+class KillSwitch:
+    """긴급 전량 청산 (한 번에 하나만 실행)"""
+
+    def __init__(
+        self, env_mode: str = "demo", max_workers: int = 8, context: Optional[TradingContext] = None
+    ):
+        """
+        초기화
+
+        Args:
+            env_mode: 실행 모드 ("demo" | "real")
+            max_workers: 취소 · 매도 동시 전송 스레드 수
+            context: 매매 루프와 같은 실행 컨텍스트 (None이면 청산만 하고 중단할 매매 루프 없음)
+        """
+        self.env_mode = env_mode
+        self.max_workers = max_workers
+        self.context = context or TradingContext()
+        self.last_report: Optional[FlattenReport] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_config(
+        cls, config: dict, env_mode: Optional[str] = None, context: Optional[TradingContext] = None
+    ) -> "KillSwitch":
+        """trading_config.yaml kill_switch 설정으로 생성"""
+        return cls(
+            env_mode=env_mode or config.get("trading", {}).get("env_mode", "demo"),
+            max_workers=config.get("kill_switch", {}).get("max_workers", 8),
+            context=context,
+        )
+
+    def _submit_all(
+        self, pool: ThreadPoolExecutor, jobs: List[FlattenOrder], send, started: float
+    ) -> None:
+        """주문들을 동시에 보내고 결과를 각 FlattenOrder에 기록"""
+
+        def run(order: FlattenOrder) -> None:
+            result = send(order)
+            order.success = result["success"]
+            order.order_no = result.get("order_no", "")
+            order.message = result.get("message", "")
+            order.elapsed = perf_counter() - started
+            log = logger.info if order.success else logger.error
+            log(f"[kill_switch] {order.symbol} {order.kind} {order.qty}주: {order.message}")
+
+        list(pool.map(run, jobs))
+
+    def flatten_all(self, reason: str = "킬 스위치") -> FlattenReport:
+        """
+        미체결 취소 후 전 종목 시장가 매도
+
+        Args:
+            reason: 중단 사유 (매매 루프 stop_reason으로 남음)
+
+        Returns:
+            FlattenReport (조회 실패 시 error, 주문별 실패는 orders의 success)
+        """
+        with self._lock:
+            started = perf_counter()
+            context = self.context
+            limiter = context.rate_limiter
+            context.halt(reason)
+            report = FlattenReport(reason=reason, started_at=get_clock().now())
+            logger.warning(f"[kill_switch] 전량 청산 시작: {reason}")
+
+            if not nodes._init_kis_auth(self.env_mode):
+                report.error = "KIS 인증 실패"
+                self.last_report = report
+                return report
+
+            try:
+                with ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="kill-switch"
+                ) as pool:
+                    # 1. 미체결 취소
+                    open_orders = nodes._call_inquire_open_orders(
+                        self.env_mode, priority=PRIORITY_FLATTEN, limiter=limiter
+                    )
+                    by_order_no = {row["odno"]: row for row in open_orders}
+                    cancels = [
+                        FlattenOrder(row["pdno"], "취소", int(row["rmn_qty"]), order_no=row["odno"])
+                        for row in open_orders
+                    ]
+                    self._submit_all(
+                        pool,
+                        cancels,
+                        lambda order: nodes._call_cancel_order(
+                            self.env_mode,
+                            by_order_no[order.order_no],
+                            priority=PRIORITY_FLATTEN,
+                            limiter=limiter,
+                        ),
+                        started,
+                    )
+                    report.orders.extend(cancels)
+
+                    # 2. 보유 종목 시장가 매도 (취소로 풀린 수량 포함)
+                    sells = []
+                    try:
+                        for page, _ in nodes._iter_inquire_balance(
+                            self.env_mode, priority=PRIORITY_FLATTEN, limiter=limiter
+                        ):
+                            for row in page:
+                                qty = int(row.get("ord_psbl_qty", row.get("hldg_qty", 0)) or 0)
+                                if qty > 0:
+                                    sells.append(FlattenOrder(row["pdno"], "매도", qty))
+                    except PageLimitExceeded as e:
+                        # 읽은 종목은 매도하고, 남은 종목이 있으므로 미완료로 보고
+                        logger.error(f"[kill_switch] 보유 종목 일부 조회 못함: {e}")
+                        report.error = str(e)
+                    self._submit_all(
+                        pool,
+                        sells,
+                        lambda order: nodes._call_order_cash(
+                            self.env_mode,
+                            "sell",
+                            order.symbol,
+                            order.qty,
+                            0,
+                            "01",
+                            priority=PRIORITY_FLATTEN,
+                            limiter=limiter,
+                        ),
+                        started,
+                    )
+                    report.orders.extend(sells)
+
+            except Exception as e:
+                logger.error(f"[kill_switch] 청산 중 조회 실패: {e}")
+                report.error = str(e)
+
+            if context.account_model is not None:
+                context.account_model.flag_drift("킬 스위치 청산")
+            report.time_to_flat = perf_counter() - started
+            logger.warning(
+                f"[kill_switch] 전량 청산 {'완료' if report.flat else '미완료'}: "
+                f"주문 {len(report.orders)}건 · 실패 {len(report.failed)}건 · "
+                f"{report.time_to_flat:.2f}초"
+            )
+            self.last_report = report
+            return report
+
+    def trigger(self, reason: str) -> bool:
+        """
+        백그라운드 스레드에서 전량 청산 시작 (신호 처리기용)
+
+        Returns:
+            시작 여부 (이미 실행 중이면 False)
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return False
+        self._thread = threading.Thread(
+            target=self.flatten_all, args=(reason,), name="kill-switch", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """백그라운드 청산 종료 대기"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+def install_signal_handler(kill_switch: KillSwitch, signum: int = signal.SIGUSR1):
+    """
+    신호를 받으면 전량 청산 (메인 스레드에서 호출)
+
+    처리기에서는 스레드만 시작하므로 매매 루프는 다음 risk_check에서 halt_reason을 보고 멈춥니다.
+
+    Args:
+        kill_switch: 킬 스위치
+        signum: 신호 번호 (기본 SIGUSR1)
+
+    Returns:
+        이전 신호 처리기
+    """
+
+    def handler(received, frame):
+        name = signal.Signals(received).name
+        logger.warning(f"[kill_switch] {name} 수신")
+        kill_switch.trigger(f"신호 {name}")
+
+    return signal.signal(signum, handler)
@@ -0,0 +1,67 @@
+"""
+원 단위 정수 가격
+
+KRX 호가와 체결가, 예수금은 항상 원 단위 정수이므로 시세 조회 시점에 한 번만
+int로 바꾸고, 이후 전략 · 주문 · 손익 · 백테스터에서는 int(배열은 int64)로만
+계산합니다. 부동소수점 누적 오차 없이 현금/손익이 정확히 맞고, 비교도 정수 비교입니다.
+
+비율 파라미터(k, 손절/익절 비율, 투자 비율)와 가격의 곱은 비율을 1bp(0.01%) 단위
+정수로 양자화해 정확히 올림/내림합니다. 예: 목표가 = 시가 + ceil(변동폭 × k) 이므로
+"현재가 >= 목표가" 정수 비교가 실수 목표가와의 비교와 같은 결과를 냅니다.
+"""
+
+from typing import Union
+
+import numpy as np
+
+Won = int  # 원 단위 정수 가격/금액
+
+PRICE_DTYPE = np.int64
+
+# 비율 양자화 단위 (1bp)
+RATIO_SCALE = 10_000
+
+IntOrArray = Union[int, np.ndarray]
+
+
+def to_won(value: Union[int, float, str]) -> Won:
+    """
+    API 응답/설정 값을 원 단위 정수로 변환 (반올림)
+
+    Args:
+        value: 가격/금액 (int, float, "30000", "30000.0")
+
+    Returns:
+        원 단위 정수
+    """
+    if isinstance(value, int):
+        return value
+    return int(round(float(value)))
+
+
+def to_won_array(values) -> np.ndarray:
+    """가격 배열을 int64 원 단위 배열로 변환 (정수 배열은 복사 없이 반환)"""
+    arr = np.asarray(values)
+    if arr.dtype.kind in "iu":
+        return arr.astype(PRICE_DTYPE, copy=False)
+    return np.rint(arr.astype(np.float64)).astype(PRICE_DTYPE)
+
+
+RatioOrArray = Union[float, np.ndarray]
+
+
+def ratio_units(ratio: RatioOrArray) -> IntOrArray:
+    """비율을 1bp 단위 정수로 양자화 (0.5 → 5000, -0.03 → -300, 배열은 int64 배열)"""
+    if isinstance(ratio, np.ndarray):
+        return np.rint(ratio * RATIO_SCALE).astype(np.int64)
+    return int(round(ratio * RATIO_SCALE))
+
+
+def mul_ratio_floor(amount: IntOrArray, ratio: RatioOrArray) -> IntOrArray:
+    """floor(amount × ratio) — 정수/정수 배열에 대해 정확"""
+    return amount * ratio_units(ratio) // RATIO_SCALE
+
+
+def mul_ratio_ceil(amount: IntOrArray, ratio: RatioOrArray) -> IntOrArray:
+    """ceil(amount × ratio) — 정수/정수 배열에 대해 정확"""
+    return -(-amount * ratio_units(ratio) // RATIO_SCALE)
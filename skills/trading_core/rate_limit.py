@@ -0,0 +1,86 @@
+"""
+KIS REST 호출 우선순위 속도 제한기
+
+KIS는 계좌당 초당 호출 수를 넘으면 EGW00201(초당 거래건수 초과)로 거절합니다.
+호출 직전 acquire()로 토큰을 받아 호출 간격을 1/rate초 이상으로 유지하고,
+토큰을 기다리는 호출이 여럿이면 우선순위 숫자가 작은 호출부터 내보냅니다.
+킬 스위치 매도(PRIORITY_FLATTEN)는 대기 중인 시세 · 잔고 조회보다 먼저 나갑니다.
+
+TradingContext.rate_limiter가 설정되면 _call_order_cash · 시세 · 잔고 · 취소 호출이 모두 거칩니다.
+"""
+
+import heapq
+import itertools
+import threading
+from time import monotonic
+from typing import List, Tuple
+
+PRIORITY_FLATTEN = 0  # 킬 스위치 취소 · 매도
+PRIORITY_ORDER = 1  # 일반 주문
+PRIORITY_QUERY = 2  # 시세 · 잔고 조회
+
+
+class PriorityRateLimiter:
+    """토큰 버킷 + 우선순위 대기열 (스레드 안전)"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        초기화
+
+        Args:
+            rate: 초당 최대 호출 수
+            burst: 한 번에 몰아 보낼 수 있는 호출 수
+                (1이면 균등 간격, 어떤 1초 구간에도 rate회 이하)
+
+        Raises:
+            ValueError: rate가 0 이하일 때
+        """
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+        self.rate = rate
+        self.burst = burst
+        self.interval = 1.0 / rate
+        self.granted = 0
+        self.waited = 0.0  # 누적 대기 시간 (초)
+        self._tokens = float(burst)
+        self._updated = monotonic()
+        self._waiters: List[Tuple[int, int]] = []  # (우선순위, 도착 순번) 힙
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_config(cls, config: dict) -> "PriorityRateLimiter":
+        """trading_config.yaml api.rate_limit으로 생성"""
+        return cls(rate=config.get("api", {}).get("rate_limit", 20))
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) / self.interval)
+        self._updated = now
+
+    def acquire(self, priority: int = PRIORITY_ORDER) -> float:
+        """
+        호출 토큰 획득 (토큰이 생기고 자기 차례가 될 때까지 대기)
+
+        Args:
+            priority: 우선순위 (작을수록 먼저)
+
+        Returns:
+            대기 시간 (초)
+        """
+        with self._cond:
+            entry = (priority, next(self._sequence))
+            heapq.heappush(self._waiters, entry)
+            started = monotonic()
+            while True:
+                now = monotonic()
+                self._refill(now)
+                head = self._waiters[0] == entry
+                if head and self._tokens >= 1.0:
+                    heapq.heappop(self._waiters)
+                    self._tokens -= 1.0
+                    self.granted += 1
+                    self.waited += now - started
+                    self._cond.notify_all()  # 다음 순서가 자기 대기 시간을 다시 계산
+                    return now - started
+                # 선두만 다음 토큰 시각까지 기다리고, 나머지는 선두가 바뀔 때까지 대기
+                self._cond.wait((1.0 - self._tokens) * self.interval if head else None)
@@ -0,0 +1,198 @@
+"""
+보유 종목 대사 (inquire-balance output1 ↔ 로컬 계좌 모델)
+
+잔고 조회 output1을 페이지 단위로 받아 오는 즉시 종목 코드 인덱스(dict)로
+로컬 보유 수량과 비교하고, 다른 종목만 보정(Correction)으로 내보냅니다.
+전체 잔고를 모아 다시 만드는 대신 페이지마다 O(페이지 종목 수)로 처리하고,
+시간 예산(budget_seconds)을 넘기거나 최대 페이지 수(PageLimitExceeded)에 걸리면
+남은 페이지는 조회하지 않고 부분 결과로 끝냅니다.
+
+PositionReconciler는 대사를 백그라운드 스레드에서 실행하고, 매매 루프는
+update_account 노드에서 poll()로 끝난 결과만 가져와 반영하므로 조회를 기다리지 않습니다.
+대사를 시작한 뒤 체결이 있었으면(계좌 모델 fills 변경) 결과를 버리고 다시 대사합니다.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Callable, Iterable, List, Mapping, Optional, Tuple
+
+from .price import Won, to_won
+
+logger = logging.getLogger(__name__)
+
+Page = Tuple[List[Mapping[str, str]], List[Mapping[str, str]]]  # (output1 페이지, output2)
+
+
+class PageLimitExceeded(Exception):
+    """연속 조회가 최대 페이지 수에 걸려 남은 페이지를 읽지 못함"""
+
+
+@dataclass
+class Correction:
+    """로컬과 증권사 보유 수량이 다른 종목 (증권사 기준으로 보정)"""
+
+    symbol: str
+    local_qty: int
+    broker_qty: int
+    avg_price: Won = 0
+    price: Won = 0
+
+    @property
+    def kind(self) -> str:
+        if self.local_qty == 0:
+            return "추가"
+        if self.broker_qty == 0:
+            return "삭제"
+        return "수량"
+
+    def __str__(self) -> str:
+        return f"{self.symbol} {self.kind} {self.local_qty}주 → {self.broker_qty}주"
+
+
+@dataclass
+class ReconcileResult:
+    """대사 결과"""
+
+    corrections: List[Correction] = field(default_factory=list)
+    output2: List[Mapping[str, str]] = field(default_factory=list)
+    pages: int = 0
+    rows: int = 0
+    complete: bool = False  # 모든 페이지를 읽었는지 (False면 로컬에만 있는 종목은 판단 보류)
+    elapsed: float = 0.0
+    fills: int = 0  # 대사 시작 시점 계좌 모델 체결 수
+    error: Optional[str] = None
+
+
+def diff_positions(
+    pages: Iterable[Page], book: Mapping[str, int], budget_seconds: Optional[float] = None
+) -> ReconcileResult:
+    """
+    잔고 페이지를 받는 대로 로컬 보유 수량과 비교
+
+    Args:
+        pages: (output1 페이지, output2) 이터러블 (지연 조회 제너레이터)
+        book: 로컬 보유 수량 (종목 → 수량)
+        budget_seconds: 시간 예산 (넘으면 다음 페이지를 조회하지 않고 부분 결과)
+
+    Returns:
+        ReconcileResult (complete면 로컬에만 있는 종목도 삭제 보정에 포함,
+        최대 페이지 수에 걸리면 읽은 페이지까지의 부분 결과)
+    """
+    started = perf_counter()
+    unseen = dict(book)
+    result = ReconcileResult()
+    try:
+        for page, output2 in pages:
+            result.pages += 1
+            result.output2 = output2
+            for row in page:
+                symbol = row["pdno"]
+                broker_qty = int(row.get("hldg_qty", 0) or 0)
+                local_qty = unseen.pop(symbol, 0)
+                result.rows += 1
+                if broker_qty != local_qty:
+                    result.corrections.append(
+                        Correction(
+                            symbol,
+                            local_qty,
+                            broker_qty,
+                            to_won(row.get("pchs_avg_pric", 0) or 0),
+                            to_won(row.get("prpr", 0) or 0),
+                        )
+                    )
+            if budget_seconds is not None and perf_counter() - started > budget_seconds:
+                break
+        else:
+            result.complete = True
+            result.corrections.extend(
+                Correction(symbol, qty, 0) for symbol, qty in unseen.items() if qty > 0
+            )
+    except PageLimitExceeded as e:
+        logger.warning(f"[reconcile] {e}, 부분 대사")
+    result.elapsed = perf_counter() - started
+    return result
+
+
+class PositionReconciler:
+    """백그라운드 보유 종목 대사 (한 번에 하나만 실행)"""
+
+    def __init__(self, budget_seconds: float = 2.0, max_pages: int = 50):
+        """
+        초기화
+
+        Args:
+            budget_seconds: 대사 1회 시간 예산 (초)
+            max_pages: 대사 1회 최대 페이지 수
+        """
+        self.budget_seconds = budget_seconds
+        self.max_pages = max_pages
+        self.runs = 0
+        self._thread: Optional[threading.Thread] = None
+        self._result: Optional[ReconcileResult] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict) -> "PositionReconciler":
+        """trading_config.yaml account 설정으로 생성"""
+        account = config.get("account", {})
+        return cls(
+            budget_seconds=account.get("reconcile_budget", 2.0),
+            max_pages=account.get("reconcile_max_pages", 50),
+        )
+
+    @property
+    def busy(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def run(
+        self, fetch_pages: Callable[[], Iterable[Page]], book: Mapping[str, int], fills: int = 0
+    ) -> ReconcileResult:
+        """대사 1회 (호출한 스레드에서 실행, 조회 오류는 결과의 error로)"""
+        try:
+            result = diff_positions(fetch_pages(), book, self.budget_seconds)
+        except Exception as e:
+            logger.error(f"[reconcile] 잔고 대사 실패: {e}")
+            result = ReconcileResult(error=str(e))
+        result.fills = fills
+        self.runs += 1
+        return result
+
+    def submit(
+        self, fetch_pages: Callable[[], Iterable[Page]], book: Mapping[str, int], fills: int = 0
+    ) -> bool:
+        """
+        백그라운드 대사 시작
+
+        Args:
+            fetch_pages: 잔고 페이지 제너레이터를 만드는 함수 (백그라운드 스레드에서 호출)
+            book: 로컬 보유 수량 스냅샷 (종목 → 수량)
+            fills: 현재 계좌 모델 체결 수 (결과 반영 시 비교)
+
+        Returns:
+            시작 여부 (이미 실행 중이면 False)
+        """
+        if self.busy:
+            return False
+        book = dict(book)
+
+        def work():
+            result = self.run(fetch_pages, book, fills)
+            with self._lock:
+                self._result = result
+
+        self._thread = threading.Thread(target=work, name="position-reconciler", daemon=True)
+        self._thread.start()
+        return True
+
+    def poll(self) -> Optional[ReconcileResult]:
+        """끝난 대사 결과 (없거나 실행 중이면 None, 기다리지 않음)"""
+        with self._lock:
+            result, self._result = self._result, None
+        return result
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """실행 중인 대사 종료 대기 (테스트 · 종료 시)"""
+        if self._thread is not None:
+            self._thread.join(timeout)
@@ -0,0 +1,104 @@
+"""
+장중 반복 실행 스케줄러
+
+build_trading_graph()로 만든 단일 반복 그래프를 일정 간격으로 실행합니다.
+대기와 시각 판단은 모두 주입된 시계를 사용하므로, VirtualClock을 넘기면
+하루치 세션을 실제 대기 없이 리플레이할 수 있습니다.
+"""
+
+import logging
+from datetime import datetime, time, timedelta
+from typing import Any, Callable, Optional
+
+from .clock import Clock, get_clock, use_clock
+from .graph.state import TradingState
+
+logger = logging.getLogger(__name__)
+
+
+class TradingScheduler:
+    """장중 그래프 반복 실행기"""
+
+    def __init__(
+        self,
+        graph: Any,
+        clock: Optional[Clock] = None,
+        interval_seconds: float = 60.0,
+        session_start: time = time(9, 0),
+        session_end: time = time(15, 30),
+        max_iterations: Optional[int] = None,
+        on_iteration: Optional[Callable[[TradingState], None]] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            graph: invoke(state)를 제공하는 컴파일된 그래프
+            clock: 사용할 시계 (None이면 전역 시계, 지정 시 실행 중 전역 시계로도 설치)
+            interval_seconds: 반복 간격 (초, monitoring.check_interval)
+            session_start: 첫 실행 시각
+            session_end: 마지막 실행 허용 시각 (이 시각 이후 종료)
+            max_iterations: 최대 반복 횟수 (None이면 세션 종료까지)
+            on_iteration: 매 반복 후 호출할 콜백 (대시보드 갱신, 기록 등)
+        """
+        if interval_seconds <= 0:
+            raise ValueError(f"interval_seconds는 0보다 커야 합니다: {interval_seconds}")
+
+        self.graph = graph
+        self.clock = clock
+        self.interval_seconds = interval_seconds
+        self.session_start = session_start
+        self.session_end = session_end
+        self.max_iterations = max_iterations
+        self.on_iteration = on_iteration
+        self.iterations = 0
+
+    def run(self, initial_state: TradingState) -> TradingState:
+        """
+        세션 종료(또는 거래 중단)까지 그래프 반복 실행
+
+        Args:
+            initial_state: 초기 상태
+
+        Returns:
+            마지막 반복 후 상태
+        """
+        if self.clock is None:
+            return self._run(initial_state, get_clock())
+
+        with use_clock(self.clock):
+            return self._run(initial_state, self.clock)
+
+    def _run(self, state: TradingState, clock: Clock) -> TradingState:
+        today = clock.now().date()
+        start_dt = datetime.combine(today, self.session_start)
+        end_dt = datetime.combine(today, self.session_end)
+
+        if clock.now() < start_dt:
+            logger.info(f"[scheduler] 세션 시작 대기: {start_dt.isoformat()}")
+            clock.sleep_until(start_dt)
+
+        self.iterations = 0
+        next_run = clock.now()
+
+        while clock.now() < end_dt:
+            state = self.graph.invoke(state)
+            self.iterations += 1
+
+            if self.on_iteration is not None:
+                self.on_iteration(state)
+
+            if state.get("trading_stopped"):
+                logger.info(f"[scheduler] 거래 중단으로 종료: {state.get('stop_reason')}")
+                break
+
+            if self.max_iterations is not None and self.iterations >= self.max_iterations:
+                logger.info(f"[scheduler] 최대 반복 횟수 도달: {self.iterations}회")
+                break
+
+            # 실행 시간이 간격에 누적되지 않도록 예정 시각 기준으로 대기
+            next_run = max(next_run + timedelta(seconds=self.interval_seconds), clock.now())
+            clock.sleep_until(next_run)
+
+        logger.info(f"[scheduler] 세션 종료: 총 {self.iterations}회 실행")
+        return state
@@ -0,0 +1,392 @@
+"""
+섀도(페이퍼) 평가
+
+운영 k_value · 손절/익절을 바꾸기 전에 후보 값이 실제 장에서 어떻게 거래했을지
+확인합니다. 실운영과 같은 프로세스에서 같은 시세 — 반복마다 조회한 상태
+(TradingScheduler on_iteration)와 틱 스트림(on_tick) — 를 받아 N개 파라미터 조합을
+가상 체결로 평가하며, 주문은 내지 않고 조회도 추가하지 않습니다.
+
+- 변형: 이름 + 상태 덮어쓰기 (VARIANT_PARAMS), 판단은 registry.BreakoutPlugin
+- 체결 모델: 신호 가격 ± ceil(가격 × 슬리피지), 체결 금액 × 수수료 올림
+  (backtest.engine과 같은 비용)
+- 기록: 체결 · 반복별 평가 손익을 열 단위 배열로 모아 data/shadow/{일자_시각}.npz 로 저장
+- 시간 예산: 변형을 시작하기 전마다 확인해 호출당 budget_ms를 넘으면 남은 변형은 다음 호출로
+  미룸 (다음 호출은 미룬 변형부터).
+  섀도의 예외는 기록만 하고 실운영 경로로 올리지 않음
+"""
+
+import io
+import logging
+import math
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from .clock import get_clock
+from .price import Won, mul_ratio_ceil
+from .strategies.registry import BreakoutPlugin, SignalContext
+from .strategies.trailing_stop import trailing_stop_price
+
+logger = logging.getLogger(__name__)
+
+project_root = Path(__file__).parent.parent.parent
+
+# 변형이 덮어쓸 수 있는 상태 필드
+VARIANT_PARAMS = (
+    "k_value",
+    "min_volume",
+    "min_breakout_strength",
+    "stop_loss_pct",
+    "take_profit_pct",
+    "max_position_size",
+    "trailing_stop",
+    "trailing_stop_pct",
+    "trailing_mode",
+    "trailing_atr_multiplier",
+)
+
+# 로그 열 (체결 행, 평가 손익 행)
+FILL_COLUMNS = {
+    "ts": np.float64,
+    "variant": np.int16,
+    "symbol": "S12",
+    "side": np.int8,
+    "price": np.int64,
+    "qty": np.int64,
+    "fee": np.int64,
+    "pnl": np.int64,
+    "cash": np.int64,
+}
+MARK_COLUMNS = {"ts": np.float64, "variant": np.int16, "equity": np.int64, "realized_pnl": np.int64}
+
+
+class _Position:
+    __slots__ = ("qty", "entry_price", "highest_price", "cost")
+
+    def __init__(self, qty: int, entry_price: Won, highest_price: Won, cost: Won):
+        self.qty = qty
+        self.entry_price = entry_price
+        self.highest_price = highest_price
+        self.cost = cost  # 수수료 포함 매수 금액
+
+
+class ShadowVariant:
+    """후보 파라미터 조합 하나와 그 가상 계좌"""
+
+    def __init__(self, name: str, params: Dict[str, Any], initial_capital: Won):
+        """
+        초기화
+
+        Args:
+            name: 변형 이름
+            params: 덮어쓸 상태 필드 (VARIANT_PARAMS 중)
+            initial_capital: 가상 계좌 초기 자본 (원)
+
+        Raises:
+            ValueError: 지원하지 않는 필드가 있는 경우
+        """
+        unknown = sorted(set(params) - set(VARIANT_PARAMS))
+        if unknown:
+            raise ValueError(f"섀도 변형 {name}: 지원하지 않는 파라미터 {', '.join(unknown)}")
+
+        self.name = name
+        self.params = dict(params)
+        self.plugin = BreakoutPlugin(
+            name,
+            k=params.get("k_value"),
+            min_volume=params.get("min_volume"),
+            min_breakout_strength=params.get("min_breakout_strength"),
+            stop_loss_pct=params.get("stop_loss_pct"),
+            take_profit_pct=params.get("take_profit_pct"),
+        )
+        self.cash: Won = initial_capital
+        self.positions: Dict[str, _Position] = {}
+        self.realized_pnl: Won = 0
+        self.trades = 0
+        self.wins = 0
+
+    def buy(
+        self, symbol: str, price: Won, qty: int, commission: float, slippage: float
+    ) -> Optional[Dict[str, int]]:
+        """가상 매수 (현금이 모자라면 살 수 있는 만큼, 0주면 None)"""
+        fill = price + mul_ratio_ceil(price, slippage)
+        qty = min(qty, int(self.cash // (fill * (1 + commission))))
+        if qty <= 0:
+            return None
+        amount = fill * qty
+        fee = math.ceil(amount * commission)
+        self.cash -= amount + fee
+        self.positions[symbol] = _Position(qty, fill, price, amount + fee)
+        return {"side": 1, "price": fill, "qty": qty, "fee": fee, "pnl": 0}
+
+    def sell(self, symbol: str, price: Won, commission: float, slippage: float) -> Dict[str, int]:
+        """가상 전량 매도"""
+        position = self.positions.pop(symbol)
+        fill = price - mul_ratio_ceil(price, slippage)
+        amount = fill * position.qty
+        fee = math.ceil(amount * commission)
+        pnl = amount - fee - position.cost
+        self.cash += amount - fee
+        self.realized_pnl += pnl
+        self.trades += 1
+        self.wins += pnl > 0
+        return {"side": -1, "price": fill, "qty": position.qty, "fee": fee, "pnl": pnl}
+
+    def equity(self, prices: Dict[str, Won]) -> Won:
+        """현금 + 보유 평가액 (가격 없는 종목은 진입가)"""
+        return self.cash + sum(
+            position.qty * prices.get(symbol, position.entry_price)
+            for symbol, position in self.positions.items()
+        )
+
+
+class ShadowLog:
+    """열 단위 섀도 로그 (체결 행 · 평가 손익 행)"""
+
+    def __init__(self, variants: List[str]):
+        self.variants = list(variants)
+        self.fills: Dict[str, list] = {column: [] for column in FILL_COLUMNS}
+        self.marks: Dict[str, list] = {column: [] for column in MARK_COLUMNS}
+
+    def fill(self, **row) -> None:
+        for column, values in self.fills.items():
+            values.append(row[column])
+
+    def mark(self, **row) -> None:
+        for column, values in self.marks.items():
+            values.append(row[column])
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """저장 형식 ({fill_열, mark_열, variants})"""
+        out = {"variants": np.asarray(self.variants, dtype=str)}
+        for column, dtype in FILL_COLUMNS.items():
+            out[f"fill_{column}"] = np.asarray(self.fills[column], dtype=dtype)
+        for column, dtype in MARK_COLUMNS.items():
+            out[f"mark_{column}"] = np.asarray(self.marks[column], dtype=dtype)
+        return out
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """npz로 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, **self.arrays())
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(buffer.getvalue())
+        tmp.replace(path)
+        return path
+
+    @staticmethod
+    def load(path: Union[str, Path]) -> Dict[str, np.ndarray]:
+        with np.load(path) as data:
+            return {name: data[name] for name in data.files}
+
+
+class ShadowRunner:
+    """실운영 시세로 후보 파라미터를 가상 체결 평가 (주문 없음)"""
+
+    def __init__(
+        self,
+        variants: Dict[str, Dict[str, Any]],
+        initial_capital: Won,
+        commission: float = 0.00015,
+        slippage: float = 0.001,
+        budget_ms: float = 2.0,
+        log_dir: Optional[Union[str, Path]] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            variants: {변형 이름: 덮어쓸 파라미터}
+            initial_capital: 변형별 가상 계좌 초기 자본 (원)
+            commission: 편도 수수료율
+            slippage: 편도 슬리피지
+            budget_ms: 호출(반복 · 틱)마다 섀도 평가에 쓰는 최대 시간 (밀리초)
+            log_dir: 로그 디렉터리 (None이면 data/shadow)
+        """
+        self.variants = [
+            ShadowVariant(name, params, initial_capital) for name, params in variants.items()
+        ]
+        self.commission = commission
+        self.slippage = slippage
+        self.budget = budget_ms / 1000
+        self.log_dir = Path(log_dir) if log_dir else project_root / "data" / "shadow"
+        self.log = ShadowLog([variant.name for variant in self.variants])
+        self.started_at = get_clock().now()
+
+        self._snapshots: Dict[str, Dict[str, Any]] = {}  # 종목별 마지막 실운영 상태
+        self._prices: Dict[str, Won] = {}
+        self._cursor = 0
+        self.deferred = 0  # 예산 초과로 미룬 변형 평가 수
+        self.busy_seconds = 0.0
+
+    @classmethod
+    def from_config(cls, config: dict, initial_capital: Optional[Won] = None) -> "ShadowRunner":
+        """
+        trading_config.yaml로 생성 (shadow, backtest 비용)
+
+        Args:
+            config: 전략 설정
+            initial_capital: 가상 계좌 자본 (None이면 trading.capital)
+        """
+        shadow = config.get("shadow", {})
+        backtest = config.get("backtest", {})
+        return cls(
+            variants=shadow.get("variants") or {},
+            initial_capital=initial_capital or config.get("trading", {}).get("capital", 10_000_000),
+            commission=backtest.get("commission", 0.00015),
+            slippage=backtest.get("slippage", 0.001),
+            budget_ms=shadow.get("budget_ms", 2.0),
+            log_dir=shadow.get("log_dir") or None,
+        )
+
+    def on_state(self, state: Dict[str, Any]) -> int:
+        """
+        실운영 반복 결과 반영 (TradingScheduler on_iteration)
+
+        Args:
+            state: 그래프 실행 후 상태 (시세 · 목표가)
+
+        Returns:
+            이번 호출에서 평가한 변형 수
+        """
+        if state.get("current_price", 0) <= 0 or not state.get("target_price"):
+            return 0
+        symbol = state["symbol"]
+        self._snapshots[symbol] = state
+        return self._run(symbol, state["current_price"], state.get("today_volume", 0), mark=True)
+
+    def on_tick(self, symbol: str, price: Won, volume: Optional[int] = None) -> int:
+        """
+        체결 틱 반영 (마지막 반복의 목표가 · 전일 값으로 진입 · 청산 판단)
+
+        Args:
+            symbol: 종목 코드
+            price: 체결가 (원)
+            volume: 당일 누적 거래량 (None이면 마지막 반복 값)
+
+        Returns:
+            이번 호출에서 평가한 변형 수 (반복 결과가 아직 없으면 0)
+        """
+        snapshot = self._snapshots.get(symbol)
+        if snapshot is None:
+            return 0
+        return self._run(
+            symbol,
+            price,
+            volume if volume is not None else snapshot.get("today_volume", 0),
+            mark=False,
+        )
+
+    def _run(self, symbol: str, price: Won, volume: int, mark: bool) -> int:
+        start = time.perf_counter()
+        deadline = start + self.budget
+        self._prices[symbol] = price
+        now = get_clock().now()
+        n = len(self.variants)
+
+        done = 0
+        while done < n:
+            if time.perf_counter() >= deadline:
+                self.deferred += n - done
+                logger.debug(f"[shadow] 시간 예산 초과, {n - done}개 변형 다음 호출로 미룸")
+                break
+            i = (self._cursor + done) % n
+            variant = self.variants[i]
+            try:
+                self._evaluate(i, symbol, price, volume, now)
+                if mark:
+                    self.log.mark(
+                        ts=now.timestamp(),
+                        variant=i,
+                        equity=variant.equity(self._prices),
+                        realized_pnl=variant.realized_pnl,
+                    )
+            except Exception as e:
+                logger.error(f"[shadow] {variant.name} 평가 실패: {e}")
+            done += 1
+
+        self._cursor = (self._cursor + done) % max(n, 1)
+        self.busy_seconds += time.perf_counter() - start
+        return done
+
+    def _evaluate(self, i: int, symbol: str, price: Won, volume: int, now: datetime) -> None:
+        variant = self.variants[i]
+        view = dict(self._snapshots[symbol])
+        view.update(variant.params)
+        view["current_price"] = price
+        view["cash_balance"] = variant.cash
+
+        position = variant.positions.get(symbol)
+        trail_price = None
+        if position is None:
+            view.update(
+                position_status="IDLE", entry_price=None, position_qty=0, highest_price=None
+            )
+        else:
+            position.highest_price = max(position.highest_price, price)
+            view.update(
+                position_status="IN_POSITION",
+                entry_price=position.entry_price,
+                position_qty=position.qty,
+                highest_price=position.highest_price,
+            )
+            if view.get("trailing_stop"):
+                trail_price = trailing_stop_price(
+                    position.highest_price,
+                    mode=view.get("trailing_mode", "pct"),
+                    pct=view["trailing_stop_pct"],
+                    atr=(view.get("indicators") or {}).get("atr"),
+                    atr_multiplier=view.get("trailing_atr_multiplier", 2.0),
+                )
+
+        context = SignalContext(
+            now=now,
+            volume=volume,
+            last_price=price,
+            position_ratio=view["max_position_size"],
+            trail_price=trail_price,
+        )
+        signal = variant.plugin.evaluate(view, context)
+        if signal is None:
+            return
+
+        if signal.side == "buy":
+            fill = variant.buy(symbol, price, signal.qty, self.commission, self.slippage)
+        else:
+            fill = variant.sell(symbol, price, self.commission, self.slippage)
+        if fill is not None:
+            self.log.fill(ts=now.timestamp(), variant=i, symbol=symbol, cash=variant.cash, **fill)
+            logger.info(
+                f"[shadow] {variant.name} 가상 {'매수' if fill['side'] > 0 else '매도'}: "
+                f"{symbol} {fill['qty']}주 @ {fill['price']:,}원 (손익 {fill['pnl']:,}원)"
+            )
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """변형별 손익 (평가 손익 큰 순)"""
+        rows = []
+        for variant in self.variants:
+            equity = variant.equity(self._prices)
+            rows.append(
+                {
+                    "name": variant.name,
+                    "params": variant.params,
+                    "realized_pnl": variant.realized_pnl,
+                    "unrealized_pnl": equity
+                    - variant.cash
+                    - sum(p.cost for p in variant.positions.values()),
+                    "equity": equity,
+                    "trades": variant.trades,
+                    "wins": variant.wins,
+                    "open_positions": len(variant.positions),
+                }
+            )
+        return sorted(rows, key=lambda row: row["equity"], reverse=True)
+
+    def save(self) -> Path:
+        """로그 저장 ({log_dir}/{시작 일자_시각}.npz)"""
+        return self.log.save(self.log_dir / f"{self.started_at.strftime('%Y%m%d_%H%M%S')}.npz")
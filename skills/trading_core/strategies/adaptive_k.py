@@ -0,0 +1,179 @@
+"""
+종목별 적응형 k (노이즈 비율 기반)
+
+노이즈 비율 = 1 - |종가 - 시가| / (고가 - 저가) 의 최근 N일 평균을 k로 씁니다.
+추세가 뚜렷한(노이즈가 작은) 종목은 k가 작아져 일찍 진입하고, 위아래로 흔들리는
+종목은 k가 커져 거짓 돌파를 거릅니다. 극단값은 [k_min, k_max]로 제한합니다.
+
+당일 k는 전일까지의 N일만 사용하므로 장 시작 전에 전 종목을 미리 계산해 둘 수
+있습니다 (AdaptiveKTable.precompute). 백테스터는 같은 규칙을 배열로 계산합니다
+(trailing_noise_k).
+"""
+
+import logging
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from .indicators import IndicatorEngine, SymbolIndicators
+
+logger = logging.getLogger(__name__)
+
+K_MODES = ("static", "adaptive")
+
+
+def clamp_k(noise_avg: float, k_min: float, k_max: float) -> float:
+    """노이즈 평균을 k 범위로 제한"""
+    return min(max(noise_avg, k_min), k_max)
+
+
+def noise_ratios(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray
+) -> np.ndarray:
+    """
+    일별 노이즈 비율 (벡터화, SymbolIndicators.update_bar와 같은 규칙)
+
+    변동폭이 0인 날은 1.0입니다.
+    """
+    rng = (high - low).astype(np.float64)
+    body = np.abs(close - open_).astype(np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(rng > 0, 1.0 - body / rng, 1.0)
+
+
+def trailing_noise_k(
+    noise: np.ndarray, period: int, k_min: float, k_max: float, fallback: float
+) -> np.ndarray:
+    """
+    날짜별 적응형 k (벡터화)
+
+    i번째 날의 k는 noise[i-period:i] 평균 (당일 미포함, 미래 참조 없음)이며,
+    이전 데이터가 period일 미만인 날은 fallback(고정 k)입니다.
+
+    Args:
+        noise: 일별 노이즈 비율 (날짜 오름차순)
+        period: 평균 기간 (일)
+        k_min, k_max: k 범위
+        fallback: 데이터 부족 시 k
+
+    Returns:
+        noise와 길이가 같은 k 배열
+    """
+    n = len(noise)
+    k = np.full(n, float(fallback))
+    if n > period:
+        csum = np.concatenate([[0.0], np.cumsum(noise, dtype=np.float64)])
+        idx = np.arange(period, n)
+        k[period:] = np.clip((csum[idx] - csum[idx - period]) / period, k_min, k_max)
+    return k
+
+
+class AdaptiveKTable:
+    """당일 종목별 k 테이블 (장 시작 전 계산, 장중 조회만)"""
+
+    def __init__(self, noise_period: int = 20, k_min: float = 0.2, k_max: float = 0.9):
+        """
+        초기화
+
+        Args:
+            noise_period: 노이즈 비율 평균 기간 (일)
+            k_min: k 하한
+            k_max: k 상한
+        """
+        if k_min > k_max:
+            raise ValueError(f"k_min이 k_max보다 큽니다: {k_min} > {k_max}")
+        self.noise_period = noise_period
+        self.k_min = k_min
+        self.k_max = k_max
+        self.date: Optional[str] = None
+        self._k: Dict[str, float] = {}
+
+    @classmethod
+    def from_config(cls, config: Optional[dict]) -> "AdaptiveKTable":
+        """trading_config.yaml의 volatility_breakout 설정으로 생성"""
+        vb = (config or {}).get("volatility_breakout", {})
+        return cls(
+            noise_period=vb.get("noise_period", 20),
+            k_min=vb.get("k_min", 0.2),
+            k_max=vb.get("k_max", 0.9),
+        )
+
+    def compute(self, indicators: SymbolIndicators) -> Optional[float]:
+        """
+        지표 상태로 k 계산 (확정 일봉이 noise_period개 미만이면 None)
+
+        Args:
+            indicators: 전일까지 반영된 종목 지표 상태
+
+        Returns:
+            k 또는 None
+        """
+        window = indicators.noise
+        if window.count < self.noise_period:
+            return None
+        if window.count == self.noise_period:
+            noise_avg = window.mean()
+        else:
+            noise_avg = sum(window.values()[-self.noise_period :]) / self.noise_period
+        return clamp_k(noise_avg, self.k_min, self.k_max)
+
+    def precompute(self, engine: IndicatorEngine, symbols: Iterable[str], date: str) -> int:
+        """
+        장 시작 전 전 종목 k 계산
+
+        Args:
+            engine: 전일까지 워밍업된 지표 엔진
+            symbols: 종목 목록
+            date: 적용 일자 (YYYYMMDD)
+
+        Returns:
+            k를 계산한 종목 수 (데이터 부족 종목은 제외되어 고정 k 사용)
+        """
+        if engine.noise_period < self.noise_period:
+            logger.warning(
+                f"[adaptive_k] 지표 엔진 노이즈 기간({engine.noise_period}일)이 "
+                f"noise_period({self.noise_period}일)보다 짧아 고정 k를 사용합니다"
+            )
+
+        self.date = date
+        self._k = {}
+        for symbol in symbols:
+            if symbol not in engine:
+                continue
+            k = self.compute(engine.get(symbol))
+            if k is not None:
+                self._k[symbol] = k
+
+        logger.info(f"[adaptive_k] {date} 적응형 k 계산 완료: {len(self._k)}개 종목")
+        return len(self._k)
+
+    def get(self, symbol: str, date: str) -> Optional[float]:
+        """미리 계산된 k (없거나 다른 날짜의 테이블이면 None)"""
+        if date != self.date:
+            return None
+        return self._k.get(symbol)
+
+    def lookup(self, engine: IndicatorEngine, symbol: str, date: str) -> Optional[float]:
+        """
+        k 조회 (테이블에 없으면 지표 엔진으로 계산해 테이블에 추가)
+
+        Args:
+            engine: 지표 엔진
+            symbol: 종목 코드
+            date: 적용 일자 (YYYYMMDD)
+
+        Returns:
+            k 또는 None (데이터 부족)
+        """
+        if date != self.date:
+            self.date = date
+            self._k = {}
+        k = self._k.get(symbol)
+        if k is None and symbol in engine:
+            k = self.compute(engine.get(symbol))
+            if k is not None:
+                self._k[symbol] = k
+        return k
+
+    def as_dict(self) -> Dict[str, float]:
+        return dict(self._k)
@@ -8,40 +8,56 @@ import logging
 from typing import Tuple, Optional
 from datetime import datetime, time
 
+from ..clock import Clock, get_clock
+from ..price import Won, mul_ratio_ceil, mul_ratio_floor
+
 logger = logging.getLogger(__name__)
 
 
 class BreakoutStrategy:
     """변동성 돌파 전략 클래스"""
 
-    def __init__(self):
+    def __init__(self, clock: Optional[Clock] = None):
+        """
+        초기화
+
+        Args:
+            clock: 시각 조회에 사용할 시계 (None이면 전역 시계 사용)
+        """
         self.entry_time_start = time(9, 5)  # 진입 시작 시간
         self.entry_time_end = time(15, 0)  # 진입 종료 시간
         self.exit_time = time(15, 20)  # 청산 시간
+        self.clock = clock
+
+    def now(self) -> datetime:
+        """주입된 시계(없으면 전역 시계)의 현재 시각"""
+        return (self.clock or get_clock()).now()
 
     def calculate_target_price(
         self,
-        open_price: float,
-        prev_high: float,
-        prev_low: float,
+        open_price: Won,
+        prev_high: Won,
+        prev_low: Won,
         k: float = 0.5
-    ) -> float:
+    ) -> Won:
         """
         목표가 계산
 
-        목표가 = 당일 시가 + (전일 고가 - 전일 저가) × k
+        목표가 = 당일 시가 + ceil((전일 고가 - 전일 저가) × k)
+
+        원 단위로 올림하므로 정수 현재가와의 비교 결과가 실수 목표가와 같습니다.
 
         Args:
-            open_price: 당일 시가
-            prev_high: 전일 고가
-            prev_low: 전일 저가
-            k: 변동성 계수 (기본값: 0.5)
+            open_price: 당일 시가 (원)
+            prev_high: 전일 고가 (원)
+            prev_low: 전일 저가 (원)
+            k: 변동성 계수 (기본값: 0.5, 1bp 단위로 양자화)
 
         Returns:
-            목표가
+            목표가 (원)
         """
         volatility = prev_high - prev_low
-        target = open_price + (volatility * k)
+        target = open_price + mul_ratio_ceil(volatility, k)
 
         logger.debug(
             f"목표가 계산: "
@@ -57,8 +73,8 @@ class BreakoutStrategy:
 
     def should_enter(
         self,
-        current_price: float,
-        target_price: float,
+        current_price: Won,
+        target_price: Won,
         current_time: Optional[datetime] = None,
         skip_time_check: bool = False
     ) -> Tuple[bool, Optional[str]]:
@@ -68,14 +84,14 @@ class BreakoutStrategy:
         Args:
             current_price: 현재가
             target_price: 목표가
-            current_time: 현재 시각 (None이면 현재 시각 사용)
+            current_time: 현재 시각 (None이면 시계의 현재 시각 사용)
             skip_time_check: 시간 체크 스킵 여부 (테스트용)
 
         Returns:
             (진입 여부, 사유)
         """
         if current_time is None:
-            current_time = datetime.now()
+            current_time = self.now()
 
         current_time_only = current_time.time()
 
@@ -99,11 +115,12 @@ class BreakoutStrategy:
 
     def should_exit(
         self,
-        entry_price: float,
-        current_price: float,
+        entry_price: Won,
+        current_price: Won,
         stop_loss_pct: float = -0.03,
         take_profit_pct: float = 0.05,
-        current_time: Optional[datetime] = None
+        current_time: Optional[datetime] = None,
+        trailing_stop_price: Optional[Won] = None
     ) -> Tuple[bool, Optional[str]]:
         """
         청산 조건 확인
@@ -113,19 +130,24 @@ class BreakoutStrategy:
             current_price: 현재가
             stop_loss_pct: 손절매 비율
             take_profit_pct: 익절 비율
-            current_time: 현재 시각
+            current_time: 현재 시각 (None이면 시계의 현재 시각 사용)
+            trailing_stop_price: 트레일링 청산가
+                (None이면 미사용, trailing_stop.trailing_stop_price)
 
         Returns:
             (청산 여부, 사유)
         """
         if current_time is None:
-            current_time = datetime.now()
+            current_time = self.now()
 
-        # 손익률 계산
+        # 손절가/익절가를 원 단위로 계산해 정수 비교
+        # (진입가 × (1 + 비율)을 손절은 내림, 익절은 올림 → 실수 비율 비교와 동일)
+        stop_price = entry_price + mul_ratio_floor(entry_price, stop_loss_pct)
+        take_price = entry_price + mul_ratio_ceil(entry_price, take_profit_pct)
         pnl_pct = (current_price - entry_price) / entry_price
 
         # 손절매
-        if pnl_pct <= stop_loss_pct:
+        if current_price <= stop_price:
             reason = (
                 f"손절매 "
                 f"(진입가: {entry_price:,.0f}원, "
@@ -135,8 +157,20 @@ class BreakoutStrategy:
             logger.info(f"청산 조건 충족: {reason}")
             return True, reason
 
+        # 트레일링 스탑
+        if trailing_stop_price is not None and current_price <= trailing_stop_price:
+            reason = (
+                f"트레일링 스탑 "
+                f"(진입가: {entry_price:,.0f}원, "
+                f"청산가: {trailing_stop_price:,.0f}원, "
+                f"현재가: {current_price:,.0f}원, "
+                f"수익률: {pnl_pct*100:.2f}%)"
+            )
+            logger.info(f"청산 조건 충족: {reason}")
+            return True, reason
+
         # 익절
-        if pnl_pct >= take_profit_pct:
+        if current_price >= take_price:
             reason = (
                 f"익절 "
                 f"(진입가: {entry_price:,.0f}원, "
@@ -161,23 +195,23 @@ class BreakoutStrategy:
 
     def calculate_position_size(
         self,
-        capital: float,
-        current_price: float,
+        capital: Won,
+        current_price: Won,
         position_ratio: float = 0.1
     ) -> int:
         """
         포지션 크기 계산
 
         Args:
-            capital: 총 자본
-            current_price: 현재가
+            capital: 총 자본 (원)
+            current_price: 현재가 (원)
             position_ratio: 투자 비율 (기본값: 10%)
 
         Returns:
             매수 수량
         """
-        investment_amount = capital * position_ratio
-        qty = int(investment_amount / current_price)
+        investment_amount = mul_ratio_floor(capital, position_ratio)
+        qty = int(investment_amount // current_price)
 
         logger.debug(
             f"포지션 크기 계산: "
@@ -192,19 +226,24 @@ class BreakoutStrategy:
 
     def validate_breakout(
         self,
-        current_price: float,
-        target_price: float,
+        current_price: Won,
+        target_price: Won,
         volume: int,
-        min_volume: int = 100000
+        min_volume: int = 100000,
+        min_breakout_strength: float = 0.01
     ) -> Tuple[bool, Optional[str]]:
         """
         돌파 유효성 검증
 
+        돌파 강도는 목표가 + ceil(목표가 × min_breakout_strength) 이상인지 정수로
+        비교합니다 (백테스터 simulate_breakout_days와 같은 규칙).
+
         Args:
             current_price: 현재가
             target_price: 목표가
-            volume: 거래량
+            volume: 당일 누적 거래량
             min_volume: 최소 거래량
+            min_breakout_strength: 목표가 대비 최소 초과 비율
 
         Returns:
             (유효 여부, 사유)
@@ -217,9 +256,9 @@ class BreakoutStrategy:
         if volume < min_volume:
             return False, f"거래량 부족 (현재: {volume:,}, 최소: {min_volume:,})"
 
-        # 돌파 강도 확인 (목표가 대비 1% 이상 초과)
-        breakout_strength = (current_price - target_price) / target_price
-        if breakout_strength < 0.01:
+        # 돌파 강도 확인 (목표가 대비 min_breakout_strength 이상 초과)
+        if current_price < target_price + mul_ratio_ceil(target_price, min_breakout_strength):
+            breakout_strength = (current_price - target_price) / target_price
             return False, f"돌파 강도 약함 ({breakout_strength*100:.2f}%)"
 
         return True, "유효한 돌파"
@@ -0,0 +1,307 @@
+"""
+증분 롤링 지표 엔진
+
+종목별로 링 버퍼 상태를 유지하며 새 일봉/틱마다 O(1)로 지표를 갱신합니다.
+
+- ATR: 최근 N일 True Range 단순 평균
+- 실현 변동성: 최근 N일 종가 수익률 표준편차 (일간)
+- 노이즈 비율: 1 - |종가 - 시가| / (고가 - 저가), 최근 N일 평균
+- 이동평균: 종가 N일 단순 평균 (장중에는 현재가를 오늘 종가로 본 값도 제공)
+
+HistoryStore의 일봉으로 워밍업한 뒤, 장중에는 틱(현재가)을, 다음 날에는
+전일 일봉 1개만 반영하면 됩니다.
+"""
+
+import logging
+import math
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from ..price import Won
+
+logger = logging.getLogger(__name__)
+
+# 누적합의 부동소수점 오차가 쌓이지 않도록 이 횟수마다 버퍼로 다시 합산 (분할 상환 O(1))
+_RESYNC_INTERVAL = 1024
+
+
+class RollingWindow:
+    """고정 길이 링 버퍼 + 누적합/제곱합"""
+
+    __slots__ = ("size", "_values", "_index", "count", "total", "total_sq", "_pushes")
+
+    def __init__(self, size: int):
+        if size <= 0:
+            raise ValueError(f"윈도우 크기는 0보다 커야 합니다: {size}")
+        self.size = size
+        self._values: List[float] = [0.0] * size
+        self._index = 0
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self._pushes = 0
+
+    def push(self, value: float) -> None:
+        """값 추가 (가득 찼으면 가장 오래된 값 제거)"""
+        if self.count == self.size:
+            old = self._values[self._index]
+            self.total -= old
+            self.total_sq -= old * old
+        else:
+            self.count += 1
+        self._values[self._index] = value
+        self._index = (self._index + 1) % self.size
+        self.total += value
+        self.total_sq += value * value
+
+        self._pushes += 1
+        if self._pushes >= _RESYNC_INTERVAL:
+            self._resync()
+
+    def _resync(self) -> None:
+        values = self.values()
+        self.total = math.fsum(values)
+        self.total_sq = math.fsum(v * v for v in values)
+        self._pushes = 0
+
+    @property
+    def full(self) -> bool:
+        return self.count == self.size
+
+    def oldest(self) -> Optional[float]:
+        """가장 오래된 값 (비어 있으면 None)"""
+        if self.count == 0:
+            return None
+        return self._values[self._index if self.full else 0]
+
+    def values(self) -> List[float]:
+        """오래된 순 값 목록"""
+        if not self.full:
+            return self._values[: self.count]
+        return self._values[self._index :] + self._values[: self._index]
+
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def std(self) -> Optional[float]:
+        """표본 표준편차 (2개 미만이면 None)"""
+        if self.count < 2:
+            return None
+        variance = (self.total_sq - self.total * self.total / self.count) / (self.count - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    def mean_with(self, value: float) -> Optional[float]:
+        """value를 최신 값으로 추가했다고 가정한 평균 (상태 변경 없음)"""
+        if self.full:
+            return (self.total - self.oldest() + value) / self.size
+        return (self.total + value) / (self.count + 1)
+
+
+class SymbolIndicators:
+    """단일 종목 지표 상태"""
+
+    def __init__(
+        self,
+        atr_period: int = 14,
+        vol_period: int = 20,
+        noise_period: int = 20,
+        ma_periods: Sequence[int] = (5, 10, 20),
+    ):
+        self.true_range = RollingWindow(atr_period)
+        self.returns = RollingWindow(vol_period)
+        self.noise = RollingWindow(noise_period)
+        self.ma = {n: RollingWindow(n) for n in ma_periods}
+
+        self.bars = 0
+        self.last_date: Optional[str] = None
+        self.prev_open: Optional[Won] = None
+        self.prev_high: Optional[Won] = None
+        self.prev_low: Optional[Won] = None
+        self.prev_close: Optional[Won] = None
+        self.last_noise: Optional[float] = None
+
+        # 장중 (아직 확정되지 않은 오늘 봉)
+        self.today_open: Optional[Won] = None
+        self.today_high: Optional[Won] = None
+        self.today_low: Optional[Won] = None
+        self.last_price: Optional[Won] = None
+
+    @property
+    def lookback(self) -> int:
+        """워밍업에 필요한 일봉 수"""
+        return max([self.true_range.size, self.returns.size + 1, self.noise.size, *self.ma])
+
+    def update_bar(
+        self, open_: Won, high: Won, low: Won, close: Won, date: Optional[str] = None
+    ) -> None:
+        """
+        확정 일봉 반영 (O(1))
+
+        Args:
+            open_, high, low, close: 일봉 가격 (원)
+            date: 일자 (YYYYMMDD, 중복 반영 방지용)
+        """
+        if date is not None and self.last_date is not None and date <= self.last_date:
+            return
+
+        prev_close = self.prev_close
+        if prev_close is None:
+            tr = high - low
+        else:
+            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+            self.returns.push(close / prev_close - 1.0)
+        self.true_range.push(tr)
+
+        # 변동폭이 0이면 방향성 정보가 없으므로 노이즈 1로 간주 (보수적)
+        self.last_noise = 1.0 - abs(close - open_) / (high - low) if high > low else 1.0
+        self.noise.push(self.last_noise)
+
+        for window in self.ma.values():
+            window.push(close)
+
+        self.bars += 1
+        self.last_date = date
+        self.prev_open, self.prev_high, self.prev_low, self.prev_close = open_, high, low, close
+        self.today_open = self.today_high = self.today_low = self.last_price = None
+
+    def update_tick(self, price: Won, open_: Optional[Won] = None) -> None:
+        """
+        장중 현재가 반영 (O(1))
+
+        Args:
+            price: 현재가 (원)
+            open_: 당일 시가 (알면 지정, 없으면 첫 틱 가격)
+        """
+        if self.today_open is None:
+            self.today_open = open_ if open_ is not None else price
+            self.today_high = self.today_low = price
+        else:
+            if price > self.today_high:
+                self.today_high = price
+            elif price < self.today_low:
+                self.today_low = price
+        self.last_price = price
+
+    def values(self) -> Dict[str, Optional[float]]:
+        """
+        현재 지표 값
+
+        Returns:
+            atr, atr_pct, volatility, noise, noise_avg, prev_range, ma{N},
+            그리고 장중 값 today_range, ma{N}_live (틱이 없으면 None)
+        """
+        atr = self.true_range.mean()
+        result: Dict[str, Optional[float]] = {
+            "bars": self.bars,
+            "atr": atr,
+            "atr_pct": atr / self.prev_close if atr is not None and self.prev_close else None,
+            "volatility": self.returns.std(),
+            "noise": self.last_noise,
+            "noise_avg": self.noise.mean(),
+            "prev_range": (self.prev_high - self.prev_low) if self.prev_high is not None else None,
+        }
+        for n, window in self.ma.items():
+            result[f"ma{n}"] = window.mean()
+
+        live = self.last_price
+        result["today_range"] = (self.today_high - self.today_low) if live is not None else None
+        for n, window in self.ma.items():
+            result[f"ma{n}_live"] = window.mean_with(live) if live is not None else None
+        return result
+
+
+class IndicatorEngine:
+    """종목별 증분 지표 엔진"""
+
+    def __init__(
+        self,
+        atr_period: int = 14,
+        vol_period: int = 20,
+        noise_period: int = 20,
+        ma_periods: Sequence[int] = (5, 10, 20),
+    ):
+        """
+        초기화
+
+        Args:
+            atr_period: ATR 기간 (일)
+            vol_period: 실현 변동성 기간 (일)
+            noise_period: 노이즈 비율 평균 기간 (일)
+            ma_periods: 이동평균 기간 목록 (일)
+        """
+        self.atr_period = atr_period
+        self.vol_period = vol_period
+        self.noise_period = noise_period
+        self.ma_periods = tuple(ma_periods)
+        self._symbols: Dict[str, SymbolIndicators] = {}
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._symbols
+
+    def get(self, symbol: str) -> SymbolIndicators:
+        """종목 상태 (없으면 생성)"""
+        state = self._symbols.get(symbol)
+        if state is None:
+            state = SymbolIndicators(
+                self.atr_period, self.vol_period, self.noise_period, self.ma_periods
+            )
+            self._symbols[symbol] = state
+        return state
+
+    def symbols(self) -> List[str]:
+        return list(self._symbols)
+
+    def reset(self, symbol: str) -> SymbolIndicators:
+        """종목 상태 초기화"""
+        self._symbols.pop(symbol, None)
+        return self.get(symbol)
+
+    def update_bar(
+        self, symbol: str, open_: Won, high: Won, low: Won, close: Won, date: Optional[str] = None
+    ) -> None:
+        self.get(symbol).update_bar(open_, high, low, close, date)
+
+    def update_bars(self, symbol: str, bars: Iterable[dict]) -> None:
+        """일봉 딕셔너리들(날짜 오름차순, _call_inquire_daily_chart 형식) 반영"""
+        state = self.get(symbol)
+        for bar in bars:
+            state.update_bar(bar["open"], bar["high"], bar["low"], bar["close"], bar.get("date"))
+
+    def update_tick(self, symbol: str, price: Won, open_: Optional[Won] = None) -> None:
+        self.get(symbol).update_tick(price, open_)
+
+    def values(self, symbol: str) -> Dict[str, Optional[float]]:
+        return self.get(symbol).values()
+
+    def warm_start(
+        self, store, symbols: Optional[Iterable[str]] = None, until: Optional[str] = None
+    ) -> int:
+        """
+        HistoryStore 일봉으로 워밍업
+
+        필요한 기간(lookback)만큼의 마지막 일봉만 반영합니다.
+
+        Args:
+            store: HistoryStore
+            symbols: 종목 목록 (None이면 저장소 전체)
+            until: 이 날짜 이전(미포함) 일봉만 사용 (YYYYMMDD, 장중 당일 봉 제외용)
+
+        Returns:
+            워밍업된 종목 수
+        """
+        warmed = 0
+        for symbol in (symbols if symbols is not None else store.symbols()):
+            if not store.exists(symbol):
+                continue
+            bars = store.load(symbol)
+            if until is not None:
+                bars = bars[bars["date"] < until]
+            state = self.reset(symbol)
+            tail = bars.tail(state.lookback)
+            for date, open_, high, low, close in zip(
+                tail["date"], tail["open"], tail["high"], tail["low"], tail["close"]
+            ):
+                state.update_bar(int(open_), int(high), int(low), int(close), str(date))
+            warmed += 1
+
+        logger.info(f"[indicators] 워밍업 완료: {warmed}개 종목")
+        return warmed
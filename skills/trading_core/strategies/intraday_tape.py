@@ -0,0 +1,94 @@
+"""
+당일 체결 테이프 (종목별 누적 거래량 · 최근 체결가)
+
+체결 틱마다 누적 거래량과 최근 체결가를 O(1)로 갱신해 두므로, 돌파 필터
+(BreakoutStrategy.validate_breakout)는 추가 REST 조회 없이 이 값을 읽습니다.
+현재가 조회 응답의 누적 거래량(acml_vol)은 거래소 집계 값이므로 sync로 덮어쓰고,
+이후 틱은 그 위에 더합니다. 일자가 바뀌면 종목 상태를 새로 시작합니다.
+"""
+
+import logging
+from typing import Dict, Optional
+
+from ..price import Won
+
+logger = logging.getLogger(__name__)
+
+
+class _Tape:
+    __slots__ = ("date", "volume", "price")
+
+    def __init__(self, date: str):
+        self.date = date
+        self.volume = 0
+        self.price: Won = 0
+
+
+class IntradayTape:
+    """종목별 당일 누적 거래량 · 최근 체결가"""
+
+    def __init__(self):
+        self._tapes: Dict[str, _Tape] = {}
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._tapes
+
+    def _tape(self, symbol: str, date: str) -> _Tape:
+        tape = self._tapes.get(symbol)
+        if tape is None or tape.date != date:
+            tape = _Tape(date)
+            self._tapes[symbol] = tape
+        return tape
+
+    def on_tick(self, symbol: str, price: Won, qty: int, date: str) -> int:
+        """
+        체결 틱 반영
+
+        Args:
+            symbol: 종목 코드
+            price: 체결가 (원)
+            qty: 체결 수량
+            date: 체결 일자 (YYYYMMDD)
+
+        Returns:
+            당일 누적 거래량
+        """
+        tape = self._tape(symbol, date)
+        tape.volume += qty
+        tape.price = price
+        return tape.volume
+
+    def sync(self, symbol: str, price: Won, cum_volume: int, date: str) -> int:
+        """
+        누적 거래량 스냅샷 반영 (현재가 조회 응답 등)
+
+        Args:
+            symbol: 종목 코드
+            price: 현재가 (원)
+            cum_volume: 당일 누적 거래량
+            date: 일자 (YYYYMMDD)
+
+        Returns:
+            당일 누적 거래량
+        """
+        tape = self._tape(symbol, date)
+        tape.volume = cum_volume
+        tape.price = price
+        return tape.volume
+
+    def volume(self, symbol: str, date: str) -> Optional[int]:
+        """당일 누적 거래량 (당일 데이터가 없으면 None)"""
+        tape = self._tapes.get(symbol)
+        return tape.volume if tape is not None and tape.date == date else None
+
+    def last_price(self, symbol: str, date: str) -> Optional[Won]:
+        """당일 최근 체결가 (당일 데이터가 없으면 None)"""
+        tape = self._tapes.get(symbol)
+        return tape.price if tape is not None and tape.date == date and tape.price else None
+
+    def breakout_strength(self, symbol: str, target_price: Won, date: str) -> Optional[float]:
+        """최근 체결가의 목표가 대비 초과 비율 (당일 데이터가 없으면 None)"""
+        price = self.last_price(symbol, date)
+        if price is None or target_price <= 0:
+            return None
+        return (price - target_price) / target_price
@@ -0,0 +1,351 @@
+"""
+포트폴리오 리스크 집계기
+
+RiskRules는 주문 하나(check_position_size)만 보므로 종목 간 노출을 알지 못합니다.
+PortfolioRisk는 운용 종목 전체의 보유 수량 · 최근 가격을 배열로 들고 다음을
+가격 · 체결이 들어올 때마다 증분으로 갱신합니다.
+
+- 총(gross) · 순(net) 노출, 업종별 총 노출: 종목 하나 갱신에 O(1)
+- 종목 수익률 이동 상관행렬: 표본(roll)마다 합 · 외적 합에 새 표본을 더하고 창에서
+  빠지는 표본을 빼서 O(n²) (창 한 바퀴마다 버퍼로 다시 합산해 부동소수점 오차 정리)
+
+주문 후보 묶음 사전 점검(check_orders)은 배열 연산 한 번으로 우선순위 순 누적
+노출을 계산해 총 노출 · 순 노출 · 업종 노출(평가 자산 대비)과 보유 종목과의
+상관계수 한도를 확인합니다. 매도는 노출을 줄이므로 항상 통과합니다.
+
+업종은 symbols.yaml의 sector (없으면 notes) 값입니다.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import yaml
+
+from ..price import Won
+
+logger = logging.getLogger(__name__)
+
+project_root = Path(__file__).parent.parent.parent.parent
+
+# 점검 결과 코드 (check_orders reasons 배열 값)
+OK, GROSS_LIMIT, NET_LIMIT, SECTOR_LIMIT, CORRELATION_LIMIT = range(5)
+REASONS = (
+    "",
+    "총 노출 한도 초과",
+    "순 노출 한도 초과",
+    "업종 집중 한도 초과",
+    "보유 종목과 상관관계 높음",
+)
+
+DEFAULT_SECTOR = "기타"
+
+
+_TRIANGLES: Dict[int, np.ndarray] = {}
+
+
+def _lower_triangle(m: int) -> np.ndarray:
+    """m × m 하삼각(대각 포함) bool 마스크 (크기별 캐시)"""
+    tri = _TRIANGLES.get(m)
+    if tri is None:
+        tri = _TRIANGLES[m] = np.tri(m, dtype=bool)
+    return tri
+
+
+def load_sectors(symbols_path: Optional[Union[str, Path]] = None) -> Dict[str, str]:
+    """
+    symbols.yaml의 종목별 업종
+
+    Args:
+        symbols_path: 종목 목록 파일 (None이면 config/symbols.yaml)
+
+    Returns:
+        {종목 코드: sector 또는 notes} (파일이 없으면 빈 딕셔너리)
+    """
+    path = (
+        Path(symbols_path) if symbols_path is not None else project_root / "config" / "symbols.yaml"
+    )
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+    return {
+        str(item["code"]): item.get("sector") or item.get("notes") or DEFAULT_SECTOR
+        for item in config.get("symbols", [])
+    }
+
+
+class PortfolioRisk:
+    """포트폴리오 노출 · 업종 집중 · 상관관계 집계 (운용 종목 고정)"""
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        cash: Won,
+        sectors: Optional[Dict[str, str]] = None,
+        max_gross_exposure: float = 1.0,
+        max_net_exposure: float = 1.0,
+        max_sector_exposure: float = 0.3,
+        max_correlation: float = 0.9,
+        window: int = 60,
+        min_samples: int = 20,
+    ):
+        """
+        초기화
+
+        Args:
+            symbols: 운용 종목 코드
+            cash: 현금 (원)
+            sectors: {종목 코드: 업종} (None이면 load_sectors(), 없는 종목은 "기타")
+            max_gross_exposure: 총 노출 한도 (평가 자산 대비)
+            max_net_exposure: 순 노출 한도 (평가 자산 대비)
+            max_sector_exposure: 업종별 총 노출 한도 (평가 자산 대비)
+            max_correlation: 보유 종목과의 상관계수 한도 (신규 매수)
+            window: 상관행렬 표본 창 크기
+            min_samples: 상관계수 점검을 시작할 최소 표본 수
+        """
+        if window < 2:
+            raise ValueError(f"window는 2 이상이어야 합니다: {window}")
+
+        sectors = load_sectors() if sectors is None else sectors
+        self.symbols = list(symbols)
+        self._index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        names = [sectors.get(symbol, DEFAULT_SECTOR) for symbol in self.symbols]
+        self.sector_names = sorted(set(names))
+        self._sector = np.asarray([self.sector_names.index(name) for name in names], dtype=np.intp)
+
+        self.max_gross_exposure = max_gross_exposure
+        self.max_net_exposure = max_net_exposure
+        self.max_sector_exposure = max_sector_exposure
+        self.max_correlation = max_correlation
+
+        n = len(self.symbols)
+        self.cash: Won = cash
+        self.qty = np.zeros(n, dtype=np.int64)
+        self.price = np.zeros(n, dtype=np.int64)
+        self.gross: Won = 0
+        self.net: Won = 0
+        self.sector_gross = np.zeros(len(self.sector_names), dtype=np.int64)
+
+        self.window = window
+        self.min_samples = min_samples
+        self._returns = np.zeros((window, n))
+        self._count = 0
+        self._head = 0
+        self._rolls = 0
+        self._sum = np.zeros(n)
+        self._cross = np.zeros((n, n))
+        self._sampled = np.zeros(n, dtype=np.int64)  # 직전 표본 가격
+        self._held_corr: Optional[np.ndarray] = None  # 보유 종목과의 최대 상관계수 캐시
+
+    @classmethod
+    def from_config(
+        cls,
+        config: dict,
+        symbols: Sequence[str],
+        cash: Optional[Won] = None,
+        sectors: Optional[Dict[str, str]] = None,
+    ) -> "PortfolioRisk":
+        """
+        trading_config.yaml risk.portfolio 설정으로 생성
+
+        Args:
+            config: 전략 설정
+            symbols: 운용 종목 코드
+            cash: 현금 (None이면 trading.capital)
+            sectors: {종목 코드: 업종} (None이면 symbols.yaml)
+        """
+        limits = config.get("risk", {}).get("portfolio", {})
+        return cls(
+            symbols,
+            cash=cash if cash is not None else config.get("trading", {}).get("capital", 10_000_000),
+            sectors=sectors,
+            max_gross_exposure=limits.get("max_gross_exposure", 1.0),
+            max_net_exposure=limits.get("max_net_exposure", 1.0),
+            max_sector_exposure=limits.get("max_sector_exposure", 0.3),
+            max_correlation=limits.get("max_correlation", 0.9),
+            window=limits.get("correlation_window", 60),
+            min_samples=limits.get("correlation_min_samples", 20),
+        )
+
+    # ========== 증분 갱신 ==========
+
+    def _set(self, i: int, qty: int, price: Won) -> None:
+        old = int(self.qty[i]) * int(self.price[i])
+        new = qty * price
+        self.net += new - old
+        delta = abs(new) - abs(old)
+        self.gross += delta
+        self.sector_gross[self._sector[i]] += delta
+        if (qty != 0) != (self.qty[i] != 0):
+            self._held_corr = None
+        self.qty[i] = qty
+        self.price[i] = price
+
+    def on_price(self, symbol: str, price: Won) -> None:
+        """현재가 반영 (운용 종목이 아니거나 가격이 없으면 무시)"""
+        i = self._index.get(symbol)
+        if i is not None and price > 0:
+            self._set(i, int(self.qty[i]), price)
+
+    def on_fill(self, symbol: str, side: str, qty: int, price: Won) -> None:
+        """
+        체결 반영 (보유 수량 · 현금)
+
+        Args:
+            symbol: 종목 코드
+            side: "buy" | "sell"
+            qty: 체결 수량
+            price: 체결가 (원)
+        """
+        i = self._index[symbol]
+        signed = qty if side == "buy" else -qty
+        self.cash -= signed * price
+        self._set(i, int(self.qty[i]) + signed, price)
+
+    def set_position(self, symbol: str, qty: int, price: Won) -> None:
+        """보유 수량 동기화 (계좌 · 상태 기준 값, 현금은 따로 맞춤)"""
+        i = self._index.get(symbol)
+        if i is not None:
+            self._set(i, qty, price if price > 0 else int(self.price[i]))
+
+    def roll(self) -> bool:
+        """
+        수익률 표본 추가 (직전 roll 이후 가격 변화, 반복 주기마다 1회)
+
+        Returns:
+            표본 추가 여부 (첫 호출 · 가격이 하나도 없으면 기준 가격만 기록)
+        """
+        valid = (self._sampled > 0) & (self.price > 0)
+        if not valid.any():
+            self._sampled = self.price.copy()
+            return False
+
+        r = np.zeros(len(self.symbols))
+        np.divide(self.price, self._sampled, out=r, where=valid)
+        r[valid] -= 1.0
+        self._sampled = self.price.copy()
+
+        if self._count == self.window:
+            old = self._returns[self._head]
+            self._sum -= old
+            self._cross -= np.outer(old, old)
+        else:
+            self._count += 1
+        self._returns[self._head] = r
+        self._sum += r
+        self._cross += np.outer(r, r)
+        self._head = (self._head + 1) % self.window
+        self._rolls += 1
+        if self._rolls % self.window == 0:
+            filled = self._returns[: self._count]
+            self._sum = filled.sum(axis=0)
+            self._cross = filled.T @ filled
+        self._held_corr = None
+        return True
+
+    # ========== 조회 ==========
+
+    @property
+    def equity(self) -> Won:
+        """평가 자산 (현금 + 순 노출)"""
+        return self.cash + self.net
+
+    @property
+    def samples(self) -> int:
+        return self._count
+
+    def correlation(self) -> np.ndarray:
+        """
+        종목 수익률 상관행렬 (표본 2개 미만 · 변동 없는 종목은 NaN)
+
+        Returns:
+            n × n 배열 (symbols 순서)
+        """
+        n = len(self.symbols)
+        if self._count < 2:
+            return np.full((n, n), np.nan)
+        mean = self._sum / self._count
+        cov = self._cross / self._count - np.outer(mean, mean)
+        std = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+        denom = np.outer(std, std)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = np.where(denom > 1e-18, cov / denom, np.nan)
+        return np.clip(corr, -1.0, 1.0)
+
+    def exposure(self) -> Dict[str, Any]:
+        """노출 요약 (평가 자산 대비 비율 포함)"""
+        equity = self.equity
+        return {
+            "equity": equity,
+            "gross": self.gross,
+            "net": self.net,
+            "gross_pct": self.gross / equity if equity else 0.0,
+            "net_pct": self.net / equity if equity else 0.0,
+            "sectors": {
+                name: int(value) / equity if equity else 0.0
+                for name, value in zip(self.sector_names, self.sector_gross)
+                if value
+            },
+        }
+
+    # ========== 사전 점검 ==========
+
+    def _held_correlation(self) -> np.ndarray:
+        """종목별 보유 종목(자기 제외)과의 최대 상관계수 (roll · 보유 종목 변경 시 다시 계산)"""
+        if self._held_corr is None:
+            held = self.qty != 0
+            if self._count < self.min_samples or not held.any():
+                self._held_corr = np.full(len(self.symbols), -1.0)
+            else:
+                corr = np.nan_to_num(self.correlation(), nan=-1.0)
+                np.fill_diagonal(corr, -1.0)  # 같은 종목 추가 매수는 상관 점검 제외
+                self._held_corr = corr[:, held].max(axis=1)
+        return self._held_corr
+
+    def check_orders(
+        self,
+        symbols: Sequence[str],
+        sides: Sequence[str],
+        qtys: Sequence[int],
+        prices: Sequence[Won],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        주문 후보 묶음 사전 점검 (벡터화)
+
+        주문은 우선순위 순으로 받아 앞 주문들의 매수 금액을 누적한 노출로 판단합니다.
+        앞 주문이 거절되어도 누적에는 포함하므로 결과는 보수적입니다.
+
+        Args:
+            symbols: 종목 코드 (운용 종목)
+            sides: "buy" | "sell"
+            qtys: 수량
+            prices: 기준 가격 (원)
+
+        Returns:
+            (승인 여부 bool 배열, 사유 코드 배열 — REASONS 인덱스)
+
+        Raises:
+            KeyError: 운용 종목이 아닌 경우
+        """
+        m = len(symbols)
+        idx = np.array([self._index[symbol] for symbol in symbols], dtype=np.intp)
+        is_buy = np.array([side == "buy" for side in sides], dtype=bool)
+        amount = np.array(
+            [q * p if buy else 0 for q, p, buy in zip(qtys, prices, is_buy)], dtype=np.int64
+        )
+        cum = np.cumsum(amount)
+        equity = self.equity
+        reasons = np.zeros(m, dtype=np.int8)
+
+        reasons[is_buy & (self._held_correlation()[idx] > self.max_correlation)] = CORRELATION_LIMIT
+
+        # 업종별 누적: 같은 업종인 앞 주문(자기 포함) 금액 합 = 하삼각 · 같은 업종 마스크 행렬곱
+        sector = self._sector[idx]
+        same = (sector[:, None] == sector[None, :]) & _lower_triangle(m)
+        sector_after = self.sector_gross[sector] + same @ amount
+        reasons[is_buy & (sector_after > self.max_sector_exposure * equity)] = SECTOR_LIMIT
+        reasons[is_buy & (self.net + cum > self.max_net_exposure * equity)] = NET_LIMIT
+        reasons[is_buy & (self.gross + cum > self.max_gross_exposure * equity)] = GROSS_LIMIT
+        return reasons == OK, reasons
@@ -0,0 +1,119 @@
+"""
+변동성 조정 포지션 크기
+
+종목별 일간 변동성(지표 엔진의 최근 N일 수익률 표준편차)에 따른 조정 계수
+(risk_rules.volatility_factor)를 하루 한 번 계산해 캐시합니다.
+진입 시점에는 계수 조회 + 곱셈만 하므로 주문 경로에 계산이 추가되지 않습니다.
+
+투자 금액 = floor(자본 × 기본 비율 × 조정 계수), 수량 = 투자 금액 // 현재가
+(BreakoutStrategy.calculate_position_size와 같은 1bp 비율 양자화)
+"""
+
+import logging
+from typing import Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+from ..price import RATIO_SCALE, Won, ratio_units, to_won_array
+from .indicators import IndicatorEngine
+from .risk_rules import volatility_factor, volatility_factors
+
+logger = logging.getLogger(__name__)
+
+
+class PositionSizer:
+    """종목별 변동성 조정 계수 캐시"""
+
+    def __init__(self):
+        self.date: Optional[str] = None
+        self._factors: Dict[str, float] = {}
+
+    def _reset(self, date: str) -> None:
+        if date != self.date:
+            self.date = date
+            self._factors = {}
+
+    @staticmethod
+    def _volatility(engine: IndicatorEngine, symbol: str) -> float:
+        """일간 변동성 (데이터 부족이면 NaN, 엔진에 없는 종목은 만들지 않음)"""
+        volatility = engine.get(symbol).returns.std() if symbol in engine else None
+        return np.nan if volatility is None else volatility
+
+    def refresh(self, engine: IndicatorEngine, symbols: Iterable[str], date: str) -> int:
+        """
+        장 시작 전 종목별 조정 계수 계산
+
+        Args:
+            engine: 전일까지 워밍업된 지표 엔진
+            symbols: 종목 목록
+            date: 적용 일자 (YYYYMMDD)
+
+        Returns:
+            계산한 종목 수 (지표 엔진에 없는 종목은 제외, 첫 조회 시 계산)
+        """
+        self.date = date
+        symbols = [symbol for symbol in symbols if symbol in engine]
+        volatilities = np.array(
+            [self._volatility(engine, symbol) for symbol in symbols], dtype=np.float64
+        )
+        self._factors = dict(zip(symbols, volatility_factors(volatilities).tolist()))
+
+        logger.info(
+            f"[position_sizing] {date} 변동성 조정 계수 계산 완료: {len(self._factors)}개 종목"
+        )
+        return len(self._factors)
+
+    def factor(self, engine: IndicatorEngine, symbol: str, date: str) -> float:
+        """
+        조정 계수 조회 (캐시에 없으면 지표 엔진으로 계산해 추가)
+
+        Args:
+            engine: 지표 엔진
+            symbol: 종목 코드
+            date: 적용 일자 (YYYYMMDD)
+
+        Returns:
+            조정 계수 (변동성 데이터가 없으면 1.0)
+        """
+        self._reset(date)
+        factor = self._factors.get(symbol)
+        if factor is None:
+            volatility = self._volatility(engine, symbol)
+            factor = volatility_factor(volatility)
+            if not np.isnan(volatility):
+                self._factors[symbol] = factor
+        return factor
+
+    def factors(self, engine: IndicatorEngine, symbols: Sequence[str], date: str) -> np.ndarray:
+        """여러 종목의 조정 계수 배열"""
+        return np.array([self.factor(engine, symbol, date) for symbol in symbols], dtype=np.float64)
+
+    def size_many(
+        self,
+        engine: IndicatorEngine,
+        symbols: Sequence[str],
+        capital: Won,
+        prices: Sequence[Won],
+        base_ratio: float,
+        date: str,
+    ) -> np.ndarray:
+        """
+        여러 종목 동시 진입 수량 (벡터화)
+
+        Args:
+            engine: 지표 엔진
+            symbols: 종목 코드 목록
+            capital: 자본 (원, 종목마다 같은 기준)
+            prices: 종목별 현재가 (원)
+            base_ratio: 기본 투자 비율
+            date: 적용 일자 (YYYYMMDD)
+
+        Returns:
+            종목별 매수 수량 (int64)
+        """
+        units = ratio_units(base_ratio * self.factors(engine, symbols, date))
+        amounts = int(capital) * units // RATIO_SCALE
+        return amounts // to_won_array(prices)
+
+    def as_dict(self) -> Dict[str, float]:
+        return dict(self._factors)
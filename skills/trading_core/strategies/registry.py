@@ -0,0 +1,311 @@
+"""
+전략 플러그인 레지스트리
+
+한 번 조회한 시세 스냅샷(TradingState)으로 여러 전략 — 또는 같은 돌파 전략의 여러
+파라미터 조합 — 을 평가하고 신호를 종목당 주문 하나로 합칩니다. 플러그인은 상태와
+SignalContext만 읽으므로 전략을 늘려도 API 호출은 늘지 않습니다.
+
+- 플러그인: StrategyPlugin을 상속해 evaluate(state, context)에서 StrategySignal 또는 None 반환
+- 유형 등록: @register_strategy_type("이름") → trading_config.yaml strategies 목록으로 생성
+- 병합 (merge_signals):
+  - 보유 중이면 한 전략이라도 청산 신호를 내면 전량 매도
+  - 미보유면 매수 신호를 낸 전략들의 수량 합 (전략별 예산 = 종목 투자 비율 × weight),
+    합계는 종목 투자 비율 한도로 제한
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Type
+
+from ..price import Won, mul_ratio_floor
+from .breakout_etf import BreakoutStrategy
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SignalContext:
+    """
+    플러그인 공통 입력 (generate_signal 노드가 반복마다 한 번 계산)
+
+    상태에 없는 값만 담습니다. 모두 메모리 캐시(틱 테이프, 변동성 계수)에서 얻으며
+    조회를 추가로 하지 않습니다.
+    """
+
+    now: datetime
+    volume: int  # 당일 누적 거래량 (틱 테이프, 없으면 상태 값)
+    last_price: Won  # 최근 체결가 (틱 테이프, 없으면 현재가)
+    position_ratio: float  # 종목 투자 비율 (변동성 조정 반영)
+    trail_price: Optional[Won] = None  # 트레일링 청산가 (보유 중 · 사용 시)
+
+
+@dataclass
+class StrategySignal:
+    """전략 하나의 매매 신호"""
+
+    strategy: str
+    side: str  # "buy" | "sell"
+    qty: int
+    reason: str
+
+
+class StrategyPlugin(ABC):
+    """전략 플러그인 기본 클래스"""
+
+    def __init__(self, name: str, weight: float = 1.0):
+        """
+        초기화
+
+        Args:
+            name: 전략 이름 (레지스트리 안에서 고유)
+            weight: 종목 투자 비율 중 이 전략의 몫 (0~1)
+        """
+        self.name = name
+        self.weight = weight
+
+    @abstractmethod
+    def evaluate(self, state: Dict[str, Any], context: SignalContext) -> Optional[StrategySignal]:
+        """
+        신호 판단
+
+        Args:
+            state: 시세 · 목표가가 채워진 TradingState (읽기 전용)
+            context: 공통 입력
+
+        Returns:
+            신호 (없으면 None)
+        """
+
+
+_STRATEGY_TYPES: Dict[str, Type[StrategyPlugin]] = {}
+
+
+def register_strategy_type(kind: str) -> Callable[[Type[StrategyPlugin]], Type[StrategyPlugin]]:
+    """
+    플러그인 유형 등록 데코레이터 (설정의 type 값 → 클래스)
+
+    Raises:
+        ValueError: 이미 등록된 유형인 경우
+    """
+
+    def decorator(cls: Type[StrategyPlugin]) -> Type[StrategyPlugin]:
+        if kind in _STRATEGY_TYPES:
+            raise ValueError(f"이미 등록된 전략 유형: {kind}")
+        _STRATEGY_TYPES[kind] = cls
+        return cls
+
+    return decorator
+
+
+def strategy_types() -> List[str]:
+    """등록된 플러그인 유형 이름"""
+    return sorted(_STRATEGY_TYPES)
+
+
+@register_strategy_type("breakout")
+class BreakoutPlugin(StrategyPlugin):
+    """
+    변동성 돌파 플러그인
+
+    파라미터를 지정하지 않으면 상태 값(target_price, 돌파 필터, 손절 · 익절)을 그대로
+    씁니다. k를 지정하면 상태의 시가 · 전일 고저가로 목표가를 다시 계산합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        weight: float = 1.0,
+        k: Optional[float] = None,
+        min_volume: Optional[int] = None,
+        min_breakout_strength: Optional[float] = None,
+        stop_loss_pct: Optional[float] = None,
+        take_profit_pct: Optional[float] = None,
+        strategy: Optional[BreakoutStrategy] = None,
+    ):
+        super().__init__(name, weight)
+        self.k = k
+        self.min_volume = min_volume
+        self.min_breakout_strength = min_breakout_strength
+        self.stop_loss_pct = stop_loss_pct
+        self.take_profit_pct = take_profit_pct
+        self.strategy = strategy or BreakoutStrategy()
+
+    def target_price(self, state: Dict[str, Any]) -> Won:
+        """이 플러그인의 목표가 (k 미지정이면 calculate_target 노드 결과)"""
+        if self.k is None:
+            return state["target_price"]
+        return self.strategy.calculate_target_price(
+            open_price=state["today_open"],
+            prev_high=state["yesterday_high"],
+            prev_low=state["yesterday_low"],
+            k=self.k,
+        )
+
+    def evaluate(self, state: Dict[str, Any], context: SignalContext) -> Optional[StrategySignal]:
+        if state["position_status"] == "IDLE":
+            target_price = self.target_price(state)
+            should_enter, reason = self.strategy.should_enter(
+                current_price=state["current_price"],
+                target_price=target_price,
+                current_time=context.now,
+                skip_time_check=state.get("debug_mode", False),
+            )
+            if not should_enter:
+                return None
+
+            valid, filter_reason = self.strategy.validate_breakout(
+                current_price=context.last_price,
+                target_price=target_price,
+                volume=context.volume,
+                min_volume=(
+                    self.min_volume if self.min_volume is not None else state.get("min_volume", 0)
+                ),
+                min_breakout_strength=(
+                    self.min_breakout_strength
+                    if self.min_breakout_strength is not None
+                    else state.get("min_breakout_strength", 0.0)
+                ),
+            )
+            if not valid:
+                logger.info(f"[{self.name}] 돌파 필터 미통과: {filter_reason}")
+                return None
+
+            qty = self.strategy.calculate_position_size(
+                capital=state["cash_balance"],
+                current_price=state["current_price"],
+                position_ratio=context.position_ratio * self.weight,
+            )
+            return StrategySignal(self.name, "buy", qty, reason)
+
+        if state["position_status"] == "IN_POSITION":
+            should_exit, reason = self.strategy.should_exit(
+                entry_price=state["entry_price"],
+                current_price=state["current_price"],
+                stop_loss_pct=(
+                    self.stop_loss_pct if self.stop_loss_pct is not None else state["stop_loss_pct"]
+                ),
+                take_profit_pct=(
+                    self.take_profit_pct
+                    if self.take_profit_pct is not None
+                    else state["take_profit_pct"]
+                ),
+                current_time=context.now,
+                trailing_stop_price=context.trail_price,
+            )
+            if should_exit:
+                return StrategySignal(self.name, "sell", state["position_qty"], reason)
+        return None
+
+
+def merge_signals(
+    signals: List[StrategySignal], state: Dict[str, Any], context: SignalContext
+) -> Dict[str, Any]:
+    """
+    전략 신호를 종목 주문 하나로 병합
+
+    Args:
+        signals: 전략별 신호
+        state: TradingState
+        context: 공통 입력
+
+    Returns:
+        generate_signal 노드 업데이트 (should_buy/should_sell/사유/order_qty/strategy_signals)
+    """
+    updates: Dict[str, Any] = {
+        "should_buy": False,
+        "should_sell": False,
+        "buy_reason": None,
+        "sell_reason": None,
+        "strategy_signals": [asdict(signal) for signal in signals],
+    }
+
+    sells = [signal for signal in signals if signal.side == "sell"]
+    buys = [signal for signal in signals if signal.side == "buy" and signal.qty > 0]
+
+    if state["position_status"] == "IN_POSITION" and sells:
+        updates["should_sell"] = True
+        updates["sell_reason"] = "; ".join(
+            f"[{signal.strategy}] {signal.reason}" for signal in sells
+        )
+    elif state["position_status"] == "IDLE" and buys:
+        # 전략별 예산 합이 종목 한도를 넘지 않도록 제한 (weight 합 > 1 설정 대비)
+        cap = (
+            mul_ratio_floor(state["cash_balance"], context.position_ratio) // state["current_price"]
+        )
+        updates["should_buy"] = True
+        updates["order_qty"] = min(sum(signal.qty for signal in buys), cap)
+        updates["buy_reason"] = "; ".join(f"[{signal.strategy}] {signal.reason}" for signal in buys)
+    return updates
+
+
+class StrategyRegistry:
+    """전략 플러그인 모음 (같은 스냅샷으로 모두 평가)"""
+
+    def __init__(self, plugins: Iterable[StrategyPlugin] = ()):
+        self._plugins: Dict[str, StrategyPlugin] = {}
+        for plugin in plugins:
+            self.register(plugin)
+
+    @classmethod
+    def from_config(cls, entries: List[Dict[str, Any]]) -> "StrategyRegistry":
+        """
+        trading_config.yaml strategies 목록으로 생성
+
+        Args:
+            entries: [{"name": ..., "type": "breakout", "weight": ..., 유형별 파라미터}, ...]
+
+        Raises:
+            ValueError: 알 수 없는 유형이거나 이름이 중복된 경우
+        """
+        registry = cls()
+        for entry in entries:
+            params = dict(entry)
+            kind = params.pop("type", "breakout")
+            if kind not in _STRATEGY_TYPES:
+                raise ValueError(
+                    f"알 수 없는 전략 유형: {kind} (가능: {', '.join(strategy_types())})"
+                )
+            registry.register(_STRATEGY_TYPES[kind](**params))
+        return registry
+
+    def register(self, plugin: StrategyPlugin) -> None:
+        """플러그인 추가 (이름 중복 시 ValueError)"""
+        if plugin.name in self._plugins:
+            raise ValueError(f"이미 등록된 전략: {plugin.name}")
+        self._plugins[plugin.name] = plugin
+
+    def unregister(self, name: str) -> None:
+        """플러그인 제거"""
+        self._plugins.pop(name, None)
+
+    def __len__(self) -> int:
+        return len(self._plugins)
+
+    def __iter__(self) -> Iterator[StrategyPlugin]:
+        return iter(self._plugins.values())
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._plugins)
+
+    def evaluate(self, state: Dict[str, Any], context: SignalContext) -> List[StrategySignal]:
+        """
+        전 플러그인 평가 (한 플러그인의 오류는 그 플러그인 신호만 취소)
+
+        Returns:
+            신호 목록 (등록 순서)
+        """
+        signals = []
+        for plugin in self._plugins.values():
+            try:
+                signal = plugin.evaluate(state, context)
+            except Exception as e:
+                logger.error(
+                    f"[strategy_registry] {plugin.name} 평가 실패, 이번 반복 신호 없음: {e}"
+                )
+                continue
+            if signal is not None:
+                signals.append(signal)
+        return signals
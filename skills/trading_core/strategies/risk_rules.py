@@ -5,10 +5,51 @@
 """
 
 import logging
+from bisect import bisect_left
 from typing import Tuple, Optional
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# 변동성 구간별 포지션 조정 계수 (변동성이 클수록 포지션 축소)
+# 변동성 3% 이하: 100%, 5% 이하: 60%, 10% 이하: 30%, 그 이상: 10%
+VOLATILITY_THRESHOLDS = [0.03, 0.05, 0.10]
+VOLATILITY_FACTORS = [1.0, 0.6, 0.3, 0.1]
+
+_THRESHOLD_ARRAY = np.asarray(VOLATILITY_THRESHOLDS, dtype=np.float64)
+_FACTOR_ARRAY = np.asarray(VOLATILITY_FACTORS, dtype=np.float64)
+
+
+def volatility_factor(volatility: Optional[float]) -> float:
+    """
+    변동성에 따른 포지션 조정 계수
+
+    Args:
+        volatility: 일간 변동성 (예: 0.03 = 3%, 데이터 부족이면 None)
+
+    Returns:
+        조정 계수 (None/NaN이면 조정하지 않음 1.0)
+    """
+    if volatility is None or volatility != volatility:
+        return 1.0
+    return VOLATILITY_FACTORS[bisect_left(VOLATILITY_THRESHOLDS, volatility)]
+
+
+def volatility_factors(volatilities: np.ndarray) -> np.ndarray:
+    """
+    변동성 배열의 포지션 조정 계수 (벡터화, volatility_factor와 같은 결과)
+
+    Args:
+        volatilities: 일간 변동성 배열 (NaN은 데이터 부족)
+
+    Returns:
+        조정 계수 배열
+    """
+    values = np.asarray(volatilities, dtype=np.float64)
+    factors = _FACTOR_ARRAY[np.searchsorted(_THRESHOLD_ARRAY, values, side="left")]
+    return np.where(np.isnan(values), 1.0, factors)
+
 
 class RiskRules:
     """리스크 관리 규칙 클래스"""
@@ -111,55 +152,6 @@ class RiskRules:
 
         return False
 
-    def calculate_risk_adjusted_position(
-        self,
-        capital: float,
-        volatility: float,
-        base_position_ratio: float = 0.1,
-        volatility_adjustment: bool = True
-    ) -> float:
-        """
-        리스크 조정 포지션 크기 계산
-
-        변동성에 따라 포지션 크기를 조정합니다.
-        변동성이 클수록 포지션을 줄입니다.
-
-        Args:
-            capital: 총 자본
-            volatility: 변동성 (예: 0.03 = 3%)
-            base_position_ratio: 기본 투자 비율
-            volatility_adjustment: 변동성 조정 사용 여부
-
-        Returns:
-            조정된 투자 금액
-        """
-        if not volatility_adjustment:
-            return capital * base_position_ratio
-
-        # 변동성이 클수록 포지션 축소
-        # 변동성 3% 이하: 100% 투자
-        # 변동성 5%: 60% 투자
-        # 변동성 10%: 30% 투자
-        if volatility <= 0.03:
-            adjustment = 1.0
-        elif volatility <= 0.05:
-            adjustment = 0.6
-        elif volatility <= 0.10:
-            adjustment = 0.3
-        else:
-            adjustment = 0.1
-
-        adjusted_amount = capital * base_position_ratio * adjustment
-
-        logger.debug(
-            f"리스크 조정 포지션: "
-            f"변동성={volatility*100:.2f}%, "
-            f"조정계수={adjustment:.2f}, "
-            f"투자금액={adjusted_amount:,.0f}원"
-        )
-
-        return adjusted_amount
-
     def check_max_drawdown(
         self,
         current_asset: float,
@@ -0,0 +1,256 @@
+"""
+트레일링 스탑
+
+진입 후 최고가에서 일정 거리 아래를 청산가로 두고, 최고가가 오를 때만 청산가를
+끌어올립니다. 거리는 두 가지 방식 중 하나입니다.
+
+- pct: 최고가 × trailing_stop_pct (내림, 손절가와 같은 규칙)
+- atr: ATR × trailing_atr_multiplier (올림, 진입 시 ATR로 고정)
+
+ATR을 모르는 종목(일봉 부족)은 pct 방식으로 대체합니다.
+
+TrailingStopWatcher는 그래프 밖에서 체결 틱마다 호출되는 감시기입니다.
+틱 처리는 dict 조회 한 번과 정수 비교뿐이며, 청산 조건을 만족한 틱에서만
+on_exit 콜백(청산 그래프 실행)을 부릅니다.
+"""
+
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+from ..price import Won, mul_ratio_floor
+
+logger = logging.getLogger(__name__)
+
+TRAIL_MODES = ("pct", "atr")
+
+
+def trailing_stop_price(
+    highest_price: Won,
+    mode: str = "pct",
+    pct: float = 0.02,
+    atr: Optional[float] = None,
+    atr_multiplier: float = 2.0,
+) -> Won:
+    """
+    최고가 기준 트레일링 청산가
+
+    Args:
+        highest_price: 진입 후 최고가 (원)
+        mode: 거리 방식 (pct | atr)
+        pct: 최고가 대비 비율 (pct 방식, 또는 ATR을 모를 때)
+        atr: ATR (원, atr 방식)
+        atr_multiplier: ATR 배수
+
+    Returns:
+        청산가 (원, 현재가가 이 값 이하이면 청산)
+
+    Raises:
+        ValueError: 알 수 없는 mode
+    """
+    return highest_price - trail_distance(highest_price, mode, pct, atr, atr_multiplier)
+
+
+def trail_distance(
+    highest_price: Won,
+    mode: str = "pct",
+    pct: float = 0.02,
+    atr: Optional[float] = None,
+    atr_multiplier: float = 2.0,
+) -> Won:
+    """최고가와 청산가의 거리 (원, 인자는 trailing_stop_price와 같음)"""
+    if mode not in TRAIL_MODES:
+        raise ValueError(f"알 수 없는 트레일링 방식: {mode} (가능: {', '.join(TRAIL_MODES)})")
+    if mode == "atr" and atr is not None and not math.isnan(atr):
+        return math.ceil(atr * atr_multiplier)
+    return -mul_ratio_floor(highest_price, -pct)
+
+
+@dataclass
+class TrailExit:
+    """트레일링 스탑 청산 신호"""
+
+    symbol: str
+    qty: int
+    entry_price: Won
+    highest_price: Won
+    stop_price: Won
+    exit_price: Won  # 청산 조건을 만족한 틱 가격
+    received_at: float  # 틱 수신 시각 (time.perf_counter)
+    triggered_at: float  # 청산 판정 시각 (time.perf_counter)
+
+    @property
+    def giveback(self) -> Won:
+        """최고가 대비 반납 금액 (주당, 원)"""
+        return self.highest_price - self.exit_price
+
+    @property
+    def giveback_pct(self) -> float:
+        """최고가 대비 반납 비율"""
+        return self.giveback / self.highest_price
+
+    @property
+    def reason(self) -> str:
+        pnl_pct = (self.exit_price - self.entry_price) / self.entry_price
+        return (
+            f"트레일링 스탑 "
+            f"(진입가: {self.entry_price:,.0f}원, "
+            f"최고가: {self.highest_price:,.0f}원, "
+            f"청산가: {self.stop_price:,.0f}원, "
+            f"현재가: {self.exit_price:,.0f}원, "
+            f"수익률: {pnl_pct*100:.2f}%)"
+        )
+
+
+class _Trail:
+    """종목별 추적 상태 (틱마다 갱신되므로 슬롯만 사용)"""
+
+    __slots__ = ("qty", "entry_price", "highest_price", "stop_price", "distance", "pct")
+
+    def __init__(
+        self, qty: int, entry_price: Won, highest_price: Won, distance: Optional[Won], pct: float
+    ):
+        self.qty = qty
+        self.entry_price = entry_price
+        self.pct = pct
+        self.distance = distance  # None이면 최고가 비율 (pct 방식)
+        self.raise_high(highest_price)
+
+    def raise_high(self, price: Won) -> None:
+        self.highest_price = price
+        if self.distance is None:
+            self.stop_price = price + mul_ratio_floor(price, -self.pct)
+        else:
+            self.stop_price = price - self.distance
+
+
+class TrailingStopWatcher:
+    """그래프 밖 틱 단위 트레일링 스탑 감시기"""
+
+    def __init__(
+        self,
+        mode: str = "pct",
+        pct: float = 0.02,
+        atr_multiplier: float = 2.0,
+        on_exit: Optional[Callable[[TrailExit], None]] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            mode: 거리 방식 (pct | atr)
+            pct: 최고가 대비 비율 (pct 방식, ATR을 모르는 종목)
+            atr_multiplier: ATR 배수 (atr 방식)
+            on_exit: 청산 신호 콜백 (청산 그래프 실행 등)
+        """
+        if mode not in TRAIL_MODES:
+            raise ValueError(f"알 수 없는 트레일링 방식: {mode} (가능: {', '.join(TRAIL_MODES)})")
+        self.mode = mode
+        self.pct = pct
+        self.atr_multiplier = atr_multiplier
+        self.on_exit = on_exit
+        self._trails: Dict[str, _Trail] = {}
+
+    @classmethod
+    def from_config(
+        cls, config: Optional[dict], on_exit: Optional[Callable[[TrailExit], None]] = None
+    ) -> "TrailingStopWatcher":
+        """trading_config.yaml의 risk 설정으로 생성"""
+        risk = (config or {}).get("risk", {})
+        return cls(
+            mode=risk.get("trailing_mode", "pct"),
+            pct=risk.get("trailing_stop_pct", 0.02),
+            atr_multiplier=risk.get("trailing_atr_multiplier", 2.0),
+            on_exit=on_exit,
+        )
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._trails
+
+    def __len__(self) -> int:
+        return len(self._trails)
+
+    def arm(
+        self,
+        symbol: str,
+        entry_price: Won,
+        qty: int,
+        highest_price: Optional[Won] = None,
+        atr: Optional[float] = None,
+    ) -> Won:
+        """
+        포지션 감시 시작 (이미 감시 중이면 교체)
+
+        Args:
+            symbol: 종목 코드
+            entry_price: 진입가
+            qty: 보유 수량
+            highest_price: 진입 후 최고가 (None이면 진입가)
+            atr: 진입 시 ATR (atr 방식, None이면 pct 방식으로 대체)
+
+        Returns:
+            현재 청산가
+        """
+        distance = None
+        if self.mode == "atr" and atr is not None and not math.isnan(atr):
+            distance = math.ceil(atr * self.atr_multiplier)
+        highest = max(highest_price or entry_price, entry_price)
+        trail = _Trail(qty, entry_price, highest, distance, self.pct)
+        self._trails[symbol] = trail
+        logger.info(
+            f"[trailing_stop] {symbol} 감시 시작: 진입가 {entry_price:,}원, "
+            f"청산가 {trail.stop_price:,}원 ({'ATR' if distance is not None else '비율'})"
+        )
+        return trail.stop_price
+
+    def disarm(self, symbol: str) -> None:
+        """포지션 감시 중단 (그래프에서 다른 사유로 청산한 경우 등)"""
+        self._trails.pop(symbol, None)
+
+    def stop_price(self, symbol: str) -> Optional[Won]:
+        """현재 청산가 (감시 중이 아니면 None)"""
+        trail = self._trails.get(symbol)
+        return None if trail is None else trail.stop_price
+
+    def on_tick(
+        self, symbol: str, price: Won, received_at: Optional[float] = None
+    ) -> Optional[TrailExit]:
+        """
+        체결 틱 처리
+
+        Args:
+            symbol: 종목 코드
+            price: 체결가 (원)
+            received_at: 틱 수신 시각 (time.perf_counter, None이면 지금)
+
+        Returns:
+            청산 신호 (조건 미충족 또는 감시 중이 아니면 None)
+        """
+        trail = self._trails.get(symbol)
+        if trail is None:
+            return None
+        if price > trail.highest_price:
+            trail.raise_high(price)
+            return None
+        if price > trail.stop_price:
+            return None
+
+        # 청산: 같은 포지션으로 두 번 나가지 않도록 먼저 감시 해제
+        del self._trails[symbol]
+        now = time.perf_counter()
+        signal = TrailExit(
+            symbol=symbol,
+            qty=trail.qty,
+            entry_price=trail.entry_price,
+            highest_price=trail.highest_price,
+            stop_price=trail.stop_price,
+            exit_price=price,
+            received_at=now if received_at is None else received_at,
+            triggered_at=now,
+        )
+        logger.info(f"[trailing_stop] {symbol} 청산 신호: {signal.reason}")
+        if self.on_exit is not None:
+            self.on_exit(signal)
+        return signal
@@ -0,0 +1,696 @@
+"""
+종목 샤딩 워커 프로세스 감독기 (supervisor)
+
+종목이 많아 한 프로세스에서 조회 · 신호 계산이 반복 간격 안에 끝나지 않을 때,
+symbols.yaml 활성 종목을 여러 워커 프로세스로 나눠(샤딩) 각 워커가 종목별
+반복 그래프(build_trading_graph)를 실행합니다.
+
+현금 · 일일/월간 손실 한도(RiskRules) · 주문 승인은 감독 프로세스의
+RiskCoordinator 한 곳이 소유합니다. 워커는 주문 직전 risk_check 노드에서
+컨텍스트의 order_gate로 승인을 요청하고, 체결 후 현금 · 손익 변화를 보고합니다.
+워커와 감독기는 워커마다 하나씩 만든 양방향 multiprocessing.Pipe(로컬 소켓쌍)로
+작은 튜플만 주고받으므로 승인 왕복은 수십 마이크로초 수준입니다.
+
+워커가 비정상 종료하면 그 워커의 종목을 살아 있는 워커에 다시 배분하고,
+코디네이터가 알고 있는 보유 포지션을 함께 넘겨 새 워커가 이어서 관리합니다.
+승인 후 체결 보고 없이 죽은 종목의 매수 예약은 잔고 · 미체결 조회로 확인해
+보유 포지션으로 반영하거나 해제하고, 조회할 수 없으면 reservation_timeout 뒤 해제합니다.
+배정 메시지를 받기 전에 루프를 끝낸 워커의 종목은 done 종목 목록과 비교해 다시 배분합니다.
+
+메시지 (워커 → 감독기):
+    ("admit", symbol, side, qty, price)
+    ("fill", symbol, side, qty, price, cash_delta, pnl)
+    ("done", worker_id, symbols, iterations)
+메시지 (감독기 → 워커):
+    ("admission", symbol, qty, reason)
+    ("assign", {symbol: position 또는 None})
+    ("stop",)
+"""
+
+import dataclasses
+import logging
+import multiprocessing
+from multiprocessing.connection import Connection, wait
+from datetime import time
+from time import monotonic
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .clock import get_clock
+from .data.pnl_ledger import PnLLedger
+from .graph.context import TradingContext
+from .graph.state import TradingState, create_initial_state, load_trading_config
+from .price import Won, mul_ratio_floor, to_won
+from .rate_limit import PriorityRateLimiter
+from .strategies.risk_rules import RiskRules
+
+logger = logging.getLogger(__name__)
+
+# 죽은 워커가 남긴 매수 예약의 잔고 · 미체결 재조회 간격 (초)
+RESOLVE_INTERVAL = 5.0
+
+
+def shard_symbols(symbols: Sequence[str], n_shards: int) -> List[List[str]]:
+    """
+    종목을 워커 수만큼 나눔 (라운드 로빈, 순서 유지)
+
+    Args:
+        symbols: 종목 코드 목록
+        n_shards: 샤드 수
+
+    Returns:
+        샤드별 종목 목록 (종목이 샤드보다 적으면 빈 샤드 포함)
+    """
+    if n_shards <= 0:
+        raise ValueError(f"n_shards는 0보다 커야 합니다: {n_shards}")
+    return [list(symbols[i::n_shards]) for i in range(n_shards)]
+
+
+class RiskCoordinator:
+    """공유 현금 · 포트폴리오 손실 한도 · 주문 승인 (감독 프로세스 단일 소유)"""
+
+    def __init__(
+        self,
+        initial_capital: Won,
+        max_daily_loss: float = -0.05,
+        max_monthly_loss: float = -0.15,
+        max_position_size: float = 0.1,
+        max_positions: int = 3,
+        monthly_pnl: float = 0.0,
+        ledger: Optional[PnLLedger] = None,
+        context: Optional[TradingContext] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            initial_capital: 운용 자본 (원)
+            max_daily_loss: 최대 일일 손실 비율
+            max_monthly_loss: 최대 월간 손실 비율
+            max_position_size: 종목당 최대 투자 비율
+            max_positions: 최대 동시 보유 종목 수
+            monthly_pnl: 당월 누적 손익 (전일까지, ledger가 있으면 무시)
+            ledger: 실현 손익 원장 (있으면 체결을 기록하고 손실 한도는 원장 누적값으로 점검)
+            context: 감독 프로세스 실행 컨텍스트 (킬 스위치 halt_reason 확인용)
+        """
+        self.initial_capital = initial_capital
+        self.max_daily_loss = max_daily_loss
+        self.max_monthly_loss = max_monthly_loss
+        self.max_position_size = max_position_size
+        self.max_positions = max_positions
+        self.cash: Won = initial_capital
+        self.ledger = ledger
+        self.daily_pnl = ledger.daily_pnl() if ledger is not None else 0
+        self.monthly_pnl = ledger.monthly_pnl() if ledger is not None else monthly_pnl
+        self.total_trades = 0
+        self.trading_stopped = False
+        self.stop_reason: Optional[str] = None
+        self.positions: Dict[str, Dict[str, Any]] = {}
+        self.reserved: Dict[str, Won] = {}  # 승인 후 체결 보고 전 매수 예약 금액
+        self.risk_rules = RiskRules()
+        self.context = context
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Optional[dict] = None,
+        ledger: Optional[PnLLedger] = None,
+        context: Optional[TradingContext] = None,
+    ) -> "RiskCoordinator":
+        """trading_config.yaml 설정으로 생성 (None이면 파일에서 로드, ledger는 실현 손익 원장)"""
+        config = load_trading_config() if config is None else config
+        trading = config.get("trading", {})
+        risk = config.get("risk", {})
+        return cls(
+            initial_capital=trading.get("capital", 1000000),
+            max_daily_loss=risk.get("max_daily_loss", -0.05),
+            max_monthly_loss=risk.get("max_monthly_loss", -0.15),
+            max_position_size=trading.get("position_size", 0.1),
+            max_positions=trading.get("max_positions", 3),
+            ledger=ledger,
+            context=context,
+        )
+
+    @property
+    def available_cash(self) -> Won:
+        """매수 예약분을 뺀 배분 가능 현금"""
+        return self.cash - sum(self.reserved.values())
+
+    def admit(self, symbol: str, side: str, qty: int, price: Won) -> Tuple[int, Optional[str]]:
+        """
+        주문 승인
+
+        매수는 공유 현금 · 종목당 최대 비중 · 최대 보유 종목 수 안으로 수량을 줄여
+        승인하고 금액을 예약합니다. 매도는 보유 수량 그대로 승인합니다.
+        손실 한도 초과 시에는 risk_check 노드와 같이 매수 · 매도 모두 거절합니다.
+
+        Args:
+            symbol: 종목 코드
+            side: "buy" | "sell"
+            qty: 요청 수량
+            price: 기준 가격 (현재가, 원)
+
+        Returns:
+            (승인 수량, 거절 사유)
+        """
+        halt_reason = self.context.halt_reason if self.context is not None else None
+        if not self.trading_stopped and halt_reason is not None:
+            self.trading_stopped = True
+            self.stop_reason = (
+                halt_reason  # 킬 스위치 (감독기 프로세스에서 설정, 워커 주문 모두 거절)
+            )
+            logger.warning(f"[coordinator] 거래 중단: {self.stop_reason}")
+        if not self.trading_stopped:
+            if self.ledger is not None:
+                now = get_clock().now()
+                self.daily_pnl, self.monthly_pnl = self.ledger.daily_pnl(
+                    now
+                ), self.ledger.monthly_pnl(now)
+            can_trade, reason = self.risk_rules.validate_trading_conditions(
+                daily_pnl=self.daily_pnl,
+                monthly_pnl=self.monthly_pnl,
+                initial_capital=self.initial_capital,
+                max_daily_loss=self.max_daily_loss,
+                max_monthly_loss=self.max_monthly_loss,
+            )
+            if not can_trade:
+                self.trading_stopped = True
+                self.stop_reason = reason
+                logger.warning(f"[coordinator] 거래 중단: {reason}")
+        if self.trading_stopped:
+            return 0, self.stop_reason
+
+        if side == "sell":
+            return qty, None
+
+        if symbol in self.positions or symbol in self.reserved:
+            return 0, "이미 보유 중이거나 체결 대기 중인 종목"
+        if len(self.positions) + len(self.reserved) >= self.max_positions:
+            return 0, "최대 보유 종목 수 도달"
+
+        position_cap = mul_ratio_floor(self.initial_capital, self.max_position_size)
+        approved = min(qty, position_cap // price, self.available_cash // price)
+        if approved <= 0:
+            return 0, "배분 가능 현금 부족"
+
+        self.reserved[symbol] = price * approved
+        logger.info(
+            f"[coordinator] {symbol} 매수 승인: {approved}주 "
+            f"(요청 {qty}주, 예약 {price * approved:,}원)"
+        )
+        return approved, None
+
+    def settle(
+        self, symbol: str, side: str, qty: int, price: Won, cash_delta: Won, pnl: Won
+    ) -> None:
+        """
+        체결 보고 반영 (qty 0이면 미체결 → 예약만 해제)
+
+        Args:
+            symbol: 종목 코드
+            side: "buy" | "sell"
+            qty: 체결 수량
+            price: 체결 기준 가격 (매수는 진입가)
+            cash_delta: 현금 변화 (매수 음수, 매도 양수)
+            pnl: 실현 손익 (매도)
+        """
+        if qty > 0 and self.ledger is not None:
+            self.ledger.record(symbol, side, qty, price, pnl if side == "sell" else 0)
+        if side == "buy":
+            self.reserved.pop(symbol, None)
+            if qty > 0:
+                self.positions[symbol] = {"qty": qty, "entry_price": price}
+        elif qty > 0:
+            self.positions.pop(symbol, None)
+            self.daily_pnl += pnl
+            self.monthly_pnl += pnl
+            self.total_trades += 1
+        self.cash += cash_delta
+        if qty > 0:
+            logger.info(
+                f"[coordinator] {symbol} {side} 체결 반영: {qty}주, "
+                f"현금 {self.cash:,}원, 일일손익 {self.daily_pnl:,}원"
+            )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 현금 · 손익 · 보유 포지션"""
+        return {
+            "cash_balance": self.cash,
+            "available_cash": self.available_cash,
+            "daily_pnl": self.daily_pnl,
+            "monthly_pnl": self.monthly_pnl,
+            "total_trades": self.total_trades,
+            "positions": {symbol: dict(position) for symbol, position in self.positions.items()},
+            "reserved": dict(self.reserved),
+            "trading_stopped": self.trading_stopped,
+            "stop_reason": self.stop_reason,
+        }
+
+
+# ========== 워커 프로세스 ==========
+
+
+class _WorkerLink:
+    """워커 쪽 파이프 (승인 요청은 응답을 기다리고, 그 사이 제어 메시지는 보관)"""
+
+    def __init__(self, conn: Connection):
+        self.conn = conn
+        self.pending: List[tuple] = []
+        self.admitted: Dict[str, str] = {}  # 이번 반복에서 승인받은 종목 → side
+
+    def gate(self, state: TradingState) -> Tuple[int, Optional[str]]:
+        """TradingContext.order_gate 구현"""
+        side = "buy" if state.get("should_buy") else "sell"
+        qty = state.get("order_qty", 0) if side == "buy" else state["position_qty"]
+        self.conn.send(("admit", state["symbol"], side, qty, state["current_price"]))
+        while True:
+            message = self.conn.recv()
+            if message[0] == "admission" and message[1] == state["symbol"]:
+                if message[2] > 0:
+                    self.admitted[state["symbol"]] = side
+                return message[2], message[3]
+            self.pending.append(message)
+
+    def report(self, before: TradingState, after: TradingState) -> None:
+        """승인받은 종목의 체결 결과 보고 (미체결이면 수량 0)"""
+        side = self.admitted.pop(before["symbol"], None)
+        if side is None:
+            return
+        cash_delta = after["cash_balance"] - before["cash_balance"]
+        if side == "buy":
+            qty = after["position_qty"] - before["position_qty"]
+            price = after["entry_price"] if qty > 0 else before["current_price"]
+            pnl = 0
+        else:
+            qty = before["position_qty"] - after["position_qty"]
+            price = after["current_price"]
+            pnl = after["realized_pnl"] - before["realized_pnl"]
+        self.conn.send(("fill", before["symbol"], side, qty, price, cash_delta, pnl))
+
+
+def _symbol_state(
+    symbol: str, position: Optional[Dict[str, Any]], state_kwargs: Dict[str, Any]
+) -> TradingState:
+    """종목 상태 생성 (코디네이터가 아는 보유 포지션이 있으면 이어받음)"""
+    state = create_initial_state(symbol=symbol, **state_kwargs)
+    if position:
+        state.update(
+            {
+                "position_status": "IN_POSITION",
+                "position_qty": position["qty"],
+                "entry_price": position["entry_price"],
+                "highest_price": position["entry_price"],
+                "lowest_price": position["entry_price"],
+            }
+        )
+    return state
+
+
+def worker_main(
+    worker_id: int,
+    conn: Connection,
+    assignment: Dict[str, Optional[Dict[str, Any]]],
+    state_kwargs: Dict[str, Any],
+    interval_seconds: float,
+    max_iterations: Optional[int],
+    session_end: time,
+    setup: Optional[Callable[[int], None]] = None,
+    context: Optional[TradingContext] = None,
+) -> None:
+    """
+    워커 프로세스 본체
+
+    배정된 종목마다 반복 그래프를 한 번씩 실행하는 것을 한 반복으로,
+    interval_seconds 간격으로 세션 종료 · 최대 반복 · 중단 메시지까지 반복합니다.
+
+    Args:
+        worker_id: 워커 번호
+        conn: 감독기와 연결된 파이프
+        assignment: 배정 종목 → 이어받을 포지션 (없으면 None)
+        state_kwargs: create_initial_state 인자
+        interval_seconds: 반복 간격 (초)
+        max_iterations: 최대 반복 횟수 (None이면 세션 종료까지)
+        session_end: 세션 종료 시각
+        setup: 워커 시작 시 호출할 함수 (worker_id 인자, KIS 인증 · 시계 설정 등)
+        context: 감독 프로세스 실행 컨텍스트
+            (전략 · 지표 · 시세 버스 등을 물려받음, None이면 기본 구성)
+    """
+    from .graph.graph_builder import build_trading_graph
+
+    if setup is not None:
+        setup(worker_id)
+
+    link = _WorkerLink(conn)
+    context = context or TradingContext()
+    limiter = context.rate_limiter
+    context = dataclasses.replace(
+        context,
+        order_gate=link.gate,
+        # 체결 기록 · 손실 한도는 코디네이터 원장이 소유 (물려받은 원장 사용 안 함)
+        pnl_ledger=None,
+        account_model=None,  # 계좌 전체 잔고는 워커 종목 일부와 맞지 않음
+        position_reconciler=None,
+        halt_reason=None,  # 거래 중단은 코디네이터가 승인 거절로 전달
+        # 물려받은 잠금 상태 대신 새 제한기 (프로세스마다 따로 제한)
+        rate_limiter=(
+            PriorityRateLimiter(limiter.rate, limiter.burst) if limiter is not None else None
+        ),
+    )
+    graph = build_trading_graph(context)
+    states = {
+        symbol: _symbol_state(symbol, position, state_kwargs)
+        for symbol, position in assignment.items()
+    }
+    logger.info(f"[worker {worker_id}] 시작: {len(states)}개 종목 {list(states)}")
+
+    iterations = 0
+    stopped = False
+    while not stopped:
+        for symbol in list(states):
+            before = states[symbol]
+            try:
+                after = graph.invoke(before)
+            except Exception as e:
+                logger.error(f"[worker {worker_id}] {symbol} 반복 실패: {e}")
+                after = before
+            link.report(before, after)
+            states[symbol] = after
+        iterations += 1
+
+        if max_iterations is not None and iterations >= max_iterations:
+            break
+        if get_clock().now().time() >= session_end:
+            break
+
+        # 반복 간격 동안 제어 메시지 대기 (승인 대기 중 받은 메시지 먼저)
+        while link.pending or conn.poll(interval_seconds):
+            message = link.pending.pop(0) if link.pending else conn.recv()
+            if message[0] == "stop":
+                stopped = True
+                break
+            if message[0] == "assign":
+                for symbol, position in message[1].items():
+                    states[symbol] = _symbol_state(symbol, position, state_kwargs)
+                logger.info(f"[worker {worker_id}] 종목 추가 배정: {list(message[1])}")
+                break
+
+    conn.send(("done", worker_id, list(states), iterations))
+    logger.info(f"[worker {worker_id}] 종료: {iterations}회 반복")
+
+
+# ========== 감독기 ==========
+
+
+class ShardSupervisor:
+    """종목 샤딩 워커 감독 · 중앙 코디네이터 메시지 처리"""
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        n_workers: int,
+        coordinator: Optional[RiskCoordinator] = None,
+        state_kwargs: Optional[Dict[str, Any]] = None,
+        interval_seconds: float = 60.0,
+        max_iterations: Optional[int] = None,
+        session_end: time = time(15, 30),
+        worker_setup: Optional[Callable[[int], None]] = None,
+        mp_context: Optional[Any] = None,
+        reservation_timeout: float = 60.0,
+        context: Optional[TradingContext] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            symbols: 전체 종목 코드 (symbols.yaml 활성 종목)
+            n_workers: 워커 프로세스 수
+            coordinator: 리스크 코디네이터 (None이면 trading_config.yaml로 생성)
+            state_kwargs: 워커 종목 상태 create_initial_state 인자 (env_mode, k_value 등)
+            interval_seconds: 워커 반복 간격 (초)
+            max_iterations: 워커별 최대 반복 횟수 (None이면 세션 종료까지)
+            session_end: 세션 종료 시각
+            worker_setup: 워커 시작 시 호출할 함수 (pickle 가능한 모듈 수준 함수)
+            mp_context: multiprocessing 컨텍스트 (None이면 플랫폼 기본값)
+            reservation_timeout: 죽은 워커의 매수 예약을 조회로 확인하지 못할 때 해제까지 대기 (초)
+            context: 워커에 물려줄 실행 컨텍스트
+                (fork 방식에서만 그대로 전달, None이면 워커마다 기본 구성)
+        """
+        if not symbols:
+            raise ValueError("감독할 종목이 비어 있습니다")
+        self.symbols = list(symbols)
+        self.n_workers = min(n_workers, len(self.symbols))
+        self.coordinator = coordinator or RiskCoordinator.from_config()
+        self.state_kwargs = dict(state_kwargs or {})
+        self.state_kwargs.setdefault("initial_capital", self.coordinator.initial_capital)
+        self.interval_seconds = interval_seconds
+        self.max_iterations = max_iterations
+        self.session_end = session_end
+        self.worker_setup = worker_setup
+        self.ctx = mp_context or multiprocessing.get_context()
+        self.reservation_timeout = reservation_timeout
+        self.context = context
+
+        self.shards: Dict[int, List[str]] = {}
+        self.processes: Dict[int, Any] = {}
+        self.conns: Dict[int, Connection] = {}
+        self.finished: Dict[int, Dict[str, Any]] = {}
+        self.failed: List[int] = []
+        self.orphaned: List[str] = []  # 살아 있는 워커가 없어 배정 못 한 종목
+        self.unresolved: Dict[str, float] = {}  # 체결 미확인 매수 예약 → 워커 종료 시각 (monotonic)
+        self._next_resolve = 0.0
+
+    def start(self) -> None:
+        """샤드별 워커 프로세스 시작"""
+        for worker_id, shard in enumerate(shard_symbols(self.symbols, self.n_workers)):
+            parent_conn, child_conn = self.ctx.Pipe(duplex=True)
+            assignment = {symbol: self.coordinator.positions.get(symbol) for symbol in shard}
+            process = self.ctx.Process(
+                target=worker_main,
+                args=(
+                    worker_id,
+                    child_conn,
+                    assignment,
+                    self.state_kwargs,
+                    self.interval_seconds,
+                    self.max_iterations,
+                    self.session_end,
+                    self.worker_setup,
+                    self.context,
+                ),
+                name=f"breakout-worker-{worker_id}",
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self.shards[worker_id] = shard
+            self.processes[worker_id] = process
+            self.conns[worker_id] = parent_conn
+        logger.info(f"[supervisor] 워커 {self.n_workers}개 시작: {self.shards}")
+
+    def _alive(self) -> List[int]:
+        return [
+            worker_id
+            for worker_id in self.processes
+            if worker_id not in self.finished and worker_id not in self.failed
+        ]
+
+    def _handle(self, worker_id: int, message: tuple) -> None:
+        kind = message[0]
+        if kind == "admit":
+            _, symbol, side, qty, price = message
+            approved, reason = self.coordinator.admit(symbol, side, qty, price)
+            self.conns[worker_id].send(("admission", symbol, approved, reason))
+        elif kind == "fill":
+            self.coordinator.settle(*message[1:])
+        elif kind == "done":
+            _, _, symbols, iterations = message
+            self.finished[worker_id] = {"symbols": symbols, "iterations": iterations}
+            # 루프를 끝낸 뒤 도착한 배정은 실행되지 않으므로 다른 워커로 다시 배분
+            shard = self.shards.get(worker_id, [])
+            missed = [symbol for symbol in shard if symbol not in symbols]
+            if missed:
+                self.shards[worker_id] = [symbol for symbol in shard if symbol in symbols]
+                logger.warning(f"[supervisor] 워커 {worker_id} 종료 전 받지 못한 배정: {missed}")
+                self._assign(missed)
+
+    def _assign(self, symbols: List[str]) -> None:
+        """종목을 살아 있는 워커에 나눠 배정 (없으면 orphaned)"""
+        alive = self._alive()
+        if not alive:
+            logger.error(f"[supervisor] 살아 있는 워커가 없어 배정 못 한 종목: {symbols}")
+            self.orphaned.extend(symbols)
+            return
+
+        for worker_id, shard in zip(alive, shard_symbols(symbols, len(alive))):
+            if not shard:
+                continue
+            assignment = {symbol: self.coordinator.positions.get(symbol) for symbol in shard}
+            try:
+                self.conns[worker_id].send(("assign", assignment))
+            except (BrokenPipeError, OSError):
+                # 종료 중인 워커: 종료 처리(_rebalance)에서 이 종목까지 다시 배분됨
+                pass
+            self.shards[worker_id].extend(shard)
+
+    def _rebalance(self, dead_id: int) -> None:
+        """죽은 워커의 종목을 살아 있는 워커에 재배분"""
+        self.failed.append(dead_id)
+        orphans = self.shards.pop(dead_id, [])
+        pending = [symbol for symbol in orphans if symbol in self.coordinator.reserved]
+        if pending:
+            # 승인 후 체결 보고 전 종료: 잔고 · 미체결 조회로 확인할 때까지 예약 유지
+            logger.warning(
+                f"[supervisor] 워커 {dead_id} 체결 미확인 종목 (확인 전 예약 유지): {pending}"
+            )
+            now = monotonic()
+            for symbol in pending:
+                self.unresolved.setdefault(symbol, now)
+
+        logger.error(
+            f"[supervisor] 워커 {dead_id} 비정상 종료 "
+            f"(exitcode={self.processes[dead_id].exitcode}), "
+            f"종목 {orphans} 재배분 → 워커 {self._alive()}"
+        )
+        # 잔고에서 확인된 포지션을 새 워커에 함께 넘기도록 배분 전에 먼저 조회
+        self._resolve_reservations(force=True)
+        self._assign(orphans)
+
+    def _inquire_reserved(self, symbols: List[str]) -> Dict[str, Optional[Tuple[int, Won]]]:
+        """
+        체결 미확인 종목의 잔고 · 미체결 조회
+
+        Returns:
+            {종목: (보유 수량, 매입 평균가) | None(미체결 매수 주문이 남아 있음)},
+            잔고에도 미체결에도 없는 종목은 (0, 0)
+
+        Raises:
+            RuntimeError: KIS 인증 실패
+        """
+        from .graph import nodes
+
+        env_mode = self.state_kwargs.get("env_mode", "demo")
+        limiter = self.context.rate_limiter if self.context is not None else None
+        if not nodes._init_kis_auth(env_mode):
+            raise RuntimeError("KIS 인증 실패")
+        result: Dict[str, Optional[Tuple[int, Won]]] = {symbol: (0, 0) for symbol in symbols}
+        for page, _ in nodes._iter_inquire_balance(env_mode, limiter=limiter):
+            for row in page:
+                qty = int(row.get("hldg_qty", 0) or 0)
+                if row.get("pdno") in result and qty > 0:
+                    result[row["pdno"]] = (qty, to_won(row.get("pchs_avg_pric") or 0))
+        for order in nodes._call_inquire_open_orders(env_mode, limiter=limiter):
+            if order.get("pdno") in result and order.get("sll_buy_dvsn_cd") == "02":
+                result[order["pdno"]] = None
+        return result
+
+    def _resolve_reservations(self, force: bool = False) -> None:
+        """
+        죽은 워커가 남긴 매수 예약 정리 (RESOLVE_INTERVAL마다 한 번 조회)
+
+        잔고에 있으면 보유 포지션으로 반영하고, 잔고 · 미체결 모두 없으면 해제합니다.
+        미체결 매수가 남아 있거나 조회에 실패하면 reservation_timeout이 지난 뒤 해제합니다.
+
+        Args:
+            force: 조회 간격과 무관하게 바로 조회
+        """
+        if not self.unresolved or (not force and monotonic() < self._next_resolve):
+            return
+        self._next_resolve = monotonic() + RESOLVE_INTERVAL
+        try:
+            found = self._inquire_reserved(list(self.unresolved))
+        except Exception as e:
+            logger.warning(f"[supervisor] 체결 미확인 종목 조회 실패: {e}")
+            found = {}
+
+        now = monotonic()
+        for symbol, since in list(self.unresolved.items()):
+            if symbol not in self.coordinator.reserved:  # 새 워커가 체결을 보고함
+                del self.unresolved[symbol]
+                continue
+            held = found.get(symbol)
+            if held is None and now - since < self.reservation_timeout:
+                continue
+            qty, price = held or (0, 0)
+            del self.unresolved[symbol]
+            self.coordinator.settle(symbol, "buy", qty, price, -qty * price, 0)
+            if qty <= 0:
+                logger.warning(f"[supervisor] {symbol} 체결 미확인 매수 예약 해제")
+                continue
+            logger.warning(f"[supervisor] {symbol} 잔고 확인: {qty}주 보유로 반영")
+            # 이미 종목을 넘겨받은 워커에는 포지션을 다시 배정해 청산 관리를 이어받게 함
+            for worker_id in self._alive():
+                if symbol in self.shards.get(worker_id, []):
+                    try:
+                        self.conns[worker_id].send(
+                            ("assign", {symbol: self.coordinator.positions[symbol]})
+                        )
+                    except (BrokenPipeError, OSError):
+                        pass
+
+    def run(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        모든 워커가 끝날 때까지 코디네이터 메시지 처리
+
+        Args:
+            timeout: 최대 실행 시간 (초, 초과 시 워커에 중단 메시지)
+
+        Returns:
+            코디네이터 최종 스냅샷 (+ shards, failed, orphaned)
+        """
+        if not self.processes:
+            self.start()
+
+        started = monotonic()
+        while self._alive():
+            alive = self._alive()
+            conns = {self.conns[worker_id]: worker_id for worker_id in alive}
+            sentinels = {self.processes[worker_id].sentinel: worker_id for worker_id in alive}
+            for ready in wait(list(conns) + list(sentinels), timeout=1.0):
+                if ready in conns:
+                    worker_id = conns[ready]
+                    try:
+                        while ready.poll():
+                            self._handle(worker_id, ready.recv())
+                    except (EOFError, OSError):
+                        pass
+                elif sentinels[ready] not in self.finished and sentinels[ready] not in self.failed:
+                    worker_id = sentinels[ready]
+                    # 종료 직전에 보낸 메시지(done 등)를 먼저 처리
+                    try:
+                        while self.conns[worker_id].poll():
+                            self._handle(worker_id, self.conns[worker_id].recv())
+                    except (EOFError, OSError):
+                        pass
+                    if worker_id not in self.finished:
+                        self._rebalance(worker_id)
+
+            self._resolve_reservations()
+            if timeout is not None and monotonic() - started > timeout:
+                self.stop()
+                timeout = None
+
+        for process in self.processes.values():
+            process.join(timeout=5)
+        self._resolve_reservations(force=True)
+
+        result = self.coordinator.snapshot()
+        result.update(
+            {
+                "shards": {k: list(v) for k, v in self.shards.items()},
+                "failed": list(self.failed),
+                "orphaned": list(self.orphaned),
+            }
+        )
+        logger.info(
+            f"[supervisor] 종료: 현금 {result['cash_balance']:,}원, "
+            f"일일손익 {result['daily_pnl']:,}원, "
+            f"보유 {len(result['positions'])}종목, 실패 워커 {self.failed}"
+        )
+        return result
+
+    def stop(self) -> None:
+        """모든 워커에 중단 메시지 (현재 반복을 마치고 종료)"""
+        for worker_id in self._alive():
+            try:
+                self.conns[worker_id].send(("stop",))
+            except (BrokenPipeError, OSError):
+                pass
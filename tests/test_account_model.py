@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+로컬 계좌 모델 테스트
+
+Usage:
+    python -m pytest tests/test_account_model.py -q
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.kis_standin import KISStandIn
+from skills.trading_core.account import AccountModel
+from skills.trading_core.clock import VirtualClock, use_clock
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.graph.graph_builder import build_trading_graph
+from skills.trading_core.graph.state import create_initial_state
+from skills.trading_core.scheduler import TradingScheduler
+
+NOW = datetime(2025, 1, 6, 10, 0)
+
+
+def _holdings(standin, count):
+    for i in range(count):
+        standin.holdings[f"{i:06d}"] = {"qty": i + 1, "avg_price": 10_000.0}
+
+
+def test_balance_pages_are_merged():
+    standin = KISStandIn(seed=0, page_size=20)
+    _holdings(standin, 45)
+    with standin.install(nodes):
+        output1, output2 = nodes._call_inquire_balance("demo")
+        assert standin.calls == 3  # 20 + 20 + 5
+        assert [row["pdno"] for row in output1] == [f"{i:06d}" for i in range(45)]
+        assert int(output2[0]["scts_evlu_amt"]) == sum(int(row["evlu_amt"]) for row in output1)
+
+        standin.page_size = 100
+        assert len(nodes._call_inquire_balance("demo")[0]) == 45 and standin.calls == 4
+
+
+def test_local_marks_fills_and_reconcile_triggers():
+    standin = KISStandIn(seed=0, cash=1_000_000, page_size=2)
+    _holdings(standin, 5)
+    with standin.install(nodes):
+        model = AccountModel(reconcile_interval=60)
+        assert model.needs_reconcile(NOW) == "초기"
+        total = model.reconcile(*nodes._call_inquire_balance("demo"), now=NOW)
+    assert total == 1_000_000 + 15 * 10_000 == model.total_asset
+    assert len(model.positions) == 5 and model.needs_reconcile(NOW) is None
+
+    # 시세 평가: 보유 종목만 반영, 총자산 증분 갱신
+    model.on_price("000004", 11_000)  # 5주 × +1,000원
+    model.on_price("999999", 50_000)  # 미보유 → 무시
+    assert model.total_asset == total + 5_000
+
+    model.on_fill("000000", "sell", 1, 12_000)
+    assert "000000" not in model.positions and model.total_asset == total + 5_000 + 2_000
+    assert model.needs_reconcile(NOW) == "체결 후"
+    model.reconcile([], [{"tot_evlu_amt": "1000000", "scts_evlu_amt": "0"}], now=NOW)
+    assert model.last_drift == 1_000_000 - (total + 7_000) and model.positions == {}
+
+    assert model.needs_reconcile(NOW + timedelta(seconds=59)) is None
+    assert model.needs_reconcile(NOW + timedelta(seconds=60)) == "주기"
+    assert not model.check_positions({"069500": 3})
+    assert model.needs_reconcile(NOW).startswith("불일치")
+
+
+def test_loop_skips_balance_calls_between_reconciles():
+    balance_calls = []
+    standin = KISStandIn(seed=7)
+    original = standin._balance
+    standin._balance = lambda tr_cont, params: balance_calls.append(tr_cont) or original(
+        tr_cont, params
+    )
+    clock = VirtualClock(datetime(2025, 1, 6, 9, 0))
+
+    context = TradingContext(account_model=AccountModel(reconcile_interval=30 * 60))
+    with standin.install(nodes), use_clock(clock):
+        state = create_initial_state(
+            symbol="069500",
+            initial_capital=10_000_000,
+            env_mode="demo",
+            k_value=-1.0,
+            min_volume=0,
+            min_breakout_strength=0.0,
+        )
+        trace = []
+        scheduler = TradingScheduler(
+            build_trading_graph(context),
+            clock=clock,
+            interval_seconds=60,
+            max_iterations=60,
+            on_iteration=lambda s: trace.append((s["total_asset"], s["position_qty"])),
+        )
+        scheduler.run(state)
+        kis_total = int(original("", {})._body.output2[0]["tot_evlu_amt"])
+
+    # 초기 1회 + 매수 체결 후 1회 + 30분 주기 1회 (반복 60회 중)
+    assert len(standin.orders) == 1 and len(balance_calls) == 3
+    assert trace[-1][1] == standin.holdings["069500"]["qty"]
+    # 로컬 평가 총자산 ≈ 같은 시세의 KIS 총평가 (대역 시세의 원 단위 반올림 차이만)
+    assert abs(trace[-1][0] - kis_total) <= trace[-1][1]
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+적응형 k 테스트
+
+Usage:
+    python -m pytest tests/test_adaptive_k.py -q
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from skills.trading_core.backtest.engine import run_breakout_backtest
+from skills.trading_core.backtest.incremental import IncrementalBacktester
+from skills.trading_core.backtest.runner import compare_k_modes
+from skills.trading_core.clock import FixedClock, use_clock
+from skills.trading_core.data.history_store import HistoryStore
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.graph.state import create_initial_state
+from skills.trading_core.price import to_won_array
+from skills.trading_core.strategies.adaptive_k import (
+    AdaptiveKTable,
+    noise_ratios,
+    trailing_noise_k,
+)
+from skills.trading_core.strategies.indicators import IndicatorEngine
+from tests.test_backtest_cache import make_bars
+
+ADAPTIVE = {"k_mode": "adaptive", "noise_period": 20, "k_min": 0.2, "k_max": 0.9}
+
+
+def test_table_matches_vectorized_k_without_lookahead():
+    bars = make_bars(200, seed=4)
+    arrays = [to_won_array(bars[col].to_numpy()) for col in ("open", "high", "low", "close")]
+    k = trailing_noise_k(noise_ratios(*arrays), 20, 0.2, 0.9, fallback=0.5)
+    assert (k[:20] == 0.5).all()
+
+    # i번째 날의 k는 전일까지의 일봉만으로 계산한 테이블 값과 같아야 함 (당일 봉 미사용)
+    table = AdaptiveKTable(noise_period=20, k_min=0.2, k_max=0.9)
+    for i in (20, 57, 199):
+        engine = IndicatorEngine()
+        engine.update_bars("A", bars.iloc[:i].to_dict("records"))
+        assert table.precompute(engine, ["A"], str(bars["date"].iloc[i])) == 1
+        assert table.get("A", str(bars["date"].iloc[i])) == pytest.approx(k[i], rel=1e-12)
+        assert table.get("A", "19990101") is None
+
+    engine = IndicatorEngine()
+    engine.update_bars("B", bars.iloc[:10].to_dict("records"))
+    assert table.lookup(engine, "B", "20990101") is None  # 데이터 부족
+
+
+def test_backtest_adaptive_mode_and_incremental_equivalence(tmp_path):
+    bars = make_bars(300, seed=8)
+    static = run_breakout_backtest(bars, {"k_mode": "static"})
+    adaptive = run_breakout_backtest(bars, ADAPTIVE)
+    # 데이터 부족 구간(처음 20일)은 고정 k와 같고 이후 달라짐
+    assert np.array_equal(static["daily_returns"][:19], adaptive["daily_returns"][:19])
+    assert not np.array_equal(static["daily_returns"], adaptive["daily_returns"])
+
+    with pytest.raises(ValueError):
+        run_breakout_backtest(bars, {"k_mode": "bogus"})
+
+    store = HistoryStore(tmp_path / "hist")
+    store.save("069500", bars.iloc[:250])
+    backtester = IncrementalBacktester(store, tmp_path / "state")
+    backtester.update("069500", ADAPTIVE)
+    for i in range(250, 300):
+        store.append("069500", bars.iloc[i : i + 1])
+        result = backtester.update("069500", ADAPTIVE)
+    for key, value in adaptive["metrics"].items():
+        assert result["metrics"][key] == pytest.approx(value, rel=1e-9, abs=1e-12), key
+
+    comparison = compare_k_modes(store, ["069500"], start=str(bars["date"].iloc[100]))
+    row = comparison["symbols"]["069500"]
+    assert set(row) == {"static", "adaptive"}
+    assert row["static"] != row["adaptive"]
+    assert comparison["summary"]["adaptive_wins"] in (0, 1)
+
+
+def test_calculate_target_node_uses_precomputed_k(tmp_path):
+    store = HistoryStore(tmp_path)
+    bars = make_bars(60, seed=3)
+    store.save("069500", bars)
+    today = "20990101"
+
+    engine = IndicatorEngine()
+    engine.warm_start(store, ["069500"], until=today)
+    table = AdaptiveKTable()
+    table.precompute(engine, ["069500"], today)
+    expected = table.get("069500", today)
+
+    state = create_initial_state(
+        symbol="069500", initial_capital=10_000_000, env_mode="demo", k_mode="adaptive"
+    )
+    state.update({"today_open": 30000, "yesterday_high": 30500, "yesterday_low": 29500})
+    context = TradingContext(indicator_engine=engine, adaptive_k_table=table)
+    with use_clock(FixedClock(datetime(2099, 1, 1, 9, 0))):
+        updates = nodes.calculate_target_node(state, context)
+        assert updates["effective_k"] == expected
+        state["k_mode"] = "static"
+        assert nodes.calculate_target_node(state, context)["effective_k"] == state["k_value"]
+    assert updates["target_price"] == 30000 + -(-1000 * round(expected * 10_000) // 10_000)
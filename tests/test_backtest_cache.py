@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+백테스트 엔진 · 일봉 저장소 · 결과 캐시 테스트
+
+Usage:
+    python -m pytest tests/test_backtest_cache.py -q
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from skills.trading_core.backtest.cache import BacktestCache, make_cache_key
+from skills.trading_core.backtest.engine import run_breakout_backtest, simulate_breakout_days
+from skills.trading_core.backtest.runner import backtest_symbol, run_parameter_sweep, walk_forward
+from skills.trading_core.data.history_store import HistoryStore
+
+
+def make_bars(n_days: int = 300, seed: int = 0, start_price: float = 30000.0) -> pd.DataFrame:
+    """랜덤워크 일봉 생성"""
+    rng = np.random.default_rng(seed)
+    close = start_price * np.cumprod(1 + rng.normal(0.0005, 0.015, n_days))
+    open_ = close * (1 + rng.normal(0, 0.005, n_days))
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.02, n_days))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.02, n_days))
+    dates = pd.bdate_range("2023-01-02", periods=n_days).strftime("%Y%m%d")
+    return pd.DataFrame(
+        {
+            "date": dates,
+            "open": open_.round(),
+            "high": high.round(),
+            "low": low.round(),
+            "close": close.round(),
+            "volume": rng.integers(100_000, 1_000_000, n_days),
+        }
+    )
+
+
+def test_simulate_matches_breakout_rules():
+    open_ = np.array([100.0, 100.0, 100.0])
+    high = np.array([110.0, 106.0, 103.0])
+    low = np.array([90.0, 99.0, 95.0])
+    close = np.array([100.0, 104.0, 96.0])
+    sim = simulate_breakout_days(
+        open_,
+        high,
+        low,
+        close,
+        k_value=0.5,
+        stop_loss_pct=-0.03,
+        take_profit_pct=0.05,
+        commission=0.0,
+        slippage=0.0,
+    )
+    # 2일차: 목표가 100 + 20×0.5 = 110 → 고가 106 미돌파
+    assert not sim["traded"][1]
+    assert sim["target"][1] == 110.0
+    assert not sim["traded"][0]
+
+
+def test_history_store_append_and_checksum(tmp_path):
+    store = HistoryStore(tmp_path)
+    bars = make_bars(10)
+    store.save("069500", bars.iloc[:8])
+    before = store.checksum("069500")
+    assert store.last_date("069500") == bars["date"].iloc[7]
+
+    added = store.append("069500", bars.iloc[8:].to_dict("records"))
+    assert added == 2
+    assert len(store.load("069500")) == 10
+    assert store.checksum("069500") != before
+
+
+def test_cache_skips_recomputation(tmp_path):
+    store = HistoryStore(tmp_path / "hist")
+    store.save("069500", make_bars())
+    cache = BacktestCache(tmp_path / "cache")
+
+    grid = {"k_value": [0.4, 0.5, 0.6], "stop_loss_pct": [-0.02, -0.03]}
+    first = run_parameter_sweep(store, "069500", grid, cache=cache)
+    assert cache.misses == 6 and cache.hits == 0
+
+    second = run_parameter_sweep(store, "069500", grid, cache=cache)
+    assert cache.hits == 6
+    assert [r["metrics"] for r in first] == [r["metrics"] for r in second]
+
+    # 데이터 파일이 바뀌면 새 키
+    store.append("069500", make_bars(301).iloc[-1:])
+    run_parameter_sweep(store, "069500", {"k_value": [0.5]}, cache=cache)
+    assert cache.misses == 7
+
+
+def test_cached_result_round_trip(tmp_path):
+    store = HistoryStore(tmp_path / "hist")
+    store.save("005930", make_bars(seed=3))
+    cache = BacktestCache(tmp_path / "cache")
+
+    fresh = backtest_symbol(store, "005930", {"k_value": 0.5}, cache=cache)
+    cached = backtest_symbol(store, "005930", {"k_value": 0.5}, cache=cache)
+    np.testing.assert_allclose(fresh["equity"], cached["equity"])
+    assert list(cached["dates"]) == list(fresh["dates"])
+    assert cached["metrics"] == fresh["metrics"]
+
+
+def test_lru_eviction_respects_size_cap(tmp_path):
+    bars = make_bars()
+    result = run_breakout_backtest(bars)
+    cache = BacktestCache(tmp_path / "cache", max_bytes=10**9)
+    cache.put("a" * 64, result)
+    entry_size = cache.total_bytes
+
+    cache.max_bytes = entry_size * 2 + entry_size // 2
+    cache.put("b" * 64, result)
+    cache.get("a" * 64)  # a를 최근 사용으로
+    cache.put("c" * 64, result)
+
+    assert ("a" * 64) in cache and ("c" * 64) in cache
+    assert ("b" * 64) not in cache
+    assert cache.total_bytes <= cache.max_bytes
+
+
+def test_walk_forward_reuses_cache(tmp_path):
+    store = HistoryStore(tmp_path / "hist")
+    store.save("069500", make_bars(400))
+    cache = BacktestCache(tmp_path / "cache")
+    grid = {"k_value": [0.4, 0.6]}
+
+    result = walk_forward(store, "069500", grid, train_days=120, test_days=60, cache=cache)
+    assert len(result["windows"]) >= 3
+    misses = cache.misses
+
+    walk_forward(store, "069500", grid, train_days=120, test_days=60, cache=cache)
+    assert cache.misses == misses
+
+
+def test_cache_key_changes_with_code_version():
+    a = make_cache_key("069500", {"k_value": 0.5}, None, None, "abc", code_version="v1")
+    b = make_cache_key("069500", {"k_value": 0.5}, None, None, "abc", code_version="v2")
+    assert a != b
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+KIS 대역 · 벤치마크 기록/비교 테스트
+
+Usage:
+    python -m pytest tests/test_benchmarks.py -q
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.harness import (
+    append_history,
+    compare,
+    find_record,
+    load_history,
+    make_record,
+    measure,
+)
+from benchmarks.kis_standin import KISStandIn
+from skills.trading_core.clock import FixedClock, use_clock
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.graph_builder import build_trading_graph
+from skills.trading_core.graph.state import create_initial_state
+
+
+def test_standin_runs_real_kis_call_path():
+    standin = KISStandIn(seed=1, cash=10_000_000)
+    previous = nodes.KIS_AVAILABLE
+    with standin.install(nodes), use_clock(FixedClock(datetime(2025, 1, 6, 10, 0))):
+        state = create_initial_state(symbol="069500", initial_capital=10_000_000, env_mode="demo")
+        result = build_trading_graph().invoke(state)
+
+        buy = nodes._call_order_cash("demo", "buy", "069500", qty=3, price=30000)
+        assert buy["success"]
+        output1, output2 = nodes._call_inquire_balance("demo")
+
+    assert nodes.KIS_AVAILABLE is previous
+    assert result["current_price"] > 0 and result["yesterday_high"] > 0
+    assert output1[0]["pdno"] == "069500" and int(output1[0]["hldg_qty"]) >= 3
+    assert standin.calls >= 4
+
+
+def test_standin_rejects_order_over_cash():
+    standin = KISStandIn(cash=100_000)
+    with standin.install(nodes):
+        result = nodes._call_order_cash("demo", "buy", "069500", qty=10, price=30000)
+    assert not result["success"]
+    assert standin.cash == 100_000
+
+
+def test_compare_flags_regressions(tmp_path):
+    timing = measure(lambda: sum(range(100)), repeat=3, min_time=0.001)
+    assert timing["median"] > 0 and timing["number"] >= 1
+
+    def record(value, label):
+        stats = {
+            "min": value,
+            "median": value,
+            "mean": value,
+            "stdev": 0.0,
+            "number": 1,
+            "repeat": 1,
+        }
+        return make_record({"a": stats, "b": dict(stats, median=1.0)}, label)
+
+    history_path = tmp_path / "history.jsonl"
+    append_history(record(1.0, "base"), history_path)
+    append_history(record(1.25, "head"), history_path)
+    history = load_history(history_path)
+
+    assert find_record(history, "base")["label"] == "base"
+    rows = {row["name"]: row for row in compare(history[-2], history[-1], threshold=0.10)}
+    assert rows["a"]["status"] == "regression"
+    assert rows["b"]["status"] == "ok"
+    assert compare(history[-2], history[-1], threshold=0.30)[0]["status"] == "ok"
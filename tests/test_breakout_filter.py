@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+돌파 필터 (누적 거래량 · 돌파 강도) 테스트
+
+Usage:
+    python -m pytest tests/test_breakout_filter.py -q
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from skills.trading_core.backtest.engine import run_breakout_backtest, simulate_breakout_days
+from skills.trading_core.backtest.incremental import IncrementalBacktester
+from skills.trading_core.clock import FixedClock, use_clock
+from skills.trading_core.data.history_store import HistoryStore
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.graph.state import create_initial_state
+from skills.trading_core.price import to_won_array
+from skills.trading_core.strategies.breakout_etf import BreakoutStrategy
+from skills.trading_core.strategies.intraday_tape import IntradayTape
+from tests.test_backtest_cache import make_bars
+
+TODAY = "20250106"
+
+
+def test_validate_breakout_and_tape():
+    strategy = BreakoutStrategy()
+    assert strategy.validate_breakout(30_300, 30_000, 200_000) == (True, "유효한 돌파")
+    assert strategy.validate_breakout(30_299, 30_000, 200_000)[1].startswith("돌파 강도 약함")
+    assert strategy.validate_breakout(29_999, 30_000, 200_000) == (False, "목표가 미돌파")
+    assert strategy.validate_breakout(30_300, 30_000, 99_999)[1].startswith("거래량 부족")
+    assert strategy.validate_breakout(30_000, 30_000, 0, min_volume=0, min_breakout_strength=0.0)[0]
+
+    tape = IntradayTape()
+    assert tape.volume("069500", TODAY) is None
+    tape.sync("069500", 30_100, 50_000, TODAY)
+    tape.on_tick("069500", 30_200, 300, TODAY)
+    assert tape.on_tick("069500", 30_350, 200, TODAY) == 50_500
+    assert tape.last_price("069500", TODAY) == 30_350
+    assert tape.breakout_strength("069500", 30_000, TODAY) == pytest.approx(350 / 30_000)
+    # 현재가 조회 누적 거래량은 거래소 집계 값으로 덮어씀
+    assert tape.sync("069500", 30_300, 51_000, TODAY) == 51_000
+    # 일자가 바뀌면 새로 시작
+    assert tape.volume("069500", "20250107") is None
+    assert tape.on_tick("069500", 30_000, 10, "20250107") == 10
+
+
+def test_generate_signal_filters_with_tape_volume():
+    state = create_initial_state(
+        symbol="069500",
+        initial_capital=10_000_000,
+        env_mode="demo",
+        min_volume=100_000,
+        min_breakout_strength=0.01,
+    )
+    state.update(
+        {
+            "current_price": 30_400,
+            "target_price": 30_000,
+            "cash_balance": 10_000_000,
+            "today_volume": 90_000,
+        }
+    )
+
+    tape = IntradayTape()
+    context = TradingContext(intraday_tape=tape)
+    with use_clock(FixedClock(datetime(2025, 1, 6, 10, 0))):
+        # 테이프가 비어 있으면 현재가 조회 시점의 누적 거래량 사용
+        assert not nodes.generate_signal_node(state, context)["should_buy"]
+
+        # 틱으로 누적 거래량이 하한을 넘으면 추가 조회 없이 통과
+        tape.sync("069500", 30_400, 90_000, TODAY)
+        for _ in range(20):
+            tape.on_tick("069500", 30_400, 500, TODAY)
+        assert nodes.generate_signal_node(state, context)["should_buy"]
+
+        # 최근 체결가가 목표가 +1% 아래로 밀리면 약한 돌파로 거름
+        tape.on_tick("069500", 30_250, 100, TODAY)
+        assert not nodes.generate_signal_node(state, context)["should_buy"]
+
+
+def test_backtester_filter_matches_scalar_rules(tmp_path):
+    bars = make_bars(300, seed=4)
+    open_, high, low, close = (
+        to_won_array(bars[c].to_numpy()) for c in ("open", "high", "low", "close")
+    )
+    volume = bars["volume"].to_numpy()
+    sim = simulate_breakout_days(
+        open_,
+        high,
+        low,
+        close,
+        k_value=0.5,
+        volume=volume,
+        min_volume=300_000,
+        min_breakout_strength=0.01,
+    )
+
+    # 고가에서 본 실전 필터 결과와 같은 날만 거래 (당일 거래량은 장중 누적의 상한)
+    strategy = BreakoutStrategy()
+    for i in range(1, len(bars)):
+        expected = strategy.validate_breakout(
+            int(high[i]),
+            int(sim["target"][i]),
+            int(volume[i]),
+            min_volume=300_000,
+            min_breakout_strength=0.01,
+        )[0]
+        assert sim["traded"][i] == expected, i
+    assert sim["filtered"].sum() > 0
+    assert (sim["entry"][sim["traded"]] >= sim["target"][sim["traded"]] * 1.01).all()
+
+    params = {"min_volume": 300_000, "min_breakout_strength": 0.01}
+    filtered = run_breakout_backtest(bars, params)["metrics"]
+    unfiltered = run_breakout_backtest(bars)["metrics"]
+    assert unfiltered["n_filtered"] == 0
+    assert filtered["n_trades"] + filtered["n_filtered"] == unfiltered["n_trades"]
+
+    # 증분 백테스트도 같은 필터
+    store = HistoryStore(tmp_path / "hist")
+    store.save("069500", bars.iloc[:200])
+    backtester = IncrementalBacktester(store, tmp_path / "state")
+    backtester.update("069500", params)
+    store.append("069500", bars.iloc[200:])
+    incremental = backtester.update("069500", params)["metrics"]
+    for key, value in filtered.items():
+        assert incremental[key] == pytest.approx(value, rel=1e-9, abs=1e-12), key
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+시계 주입 및 가상 시계 리플레이 테스트
+
+Usage:
+    python -m pytest tests/test_clock.py -q
+"""
+
+import sys
+import time as _time
+from datetime import datetime, time
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import skills.trading_core.graph.nodes as nodes
+from skills.trading_core.clock import (
+    Clock,
+    FixedClock,
+    VirtualClock,
+    AcceleratedClock,
+    get_clock,
+    use_clock,
+)
+from skills.trading_core.graph.graph_builder import build_trading_graph
+from skills.trading_core.graph.state import create_initial_state
+from skills.trading_core.scheduler import TradingScheduler
+from skills.trading_core.strategies.breakout_etf import BreakoutStrategy
+
+SESSION_DAY = datetime(2024, 3, 4)
+
+
+def test_strategy_uses_injected_clock():
+    """주입된 시계로 진입 시간/장 마감 청산을 판단하는지 확인"""
+    clock = FixedClock(datetime(2024, 3, 4, 9, 0))
+    strategy = BreakoutStrategy(clock=clock)
+
+    ok, reason = strategy.should_enter(current_price=10100, target_price=10000)
+    assert not ok and reason == "진입 시간이 아님"
+
+    clock.set(datetime(2024, 3, 4, 10, 0))
+    ok, _ = strategy.should_enter(current_price=10100, target_price=10000)
+    assert ok
+
+    clock.set(datetime(2024, 3, 4, 15, 25))
+    should_exit, reason = strategy.should_exit(entry_price=10000, current_price=10010)
+    assert should_exit and reason.startswith("장 마감 청산")
+
+
+def test_virtual_clock_sleep_is_instant():
+    """VirtualClock.sleep은 실제로 대기하지 않고 시각만 전진"""
+    clock = VirtualClock(datetime(2024, 3, 4, 9, 0))
+    started = _time.perf_counter()
+    clock.sleep(3600)
+    assert _time.perf_counter() - started < 0.1
+    assert clock.now() == datetime(2024, 3, 4, 10, 0)
+
+
+def test_accelerated_clock_runs_faster():
+    """AcceleratedClock은 실제 경과 시간 × speed 만큼 흐름"""
+    clock = AcceleratedClock(datetime(2024, 3, 4, 9, 0), speed=3600.0)
+    clock.sleep(60)  # 가상 60초 = 실제 약 17ms
+    assert clock.now() >= datetime(2024, 3, 4, 9, 1)
+
+
+def test_use_clock_restores_previous():
+    previous = get_clock()
+    with use_clock(FixedClock(datetime(2024, 3, 4, 9, 0))) as clock:
+        assert get_clock() is clock
+    assert get_clock() is previous
+
+
+def test_clock_subclass_must_implement_now_and_sleep():
+    """now/sleep을 구현하지 않은 시계는 만들 수 없음"""
+
+    class NowOnly(Clock):
+        def now(self) -> datetime:
+            return SESSION_DAY
+
+    with pytest.raises(TypeError):
+        Clock()
+    with pytest.raises(TypeError):
+        NowOnly()
+
+
+def _install_recorded_day(monkeypatch):
+    """분 단위로 기록된 세션을 시계 기준으로 반환하는 KIS 대역 설치"""
+
+    def recorded_price(env_mode, symbol, limiter=None):
+        now = get_clock().now()
+        minutes = (now.hour - 9) * 60 + now.minute
+        price = 10000 + minutes * 5  # 장중 꾸준한 상승
+        return {
+            'current_price': price,
+            'open': 10000,
+            'high': price,
+            'low': 10000,
+            'volume': 1000 * (minutes + 1),
+            'change': 0,
+            'change_pct': 0.0,
+        }
+
+    def recorded_chart(env_mode, symbol, days=2, limiter=None):
+        return [
+            {
+                'date': '20240304',
+                'open': 10000,
+                'high': 10000,
+                'low': 10000,
+                'close': 10000,
+                'volume': 0,
+            },
+            {
+                'date': '20240229',
+                'open': 9900,
+                'high': 10200,
+                'low': 9800,
+                'close': 10000,
+                'volume': 500000,
+            },
+        ]
+
+    def fake_order(env_mode, order_type, symbol, qty, price=0, order_dvsn="00", limiter=None):
+        return {
+            'success': True,
+            'order_no': f"{order_type}-{get_clock().now():%H%M}",
+            'message': 'ok',
+        }
+
+    def fake_balance(env_mode, limiter=None):
+        return [], [{'tot_evlu_amt': '10000000'}]
+
+    monkeypatch.setattr(nodes, "KIS_AVAILABLE", True)
+    monkeypatch.setattr(nodes, "_init_kis_auth", lambda env_mode="demo": True)
+    monkeypatch.setattr(nodes, "_call_inquire_price", recorded_price)
+    monkeypatch.setattr(nodes, "_call_inquire_daily_chart", recorded_chart)
+    monkeypatch.setattr(nodes, "_call_order_cash", fake_order)
+    monkeypatch.setattr(nodes, "_call_inquire_balance", fake_balance)
+
+
+def _replay_session():
+    clock = VirtualClock(datetime.combine(SESSION_DAY, time(8, 50)))
+    scheduler = TradingScheduler(build_trading_graph(), clock=clock, interval_seconds=60)
+    with use_clock(clock):
+        state = create_initial_state(symbol="069500", initial_capital=10000000)
+    trace = []
+    scheduler.on_iteration = lambda s: trace.append(
+        (s["timestamp"], s["position_status"], s["last_order_no"])
+    )
+    final_state = scheduler.run(state)
+    return final_state, trace, scheduler.iterations
+
+
+def test_recorded_day_replays_fast_and_deterministically(monkeypatch):
+    _install_recorded_day(monkeypatch)
+
+    started = _time.perf_counter()
+    first_state, first_trace, iterations = _replay_session()
+    elapsed = _time.perf_counter() - started
+
+    # 09:00 ~ 15:29 매분 1회 = 390회, 실제 대기 없이 수 초 내 완료
+    assert iterations == 390
+    assert elapsed < 30
+
+    # 09:05 이후 목표가(10,000 + 400×0.5 = 10,200) 돌파 시 매수, 익절(+5%) 시 매도
+    assert first_state["total_trades"] >= 1
+    assert first_trace[0][0] == "2024-03-04T09:00:00"
+    assert first_trace[-1][0] == "2024-03-04T15:29:00"
+
+    second_state, second_trace, _ = _replay_session()
+    assert first_trace == second_trace
+    assert first_state["realized_pnl"] == second_state["realized_pnl"]
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+증분 일일 백테스트 테스트
+
+Usage:
+    python -m pytest tests/test_incremental_backtest.py -q
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from skills.trading_core.backtest.engine import run_breakout_backtest
+from skills.trading_core.backtest.incremental import IncrementalBacktester
+from skills.trading_core.data.history_store import HistoryStore
+from tests.test_backtest_cache import make_bars
+
+
+def test_incremental_matches_full_recomputation(tmp_path):
+    bars = make_bars(500, seed=11)
+    store = HistoryStore(tmp_path / "hist")
+    store.save("069500", bars.iloc[:400])
+    backtester = IncrementalBacktester(store, tmp_path / "state")
+    params = {"k_value": 0.5}
+
+    first = backtester.update("069500", params)
+    assert first["new_bars"] == 400
+
+    # 하루씩 추가하며 갱신
+    for i in range(400, 500):
+        store.append("069500", bars.iloc[i : i + 1])
+        result = backtester.update("069500", params)
+        assert result["new_bars"] == 1
+
+    full = run_breakout_backtest(bars, params)["metrics"]
+    incremental = result["metrics"]
+    for key, value in full.items():
+        assert incremental[key] == pytest.approx(value, rel=1e-9, abs=1e-12), key
+
+
+def test_no_new_bars_is_noop(tmp_path):
+    store = HistoryStore(tmp_path / "hist")
+    store.save("069500", make_bars(50))
+    backtester = IncrementalBacktester(store, tmp_path / "state")
+
+    backtester.update("069500")
+    again = backtester.update("069500")
+    assert again["new_bars"] == 0
+
+
+def test_rewritten_file_falls_back_to_date_filter(tmp_path):
+    bars = make_bars(120, seed=5)
+    store = HistoryStore(tmp_path / "hist")
+    store.save("069500", bars.iloc[:100])
+    backtester = IncrementalBacktester(store, tmp_path / "state")
+    backtester.update("069500")
+
+    # 과거 행 정정 + 신규 행 → 전체 재작성 (오프셋 무효)
+    corrected = bars.iloc[95:110].copy()
+    corrected.loc[corrected.index[0], "volume"] += 1
+    store.append("069500", corrected)
+
+    result = backtester.update("069500")
+    assert result["new_bars"] == 10
+    assert result["snapshot"]["last_date"] == bars["date"].iloc[109]
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+증분 지표 엔진 테스트
+
+Usage:
+    python -m pytest tests/test_indicators.py -q
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.kis_standin import KISStandIn
+from skills.trading_core.clock import FixedClock, use_clock
+from skills.trading_core.data.history_store import HistoryStore
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.graph.state import create_initial_state
+from skills.trading_core.strategies.indicators import IndicatorEngine, RollingWindow
+from tests.test_backtest_cache import make_bars
+
+
+def reference(bars: pd.DataFrame) -> dict:
+    """pandas rolling으로 계산한 마지막 날 지표"""
+    prev_close = bars["close"].shift(1)
+    tr = pd.concat(
+        [
+            bars["high"] - bars["low"],
+            (bars["high"] - prev_close).abs(),
+            (bars["low"] - prev_close).abs(),
+        ],
+        axis=1,
+    ).max(axis=1)
+    noise = 1 - (bars["close"] - bars["open"]).abs() / (bars["high"] - bars["low"])
+    return {
+        "atr": tr.rolling(14).mean().iloc[-1],
+        "volatility": bars["close"].pct_change().rolling(20).std().iloc[-1],
+        "noise_avg": noise.rolling(20).mean().iloc[-1],
+        "ma5": bars["close"].rolling(5).mean().iloc[-1],
+        "ma20": bars["close"].rolling(20).mean().iloc[-1],
+    }
+
+
+def test_incremental_values_match_rolling_reference():
+    bars = make_bars(3000, seed=5)  # 누적합 재동기화 구간 포함
+    for col in ("open", "high", "low", "close"):
+        bars[col] = bars[col].astype(np.int64)
+    engine = IndicatorEngine()
+    for row in bars.itertuples():
+        engine.update_bar("069500", row.open, row.high, row.low, row.close, row.date)
+
+    values = engine.values("069500")
+    for key, expected in reference(bars).items():
+        assert values[key] == pytest.approx(expected, rel=1e-9), key
+    assert values["prev_range"] == bars["high"].iloc[-1] - bars["low"].iloc[-1]
+
+
+def test_live_tick_values_and_duplicate_bars():
+    engine = IndicatorEngine(ma_periods=(3,))
+    for date, close in (("20250101", 100), ("20250102", 110), ("20250103", 120)):
+        engine.update_bar("A", close, close + 5, close - 5, close, date)
+    engine.update_bar("A", 999, 999, 999, 999, "20250102")  # 이미 반영한 날짜는 무시
+    assert engine.values("A")["ma3"] == 110
+
+    engine.update_tick("A", 150, open_=125)
+    engine.update_tick("A", 118)
+    values = engine.values("A")
+    assert values["ma3_live"] == pytest.approx((110 + 120 + 118) / 3)
+    assert values["today_range"] == 150 - 118
+
+    window = RollingWindow(3)
+    for v in (1.0, 2.0, 3.0, 4.0):
+        window.push(v)
+    assert window.values() == [2.0, 3.0, 4.0] and window.oldest() == 2.0
+
+
+def test_warm_start_and_node_exposure(tmp_path):
+    store = HistoryStore(tmp_path)
+    bars = make_bars(120, seed=2)
+    store.save("069500", bars)
+
+    engine = IndicatorEngine()
+    assert engine.warm_start(store, ["069500", "missing"]) == 1
+    full = IndicatorEngine()
+    full.update_bars("069500", store.load("069500").to_dict("records"))
+    warm, reference_values = engine.values("069500"), full.values("069500")
+    assert warm.pop("bars") == engine.get("069500").lookback
+    reference_values.pop("bars")
+    assert warm == pytest.approx(reference_values)
+
+    # 노드는 상태의 indicators로 지표를 노출
+    with KISStandIn(seed=0).install(nodes), use_clock(FixedClock(datetime(2025, 1, 6, 10, 0))):
+        state = create_initial_state(symbol="069500", initial_capital=10_000_000, env_mode="demo")
+        updates = nodes.fetch_market_data_node(state, TradingContext())
+
+    indicators = updates["indicators"]
+    assert indicators["bars"] >= 2
+    assert indicators["prev_range"] == updates["yesterday_high"] - updates["yesterday_low"]
+    assert indicators["ma5_live"] is not None
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+킬 스위치 · 우선순위 속도 제한 테스트
+
+Usage:
+    python -m pytest tests/test_kill_switch.py -q
+"""
+
+import os
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.kis_standin import KISStandIn
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.graph.state import create_initial_state
+from skills.trading_core.kill_switch import KillSwitch, install_signal_handler
+from skills.trading_core.rate_limit import PRIORITY_FLATTEN, PRIORITY_QUERY, PriorityRateLimiter
+
+
+def _standin(positions, **kwargs):
+    standin = KISStandIn(seed=0, cash=1_000_000, **kwargs)
+    for i in range(positions):
+        standin.holdings[f"{i:06d}"] = {"qty": 10, "avg_price": 30_000.0}
+    return standin
+
+
+def test_limiter_spaces_calls_and_serves_priority_first():
+    limiter = PriorityRateLimiter(rate=50)
+    started = time.perf_counter()
+    for _ in range(6):
+        limiter.acquire()
+    assert time.perf_counter() - started >= 5 / 50 * 0.9 and limiter.granted == 6
+
+    # 토큰이 없는 동안 조회가 먼저 기다리고 있어도 청산 호출이 먼저 나감
+    limiter = PriorityRateLimiter(rate=10)
+    limiter.acquire()
+    served = []
+
+    def call(name, priority):
+        limiter.acquire(priority)
+        served.append(name)
+
+    query = threading.Thread(target=call, args=("query", PRIORITY_QUERY))
+    flatten = threading.Thread(target=call, args=("flatten", PRIORITY_FLATTEN))
+    query.start()
+    time.sleep(0.01)
+    flatten.start()
+    query.join()
+    flatten.join()
+    assert served == ["flatten", "query"]
+
+
+def test_flatten_cancels_open_orders_and_sells_everything():
+    standin = _standin(20, latency=0.02, fill_orders=False, rate_limit=30)
+    with standin.install(nodes):
+        for i in range(3):
+            assert nodes._call_order_cash("demo", "sell", f"{i:06d}", 4, 31_000)["success"]
+        assert nodes._call_order_cash("demo", "buy", "069500", 10, 30_000)["success"]
+        assert standin.cash == 700_000 and len(standin.open_orders) == 4
+        standin.fill_orders = True
+
+        context = TradingContext(rate_limiter=PriorityRateLimiter(rate=27))
+        report = KillSwitch(max_workers=8, context=context).flatten_all("테스트 청산")
+
+        # 청산 후에는 같은 컨텍스트의 매매 루프가 새 주문 없이 멈춤
+        state = create_initial_state(symbol="069500", initial_capital=1_000_000, env_mode="demo")
+        state.update({"should_buy": True, "order_qty": 1, "current_price": 30_000})
+        halted = nodes.risk_check_node(state, context)
+
+    assert report.flat and standin.rejected == 0
+    assert [(o.kind, o.qty) for o in report.orders[:4]] == [("취소", 4)] * 3 + [("취소", 10)]
+    assert sorted(o.symbol for o in report.orders[4:]) == [f"{i:06d}" for i in range(20)]
+    assert all(o.kind == "매도" and o.qty == 10 and o.order_no for o in report.orders[4:])
+    assert not standin.open_orders and not any(h["qty"] for h in standin.holdings.values())
+    # 호출 26회 (미체결 1 + 취소 4 + 잔고 1 + 매도 20)를 초당 27회로
+    assert standin.calls == 4 + 26 and report.time_to_flat < 26 / 27 + 0.5
+    assert report.to_dict()["orders"][0]["kind"] == "취소"
+    assert (
+        halted["trading_stopped"]
+        and halted["stop_reason"] == "테스트 청산"
+        and not halted["should_buy"]
+    )
+
+    # 속도 제한이 없으면 매도는 동시 전송 (직렬이면 20 × 50ms)
+    standin = _standin(20, latency=0.05)
+    with standin.install(nodes):
+        report = KillSwitch(max_workers=8).flatten_all("테스트 청산")
+    assert report.flat and len(report.orders) == 20 and report.time_to_flat < 0.6
+
+
+def test_flatten_reports_unread_holdings_past_page_limit():
+    # 잔고가 최대 페이지 수(50)를 넘으면 읽은 종목만 매도하고 미완료로 보고
+    standin = _standin(52, page_size=1)
+    with standin.install(nodes):
+        report = KillSwitch(max_workers=8).flatten_all("테스트 청산")
+    assert not report.flat and "50페이지 초과" in report.error
+    assert len(report.orders) == 50 and all(o.success for o in report.orders)
+    assert sorted(s for s, h in standin.holdings.items() if h["qty"]) == ["000050", "000051"]
+
+
+def test_signal_handler_and_web_endpoint(monkeypatch):
+    from apps import flask_app
+
+    standin = _standin(5)
+    context = TradingContext()
+    kill_switch = KillSwitch(context=context)
+    previous = install_signal_handler(kill_switch, signal.SIGUSR1)
+    try:
+        with standin.install(nodes):
+            os.kill(os.getpid(), signal.SIGUSR1)
+            time.sleep(0.01)  # 처리기는 메인 스레드의 다음 바이트코드에서 실행
+            kill_switch.join(5)
+            assert kill_switch.last_report.reason == "신호 SIGUSR1" and kill_switch.last_report.flat
+            assert context.halt_reason == "신호 SIGUSR1"
+            assert not any(h["qty"] for h in standin.holdings.values())
+
+            standin.holdings["069500"] = {"qty": 7, "avg_price": 30_000.0}
+            monkeypatch.setattr(flask_app, "kill_switch", kill_switch)
+            response = flask_app.app.test_client().post(
+                "/api/kill-switch", json={"reason": "웹 청산"}
+            )
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+
+    data = response.get_json()
+    assert response.status_code == 200 and data["success"] and data["reason"] == "웹 청산"
+    assert [(o["symbol"], o["kind"], o["qty"], o["success"]) for o in data["orders"]] == [
+        ("069500", "매도", 7, True)
+    ]
+    assert standin.holdings["069500"]["qty"] == 0
+
+
+def test_web_kill_switch_halts_the_app_graph(monkeypatch):
+    from apps import flask_app
+
+    built = []
+    context = flask_app.create_trading_context({"api": {"rate_limit_enabled": True}})
+    monkeypatch.setattr(flask_app, "trading_context", context)
+    monkeypatch.setattr(flask_app, "kill_switch", None)
+    monkeypatch.setattr(flask_app, "trading_graph", None)
+    graph = SimpleNamespace(invoke=lambda state: state)
+    monkeypatch.setattr(flask_app, "build_trading_graph", lambda ctx: built.append(ctx) or graph)
+    standin = _standin(2)
+    with standin.install(nodes):
+        client = flask_app.app.test_client()
+        assert client.post("/api/run").status_code == 200
+        response = client.post("/api/kill-switch", json={"reason": "웹 청산"})
+
+    # 그래프와 킬 스위치가 같은 컨텍스트 (속도 제한기 · 중단 사유 공유)
+    assert response.status_code == 200 and response.get_json()["success"]
+    assert built == [context] and flask_app.kill_switch.context is context
+    assert context.halt_reason == "웹 청산" and context.rate_limiter.granted == standin.calls
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+공유 메모리 시세 버스 테스트
+
+Usage:
+    python -m pytest tests/test_market_bus.py -q
+"""
+
+import logging
+import multiprocessing
+import sys
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from apps.market_bus_app import run_publisher
+from benchmarks.kis_standin import KISStandIn
+from skills.trading_core.clock import FixedClock, use_clock
+from skills.trading_core.data.market_bus import MarketBus, MarketBusPublisher
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.graph.state import create_initial_state
+
+NOW = datetime(2025, 1, 6, 10, 0)
+TODAY = "20250106"
+PREV = {
+    "date": "20250103",
+    "open": 29_800,
+    "high": 30_400,
+    "low": 29_600,
+    "close": 30_000,
+    "volume": 500_000,
+}
+
+
+def _quote(value):
+    return {"current_price": value, "open": value, "high": value, "low": value, "volume": value}
+
+
+def test_publish_and_read_rules(tmp_path):
+    path = tmp_path / "bus.npy"
+    with use_clock(FixedClock(NOW)) as clock:
+        publisher = MarketBusPublisher(["069500", "005930"], path)
+        bus = MarketBus(path, max_age=5)
+        assert len(bus) == 2 and bus.get("005930") is None and bus.get("999999") is None
+
+        publisher.publish_quote(
+            "069500", {**_quote(30_150), "open": 30_000, "change": 150, "change_pct": 0.5}
+        )
+        assert bus.market_data("069500", TODAY) is None  # 전일 일봉 미게시
+        publisher.publish_prev_bar("069500", PREV)
+
+        price_data, chart = bus.market_data("069500", TODAY)
+        assert price_data["current_price"] == 30_150 and price_data["open"] == 30_000
+        assert chart[1] == PREV and chart[0]["date"] == TODAY
+        row = bus.get("069500")
+        assert row["symbol"] == "069500" and row["seq"] == 4 and row["change"] == 150
+
+        # 오래된 시세 · 다른 일자는 쓰지 않음
+        clock.set(datetime(2025, 1, 6, 10, 0, 6))
+        assert bus.market_data("069500", TODAY) is None
+        assert bus.market_data("069500", TODAY, max_age=10) is not None
+        assert bus.market_data("069500", "20250107", max_age=10) is None
+    assert [row["symbol"] for row in MarketBus.open(path).records()] == ["069500"]
+    assert MarketBus.open(tmp_path / "missing.npy") is None
+
+
+def test_restarted_publisher_keeps_readers(tmp_path):
+    path = tmp_path / "bus.npy"
+    with use_clock(FixedClock(NOW)):
+        MarketBusPublisher(["069500", "005930"], path).publish_quote("069500", _quote(30_000))
+        bus = MarketBus(path, max_age=5)
+        inode = path.stat().st_ino
+
+        # 같은 종목 구성이면 기존 파일에 이어서 씀 (파일 교체 없음)
+        publisher = MarketBusPublisher.open(["005930", "069500"], path)
+        publisher.publish_quote("069500", _quote(30_100))
+        assert path.stat().st_ino == inode and bus.get("069500")["price"] == 30_100
+
+        # 종목 구성이 바뀌면 새 파일로 교체되고, 읽는 쪽은 inode 변경을 보고 다시 엶
+        publisher = MarketBusPublisher.open(["069500", "229200"], path)
+        publisher.publish_quote("229200", _quote(9_000))
+        assert path.stat().st_ino != inode
+        assert "229200" in bus and "005930" not in bus
+        assert bus.get("229200")["price"] == 9_000 and bus.get("069500") is None
+
+
+def _hammer(path, n):
+    publisher = MarketBusPublisher.attach(path)
+    for i in range(1, n + 1):
+        publisher.publish_quote("069500", _quote(i))
+
+
+def test_readers_never_see_torn_rows(tmp_path):
+    path = tmp_path / "bus.npy"
+    MarketBusPublisher(["069500"], path)
+    bus = MarketBus(path)
+    writer = multiprocessing.Process(target=_hammer, args=(path, 20_000))
+    writer.start()
+    seen = set()
+    try:
+        while writer.is_alive():
+            row = bus.get("069500")
+            if row is None:
+                continue
+            assert row["price"] == row["open"] == row["high"] == row["low"] == row["volume"], row
+            assert row["seq"] % 2 == 0
+            seen.add(row["price"])
+    finally:
+        writer.join()
+    assert writer.exitcode == 0 and len(seen) > 1
+    assert bus.get("069500")["price"] == 20_000 and bus.get("069500")["seq"] == 40_000
+
+
+def test_fetch_node_reads_bus_without_kis_calls(tmp_path):
+    standin = KISStandIn(seed=4)
+    state = create_initial_state(symbol="069500", initial_capital=10_000_000, env_mode="demo")
+    with standin.install(nodes), use_clock(FixedClock(NOW)) as clock:
+        publisher = MarketBusPublisher(["069500"], tmp_path / "bus.npy")
+        assert run_publisher(publisher, "demo", logging.getLogger("test"), max_cycles=1) == 1
+        published_calls = standin.calls
+        context = TradingContext(market_bus=MarketBus(tmp_path / "bus.npy", max_age=5))
+
+        updates = nodes.fetch_market_data_node(state, context)
+        assert standin.calls == published_calls  # 네트워크(대역) 호출 없음
+        row = context.market_bus.get("069500")
+        assert updates["current_price"] == row["price"] and updates["today_volume"] == row["volume"]
+        assert (
+            updates["yesterday_high"] == row["prev_high"]
+            and updates["yesterday_close"] == row["prev_close"]
+        )
+
+        # 게시가 끊겨 오래되면 직접 조회로 대체
+        clock.set(datetime(2025, 1, 6, 10, 1))
+        nodes.fetch_market_data_node(state, context)
+        assert standin.calls > published_calls
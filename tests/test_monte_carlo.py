@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+몬테카를로 부트스트랩 테스트
+
+Usage:
+    python -m pytest tests/test_monte_carlo.py -q
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from skills.trading_core.backtest.monte_carlo import (
+    MonteCarloSimulator,
+    block_bootstrap_indices,
+    load_trade_returns,
+)
+
+
+def test_block_indices_are_contiguous_blocks():
+    rng = np.random.default_rng(0)
+    idx = block_bootstrap_indices(rng, n_samples=10, n_paths=4, n_steps=12, block_size=3)
+    assert idx.shape == (4, 12)
+    # 각 블록 내부는 (순환) 연속 인덱스
+    blocks = idx.reshape(4, 4, 3)
+    assert np.all((blocks[:, :, 1] - blocks[:, :, 0]) % 10 == 1)
+
+
+def test_all_winning_trades_never_breach():
+    simulator = MonteCarloSimulator(n_paths=2_000, n_months=3, chunk_size=500, seed=1)
+    result = simulator.run([0.01, 0.02, 0.005])
+    summary = result["summary"]
+    assert summary["mdd_median"] == 0.0
+    assert summary["prob_drawdown_breach"] == 0.0
+    assert summary["prob_daily_loss_breach"] == 0.0
+    assert summary["expected_monthly_return"] > 0
+    assert result["mdd"].shape == (2_000,)
+
+
+def test_losing_distribution_breaches_drawdown():
+    simulator = MonteCarloSimulator(
+        n_paths=5_000, n_months=12, position_ratio=1.0, chunk_size=1_000, seed=7
+    )
+    returns = [0.03, -0.03, -0.03, 0.02, -0.04]
+    summary = simulator.run(returns, max_drawdown=-0.20)["summary"]
+    assert summary["prob_drawdown_breach"] > 0.9
+    assert summary["mdd_p05"] <= summary["mdd_median"] <= 0
+
+
+def test_seed_is_reproducible():
+    returns = np.random.default_rng(3).normal(0.002, 0.02, 200)
+    first = MonteCarloSimulator(n_paths=1_000, seed=42).run(returns)
+    second = MonteCarloSimulator(n_paths=1_000, seed=42).run(returns)
+    np.testing.assert_array_equal(first["mdd"], second["mdd"])
+    np.testing.assert_array_equal(first["time_to_recovery"], second["time_to_recovery"])
+
+
+def test_load_trade_returns_reads_sell_records(tmp_path):
+    trades = [
+        {"action": "BUY", "price": 10000, "qty": 10},
+        {"action": "SELL", "price": 10300, "qty": 10, "pnl_pct": 0.03},
+        {"action": "SELL", "price": 9800, "qty": 10, "pnl_pct": -0.02},
+    ]
+    path = tmp_path / "trades_20240304.json"
+    path.write_text(json.dumps(trades), encoding="utf-8")
+    np.testing.assert_allclose(load_trade_returns(path), [0.03, -0.02])
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+실현 손익 원장 테스트
+
+Usage:
+    python -m pytest tests/test_pnl_ledger.py -q
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.kis_standin import KISStandIn
+from skills.trading_core.clock import FixedClock, use_clock
+from skills.trading_core.data.pnl_ledger import PnLLedger
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.graph.state import create_initial_state
+from skills.trading_core.supervisor import RiskCoordinator
+
+
+def test_aggregates_roll_by_day_week_month_and_survive_restart(tmp_path):
+    path = tmp_path / "pnl.csv"
+    ledger = PnLLedger(path)
+    ledger.record("A", "buy", 10, 10_000, ts=datetime(2025, 1, 30, 9, 10))
+    ledger.record("A", "sell", 10, 10_500, 5_000, ts=datetime(2025, 1, 30, 14, 0))  # 목 (W05)
+    ledger.record("B", "sell", 5, 9_000, -12_000, ts=datetime(2025, 1, 31, 10, 0))  # 금 (W05)
+    ledger.record("B", "sell", 5, 9_000, -3_000, ts=datetime(2025, 2, 3, 10, 0))  # 월 (W06, 2월)
+    with pytest.raises(ValueError):
+        ledger.record("A", "short", 1, 10_000)
+
+    assert ledger.daily_pnl(datetime(2025, 1, 31, 15, 0)) == -12_000
+    assert ledger.daily_pnl(datetime(2025, 2, 1, 9, 0)) == 0
+    assert ledger.weekly_pnl(datetime(2025, 2, 2, 9, 0)) == -7_000  # 일요일까지 같은 주
+    assert ledger.weekly_pnl(datetime(2025, 2, 3, 9, 0)) == -3_000
+    assert ledger.monthly_pnl(datetime(2025, 1, 2)) == -7_000
+    assert ledger.monthly_pnl(datetime(2025, 2, 28)) == -3_000
+    assert ledger.mark(10_100_000) and not ledger.mark(10_050_000) and ledger.mark(10_200_000)
+
+    # 원장 파일 끝이 잘린 채 재시작해도 나머지 행으로 복원
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("2025-02-03T11:00:00,C,sell,1,")
+    restored = PnLLedger(path)
+    now = datetime(2025, 2, 3, 15, 0)
+    assert (
+        restored.snapshot(now)
+        == ledger.snapshot(now)
+        == {
+            "daily_pnl": -3_000,
+            "weekly_pnl": -3_000,
+            "monthly_pnl": -3_000,
+            "realized_pnl": -10_000,
+            "trades": 3,
+            "peak_asset": 10_200_000,
+        }
+    )
+
+
+def test_risk_check_reads_ledger_after_restart(tmp_path):
+    now = datetime(2025, 3, 14, 10, 0)
+    ledger = PnLLedger(tmp_path / "pnl.csv")
+    ledger.record("069500", "sell", 100, 10_000, -400_000, ts=datetime(2025, 3, 3, 10, 0))
+    ledger.record("069500", "sell", 100, 10_000, -200_000, ts=datetime(2025, 3, 14, 9, 30))
+    state = create_initial_state(symbol="069500", initial_capital=10_000_000, env_mode="demo")
+
+    with use_clock(FixedClock(now)):
+        # 상태는 재시작으로 0이지만 당월 누적 -60만원 → 월간 한도 -5% (-50만원) 초과
+        context = TradingContext(pnl_ledger=PnLLedger(tmp_path / "pnl.csv", capital=10_000_000))
+        updates = nodes.risk_check_node({**state, "max_monthly_loss": -0.05}, context)
+        assert updates["trading_stopped"] and updates["stop_reason"] == "월간 손실 한도 초과"
+
+        # 재시작 전 최고 자산 기준 MDD
+        context.pnl_ledger.mark(14_000_000)
+        updates = nodes.risk_check_node({**state, "total_asset": 11_000_000}, context)
+        assert updates["stop_reason"] == "최대 낙폭(MDD) 초과"
+
+        updates = nodes.risk_check_node({**state, "total_asset": 11_000_000}, TradingContext())
+        assert not updates.get("trading_stopped")
+
+
+def test_fills_recorded_by_execute_node_and_coordinator(tmp_path):
+    with KISStandIn(seed=3).install(nodes), use_clock(FixedClock(datetime(2025, 1, 6, 10, 0))):
+        context = TradingContext(pnl_ledger=PnLLedger(tmp_path / "node.csv"))
+        state = create_initial_state(symbol="069500", initial_capital=10_000_000, env_mode="demo")
+        state.update({"should_buy": True, "order_qty": 10, "current_price": 10_000})
+        state.update(nodes.execute_order_node(state, context))
+        state.update({"should_sell": True, "current_price": 9_800})
+        state.update(nodes.execute_order_node(state, context))
+        assert context.pnl_ledger.daily_pnl() == state["daily_pnl"] == -2_000
+        assert context.pnl_ledger.trades == 1
+
+        ledger = PnLLedger(tmp_path / "coordinator.csv")
+        ledger.record("A", "sell", 1, 10_000, -30_000, ts=datetime(2025, 1, 6, 9, 5))
+        coordinator = RiskCoordinator(1_000_000, max_daily_loss=-0.05, ledger=ledger)
+        assert coordinator.daily_pnl == -30_000
+        coordinator.settle("A", "buy", 10, 10_000, -100_000, 0)
+        coordinator.settle("A", "sell", 10, 8_000, 80_000, -20_000)
+        assert ledger.daily_pnl() == -50_000 and ledger.trades == 2
+        # 원장 누적 -5만원 = 한도 -5% → 신규 주문 거절
+        assert coordinator.admit("B", "buy", 1, 10_000) == (0, "일일 손실 한도 초과")
+
+
+def test_ledger_is_scoped_by_mode_account_and_capital(tmp_path, monkeypatch):
+    monkeypatch.setattr("skills.trading_core.data.pnl_ledger.project_root", tmp_path)
+    config = {"trading": {"capital": 10_000_000}, "ledger": {"path": ""}}
+    demo_config = {"trading": {"capital": 100_000_000}}
+    demo = PnLLedger.from_config(demo_config, env_mode="demo", account="50000001")
+    demo.mark(100_000_000)
+    real = PnLLedger.from_config(config, env_mode="real", account="60000002")
+    assert demo.path == tmp_path / "data" / "ledger" / "demo" / "50000001.csv"
+    assert real.path == tmp_path / "data" / "ledger" / "real" / "60000002.csv"
+    assert real.peak_asset is None
+
+    # 같은 파일이라도 다른 운용 자본으로 기록한 최고 자산은 MDD에 쓰지 않음
+    shared = PnLLedger(tmp_path / "shared.csv", capital=100_000_000)
+    shared.mark(100_000_000)
+    reopened = PnLLedger(tmp_path / "shared.csv", capital=10_000_000)
+    assert reopened.peak_asset is None and reopened.peak_for(100_000_000) == 100_000_000
+    context = TradingContext(pnl_ledger=reopened)
+    state = create_initial_state(symbol="069500", initial_capital=10_000_000, env_mode="real")
+    assert nodes._loss_inputs(context, {**state, "total_asset": 10_000_000})[2] == 10_000_000
+    assert not nodes.risk_check_node({**state, "total_asset": 10_000_000}, context).get(
+        "trading_stopped"
+    )
+
+    # 이전 형식(capital 컬럼 없음) 원장은 복원 후 새 형식으로 다시 씀
+    legacy = tmp_path / "legacy.csv"
+    legacy.write_text("ts,symbol,side,qty,price,pnl\n2025-01-06T10:00:00,A,sell,1,10000,-500\n")
+    assert PnLLedger(legacy).trades == 1
+    assert legacy.read_text().splitlines()[0] == "ts,symbol,side,qty,price,pnl,capital"
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+다종목 포트폴리오 그래프 테스트
+
+Usage:
+    python -m pytest tests/test_portfolio_graph.py -q
+"""
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.kis_standin import KISStandIn
+from skills.trading_core.clock import FixedClock, use_clock
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.graph.graph_builder import build_portfolio_graph
+from skills.trading_core.graph.state import create_portfolio_state
+from skills.trading_core.strategies.intraday_tape import IntradayTape
+
+NOW = datetime(2025, 1, 6, 10, 0)
+
+
+def _signalled(state, symbol, price, target, qty):
+    state["symbol_states"][symbol].update(
+        {"should_buy": True, "current_price": price, "target_price": target, "order_qty": qty}
+    )
+
+
+def test_portfolio_risk_allocates_shared_cash():
+    state = create_portfolio_state(
+        ["A", "B", "C", "D"],
+        initial_capital=1_000_000,
+        max_positions=2,
+        env_mode="demo",
+        max_position_size=0.3,
+    )
+    _signalled(state, "A", 10_100, 10_000, 50)  # 강도 1%
+    _signalled(state, "B", 20_800, 20_000, 50)  # 강도 4% → 먼저 배분
+    _signalled(state, "C", 5_300, 5_000, 10)  # 강도 6% → 가장 먼저
+    state["symbol_states"]["D"].update({"position_status": "IN_POSITION", "should_sell": True})
+
+    result = nodes.portfolio_risk_node(state)
+    allocated = result["symbol_states"]
+    # D는 이미 보유 중이라 매수 자리는 하나 → 강도가 가장 큰 C만
+    assert result["orders"] == ["D", "C"]
+    assert allocated["C"]["order_qty"] == 10
+    assert not allocated["B"]["should_buy"] and not allocated["A"]["should_buy"]
+    assert all(sym["cash_balance"] == 1_000_000 for sym in allocated.values())
+
+    # 보유 종목이 없으면 종목당 최대 비중(30만원)과 남은 현금 안에서 배분
+    state["symbol_states"]["D"].update({"position_status": "IDLE", "should_sell": False})
+    state["max_positions"] = 3
+    allocated = nodes.portfolio_risk_node(state)["symbol_states"]
+    assert allocated["C"]["order_qty"] == 10
+    assert allocated["B"]["order_qty"] == 300_000 // 20_800
+    assert allocated["A"]["order_qty"] == 29
+
+    # 포트폴리오 일일 손실 한도 초과 → 모든 신호 취소
+    state["daily_pnl"] = -60_000
+    stopped = nodes.portfolio_risk_node(state)
+    assert stopped["trading_stopped"] and stopped["orders"] == []
+    assert not any(
+        sym["should_buy"] or sym["should_sell"] for sym in stopped["symbol_states"].values()
+    )
+
+
+def _run(graph, context, symbols, latency):
+    standin = KISStandIn(seed=1, cash=10_000_000, latency=latency)
+    state = create_portfolio_state(
+        symbols,
+        initial_capital=10_000_000,
+        max_positions=len(symbols),
+        env_mode="demo",
+        min_volume=0,
+    )
+    context.intraday_tape = IntradayTape()  # 실행마다 새 테이프 (대역 거래량으로 다시 시작)
+    with standin.install(nodes), use_clock(FixedClock(NOW)):
+        started = time.perf_counter()
+        result = graph.invoke(state)
+        return result, standin, time.perf_counter() - started
+
+
+def test_symbol_branches_run_in_parallel():
+    context = TradingContext()
+    graph = build_portfolio_graph(context)
+    _run(graph, context, ["900001"], 0.0)  # 워밍업
+
+    _, _, single = _run(graph, context, ["900001"], 0.02)
+    symbols = [f"{900001 + i}" for i in range(8)]
+    many, standin, eight = _run(graph, context, symbols, 0.02)
+
+    assert set(many["symbol_states"]) == set(symbols)
+    assert many["iteration"] == 1
+    # 8종목 조회가 순차라면 8배 가까이 걸림
+    assert eight < single * 4, (single, eight)
+    assert standin.calls >= len(symbols) * 2  # 모든 종목 분기가 조회까지 실행
+
+
+def test_portfolio_buys_within_max_positions_and_settles_cash():
+    symbols = [f"{900001 + i}" for i in range(5)]
+    standin = KISStandIn(seed=5, cash=10_000_000)
+    state = create_portfolio_state(
+        symbols,
+        initial_capital=10_000_000,
+        max_positions=3,
+        env_mode="demo",
+        k_value=-1.0,
+        min_volume=0,
+        min_breakout_strength=0.0,
+        max_position_size=0.2,
+    )
+    with standin.install(nodes), use_clock(FixedClock(NOW)):
+        result = build_portfolio_graph(TradingContext()).invoke(state)
+
+    held = {
+        s: sym
+        for s, sym in result["symbol_states"].items()
+        if sym["position_status"] == "IN_POSITION"
+    }
+    assert len(held) == 3 and result["total_trades"] == 0
+    spent = sum(sym["entry_price"] * sym["position_qty"] for sym in held.values())
+    assert all(sym["entry_price"] * sym["position_qty"] <= 2_000_000 for sym in held.values())
+    assert result["cash_balance"] == 10_000_000 - spent
+    assert [o["side"] for o in standin.orders] == ["buy"] * 3
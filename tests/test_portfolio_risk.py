@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+포트폴리오 리스크 집계기 테스트
+
+Usage:
+    python -m pytest tests/test_portfolio_risk.py -q
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.graph.state import create_portfolio_state
+from skills.trading_core.strategies.portfolio_risk import (
+    CORRELATION_LIMIT,
+    GROSS_LIMIT,
+    NET_LIMIT,
+    OK,
+    SECTOR_LIMIT,
+    PortfolioRisk,
+    load_sectors,
+)
+
+SECTORS = {"A": "반도체", "B": "반도체", "C": "바이오", "D": "지수"}
+
+
+def test_incremental_exposure_matches_recompute(tmp_path):
+    path = tmp_path / "symbols.yaml"
+    path.write_text(
+        'symbols:\n'
+        '  - {code: "A", sector: "반도체", notes: "대장주"}\n'
+        '  - {code: "B", notes: "바이오"}\n'
+        '  - {code: "C"}\n',
+        encoding="utf-8",
+    )
+    assert load_sectors(path) == {"A": "반도체", "B": "바이오", "C": "기타"}
+
+    risk = PortfolioRisk(list(SECTORS), cash=10_000_000, sectors=SECTORS)
+    rng = np.random.default_rng(0)
+    for _ in range(300):
+        symbol = str(rng.choice(list(SECTORS)))
+        if rng.random() < 0.3:
+            risk.on_fill(
+                symbol,
+                str(rng.choice(["buy", "sell"])),
+                int(rng.integers(1, 20)),
+                int(rng.integers(9_000, 11_000)),
+            )
+        else:
+            risk.on_price(symbol, int(rng.integers(9_000, 11_000)))
+
+    values = risk.qty * risk.price
+    assert risk.net == values.sum() and risk.gross == np.abs(values).sum()
+    sector_of = np.array([risk.sector_names.index(SECTORS[s]) for s in risk.symbols])
+    assert list(risk.sector_gross) == [
+        np.abs(values[sector_of == k]).sum() for k in range(len(risk.sector_names))
+    ]
+    assert risk.equity == risk.cash + risk.net
+    risk.on_price("UNKNOWN", 1_000)  # 운용 종목 아님 → 무시
+
+
+def test_rolling_correlation_matches_window():
+    risk = PortfolioRisk(list(SECTORS), cash=10_000_000, sectors=SECTORS, window=30, min_samples=10)
+    assert not risk.roll() and np.isnan(risk.correlation()).all()
+
+    rng = np.random.default_rng(1)
+    prices = np.full(4, 10_000.0)
+    for symbol in SECTORS:
+        risk.on_price(symbol, 10_000)
+    assert not risk.roll()  # 첫 표본은 기준 가격만 기록
+    for _ in range(95):  # 창을 여러 번 돌아 빠지는 표본 · 재합산 경로 포함
+        common = rng.normal(0, 0.01)
+        shocks = rng.normal(0, 0.01, 4)
+        prices *= 1 + np.array(
+            [
+                common + shocks[0] * 0.2,
+                common + shocks[1] * 0.2,
+                shocks[2],
+                -common + shocks[3] * 0.2,
+            ]
+        )
+        for symbol, price in zip(SECTORS, prices):
+            risk.on_price(symbol, int(round(price)))
+        assert risk.roll()
+
+    window = risk._returns  # 창이 가득 찼으므로 버퍼 전체가 최근 30개 표본
+    assert risk.samples == 30
+    np.testing.assert_allclose(risk.correlation(), np.corrcoef(window.T), atol=1e-9)
+    corr = risk.correlation()
+    assert corr[0, 1] > 0.9 and corr[0, 3] < -0.9
+
+    # A 보유 중: 같이 움직이는 B 신규 매수는 거절, 반대로 움직이는 D와 A 추가 매수는 통과
+    risk.on_fill("A", "buy", 10, int(prices[0]))
+    approved, reasons = risk.check_orders(["B", "D", "A"], ["buy"] * 3, [1, 1, 1], [10_000] * 3)
+    assert list(reasons) == [CORRELATION_LIMIT, OK, OK]
+
+
+def test_batch_limits_and_portfolio_node():
+    risk = PortfolioRisk(
+        list(SECTORS),
+        cash=1_000_000,
+        sectors=SECTORS,
+        max_gross_exposure=0.7,
+        max_net_exposure=0.6,
+        max_sector_exposure=0.3,
+    )
+    risk.on_fill("C", "buy", 10, 10_000)  # 바이오 10만원
+    approved, reasons = risk.check_orders(
+        ["A", "B", "C", "D", "A", "C"],
+        ["buy", "buy", "buy", "buy", "buy", "sell"],
+        [20, 20, 5, 20, 10, 10],
+        [10_000] * 6,
+    )
+    # 보유 10만 + 누적 매수: A 30만(반도체 20만) → B 50만(반도체 40만 > 30만)
+    #   → C 55만 → D 75만(순 60만 · 총 70만 초과) → A 85만. 거절된 B도 누적에 포함, 매도는 항상 통과
+    assert list(reasons) == [OK, SECTOR_LIMIT, OK, GROSS_LIMIT, GROSS_LIMIT, OK]
+    assert list(approved) == [True, False, True, False, False, True]
+    risk.max_gross_exposure = 1.0
+    assert risk.check_orders(["D"], ["buy"], [60], [10_000])[1][0] == NET_LIMIT
+
+    # 포트폴리오 노드: 배분된 매수 중 업종 한도를 넘는 뒤 순위 종목은 보류
+    state = create_portfolio_state(
+        list(SECTORS),
+        initial_capital=1_000_000,
+        max_positions=4,
+        env_mode="demo",
+        max_position_size=0.2,
+    )
+    for symbol, price in (("A", 10_600), ("B", 10_300), ("C", 10_200)):
+        state["symbol_states"][symbol].update(
+            {"should_buy": True, "current_price": price, "target_price": 10_000, "order_qty": 18}
+        )
+    risk = PortfolioRisk(list(SECTORS), cash=1_000_000, sectors=SECTORS, max_sector_exposure=0.3)
+    context = TradingContext(portfolio_risk=risk)
+    result = nodes.portfolio_risk_node(state, context)
+    assert result["orders"] == ["A", "C"]
+    assert (
+        not result["symbol_states"]["B"]["should_buy"]
+        and result["symbol_states"]["B"]["order_qty"] == 0
+    )
+
+    # 정산 시 체결 결과로 노출 동기화
+    filled = create_portfolio_state(list(SECTORS), initial_capital=1_000_000, env_mode="demo")
+    filled["symbol_states"]["A"].update(
+        {"position_qty": 18, "current_price": 10_600, "cash_balance": 809_200}
+    )
+    for sym in filled["symbol_states"].values():
+        sym.setdefault("cash_balance", 1_000_000)
+    nodes.settle_portfolio_node(filled, context)
+    assert risk.gross == 18 * 10_600 and risk.cash == 809_200
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+변동성 조정 포지션 크기 테스트
+
+Usage:
+    python -m pytest tests/test_position_sizing.py -q
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from skills.trading_core.clock import FixedClock, use_clock
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.graph.state import create_initial_state, create_portfolio_state
+from skills.trading_core.strategies.breakout_etf import BreakoutStrategy
+from skills.trading_core.strategies.indicators import IndicatorEngine
+from skills.trading_core.strategies.intraday_tape import IntradayTape
+from skills.trading_core.strategies.position_sizing import PositionSizer
+from skills.trading_core.strategies.risk_rules import volatility_factor, volatility_factors
+
+TODAY = "20250106"
+
+
+def feed(engine: IndicatorEngine, symbol: str, step: float, days: int = 25, start: int = 0) -> None:
+    """종가가 매일 ±step 비율로 번갈아 움직이는 일봉"""
+    close = 10000
+    for i in range(start, start + days):
+        close = int(close * (1 + (step if i % 2 else -step)))
+        engine.update_bar(symbol, close, close, close, close, f"2024{i + 1:04d}")
+
+
+def test_factor_table_scalar_and_vector_agree():
+    vols = [0.0, 0.03, 0.0300001, 0.05, 0.07, 0.10, 0.2, None]
+    expected = [1.0, 1.0, 0.6, 0.6, 0.3, 0.3, 0.1, 1.0]
+    assert [volatility_factor(v) for v in vols] == expected
+    array = np.array([np.nan if v is None else v for v in vols])
+    assert volatility_factors(array).tolist() == expected
+
+
+def test_sizer_caches_per_day_and_vectorized_sizes_match():
+    engine = IndicatorEngine()
+    feed(engine, "CALM", 0.01)
+    feed(engine, "WILD", 0.08)
+    sizer = PositionSizer()
+    assert sizer.refresh(engine, ["CALM", "WILD", "NEW"], TODAY) == 2
+    assert "NEW" not in engine  # 없는 종목은 엔진에 만들지 않음
+
+    calm = sizer.factor(engine, "CALM", TODAY)
+    wild = sizer.factor(engine, "WILD", TODAY)
+    assert calm == 1.0 and wild == 0.3
+
+    # 같은 날에는 지표가 바뀌어도 캐시 값 유지, 다음 날 다시 계산
+    feed(engine, "CALM", 0.2, days=5, start=25)
+    assert sizer.factor(engine, "CALM", TODAY) == 1.0
+    assert sizer.factor(engine, "CALM", "20250107") < 1.0
+
+    strategy = BreakoutStrategy()
+    symbols, prices = ["CALM", "WILD"], [10_050, 31_500]
+    qty = sizer.size_many(engine, symbols, 10_000_000, prices, 0.1, "20250107")
+    scalar = [
+        strategy.calculate_position_size(
+            10_000_000, price, 0.1 * sizer.factor(engine, symbol, "20250107")
+        )
+        for symbol, price in zip(symbols, prices)
+    ]
+    assert qty.tolist() == scalar
+
+
+def test_generate_signal_node_scales_order_qty():
+    engine = IndicatorEngine()
+    feed(engine, "069500", 0.08)
+    state = create_initial_state(
+        symbol="069500", initial_capital=10_000_000, env_mode="demo", volatility_adjustment=True
+    )
+    state.update(
+        {
+            "current_price": 31_000,
+            "target_price": 30_500,
+            "cash_balance": 10_000_000,
+            "today_volume": 1_000_000,
+        }
+    )
+
+    context = TradingContext(
+        indicator_engine=engine, position_sizer=PositionSizer(), intraday_tape=IntradayTape()
+    )
+    with use_clock(FixedClock(datetime(2025, 1, 6, 10, 0))):
+        adjusted = nodes.generate_signal_node(state, context)
+        state["volatility_adjustment"] = False
+        flat = nodes.generate_signal_node(state, context)
+
+    assert adjusted["should_buy"] and flat["should_buy"]
+    assert flat["order_qty"] == 10_000_000 // 10 // 31_000
+    assert adjusted["order_qty"] == 10_000_000 * 3 // 100 // 31_000
+
+
+def test_portfolio_risk_node_caps_volatile_buys():
+    engine = IndicatorEngine()
+    feed(engine, "CALM", 0.01)
+    feed(engine, "WILD", 0.08)
+    state = create_portfolio_state(
+        ["CALM", "WILD"],
+        initial_capital=10_000_000,
+        max_positions=2,
+        env_mode="demo",
+        max_position_size=0.1,
+        volatility_adjustment=True,
+    )
+    for symbol in ("CALM", "WILD"):
+        state["symbol_states"][symbol].update(
+            {"should_buy": True, "current_price": 31_000, "target_price": 30_500, "order_qty": 100}
+        )
+
+    context = TradingContext(indicator_engine=engine, position_sizer=PositionSizer())
+    with use_clock(FixedClock(datetime(2025, 1, 6, 10, 0))):
+        allocated = nodes.portfolio_risk_node(state, context)["symbol_states"]
+
+    # 종목당 한도: CALM 10%, WILD 10% × 0.3
+    assert allocated["CALM"]["order_qty"] == 10_000_000 // 10 // 31_000
+    assert allocated["WILD"]["order_qty"] == 10_000_000 * 3 // 100 // 31_000
+    assert context.position_sizer.as_dict() == {"CALM": 1.0, "WILD": 0.3}
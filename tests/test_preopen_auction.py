@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+동시호가 예상 체결가 기반 잠정 목표가 테스트
+
+Usage:
+    python -m pytest tests/test_preopen_auction.py -q
+"""
+
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from apps.preopen_targets_app import run_preopen
+from benchmarks.kis_standin import KISStandIn
+from skills.trading_core.clock import FixedClock, VirtualClock, use_clock
+from skills.trading_core.data.target_table import (
+    TargetTable,
+    compute_targets,
+    finalize_target_table,
+    publish_target_table,
+)
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.graph.state import create_initial_state
+from skills.trading_core.strategies.indicators import IndicatorEngine
+
+TODAY = "20250106"
+
+
+def test_finalize_recomputes_only_changed_rows():
+    provisional = compute_targets(
+        ["069500", "005930", "000660"],
+        [30_500, 56_000, 200_000],
+        [29_500, 54_000, 190_000],
+        [30_000, 55_000, 195_000],
+        [0.5, 0.5, 0.5],
+        budgets=[1_000_000, 1_000_000, 1_000_000],
+        provisional=True,
+    )
+    assert provisional["provisional"].all()
+    assert provisional["qty"].tolist() == [1_000_000 // p for p in provisional["order_price"]]
+
+    # 005930만 예상과 다르게 확정, 000660은 아직 미확정
+    final, changed = finalize_target_table(provisional, {"069500": 30_000, "005930": 55_300})
+    rows = {row["symbol"].decode(): row for row in final}
+    assert changed == 1
+    assert not rows["069500"]["provisional"] and not rows["005930"]["provisional"]
+    assert rows["000660"]["provisional"]
+    assert rows["069500"]["target"] == 30_500
+    assert rows["005930"]["target"] == 55_300 + 1_000
+    assert rows["005930"]["qty"] == 1_000_000 // rows["005930"]["order_price"]
+    # 원본(게시된 잠정 테이블)은 그대로
+    assert provisional["provisional"].all()
+
+
+def test_run_preopen_publishes_provisional_then_final(tmp_path, monkeypatch):
+    symbols = ["900001", "900002"]
+    engine = IndicatorEngine()
+    for symbol in symbols:
+        engine.update_bar(symbol, 30_000, 30_600, 29_400, 30_100, "20250103")
+
+    config = {
+        "volatility_breakout": {"k_value": 0.5, "k_mode": "static"},
+        "trading": {"capital": 10_000_000, "position_size": 0.1},
+    }
+    seen = []
+    original_publish = publish_target_table
+
+    def record(table, date, directory=None):
+        seen.append(table["provisional"].tolist())
+        return original_publish(table, date, directory)
+
+    import apps.preopen_targets_app as app
+
+    monkeypatch.setattr(app, "publish_target_table", record)
+    standin = KISStandIn(seed=3)
+    with standin.install(nodes), use_clock(VirtualClock(datetime(2025, 1, 6, 8, 59, 30))):
+        expected = {
+            s: nodes._call_inquire_expected_price("demo", s)["expected_price"] for s in symbols
+        }
+        table = run_preopen(
+            config,
+            symbols,
+            "demo",
+            logging.getLogger("test"),
+            timeout=5,
+            poll=1,
+            auction_interval=10,
+            directory=tmp_path,
+            context=TradingContext(indicator_engine=engine),
+        )
+        opens = {s: nodes._call_inquire_price("demo", s)["open"] for s in symbols}
+
+    # 08:59:30 / :40 / :50 잠정 게시 3회 → 09:00 확정 게시 1회
+    assert seen == [[True, True]] * 3 + [[False, False]]
+    assert opens == expected  # 대역의 예상 체결가는 당일 시가
+    reader = TargetTable.load(TODAY, tmp_path)
+    for row in table:
+        symbol = row["symbol"].decode()
+        assert reader.get(symbol)["open"] == opens[symbol]
+        assert row["qty"] == 1_000_000 // row["order_price"]
+        assert (reader.get(symbol)["order_price"], reader.get(symbol)["qty"]) == (
+            row["order_price"],
+            row["qty"],
+        )
+
+
+def test_calculate_target_node_ignores_provisional_rows(tmp_path):
+    table = compute_targets(["069500"], [30_500], [29_500], [30_000], [0.3], provisional=True)
+    publish_target_table(table, TODAY, tmp_path)
+
+    state = create_initial_state(
+        symbol="069500", initial_capital=10_000_000, env_mode="demo", k_value=0.5
+    )
+    state.update({"today_open": 30_000, "yesterday_high": 30_500, "yesterday_low": 29_500})
+    context = TradingContext(target_table_dir=tmp_path)
+    with use_clock(FixedClock(datetime(2025, 1, 6, 9, 0, 1))):
+        provisional = nodes.calculate_target_node(state, context)
+        publish_target_table(finalize_target_table(table, {"069500": 30_000})[0], TODAY, tmp_path)
+        final = nodes.calculate_target_node(state, context)
+
+    assert provisional == {"target_price": 30_500, "effective_k": 0.5}
+    assert final == {"target_price": 30_300, "effective_k": 0.3}
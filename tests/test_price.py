@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+원 단위 정수 가격 테스트
+
+Usage:
+    python -m pytest tests/test_price.py -q
+"""
+
+import math
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.kis_standin import KISStandIn
+from skills.trading_core.clock import FixedClock, use_clock
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.graph_builder import build_trading_graph
+from skills.trading_core.graph.state import create_initial_state
+from skills.trading_core.price import mul_ratio_ceil, mul_ratio_floor, to_won, to_won_array
+from skills.trading_core.strategies.breakout_etf import BreakoutStrategy
+
+
+def test_ratio_products_are_exact():
+    amounts = np.random.default_rng(0).integers(1, 5_000_000, 10_000)
+    for ratio in (0.5, 0.6, 0.07, -0.03, 0.0123):
+        exact = [amount * round(ratio * 10_000) for amount in amounts.tolist()]
+        np.testing.assert_array_equal(mul_ratio_floor(amounts, ratio), [e // 10_000 for e in exact])
+        np.testing.assert_array_equal(
+            mul_ratio_ceil(amounts, ratio), [-(-e // 10_000) for e in exact]
+        )
+    # 실수 곱셈 오차(100 × 0.07 = 7.000000000000001) 없음
+    assert mul_ratio_ceil(100, 0.07) == 7
+    assert math.ceil(100 * 0.07) == 8
+
+
+def test_strategy_integer_decisions_match_real_thresholds():
+    strategy = BreakoutStrategy()
+    now = datetime(2025, 1, 6, 10, 0)
+    target = strategy.calculate_target_price(10_000, 10_333, 10_000, k=0.5)
+    assert isinstance(target, int) and target == 10_167  # 10,000 + ceil(166.5)
+    assert not strategy.should_enter(10_166, target, current_time=now)[0]
+    assert strategy.should_enter(10_167, target, current_time=now)[0]
+
+    # 진입가 10,001, 손절 -3% → 9,700.97 이하 = 9,700 이하
+    assert strategy.should_exit(10_001, 9_700, -0.03, 0.05, current_time=now)[0]
+    assert not strategy.should_exit(10_001, 9_701, -0.03, 0.05, current_time=now)[0]
+    # 익절 +5% → 10,501.05 이상 = 10,502 이상
+    assert not strategy.should_exit(10_001, 10_501, -0.03, 0.05, current_time=now)[0]
+    assert strategy.should_exit(10_001, 10_502, -0.03, 0.05, current_time=now)[0]
+
+
+def test_state_prices_and_cash_stay_integer():
+    assert to_won("30000") == 30000 and to_won(29999.6) == 30000
+    assert to_won_array([1.4, 2.6]).dtype == np.int64
+
+    graph = build_trading_graph()
+    with (
+        KISStandIn(seed=3, volatility=0.01).install(nodes),
+        use_clock(FixedClock(datetime(2025, 1, 6, 10, 0))),
+    ):
+        state = create_initial_state(symbol="069500", initial_capital=10_000_000.0, env_mode="demo")
+        for _ in range(50):
+            state = graph.invoke(state)
+
+    for key in (
+        "current_price",
+        "target_price",
+        "cash_balance",
+        "realized_pnl",
+        "daily_pnl",
+        "total_asset",
+        "initial_capital",
+    ):
+        assert type(state[key]) is int, key
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+보유 종목 대사 테스트
+
+Usage:
+    python -m pytest tests/test_reconcile.py -q
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.kis_standin import KISStandIn
+from skills.trading_core.account import AccountModel
+from skills.trading_core.clock import FixedClock, use_clock
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.graph.state import create_initial_state
+from skills.trading_core.reconcile import PageLimitExceeded, PositionReconciler, diff_positions
+
+NOW = datetime(2025, 1, 6, 10, 0)
+OUTPUT2 = [{"tot_evlu_amt": "1000000", "scts_evlu_amt": "0"}]
+
+
+def _pages(rows, size, fetched, delay=0.0):
+    for start in range(0, len(rows), size):
+        fetched.append(start)
+        time.sleep(delay)
+        yield rows[start : start + size], OUTPUT2
+
+
+def _row(symbol, qty):
+    return {"pdno": symbol, "hldg_qty": str(qty), "pchs_avg_pric": "10000.00", "prpr": "10100"}
+
+
+def test_diff_streams_pages_within_budget():
+    rows = [_row(f"{i:06d}", 10) for i in range(100)] + [_row("NEW", 3), _row("CHANGED", 7)]
+    book = {f"{i:06d}": 10 for i in range(100)}
+    book.update({"CHANGED": 5, "GONE": 4})
+
+    fetched = []
+    result = diff_positions(_pages(rows, 20, fetched), book)
+    assert result.complete and result.pages == len(fetched) == 6 and result.rows == 102
+    assert [(c.symbol, c.kind, c.broker_qty) for c in result.corrections] == [
+        ("NEW", "추가", 3),
+        ("CHANGED", "수량", 7),
+        ("GONE", "삭제", 0),
+    ]
+    assert (
+        result.corrections[0].avg_price == 10_000
+        and str(result.corrections[2]) == "GONE 삭제 4주 → 0주"
+    )
+
+    # 예산 초과: 남은 페이지는 조회하지 않고, 로컬에만 있는 종목은 판단 보류
+    fetched = []
+    result = diff_positions(_pages(rows, 20, fetched, delay=0.05), book, budget_seconds=0.075)
+    assert not result.complete and result.pages == len(fetched) == 2
+    assert result.corrections == []
+
+
+def test_background_run_and_apply():
+    standin = KISStandIn(seed=0, cash=1_000_000, latency=0.05, page_size=2)
+    for i in range(6):
+        standin.holdings[f"{i:06d}"] = {"qty": 10, "avg_price": 10_000.0}
+    reconciler = PositionReconciler(budget_seconds=10)
+    model = AccountModel()
+    with standin.install(nodes):
+        model.reconcile(*nodes._call_inquire_balance("demo"), now=NOW)
+        standin.holdings["000001"]["qty"] = 4  # 다른 경로에서 일부 매도
+        del standin.holdings["000002"]
+
+        fetch_pages = partial(nodes._iter_inquire_balance, "demo")
+        started = time.perf_counter()
+        assert reconciler.submit(fetch_pages, model.book(), model.fills)
+        assert time.perf_counter() - started < 0.1  # 조회(페이지 3개 × 50ms)를 기다리지 않음
+        assert not reconciler.submit(fetch_pages, model.book(), model.fills)  # 실행 중이면 하나만
+        assert reconciler.poll() is None
+        reconciler.join()
+        result = reconciler.poll()
+
+        assert result.complete and result.pages == 3
+        assert [str(c) for c in result.corrections] == [
+            "000001 수량 10주 → 4주",
+            "000002 삭제 10주 → 0주",
+        ]
+
+        # 대사 도중 체결이 있었으면 결과를 버림
+        model.on_fill("000005", "buy", 1, 10_000)
+        assert not model.apply_reconcile(result)
+        result.fills = model.fills  # 체결 없이 끝난 대사라고 가정
+        assert model.apply_reconcile(result, now=NOW)
+    # 보정된 종목만 바뀌고 나머지(로컬 체결 포함)는 그대로
+    assert model.book() == {"000000": 10, "000001": 4, "000003": 10, "000004": 10, "000005": 11}
+    assert model.needs_reconcile(NOW) is None
+
+
+def test_page_limit_is_partial_not_complete():
+    standin = KISStandIn(seed=0, cash=1_000_000, page_size=2)
+    for i in range(6):
+        standin.holdings[f"{i:06d}"] = {"qty": 10, "avg_price": 10_000.0}
+    model = AccountModel()
+    with standin.install(nodes):
+        model.reconcile(*nodes._call_inquire_balance("demo"), now=NOW)
+        standin.holdings["000000"]["qty"] = 7
+
+        # 최대 페이지 수에 걸리면 읽은 종목만 보정하고, 못 읽은 종목(3페이지)은 삭제하지 않음
+        result = PositionReconciler(budget_seconds=10, max_pages=2).run(
+            partial(nodes._iter_inquire_balance, "demo", 2), model.book(), model.fills
+        )
+        assert result.error is None and not result.complete and result.pages == 2
+        assert [str(c) for c in result.corrections] == ["000000 수량 10주 → 7주"]
+        assert model.apply_reconcile(result, now=NOW)
+        assert model.book() == {"000000": 7, **{f"{i:06d}": 10 for i in range(1, 6)}}
+        assert model.needs_reconcile(NOW) == "부분 대사"
+
+        # 전체 조회는 잔고 일부가 빠진 채로 끝나지 않음
+        with pytest.raises(PageLimitExceeded):
+            list(nodes._iter_inquire_balance("demo", 2))
+        assert len(list(nodes._iter_inquire_balance("demo", 3))) == 3
+
+
+def test_update_account_reconciles_in_background():
+    standin = KISStandIn(seed=0, cash=1_000_000, latency=0.02, page_size=1)
+    standin.holdings["069500"] = {"qty": 10, "avg_price": 10_000.0}
+    clock = FixedClock(NOW)
+    model, reconciler = AccountModel(reconcile_interval=60), PositionReconciler()
+    context = TradingContext(account_model=model, position_reconciler=reconciler)
+    with standin.install(nodes), use_clock(clock):
+        state = create_initial_state(symbol="069500", initial_capital=1_000_000, env_mode="demo")
+        state.update(
+            {"position_status": "IN_POSITION", "position_qty": 10, "current_price": 10_000}
+        )
+        first = nodes.update_account_node(state, context)  # 첫 대사는 동기
+        assert first["total_asset"] == 1_100_000 and not reconciler.runs
+
+        standin.holdings["000660"] = {"qty": 5, "avg_price": 20_000.0}  # 수동 매수
+        clock.set(NOW + timedelta(seconds=60))
+        calls = standin.calls
+        started = time.perf_counter()
+        assert (
+            nodes.update_account_node(state, context)["total_asset"] == 1_100_000
+        )  # 로컬 평가로 진행
+        assert time.perf_counter() - started < 0.04 and reconciler.busy  # 페이지 2개 × 20ms
+        reconciler.join()
+        assert standin.calls == calls + 2  # 페이지 2개
+
+        updates = nodes.update_account_node(state, context)
+    assert model.book() == {"069500": 10, "000660": 5}
+    assert updates["total_asset"] == 1_100_000 + 100_000
+    assert model.needs_reconcile(NOW + timedelta(seconds=60)) is None
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+섀도(페이퍼) 평가 테스트
+
+Usage:
+    python -m pytest tests/test_shadow.py -q
+"""
+
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.kis_standin import KISStandIn
+from skills.trading_core.clock import FixedClock, VirtualClock, use_clock
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.graph_builder import build_trading_graph
+from skills.trading_core.graph.state import create_initial_state
+from skills.trading_core.scheduler import TradingScheduler
+from skills.trading_core.shadow import ShadowLog, ShadowRunner, ShadowVariant
+
+NOW = datetime(2025, 1, 6, 10, 0)
+LOOSE = {"k_value": -1.0, "min_volume": 0, "min_breakout_strength": 0.0}
+
+
+def _snapshot(**kwargs):
+    state = {
+        "symbol": "069500",
+        "current_price": 10_000,
+        "target_price": 9_900,
+        "today_volume": 1_000,
+        "today_open": 9_800,
+        "yesterday_high": 10_000,
+        "yesterday_low": 9_800,
+        "min_volume": 0,
+        "min_breakout_strength": 0.0,
+        "stop_loss_pct": -0.03,
+        "take_profit_pct": 0.05,
+        "max_position_size": 0.1,
+        "trailing_stop": False,
+        "trailing_stop_pct": 0.02,
+        "debug_mode": False,
+    }
+    state.update(kwargs)
+    return state
+
+
+def test_variant_fill_model():
+    with pytest.raises(ValueError):
+        ShadowVariant("bad", {"k_value": 0.4, "order_type": "market"}, 1_000_000)
+
+    variant = ShadowVariant("v", {"k_value": 0.4}, 1_000_000)
+    assert variant.plugin.k == 0.4 and variant.plugin.stop_loss_pct is None
+
+    # 매수: 10,000 + ceil(10,000 × 0.1%) = 10,010원, 수수료 ceil(100,100 × 0.015%) = 16원
+    fill = variant.buy("A", 10_000, 10, commission=0.00015, slippage=0.001)
+    assert fill == {"side": 1, "price": 10_010, "qty": 10, "fee": 16, "pnl": 0}
+    assert variant.cash == 1_000_000 - 100_116
+    assert variant.equity({"A": 10_500}) == variant.cash + 105_000
+
+    # 매도: 10,500 - 11 = 10,489원, 수수료 ceil(104,890 × 0.015%) = 16원
+    fill = variant.sell("A", 10_500, commission=0.00015, slippage=0.001)
+    assert fill["price"] == 10_489 and fill["pnl"] == 104_890 - 16 - 100_116
+    assert variant.realized_pnl == fill["pnl"] and variant.trades == variant.wins == 1
+    assert variant.cash == 1_000_000 + fill["pnl"] and variant.positions == {}
+
+    # 현금이 모자라면 살 수 있는 만큼만
+    poor = ShadowVariant("poor", {}, 25_000)
+    assert poor.buy("A", 10_000, 10, commission=0.00015, slippage=0.001)["qty"] == 2
+
+
+def _session(seed, shadow=None):
+    standin = KISStandIn(seed=seed)
+    clock = VirtualClock(datetime(2025, 1, 6, 9, 0))
+    with standin.install(nodes), use_clock(clock):
+        state = create_initial_state(symbol="069500", initial_capital=10_000_000, env_mode="demo")
+        if shadow is not None:
+            shadow.started_at = clock.now()
+        scheduler = TradingScheduler(
+            build_trading_graph(),
+            clock=clock,
+            interval_seconds=60,
+            max_iterations=60,
+            on_iteration=shadow.on_state if shadow is not None else None,
+        )
+        scheduler.run(state)
+    return standin
+
+
+def test_shadow_follows_live_session_without_extra_calls(tmp_path):
+    shadow = ShadowRunner(
+        {"loose": LOOSE, "never": {"k_value": 50.0}},
+        initial_capital=10_000_000,
+        budget_ms=1000,
+        log_dir=tmp_path,
+    )
+    live_only = _session(seed=7)
+    with_shadow = _session(seed=7, shadow=shadow)
+    # 섀도는 조회 · 주문을 하지 않음 (같은 시드 세션과 호출 수 · 주문 동일)
+    assert with_shadow.calls == live_only.calls and with_shadow.orders == live_only.orders
+
+    rows = {row["name"]: row for row in shadow.summary()}
+    assert rows["never"]["trades"] == 0 and rows["never"]["equity"] == 10_000_000
+    assert rows["loose"]["trades"] + rows["loose"]["open_positions"] >= 1
+    assert shadow.deferred == 0
+
+    log = ShadowLog.load(shadow.save())
+    assert list(log["variants"]) == ["loose", "never"]
+    assert len(log["mark_ts"]) == 2 * 60 and set(log["fill_variant"]) == {0}
+    assert log["fill_side"][0] == 1 and log["fill_symbol"][0] == b"069500"
+    assert log["mark_equity"].dtype.kind == "i"
+
+
+def _slow(evaluate, seconds):
+    def wrapped(*args, **kwargs):
+        time.sleep(seconds)
+        return evaluate(*args, **kwargs)
+
+    return wrapped
+
+
+def test_budget_defers_variants_and_ticks_trigger_exits():
+    with use_clock(FixedClock(NOW)):
+        shadow = ShadowRunner(
+            {"a": LOOSE, "b": LOOSE, "c": LOOSE, "broken": {}},
+            initial_capital=1_000_000,
+            budget_ms=0,
+        )
+        shadow.variants[3].plugin.evaluate = None  # 호출 시 TypeError
+        for variant in shadow.variants:
+            variant.plugin.evaluate = _slow(variant.plugin.evaluate, 0.01)
+        assert shadow.on_tick("069500", 10_000) == 0  # 반복 결과 전에는 평가 없음
+
+        # 예산 0: 첫 변형도 시작하지 않고 모두 다음 호출로
+        assert shadow.on_state(_snapshot()) == 0 and shadow.deferred == 4
+
+        # 예산 5ms: 변형 하나(10ms)가 예산을 넘기면 나머지는 다음 호출로 (순서대로 돌아감)
+        shadow.budget = 0.005
+        assert [shadow.on_state(_snapshot()) for _ in range(4)] == [1, 1, 1, 1]
+        assert shadow.deferred == 4 + 3 * 4
+        assert all("069500" in variant.positions for variant in shadow.variants[:3])
+
+        shadow.budget = 1.0
+        # 틱으로 손절 (-3%) → 세 변형 모두 청산, 예외 변형은 실운영으로 올라가지 않음
+        assert shadow.on_tick("069500", 9_500) == 4
+    assert all(variant.trades == 1 and variant.realized_pnl < 0 for variant in shadow.variants[:3])
+    assert list(shadow.log.fills["side"]) == [1, 1, 1, -1, -1, -1]
+    assert shadow.log.marks["variant"] == [0, 1, 2]  # 평가에 성공한 변형만 손익 기록
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+전략 플러그인 레지스트리 테스트
+
+Usage:
+    python -m pytest tests/test_strategy_registry.py -q
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.kis_standin import KISStandIn
+from skills.trading_core.clock import FixedClock, use_clock
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.graph.state import create_initial_state
+from skills.trading_core.strategies import registry as registry_module
+from skills.trading_core.strategies.registry import (
+    BreakoutPlugin,
+    SignalContext,
+    StrategyPlugin,
+    StrategyRegistry,
+    StrategySignal,
+    merge_signals,
+    register_strategy_type,
+)
+
+NOW = datetime(2025, 1, 6, 10, 0)
+
+
+def _market_state(**kwargs):
+    state = create_initial_state(
+        symbol="069500",
+        initial_capital=10_000_000,
+        env_mode="demo",
+        min_volume=0,
+        min_breakout_strength=0.0,
+        volatility_adjustment=False,
+        **kwargs,
+    )
+    state.update(nodes.fetch_market_data_node(state))
+    state.update(nodes.calculate_target_node(state))
+    return state
+
+
+def _signals(registry, state):
+    return nodes.generate_signal_node(state, TradingContext(strategy_registry=registry))
+
+
+def test_config_and_merge_rules():
+    registry = StrategyRegistry.from_config(
+        [
+            {"name": "k05", "weight": 0.5},
+            {"name": "k03", "type": "breakout", "k": 0.3, "weight": 0.5},
+        ]
+    )
+    assert registry.names == ["k05", "k03"] and registry_module.strategy_types() == ["breakout"]
+    assert isinstance(next(iter(registry)), BreakoutPlugin) and next(iter(registry)).k is None
+    with pytest.raises(ValueError):
+        StrategyRegistry.from_config([{"name": "x", "type": "unknown"}])
+    with pytest.raises(ValueError):
+        registry.register(BreakoutPlugin("k05"))
+
+    context = SignalContext(now=NOW, volume=0, last_price=10_000, position_ratio=0.1)
+    idle = {"position_status": "IDLE", "cash_balance": 1_000_000, "current_price": 10_000}
+    buys = [
+        StrategySignal("a", "buy", 6, "A"),
+        StrategySignal("b", "buy", 7, "B"),
+        StrategySignal("c", "buy", 0, "C"),
+    ]
+    updates = merge_signals(buys, idle, context)
+    # 수량 합 13주 → 종목 한도 10% (10주)로 제한
+    assert updates["should_buy"] and updates["order_qty"] == 10
+    assert updates["buy_reason"] == "[a] A; [b] B" and len(updates["strategy_signals"]) == 3
+
+    # 보유 중에는 한 전략의 청산 신호로 전량 매도, 매수 신호는 무시
+    holding = dict(idle, position_status="IN_POSITION", position_qty=30)
+    updates = merge_signals([buys[0], StrategySignal("b", "sell", 30, "손절")], holding, context)
+    assert (
+        updates["should_sell"]
+        and not updates["should_buy"]
+        and updates["sell_reason"] == "[b] 손절"
+    )
+    assert merge_signals([], holding, context)["should_sell"] is False
+
+
+def test_parameterizations_share_one_snapshot():
+    standin = KISStandIn(seed=3)
+    with standin.install(nodes), use_clock(FixedClock(NOW)):
+        state = _market_state(k_value=-1.0)
+        fetched = standin.calls
+
+        default = nodes.generate_signal_node(
+            state, TradingContext()
+        )  # 기본 레지스트리 (돌파 전략 하나)
+        single = _signals(StrategyRegistry([BreakoutPlugin("default")]), state)
+        assert single["should_buy"] == default["should_buy"] is True
+        assert single["order_qty"] == default["order_qty"] > 0
+
+        many = _signals(
+            StrategyRegistry(
+                [
+                    BreakoutPlugin("loose", weight=0.5),
+                    BreakoutPlugin("strict", k=50.0, weight=0.5),  # 목표가가 닿을 수 없는 높이
+                    BreakoutPlugin("filtered", weight=0.5, min_volume=10**12),
+                ]
+            ),
+            state,
+        )
+        # 전략을 늘려도 시세 재조회 없음
+        assert standin.calls == fetched
+    assert [signal["strategy"] for signal in many["strategy_signals"]] == ["loose"]
+    assert many["should_buy"] and many["order_qty"] == default["order_qty"] // 2
+
+
+def test_custom_plugin_type_and_failure_isolation():
+    class Broken(StrategyPlugin):
+        def evaluate(self, state, context):
+            raise ValueError("boom")
+
+    with pytest.raises(TypeError):  # evaluate 없는 플러그인은 만들 수 없음
+        StrategyPlugin("base")
+
+    @register_strategy_type("test_exit_at")
+    class ExitAt(StrategyPlugin):
+        def __init__(self, name, weight=1.0, price=0):
+            super().__init__(name, weight)
+            self.price = price
+
+        def evaluate(self, state, context):
+            if state["position_status"] == "IN_POSITION" and state["current_price"] <= self.price:
+                return StrategySignal(
+                    self.name, "sell", state["position_qty"], f"{self.price:,}원 이하"
+                )
+            return None
+
+    try:
+        registry = StrategyRegistry.from_config(
+            [{"name": "floor", "type": "test_exit_at", "price": 10**9}]
+        )
+        registry.register(Broken("broken"))
+        with KISStandIn(seed=3).install(nodes), use_clock(FixedClock(NOW)):
+            state = _market_state()
+            state.update(
+                {
+                    "position_status": "IN_POSITION",
+                    "entry_price": state["current_price"],
+                    "position_qty": 10,
+                    "highest_price": state["current_price"],
+                }
+            )
+            updates = _signals(registry, state)
+        assert updates["should_sell"] and updates["sell_reason"].startswith("[floor]")
+        assert [signal["strategy"] for signal in updates["strategy_signals"]] == ["floor"]
+    finally:
+        registry_module._STRATEGY_TYPES.pop("test_exit_at", None)
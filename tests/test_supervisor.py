@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+종목 샤딩 워커 감독기 · 리스크 코디네이터 테스트
+
+Usage:
+    python -m pytest tests/test_supervisor.py -q
+"""
+
+import multiprocessing
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.kis_standin import KISStandIn
+from skills.trading_core.clock import FixedClock, set_clock
+from skills.trading_core.graph import nodes
+from skills.trading_core.supervisor import RiskCoordinator, ShardSupervisor, shard_symbols
+
+SYMBOLS = [f"{900001 + i}" for i in range(6)]
+STATE_KWARGS = {"env_mode": "demo", "k_value": -1.0, "min_volume": 0, "min_breakout_strength": 0.0}
+
+
+_installed = []
+
+
+def offline_worker(worker_id):
+    """워커 프로세스 준비: KIS 대역 설치 · 장중 고정 시계"""
+    from skills.trading_core.graph import nodes
+
+    # 컨텍스트를 프로세스 종료까지 유지 (참조가 사라지면 복원됨)
+    installed = KISStandIn(seed=worker_id, cash=10_000_000).install(nodes)
+    installed.__enter__()
+    _installed.append(installed)
+    set_clock(FixedClock(datetime(2025, 1, 6, 10, 0)))
+
+
+def test_coordinator_admission_and_settlement():
+    assert shard_symbols(SYMBOLS, 4) == [
+        ["900001", "900005"],
+        ["900002", "900006"],
+        ["900003"],
+        ["900004"],
+    ]
+
+    coordinator = RiskCoordinator(1_000_000, max_position_size=0.3, max_positions=2)
+    assert coordinator.admit("A", "buy", 100, 10_000) == (30, None)  # 종목당 30만원
+    assert coordinator.admit("A", "buy", 10, 10_000)[0] == 0  # 체결 대기 중
+    assert coordinator.available_cash == 700_000
+    assert coordinator.admit("B", "buy", 20, 5_000) == (20, None)
+    assert coordinator.admit("C", "buy", 1, 5_000) == (0, "최대 보유 종목 수 도달")
+
+    coordinator.settle("A", "buy", 30, 10_000, -300_000, 0)
+    coordinator.settle("B", "buy", 0, 5_000, 0, 0)  # 미체결 → 예약 해제
+    assert coordinator.cash == 700_000 and coordinator.available_cash == 700_000
+    assert coordinator.positions == {"A": {"qty": 30, "entry_price": 10_000}}
+
+    # 매도 체결로 일일 손실 한도(-5%) 도달 → 이후 주문 모두 거절
+    assert coordinator.admit("A", "sell", 30, 8_300) == (30, None)
+    coordinator.settle("A", "sell", 30, 8_300, 249_000, -51_000)
+    assert coordinator.cash == 949_000 and coordinator.total_trades == 1
+    assert coordinator.admit("C", "buy", 1, 5_000) == (0, "일일 손실 한도 초과")
+    assert coordinator.snapshot()["trading_stopped"]
+
+
+def test_workers_share_cash_through_coordinator():
+    coordinator = RiskCoordinator(10_000_000, max_position_size=0.2, max_positions=3)
+    supervisor = ShardSupervisor(
+        SYMBOLS,
+        n_workers=2,
+        coordinator=coordinator,
+        state_kwargs=STATE_KWARGS,
+        interval_seconds=0.01,
+        max_iterations=2,
+        worker_setup=offline_worker,
+    )
+    result = supervisor.run(timeout=60)
+
+    assert result["failed"] == [] and result["reserved"] == {}
+    assert (
+        sorted(symbol for info in supervisor.finished.values() for symbol in info["symbols"])
+        == SYMBOLS
+    )
+    assert all(info["iterations"] == 2 for info in supervisor.finished.values())
+    # 두 워커 모두 매수 신호를 냈지만 코디네이터가 보유 종목 수 · 종목당 비중으로 제한
+    positions = result["positions"]
+    assert len(positions) == 3
+    assert all(p["qty"] * p["entry_price"] <= 2_000_000 for p in positions.values())
+    assert result["cash_balance"] == 10_000_000 - sum(
+        p["qty"] * p["entry_price"] for p in positions.values()
+    )
+
+
+def test_dead_worker_shard_is_rebalanced():
+    coordinator = RiskCoordinator(10_000_000, max_position_size=0.2, max_positions=3)
+    supervisor = ShardSupervisor(
+        SYMBOLS,
+        n_workers=3,
+        coordinator=coordinator,
+        state_kwargs=STATE_KWARGS,
+        interval_seconds=0.2,
+        max_iterations=3,
+        worker_setup=offline_worker,
+    )
+    supervisor.start()
+    supervisor.processes[0].kill()
+    result = supervisor.run(timeout=60)
+
+    assert result["failed"] == [0] and result["orphaned"] == []
+    assert 0 not in result["shards"]
+    # 워커 0의 종목(900001, 900004)이 남은 워커로 옮겨져 실행됨
+    finished = sorted(symbol for info in supervisor.finished.values() for symbol in info["symbols"])
+    assert finished == SYMBOLS
+    assert sorted(symbol for shard in result["shards"].values() for symbol in shard) == SYMBOLS
+    assert len(result["positions"]) == 3
+
+
+def _fake_workers(supervisor, shards, exitcodes):
+    """프로세스 없이 워커 상태만 구성 (감독기 쪽 파이프 끝과 워커 쪽 끝 반환)"""
+    workers = {}
+    for worker_id, shard in shards.items():
+        parent_conn, child_conn = multiprocessing.Pipe(duplex=True)
+        supervisor.shards[worker_id] = list(shard)
+        supervisor.processes[worker_id] = SimpleNamespace(exitcode=exitcodes.get(worker_id))
+        supervisor.conns[worker_id] = parent_conn
+        workers[worker_id] = child_conn
+    return workers
+
+
+def test_assignment_missed_by_finished_worker_is_rerouted():
+    supervisor = ShardSupervisor(SYMBOLS, n_workers=3, coordinator=RiskCoordinator(10_000_000))
+    workers = _fake_workers(supervisor, {0: ["900001"], 1: ["900002"], 2: ["900003"]}, {})
+
+    # 워커 0이 종목 900004를 배정받았지만 이미 루프를 끝내 done에 없음 → 살아 있는 워커로
+    supervisor.shards[0].append("900004")
+    supervisor._handle(0, ("done", 0, ["900001"], 3))
+    assert supervisor.shards[0] == ["900001"]
+    assert workers[1].recv() == ("assign", {"900004": None})
+    assert supervisor.shards[1] == ["900002", "900004"]
+
+    # 마지막 워커까지 받지 못하고 끝나면 orphaned
+    supervisor._handle(1, ("done", 1, ["900002"], 3))
+    assert workers[2].recv() == ("assign", {"900004": None})
+    supervisor._handle(2, ("done", 2, ["900003"], 3))
+    assert supervisor.orphaned == ["900004"] and not supervisor._alive()
+
+
+def test_dead_worker_reservations_are_resolved_from_balance():
+    coordinator = RiskCoordinator(10_000_000, max_position_size=0.2, max_positions=3)
+    for symbol in ("900001", "900002", "900003"):
+        assert coordinator.admit(symbol, "buy", 10, 30_000) == (10, None)
+    supervisor = ShardSupervisor(
+        SYMBOLS,
+        n_workers=2,
+        coordinator=coordinator,
+        state_kwargs={"env_mode": "demo"},
+    )
+    workers = _fake_workers(supervisor, {0: ["900001", "900002", "900003"], 1: ["900004"]}, {0: -9})
+
+    standin = KISStandIn(seed=0, cash=10_000_000, fill_orders=False)
+    standin.holdings["900001"] = {"qty": 10, "avg_price": 30_000.0}  # 보고 전에 체결됨
+    with standin.install(nodes):
+        assert nodes._call_order_cash("demo", "buy", "900003", 10, 30_000)["success"]  # 미체결
+        supervisor._rebalance(0)
+        # 체결분은 보유 포지션으로 넘기고, 주문이 없는 종목은 해제, 미체결은 예약 유지
+        assert coordinator.positions == {"900001": {"qty": 10, "entry_price": 30_000}}
+        assert coordinator.reserved == {"900003": 300_000} and list(supervisor.unresolved) == [
+            "900003"
+        ]
+        assert coordinator.cash == 9_700_000
+        assignment = workers[1].recv()[1]
+        assert assignment["900001"] == {"qty": 10, "entry_price": 30_000}
+
+        # 제한 시간이 지나도 확인되지 않으면 해제 (최대 보유 종목 수 자리 반환)
+        supervisor.reservation_timeout = 0
+        supervisor._resolve_reservations(force=True)
+    assert coordinator.reserved == {} and supervisor.unresolved == {}
+    assert coordinator.admit("900005", "buy", 10, 30_000) == (10, None)
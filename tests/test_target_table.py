@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+당일 목표가 공유 테이블 테스트
+
+Usage:
+    python -m pytest tests/test_target_table.py -q
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "config"))
+
+from skills.trading_core.clock import FixedClock, VirtualClock, use_clock
+from skills.trading_core.data.target_table import (
+    TargetTable,
+    build_target_table,
+    compute_targets,
+    publish_target_table,
+    wait_for_opens,
+)
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.context import TradingContext
+from skills.trading_core.graph.state import create_initial_state
+from skills.trading_core.strategies.breakout_etf import BreakoutStrategy
+from skills.trading_core.strategies.indicators import IndicatorEngine
+from tick_size import adjust_price_to_tick, get_symbol_class
+
+TODAY = "20250106"
+
+
+def test_vectorized_targets_match_scalar_rules():
+    rng = np.random.default_rng(1)
+    symbols = ["069500", "005930", "102110", "000660", "NOOPEN"]
+    prev_low = rng.integers(1_000, 400_000, len(symbols))
+    prev_high = prev_low + rng.integers(0, 20_000, len(symbols))
+    opens = prev_low + rng.integers(0, 20_000, len(symbols))
+    opens[-1] = 0
+    ks = rng.uniform(0.2, 0.9, len(symbols))
+
+    table = compute_targets(symbols, prev_high, prev_low, opens, ks)
+    assert table["symbol"].tolist() == sorted(s.encode() for s in symbols)
+
+    strategy = BreakoutStrategy()
+    rows = {row["symbol"].decode(): row for row in table}
+    for symbol, high, low, open_, k in zip(symbols, prev_high, prev_low, opens, ks):
+        row = rows[symbol]
+        if open_ == 0:
+            assert row["target"] == row["order_price"] == 0
+            continue
+        target = strategy.calculate_target_price(int(open_), int(high), int(low), float(k))
+        assert row["target"] == target
+        assert row["order_price"] == adjust_price_to_tick(
+            target, *get_symbol_class(symbol), mode="up"
+        )
+
+
+def test_publish_mmap_reader_and_wait_for_opens(tmp_path, monkeypatch):
+    engine = IndicatorEngine()
+    engine.update_bar("069500", 30_000, 30_500, 29_500, 30_200, "20250103")
+    engine.update_bar("005930", 55_000, 56_000, 54_000, 55_500, "20250103")
+
+    # 시가는 09:00:03에 확정 (가상 시계로 대기)
+    clock = VirtualClock(datetime(2025, 1, 6, 9, 0))
+    ready_at = datetime(2025, 1, 6, 9, 0, 3)
+    prints = {"069500": 30_100, "005930": 55_200}
+    with use_clock(clock):
+        opens = wait_for_opens(
+            lambda s: prints[s] if clock.now() >= ready_at else 0,
+            ["069500", "005930"],
+            timeout=10,
+            poll_interval=1,
+        )
+        assert clock.now() == ready_at and opens == prints
+        partial = wait_for_opens(lambda s: 0, ["069500"], timeout=5, poll_interval=1)
+        assert partial == {}
+
+    table = build_target_table(
+        engine, ["069500", "005930", "MISSING"], opens, {"069500": 0.4}, default_k=0.5
+    )
+    path = publish_target_table(table, TODAY, tmp_path)
+    reader = TargetTable.load(TODAY, tmp_path)
+    assert isinstance(reader._data, np.memmap) and not reader._data.flags.writeable
+    assert len(reader) == 2 and "MISSING" not in reader
+    assert reader.get("069500")["target"] == 30_100 + 400
+    assert reader.get("005930")["k"] == 0.5
+    assert TargetTable.load("20250107", tmp_path) is None
+    assert not list(tmp_path.glob(".*.tmp"))
+
+    # 대시보드 API도 같은 파일을 읽음
+    from apps import flask_app
+
+    monkeypatch.setattr(flask_app, "target_table_dir", tmp_path)
+    with use_clock(FixedClock(datetime(2025, 1, 6, 9, 1))):
+        response = flask_app.app.test_client().get("/api/targets")
+    assert response.status_code == 200
+    assert [row["symbol"] for row in response.get_json()["targets"]] == ["005930", "069500"]
+    assert path.exists()
+
+
+def test_calculate_target_node_reads_published_table(tmp_path):
+    table = compute_targets(["069500"], [30_500], [29_500], [30_000], [0.3])
+    publish_target_table(table, TODAY, tmp_path)
+
+    state = create_initial_state(
+        symbol="069500", initial_capital=10_000_000, env_mode="demo", k_value=0.5
+    )
+    state.update({"today_open": 30_000, "yesterday_high": 30_500, "yesterday_low": 29_500})
+    context = TradingContext(target_table_dir=tmp_path)
+    with use_clock(FixedClock(datetime(2025, 1, 6, 9, 1))):
+        published = nodes.calculate_target_node(state, context)
+        # 재게시는 inode/mtime으로 감지
+        publish_target_table(
+            compute_targets(["069500"], [30_500], [29_500], [30_000], [0.7]), TODAY, tmp_path
+        )
+        republished = nodes.calculate_target_node(state, context)
+        # 시가가 다르면 테이블을 쓰지 않고 직접 계산
+        state["today_open"] = 30_050
+        computed = nodes.calculate_target_node(state, context)
+
+    assert published == {"target_price": 30_300, "effective_k": 0.3}
+    assert republished["target_price"] == 30_700
+    assert computed == {"target_price": 30_550, "effective_k": 0.5}
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+호가 단위 조회/조정 테스트
+
+Usage:
+    python -m pytest tests/test_tick_size.py -q
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "config"))
+
+from tick_size import (
+    TICK_SIZE_TABLE,
+    adjust_price_to_tick,
+    adjust_prices_to_tick,
+    get_symbol_class,
+    get_tick_size,
+    get_tick_sizes,
+)
+
+
+def linear_tick_size(price):
+    """개편 전 선형 탐색 구현 (기준값)"""
+    for min_price, max_price, tick_size in TICK_SIZE_TABLE:
+        if min_price <= price < max_price:
+            return tick_size
+    return 1000
+
+
+def test_bisect_matches_linear_scan_at_boundaries():
+    prices = [
+        0,
+        1,
+        1999,
+        1999.99,
+        2000,
+        4999,
+        5000,
+        19999,
+        20000,
+        49999,
+        50000,
+        199999,
+        200000,
+        499999,
+        500000,
+        2_000_000,
+    ]
+    for price in prices:
+        assert get_tick_size(price) == linear_tick_size(price)
+    np.testing.assert_array_equal(get_tick_sizes(prices), [linear_tick_size(p) for p in prices])
+
+
+def test_vectorized_adjust_matches_scalar():
+    prices = np.random.default_rng(0).uniform(500, 800_000, 20_000)
+    for mode in ("nearest", "up", "down"):
+        expected = [adjust_price_to_tick(p, mode=mode) for p in prices]
+        np.testing.assert_array_equal(adjust_prices_to_tick(prices, mode=mode), expected)
+        expected_etf = [adjust_price_to_tick(p, "etf", mode=mode) for p in prices[:1000]]
+        np.testing.assert_array_equal(
+            adjust_prices_to_tick(prices[:1000], "etf", mode=mode), expected_etf
+        )
+
+
+def test_round_modes_and_instrument_tables():
+    assert adjust_price_to_tick(10003.5) == 10000
+    assert adjust_price_to_tick(10003.5, mode="up") == 10010
+    assert adjust_price_to_tick(10007, mode="down") == 10000
+    assert adjust_price_to_tick(10010.0, mode="up") == 10010  # 이미 호가면 그대로
+    assert adjust_price_to_tick(35_012, "etf", "KOSPI", mode="up") == 35_015
+    assert get_tick_size(35_000, "etn", "KOSDAQ") == 5
+    assert get_tick_size(35_000, "stock", "KOSDAQ") == 50
+
+    with pytest.raises(ValueError):
+        get_tick_size(1000, "futures")
+    with pytest.raises(ValueError):
+        adjust_price_to_tick(1000, mode="ceil")
+
+
+def test_symbol_class_from_config():
+    assert get_symbol_class("069500") == ("etf", "KOSPI")
+    assert get_symbol_class("005930") == ("stock", "KOSPI")
+    assert get_symbol_class("unknown") == ("stock", "KOSPI")
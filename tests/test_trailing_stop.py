@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+트레일링 스탑 테스트
+
+Usage:
+    python -m pytest tests/test_trailing_stop.py -q
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.kis_standin import KISStandIn
+from skills.trading_core.clock import FixedClock, use_clock
+from skills.trading_core.graph import nodes
+from skills.trading_core.graph.graph_builder import build_exit_graph, execute_trailing_exit
+from skills.trading_core.graph.state import create_initial_state
+from skills.trading_core.strategies.breakout_etf import BreakoutStrategy
+from skills.trading_core.strategies.trailing_stop import TrailingStopWatcher, trailing_stop_price
+
+NOW = datetime(2025, 1, 6, 10, 0)
+
+
+def test_stop_price_rules_and_graph_path():
+    assert trailing_stop_price(31_000, "pct", 0.02) == 31_000 - 620
+    assert trailing_stop_price(31_001, "pct", 0.02) == 31_001 - 621  # 거리 올림 = 청산가 내림
+    assert trailing_stop_price(31_000, "atr", 0.02, atr=150.4, atr_multiplier=2.0) == 31_000 - 301
+    assert trailing_stop_price(31_000, "atr", 0.02, atr=None) == 31_000 - 620  # ATR 모르면 비율
+    with pytest.raises(ValueError):
+        trailing_stop_price(31_000, "chandelier")
+
+    strategy = BreakoutStrategy()
+    assert (
+        strategy.should_exit(30_000, 30_390, current_time=NOW, trailing_stop_price=30_380)[0]
+        is False
+    )
+    exit_, reason = strategy.should_exit(
+        30_000, 30_380, current_time=NOW, trailing_stop_price=30_380
+    )
+    assert exit_ and reason.startswith("트레일링 스탑")
+
+    # 반복 주기 그래프 경로도 state의 최고가로 같은 규칙을 적용
+    state = create_initial_state(
+        symbol="069500",
+        initial_capital=10_000_000,
+        env_mode="demo",
+        trailing_stop=True,
+        trailing_stop_pct=0.02,
+        trailing_mode="pct",
+    )
+    state.update(
+        {
+            "position_status": "IN_POSITION",
+            "entry_price": 30_000,
+            "position_qty": 10,
+            "highest_price": 31_000,
+            "current_price": 30_380,
+        }
+    )
+    with use_clock(FixedClock(NOW)):
+        assert nodes.generate_signal_node(state)["should_sell"]
+        state["trailing_stop"] = False
+        assert not nodes.generate_signal_node(state)["should_sell"]
+
+
+def test_watcher_ratchets_and_fires_once():
+    fired = []
+    watcher = TrailingStopWatcher(mode="atr", pct=0.02, atr_multiplier=2.0, on_exit=fired.append)
+    assert watcher.arm("069500", 30_000, 10, atr=100.0) == 29_800
+    assert watcher.arm("102110", 30_000, 5) == 29_400  # ATR 없으면 비율
+
+    for price in (30_100, 30_500, 30_400, 30_301):
+        assert watcher.on_tick("069500", price) is None
+    assert watcher.stop_price("069500") == 30_300  # 최고가 30,500에서만 끌어올림
+
+    signal = watcher.on_tick("069500", 30_290, received_at=1.0)
+    assert signal is not None and fired == [signal]
+    assert (signal.highest_price, signal.stop_price, signal.exit_price, signal.qty) == (
+        30_500,
+        30_300,
+        30_290,
+        10,
+    )
+    assert signal.giveback == 210 and signal.giveback_pct == pytest.approx(210 / 30_500)
+    assert signal.received_at == 1.0 and signal.triggered_at >= 0
+
+    # 청산 후에는 감시 해제 → 같은 포지션으로 두 번 나가지 않음
+    assert watcher.on_tick("069500", 30_000) is None and "069500" not in watcher
+    watcher.disarm("102110")
+    assert len(watcher) == 0 and len(fired) == 1
+
+
+def test_watcher_exit_runs_exit_graph():
+    standin = KISStandIn(seed=2, cash=10_000_000)
+    graph = build_exit_graph()
+    results = []
+    with standin.install(nodes), use_clock(FixedClock(NOW)):
+        assert nodes._call_order_cash("demo", "buy", "069500", qty=10, price=30_000)["success"]
+        state = create_initial_state(
+            symbol="069500", initial_capital=10_000_000, env_mode="demo", trailing_stop=True
+        )
+        state.update(
+            {
+                "position_status": "IN_POSITION",
+                "entry_price": 30_000,
+                "position_qty": 10,
+                "highest_price": 30_000,
+                "current_price": 30_000,
+                "cash_balance": 9_700_000,
+            }
+        )
+        watcher = TrailingStopWatcher.from_config(
+            {"risk": {"trailing_stop_pct": 0.01}},
+            on_exit=lambda signal: results.append(execute_trailing_exit(graph, state, signal)),
+        )
+        watcher.arm("069500", 30_000, 10)
+        for price in (30_200, 30_600, 30_400, 30_290):
+            watcher.on_tick("069500", price)
+
+    assert len(results) == 1
+    final = results[0]
+    assert final["position_status"] == "IDLE" and final["position_qty"] == 0
+    assert final["realized_pnl"] == (30_290 - 30_000) * 10 and final["total_trades"] == 1
+    assert final["sell_reason"].startswith("트레일링 스탑")
+    assert standin.orders[-1]["side"] == "sell" and standin.holdings["069500"]["qty"] == 0
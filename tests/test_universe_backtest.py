@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+유니버스 스트리밍 백테스트 테스트
+
+Usage:
+    python -m pytest tests/test_universe_backtest.py -q
+"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from skills.trading_core.backtest.engine import run_breakout_backtest
+from skills.trading_core.backtest.universe import UniverseBacktest, iter_chunks, iter_universe
+from skills.trading_core.data.history_store import HistoryStore
+from tests.test_backtest_cache import make_bars
+
+SYMBOLS = [f"{i:06d}" for i in range(7)]
+
+
+def make_store(tmp_path) -> HistoryStore:
+    store = HistoryStore(tmp_path / "hist")
+    for i, symbol in enumerate(SYMBOLS):
+        store.save(symbol, make_bars(250, seed=i))
+    store.save("999999", make_bars(10, seed=99))  # 데이터 부족 종목
+    return store
+
+
+def test_iter_universe_from_file(tmp_path):
+    path = tmp_path / "universe.csv"
+    path.write_text("code,name\n069500,KODEX 200\n# 주석\n\n005930,삼성전자\n", encoding="utf-8")
+    assert list(iter_universe(path)) == ["069500", "005930"]
+    assert list(iter_chunks(iter(["a", "b", "c"]), 2)) == [(0, ["a", "b"]), (1, ["c"])]
+
+
+def test_ranking_matches_direct_backtest(tmp_path):
+    store = make_store(tmp_path)
+    runner = UniverseBacktest(store, chunk_size=2, max_workers=2, run_dir=tmp_path / "run")
+    assert runner.run() == 4
+
+    ranking = runner.ranking(sort_by="sharpe", top_n=3, min_trades=1)
+    assert len(ranking) == 3
+    assert "999999" not in [row["symbol"] for row in ranking]
+
+    expected = sorted(
+        ((run_breakout_backtest(store.load(s))["metrics"]["sharpe"], s) for s in SYMBOLS),
+        reverse=True,
+    )[:3]
+    assert [row["symbol"] for row in ranking] == [s for _, s in expected]
+    for row, (sharpe, _) in zip(ranking, expected):
+        assert abs(row["sharpe"] - sharpe) < 1e-12
+
+
+def test_resume_skips_completed_chunks(tmp_path):
+    store = make_store(tmp_path)
+    full = UniverseBacktest(store, chunk_size=2, max_workers=1, run_dir=tmp_path / "full")
+    full.run()
+
+    # 청크 0, 1만 끝난 상태에서 중단된 것으로 가정 (마지막 줄은 잘림)
+    run_dir = tmp_path / "resumed"
+    run_dir.mkdir()
+    lines = full.results_path.read_text(encoding="utf-8").splitlines()
+    done_rows = [line for line in lines if any(f'"{s}"' in line for s in SYMBOLS[:4])]
+    partial = "\n".join(done_rows) + '\n{"symbol": "0000'
+    (run_dir / "results.jsonl").write_text(partial, encoding="utf-8")
+    (run_dir / "done_chunks.txt").write_text("0\n1\n", encoding="utf-8")
+    (run_dir / "fingerprint.txt").write_text(full.fingerprint, encoding="utf-8")
+
+    resumed = UniverseBacktest(store, chunk_size=2, max_workers=1, run_dir=run_dir)
+    assert resumed.completed_chunks() == {0, 1}
+    assert resumed.run() == 2
+    assert resumed.completed_chunks() == {0, 1, 2, 3}
+    assert resumed.ranking(top_n=10, min_trades=1) == full.ranking(top_n=10, min_trades=1)
+
+
+def test_checkpoint_is_not_reused_across_sources_or_data(tmp_path, monkeypatch):
+    monkeypatch.setattr("skills.trading_core.backtest.universe.project_root", tmp_path)
+    store = make_store(tmp_path)
+    universe = tmp_path / "universe.txt"
+    universe.write_text("\n".join(SYMBOLS[:4]), encoding="utf-8")
+
+    def runner(**kwargs):
+        return UniverseBacktest(store, chunk_size=2, max_workers=1, source=universe, **kwargs)
+
+    # 종목 목록 파일 내용이 다르면 다른 실행 디렉토리 (같은 청크 번호가 다른 종목)
+    first = runner()
+    universe.write_text("\n".join(SYMBOLS[4:]), encoding="utf-8")
+    other = runner()
+    assert first.run_dir != other.run_dir
+    assert first.run_dir.parent == tmp_path / "data" / "universe_runs"
+
+    # 같은 run_dir이라도 저장소 데이터가 갱신되면 체크포인트를 버리고 처음부터
+    run_dir = tmp_path / "run"
+    done = runner(run_dir=run_dir)
+    assert done.run() == 2 and runner(run_dir=run_dir).run() == 0
+
+    store.save(SYMBOLS[5], make_bars(260, seed=5))
+    updated = runner(run_dir=run_dir)
+    assert updated.fingerprint != done.fingerprint and updated.completed_chunks() == set()
+    assert updated.run() == 2
+    rows = updated.results_path.read_text(encoding="utf-8").splitlines()
+    assert len(rows) == 3